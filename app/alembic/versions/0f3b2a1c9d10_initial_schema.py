@@ -0,0 +1,797 @@
+"""initial schema
+
+Revision ID: 0f3b2a1c9d10
+Revises:
+Create Date: 2026-10-16 08:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0f3b2a1c9d10"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "sales"
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSchema(SCHEMA, if_not_exists=True))
+    op.create_table(
+        "acc_accounts",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("sys_value_status_uuid", sa.UUID(), nullable=True),
+        sa.Column("name", sa.String(length=255), nullable=True),
+        sa.Column("start_on", sa.Date(), nullable=True),
+        sa.Column("end_on", sa.Date(), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "em_addresses",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("parent_uuid", sa.UUID(), nullable=False),
+        sa.Column("parent_table", sa.String(length=50), nullable=False),
+        sa.Column("sys_value_type_uuid", sa.UUID(), nullable=False),
+        sa.Column("address_line1", sa.String(length=325), nullable=True),
+        sa.Column("address_line2", sa.String(length=325), nullable=True),
+        sa.Column("city", sa.String(length=325), nullable=True),
+        sa.Column("county", sa.String(length=325), nullable=True),
+        sa.Column("state", sa.String(length=325), nullable=True),
+        sa.Column("country", sa.String(length=325), nullable=True),
+        sa.Column("zip", sa.String(length=5), nullable=True),
+        sa.Column("zip_plus4", sa.String(length=4), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "em_entities",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("type", sa.String(length=50), nullable=False),
+        sa.Column("tin", sa.String(length=20), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.CheckConstraint(
+            "type in ('individual', 'non-individual')", name="entities_type_check"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "om_sales_orders",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("account_uuid", sa.UUID(), nullable=False),
+        sa.Column("invoice_uuid", sa.UUID(), nullable=True),
+        sa.Column("owner_uuid", sa.UUID(), nullable=True),
+        sa.Column("approved_by_uuid", sa.UUID(), nullable=True),
+        sa.Column("approved_on", sa.Date(), nullable=True),
+        sa.Column("transacted_on", sa.Date(), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "pm_product_lists",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("owner_uuid", sa.UUID(), nullable=True),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("start_on", sa.Date(), nullable=False),
+        sa.Column("end_on", sa.Date(), nullable=False),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "pm_products",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("code", sa.String(length=50), nullable=True),
+        sa.Column("terms", sa.String(length=50), nullable=True),
+        sa.Column("description", sa.String(length=325), nullable=True),
+        sa.Column(
+            "sys_allowed_price_increase",
+            sa.Boolean(),
+            server_default=sa.text("False"),
+            nullable=False,
+        ),
+        sa.Column(
+            "sys_allowed_price_decrease",
+            sa.Boolean(),
+            server_default=sa.text("False"),
+            nullable=False,
+        ),
+        sa.Column(
+            "man_allowed_price_increase",
+            sa.Boolean(),
+            server_default=sa.text("False"),
+            nullable=False,
+        ),
+        sa.Column(
+            "man_allowed_price_decrease",
+            sa.Boolean(),
+            server_default=sa.text("False"),
+            nullable=False,
+        ),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("code"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "sys_users",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("first_name", sa.String(length=100), nullable=False),
+        sa.Column("last_name", sa.String(length=100), nullable=False),
+        sa.Column("email", sa.String(length=325), nullable=False),
+        sa.Column("username", sa.String(length=325), nullable=False),
+        sa.Column("password", sa.String(length=325), nullable=False),
+        sa.Column("disabled_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "sys_values",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("uuid", sa.UUID(), nullable=False),
+        sa.Column("table_name", sa.String(length=100), nullable=True),
+        sa.Column("name", sa.String(length=100), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "acc_account_contracts",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("account_uuid", sa.UUID(), nullable=False),
+        sa.Column("document_metadata_id", sa.Integer(), nullable=True),
+        sa.Column("document_metadata_uuid", sa.UUID(), nullable=True),
+        sa.Column("sys_value_type_uuid", sa.UUID(), nullable=True),
+        sa.Column("start_on", sa.Date(), nullable=True),
+        sa.Column("end_on", sa.Date(), nullable=True),
+        sa.Column("notification_days", sa.Integer(), nullable=True),
+        sa.Column("status", sa.String(length=100), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["account_uuid"],
+            ["sales.acc_accounts.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "acc_account_lists",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("account_uuid", sa.UUID(), nullable=False),
+        sa.Column("product_list_uuid", sa.UUID(), nullable=False),
+        sa.Column("start_on", sa.Date(), nullable=True),
+        sa.Column("end_on", sa.Date(), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["account_uuid"],
+            ["sales.acc_accounts.uuid"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["product_list_uuid"],
+            ["sales.pm_product_lists.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "acc_account_products",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("account_uuid", sa.UUID(), nullable=False),
+        sa.Column("product_uuid", sa.UUID(), nullable=False),
+        sa.Column("start_on", sa.Date(), nullable=False),
+        sa.Column("end_on", sa.Date(), nullable=False),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["account_uuid"],
+            ["sales.acc_accounts.uuid"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["product_uuid"],
+            ["sales.pm_products.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "em_emails",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("entity_uuid", sa.UUID(), nullable=False),
+        sa.Column("email", sa.String(length=325), nullable=False),
+        sa.Column("username", sa.String(length=325), nullable=True),
+        sa.Column("domain", sa.String(length=325), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["entity_uuid"],
+            ["sales.em_entities.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "em_entity_accounts",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("entity_uuid", sa.UUID(), nullable=False),
+        sa.Column("account_uuid", sa.UUID(), nullable=False),
+        sa.Column("start_on", sa.Date(), nullable=True),
+        sa.Column("end_on", sa.Date(), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["account_uuid"],
+            ["sales.acc_accounts.uuid"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["entity_uuid"],
+            ["sales.em_entities.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "em_individuals",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("entity_uuid", sa.UUID(), nullable=False),
+        sa.Column("first_name", sa.String(length=100), nullable=False),
+        sa.Column("last_name", sa.String(length=100), nullable=False),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["entity_uuid"],
+            ["sales.em_entities.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "em_non_individuals",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("entity_uuid", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("legal_name", sa.String(length=100), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["entity_uuid"],
+            ["sales.em_entities.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "em_numbers",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("entity_uuid", sa.UUID(), nullable=False),
+        sa.Column("sys_value_type_uuid", sa.UUID(), nullable=True),
+        sa.Column("country_code", sa.String(length=1), nullable=True),
+        sa.Column("area_code", sa.String(length=3), nullable=True),
+        sa.Column("line_number", sa.String(length=4), nullable=True),
+        sa.Column("extension", sa.String(length=10), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["entity_uuid"],
+            ["sales.em_entities.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "em_websites",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("entity_uuid", sa.UUID(), nullable=False),
+        sa.Column("sys_value_type_uuid", sa.UUID(), nullable=True),
+        sa.Column("url", sa.String(length=325), nullable=False),
+        sa.Column("description", sa.String(length=255), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["entity_uuid"],
+            ["sales.em_entities.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "om_invoices",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("order_uuid", sa.UUID(), nullable=False),
+        sa.Column("sys_value_status_uuid", sa.UUID(), nullable=False),
+        sa.Column("transacted_on", sa.Date(), nullable=True),
+        sa.Column("posted_on", sa.Date(), nullable=True),
+        sa.Column("paid_on", sa.Date(), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["order_uuid"],
+            ["sales.om_sales_orders.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "pm_product_list_items",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("product_list_uuid", sa.UUID(), nullable=False),
+        sa.Column("product_uuid", sa.UUID(), nullable=False),
+        sa.Column(
+            "price",
+            sa.Numeric(precision=10, scale=2),
+            server_default=sa.text("0.00"),
+            nullable=False,
+        ),
+        sa.Column(
+            "sys_allowed_price_increase",
+            sa.Boolean(),
+            server_default=sa.text("False"),
+            nullable=False,
+        ),
+        sa.Column(
+            "man_allowed_price_increase",
+            sa.Boolean(),
+            server_default=sa.text("False"),
+            nullable=False,
+        ),
+        sa.Column(
+            "sys_allowed_price_decrease",
+            sa.Boolean(),
+            server_default=sa.text("False"),
+            nullable=False,
+        ),
+        sa.Column(
+            "man_allowed_price_decrease",
+            sa.Boolean(),
+            server_default=sa.text("False"),
+            nullable=False,
+        ),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["product_list_uuid"],
+            ["sales.pm_product_lists.uuid"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["product_uuid"],
+            ["sales.pm_products.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "om_order_items",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("order_uuid", sa.UUID(), nullable=False),
+        sa.Column("product_list_item_uuid", sa.UUID(), nullable=False),
+        sa.Column("owner_uuid", sa.UUID(), nullable=False),
+        sa.Column(
+            "quantity", sa.Integer(), server_default=sa.text("1"), nullable=False
+        ),
+        sa.Column("original_price", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("adjustment_type", sa.String(length=50), nullable=True),
+        sa.Column("price_adjustment", sa.Numeric(precision=10, scale=2), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.CheckConstraint(
+            "adjustment_type in ('dollar', 'percentage')",
+            name="oder_items_adjustement_type",
+        ),
+        sa.ForeignKeyConstraint(
+            ["order_uuid"],
+            ["sales.om_sales_orders.uuid"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["product_list_item_uuid"],
+            ["sales.pm_product_list_items.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("uuid"),
+        schema=SCHEMA,
+    )
+    op.create_table(
+        "om_invoice_items",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "uuid",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("invoice_uuid", sa.UUID(), nullable=False),
+        sa.Column("order_item_uuid", sa.UUID(), nullable=False),
+        sa.Column("product_list_item_uuid", sa.UUID(), nullable=False),
+        sa.Column(
+            "quantity", sa.Integer(), server_default=sa.text("1"), nullable=False
+        ),
+        sa.Column("owner_uuid", sa.UUID(), nullable=True),
+        sa.Column("original_price", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("adjustment_type", sa.String(length=50), nullable=True),
+        sa.Column("price_adjustment", sa.Numeric(precision=10, scale=2), nullable=True),
+        sa.Column(
+            "sys_created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("sys_created_by", sa.UUID(), nullable=True),
+        sa.Column("sys_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_updated_by", sa.UUID(), nullable=True),
+        sa.Column("sys_deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("sys_deleted_by", sa.UUID(), nullable=True),
+        sa.CheckConstraint(
+            "adjustment_type in ('dollar', 'percentage')",
+            name="inovice_items_adjustement_type",
+        ),
+        sa.ForeignKeyConstraint(
+            ["invoice_uuid"],
+            ["sales.om_invoices.uuid"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["order_item_uuid"],
+            ["sales.om_order_items.uuid"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["product_list_item_uuid"],
+            ["sales.pm_product_list_items.uuid"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("om_invoice_items", schema=SCHEMA)
+    op.drop_table("om_order_items", schema=SCHEMA)
+    op.drop_table("pm_product_list_items", schema=SCHEMA)
+    op.drop_table("om_invoices", schema=SCHEMA)
+    op.drop_table("em_websites", schema=SCHEMA)
+    op.drop_table("em_numbers", schema=SCHEMA)
+    op.drop_table("em_non_individuals", schema=SCHEMA)
+    op.drop_table("em_individuals", schema=SCHEMA)
+    op.drop_table("em_entity_accounts", schema=SCHEMA)
+    op.drop_table("em_emails", schema=SCHEMA)
+    op.drop_table("acc_account_products", schema=SCHEMA)
+    op.drop_table("acc_account_lists", schema=SCHEMA)
+    op.drop_table("acc_account_contracts", schema=SCHEMA)
+    op.drop_table("sys_values", schema=SCHEMA)
+    op.drop_table("sys_users", schema=SCHEMA)
+    op.drop_table("pm_products", schema=SCHEMA)
+    op.drop_table("pm_product_lists", schema=SCHEMA)
+    op.drop_table("om_sales_orders", schema=SCHEMA)
+    op.drop_table("em_entities", schema=SCHEMA)
+    op.drop_table("em_addresses", schema=SCHEMA)
+    op.drop_table("acc_accounts", schema=SCHEMA)
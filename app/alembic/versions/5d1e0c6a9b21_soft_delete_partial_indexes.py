@@ -0,0 +1,88 @@
+"""soft delete partial indexes
+
+Revision ID: 5d1e0c6a9b21
+Revises: 0f3b2a1c9d10
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1e0c6a9b21"
+down_revision: Union[str, None] = "0f3b2a1c9d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "sales"
+ACTIVE_ROWS = "sys_deleted_at IS NULL"
+
+# (table, columns) of every index declared with `active_index` on the models.
+INDEXES = [
+    ("acc_account_contracts", ("account_uuid", "id")),
+    ("acc_account_lists", ("account_uuid", "id")),
+    ("acc_account_lists", ("account_uuid", "product_list_uuid")),
+    ("acc_account_products", ("account_uuid", "id")),
+    ("acc_account_products", ("account_uuid", "product_uuid")),
+    ("acc_accounts", ("id",)),
+    ("em_addresses", ("parent_uuid", "parent_table", "id")),
+    ("em_emails", ("entity_uuid", "id")),
+    ("em_emails", ("entity_uuid", "email")),
+    ("em_entities", ("id",)),
+    ("em_entity_accounts", ("entity_uuid", "id")),
+    ("em_entity_accounts", ("account_uuid", "id")),
+    ("em_individuals", ("id",)),
+    ("em_individuals", ("entity_uuid",)),
+    ("om_invoice_items", ("invoice_uuid", "id")),
+    ("om_invoices", ("id",)),
+    ("om_invoices", ("order_uuid",)),
+    ("em_non_individuals", ("id",)),
+    ("em_non_individuals", ("entity_uuid",)),
+    ("em_numbers", ("entity_uuid", "id")),
+    ("om_order_items", ("order_uuid", "id")),
+    ("om_sales_orders", ("id",)),
+    ("pm_product_list_items", ("product_list_uuid", "id")),
+    ("pm_product_list_items", ("product_list_uuid", "product_uuid")),
+    ("pm_product_lists", ("id",)),
+    ("pm_product_lists", ("name",)),
+    ("pm_products", ("id",)),
+    ("pm_products", ("name",)),
+    ("sys_users", ("id",)),
+    ("sys_users", ("username",)),
+    ("em_websites", ("entity_uuid", "id")),
+    ("em_websites", ("entity_uuid", "url")),
+]
+
+
+def index_name(table: str, columns: Sequence[str]) -> str:
+    return f"ix_{table}_{'_'.join(columns)}_active"
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for table, columns in INDEXES:
+            op.create_index(
+                index_name(table=table, columns=columns),
+                table,
+                list(columns),
+                schema=SCHEMA,
+                postgresql_where=sa.text(ACTIVE_ROWS),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, columns in INDEXES:
+            op.drop_index(
+                index_name(table=table, columns=columns),
+                table_name=table,
+                schema=SCHEMA,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,71 @@
+"""trigram search indexes
+
+Revision ID: 8a4c2e7f1b36
+Revises: 5d1e0c6a9b21
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4c2e7f1b36"
+down_revision: Union[str, None] = "5d1e0c6a9b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "sales"
+ACTIVE_ROWS = "sys_deleted_at IS NULL"
+
+# (table, columns) of every index declared with `search_index` on the models.
+INDEXES = [
+    ("em_entities", ("tin",)),
+    ("em_individuals", ("first_name", "last_name")),
+    ("em_non_individuals", ("name", "legal_name")),
+    ("pm_products", ("name", "code", "description")),
+]
+
+
+def index_name(table: str, columns: Sequence[str]) -> str:
+    return f"ix_{table}_{'_'.join(columns)}_trgm_active"
+
+
+def search_sql(columns: Sequence[str]) -> str:
+    if len(columns) == 1:
+        return columns[0]
+    return (
+        "(" + " || ' ' || ".join(f"coalesce({column}, '')" for column in columns) + ")"
+    )
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for table, columns in INDEXES:
+            op.create_index(
+                index_name(table=table, columns=columns),
+                table,
+                [sa.text(f"{search_sql(columns=columns)} gin_trgm_ops")],
+                schema=SCHEMA,
+                postgresql_using="gin",
+                postgresql_where=sa.text(ACTIVE_ROWS),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    # The extension is kept, other objects of the database may depend on it.
+    with op.get_context().autocommit_block():
+        for table, columns in INDEXES:
+            op.drop_index(
+                index_name(table=table, columns=columns),
+                table_name=table,
+                schema=SCHEMA,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,104 @@
+"""soft delete unique indexes
+
+Revision ID: b7d3f9a2c4e8
+Revises: 8a4c2e7f1b36
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d3f9a2c4e8"
+down_revision: Union[str, None] = "8a4c2e7f1b36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "sales"
+ACTIVE_ROWS = "sys_deleted_at IS NULL"
+
+# (table, columns, name) of every index declared with `active_unique_index` on the
+# models, the name replaces the columns in the index name when they are too long for it.
+UNIQUE_INDEXES = [
+    (
+        "em_addresses",
+        ("parent_uuid", "address_line1", "address_line2", "city"),
+        "address",
+    ),
+    ("em_emails", ("entity_uuid", "email"), None),
+    (
+        "em_numbers",
+        ("entity_uuid", "country_code", "area_code", "line_number", "extension"),
+        "number",
+    ),
+    ("em_websites", ("entity_uuid", "url"), None),
+    ("om_invoices", ("order_uuid",), None),
+    ("pm_product_list_items", ("product_list_uuid", "product_uuid"), None),
+]
+
+# (table, columns) of the `active_index` indexes replaced by a unique index.
+REPLACED_INDEXES = [
+    ("em_emails", ("entity_uuid", "email")),
+    ("em_websites", ("entity_uuid", "url")),
+    ("om_invoices", ("order_uuid",)),
+    ("pm_product_list_items", ("product_list_uuid", "product_uuid")),
+]
+
+
+def index_name(table: str, columns: Sequence[str]) -> str:
+    return f"ix_{table}_{'_'.join(columns)}_active"
+
+
+def unique_index_name(table: str, columns: Sequence[str], name: Optional[str]) -> str:
+    return f"ux_{table}_{name or '_'.join(columns)}_active"
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        # The build fails on duplicates among the records that are not soft deleted.
+        for table, columns, name in UNIQUE_INDEXES:
+            op.create_index(
+                unique_index_name(table=table, columns=columns, name=name),
+                table,
+                list(columns),
+                schema=SCHEMA,
+                unique=True,
+                postgresql_where=sa.text(ACTIVE_ROWS),
+                postgresql_nulls_not_distinct=True,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for table, columns in REPLACED_INDEXES:
+            op.drop_index(
+                index_name(table=table, columns=columns),
+                table_name=table,
+                schema=SCHEMA,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, columns in REPLACED_INDEXES:
+            op.create_index(
+                index_name(table=table, columns=columns),
+                table,
+                list(columns),
+                schema=SCHEMA,
+                postgresql_where=sa.text(ACTIVE_ROWS),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for table, columns, name in UNIQUE_INDEXES:
+            op.drop_index(
+                unique_index_name(table=table, columns=columns, name=name),
+                table_name=table,
+                schema=SCHEMA,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,81 @@
+"""address fingerprints
+
+Revision ID: c3e9a1d5f7b2
+Revises: b7d3f9a2c4e8
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e9a1d5f7b2"
+down_revision: Union[str, None] = "b7d3f9a2c4e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "sales"
+ACTIVE_ROWS = "sys_deleted_at IS NULL"
+TABLE = "em_addresses"
+
+# The unique index on the raw address columns, replaced by the one on the fingerprint.
+ADDRESS_INDEX = "ux_em_addresses_address_active"
+ADDRESS_COLUMNS = ["parent_uuid", "address_line1", "address_line2", "city"]
+FINGERPRINT_INDEX = "ux_em_addresses_parent_uuid_fingerprint_active"
+FINGERPRINT_COLUMNS = ["parent_uuid", "fingerprint"]
+
+
+def upgrade() -> None:
+    # A nullable column without default is added without rewriting the table, existing
+    # addresses are fingerprinted by `python -m app.database.address_fingerprints`.
+    op.add_column(
+        TABLE,
+        sa.Column("fingerprint", sa.String(length=64), nullable=True),
+        schema=SCHEMA,
+    )
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        # Missing fingerprints stay distinct, addresses waiting for the backfill do not conflict.
+        op.create_index(
+            FINGERPRINT_INDEX,
+            TABLE,
+            FINGERPRINT_COLUMNS,
+            schema=SCHEMA,
+            unique=True,
+            postgresql_where=sa.text(ACTIVE_ROWS),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            ADDRESS_INDEX,
+            table_name=TABLE,
+            schema=SCHEMA,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            ADDRESS_INDEX,
+            TABLE,
+            ADDRESS_COLUMNS,
+            schema=SCHEMA,
+            unique=True,
+            postgresql_where=sa.text(ACTIVE_ROWS),
+            postgresql_nulls_not_distinct=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            FINGERPRINT_INDEX,
+            table_name=TABLE,
+            schema=SCHEMA,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column(TABLE, "fingerprint", schema=SCHEMA)
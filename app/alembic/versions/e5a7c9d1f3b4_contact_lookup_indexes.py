@@ -0,0 +1,65 @@
+"""contact lookup indexes
+
+Revision ID: e5a7c9d1f3b4
+Revises: c3e9a1d5f7b2
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a7c9d1f3b4"
+down_revision: Union[str, None] = "c3e9a1d5f7b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "sales"
+ACTIVE_ROWS = "sys_deleted_at IS NULL"
+
+# (table, name, key) of every index declared with `lookup_index` on the models, the key
+# must stay identical to the `lookup_key` of the model for statements to use the index.
+INDEXES = [
+    ("em_emails", "email", "lower(email)"),
+    ("em_numbers", "phone", "coalesce(country_code, '1') || area_code || line_number"),
+    (
+        "em_websites",
+        "domain",
+        "substring(lower(url), '^(?:[a-z][a-z0-9+.-]*://)?(?:www\\.)?([^/:?#]+)')",
+    ),
+]
+
+
+def index_name(table: str, name: str) -> str:
+    return f"ix_{table}_{name}_lookup_active"
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for table, name, key in INDEXES:
+            op.create_index(
+                index_name(table=table, name=name),
+                table,
+                # Colons are escaped, `text` would take `(?:www` for a bind parameter.
+                [sa.text(f"({key})".replace(":", "\\:"))],
+                schema=SCHEMA,
+                postgresql_where=sa.text(ACTIVE_ROWS),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, name, key in INDEXES:
+            op.drop_index(
+                index_name(table=table, name=name),
+                table_name=table,
+                schema=SCHEMA,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
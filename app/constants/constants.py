@@ -30,8 +30,53 @@ ADDRESSES_DEL_SERVICE = "AddressesDelService"
 ADDRESSES_READ_SERVICE = "AddressesReadService"
 ADDRESSES_UPDATE_SERVICE = "AddressesUpdateService"
 
+# Words of an address folded into their USPS abbreviation before fingerprinting.
+ADDRESS_ABBREVIATIONS = {
+    "apartment": "apt",
+    "avenue": "ave",
+    "boulevard": "blvd",
+    "building": "bldg",
+    "circle": "cir",
+    "court": "ct",
+    "drive": "dr",
+    "east": "e",
+    "expressway": "expy",
+    "floor": "fl",
+    "freeway": "fwy",
+    "highway": "hwy",
+    "lane": "ln",
+    "north": "n",
+    "northeast": "ne",
+    "northwest": "nw",
+    "parkway": "pkwy",
+    "place": "pl",
+    "road": "rd",
+    "room": "rm",
+    "route": "rte",
+    "saint": "st",
+    "south": "s",
+    "southeast": "se",
+    "southwest": "sw",
+    "square": "sq",
+    "street": "st",
+    "suite": "ste",
+    "terrace": "ter",
+    "trail": "trl",
+    "west": "w",
+}
+
 AUTH_SERVICE = "AuthService"
 
+BULK_INSERT_COPY = "copy"
+BULK_INSERT_ORM = "orm"
+BULK_INSERT_RETURNING = "returning"
+
+COUNT_ESTIMATE = "estimate"
+COUNT_EXACT = "exact"
+COUNT_NONE = "none"
+COUNT_WINDOW = "window"
+COUNT_WINDOW_LABEL = "_window_total"
+
 DOLLAR = "dollar"
 
 EMAILS_CREATE_SERVICE = "EmailsCreateService"
@@ -55,6 +100,11 @@ ENTITY_NON_INDIVIDUAL = "non-individual"
 ENTITY_PARENT = "entity"
 ENTITY_UUID = "uuid"
 
+FORMAT_CSV = "csv"
+FORMAT_CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+FORMAT_NDJSON = "ndjson"
+FORMAT_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 INDIVIDUALS_CREATE_SERV = "IndividualsCreateService"
 INDIVIDUALS_DEL_SERV = "IndividualsDelService"
 INDIVIDUALS_READ_SERV = "IndividualsReadService"
@@ -70,6 +120,13 @@ INVOICES_DEL_SERV = "InvoicesDelService"
 INVOICES_READ_SERV = "InvoicesReadService"
 INVOICES_UPDATE_SERV = "InvoicesUpdateService"
 
+# Parts of the lookup keys shared by the SQL expressions of the models and the
+# normalization of the looked up values.
+LOOKUP_COUNTRY_CODE = "1"
+LOOKUP_DOMAIN_PATTERN = r"^(?:[a-z][a-z0-9+.-]*://)?(?:www\.)?([^/:?#]+)"
+
+LOOKUP_READ_SERVICE = "LookupReadService"
+
 NON_INDIVIDUALS_CREATE_SERV = "NonIndividualsCreateService"
 NON_INDIVIDUALS_DEL_SERV = "NonIndividualsDelService"
 NON_INDIVIDUALS_READ_SERV = "NonIndividualsReadService"
@@ -93,6 +150,8 @@ ORDERS_DEL_SERVICE = "OrdersDelService"
 ORDERS_READ_SERVICE = "OrdersReadService"
 ORDERS_UPDATE_SERVICE = "OrdersUpdateService"
 
+OVERVIEWS_READ_SERVICE = "OverviewsReadService"
+
 PERCENTAGE = "percentage"
 
 PRODUCT_LIST_ITEMS_CREATE_SERV = "ProductListItemsCreateService"
@@ -110,6 +169,14 @@ PRODUCTS_DEL_SERV = "ProductsDelService"
 PRODUCTS_READ_SERV = "ProductsReadService"
 PRODUCTS_UPDATE_SERV = "ProductsUpdateService"
 
+SEARCH_READ_SERVICE = "SearchReadService"
+
+SQL_LOG_ALL = "all"
+SQL_LOG_OFF = "off"
+SQL_LOG_SAMPLED = "sampled"
+SQL_LOG_SLOW = "slow"
+SQL_SERVICE_OPTION = "crm_service"
+
 TAG_ACCOUNT_ADDRESSES = "Account-Addresses"
 TAG_ACCOUNT_CONTRACTS = "Account-Contracts"
 TAG_ACCOUNT_ENTITIES = "Account-Entities"
@@ -121,6 +188,7 @@ TAG_SYS_USER = "Users"
 TAG_ENTITY_ACCOUNTS = "Entity-Accounts"
 TAG_ENTITY_ADDRESSES = "Entity-Addresses"
 TAG_ENTITY_EMAILS = "Entity-Emails"
+TAG_ENTITY_LOOKUP = "Entity-Lookup"
 TAG_ENTITY_MANAGEMENT = "Entity-Management"
 TAG_ENTITY_NUMBERS = "Entity-Numbers"
 TAG_ENTITY_WEBSITES = "Entity-Websites"
@@ -128,6 +196,7 @@ TAG_INDIVIDUAL = "Individual"
 TAG_INVOICE_ITEMS = "Invoice-Items"
 TAG_INVOICES = "Invoices"
 TAG_LOGIN = "Login"
+TAG_METRICS = "Metrics"
 TAG_NON_INDIVIDUAL = "Non-Individual"
 TAG_ORDERS_ITEMS = "Order-Items"
 TAG_ORDERS = "Orders"
@@ -137,11 +206,35 @@ TAG_PRODUCTS = "Products"
 TAG_SIGN_UP = "Sign-up"
 TAG_ENTITY_MANAGEMENT = "Entity-Management"
 
+TIMING_AUTH = "auth"
+TIMING_DB = "db"
+TIMING_HANDLER = "handler"
+TIMING_ORCH = "orch"
+TIMING_SERIALIZE = "serialize"
+TIMING_TOTAL = "total"
+
+
+TRUTHY_VALUES = ("1", "true", "yes")
 
 TOKEN_TYPE = "bearer"
 TOKEN_KEY = "jwt"
 TOKEN_URL = "/v1/system-management/login/"
 
+READ_PRIMARY_HEADER = "x-read-primary"
+
+SERVER_TIMING_HEADER = "server-timing"
+
+CACHE_CONTROL_HEADER = "cache-control"
+CACHE_CONTROL_REVALIDATE = "private, no-cache"
+ETAG_HEADER = "etag"
+IF_MODIFIED_SINCE_HEADER = "if-modified-since"
+IF_NONE_MATCH_HEADER = "if-none-match"
+LAST_MODIFIED_HEADER = "last-modified"
+
+METRICS_UNMATCHED_ROUTE = "unmatched"
+
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
+
 SCHEMAS = ["sales"]
 
 SYS_USER_CREATE_SERV = "SysUserCreateService"
@@ -8,6 +8,31 @@ class ItemAdjustmentType(str, Enum):
     PERCENTAGE = cnst.PERCENTAGE
 
 
+class BulkInsertMode(str, Enum):
+    COPY = cnst.BULK_INSERT_COPY
+    ORM = cnst.BULK_INSERT_ORM
+    RETURNING = cnst.BULK_INSERT_RETURNING
+
+
+class CountStrategy(str, Enum):
+    ESTIMATE = cnst.COUNT_ESTIMATE
+    EXACT = cnst.COUNT_EXACT
+    NONE = cnst.COUNT_NONE
+    WINDOW = cnst.COUNT_WINDOW
+
+
+class DataFormat(str, Enum):
+    CSV = cnst.FORMAT_CSV
+    NDJSON = cnst.FORMAT_NDJSON
+
+
+class SqlLogMode(str, Enum):
+    ALL = cnst.SQL_LOG_ALL
+    OFF = cnst.SQL_LOG_OFF
+    SAMPLED = cnst.SQL_LOG_SAMPLED
+    SLOW = cnst.SQL_LOG_SLOW
+
+
 class EntityTypes(str, Enum):
     ENTITY_INDIVIDUAL = cnst.ENTITY_INDIVIDUAL
     ENTITY_NON_INDIVIDUAL = cnst.ENTITY_NON_INDIVIDUAL
@@ -32,6 +32,10 @@ ENTTIY_TYPE_INVALID = "entity_type_invalid"
 
 INVALID_CREDENTIALS = "invalid_credentials"
 
+INVALID_CURSOR = "invalid_cursor"
+
+METRICS_CLIENT_NOT_ALLOWED = "metrics_client_not_allowed"
+
 INDIVIDUAL_NOT_EXIST = "individual_not_exist"
 INDIVIDUAL_EXISTS = "individual_exists"
 
@@ -41,6 +45,8 @@ INVOICE_ITEM_EXISTS = "invoie_item_exists"
 INVOICE_NOT_EXIST = "invoice_not_exist"
 INVOICE_EXISTS = "invoice_exists"
 
+LOOKUP_KEY_INVALID = "lookup_key_invalid"
+
 NON_INDIVIDUAL_NOT_EXIST = "non_individual_not_exist"
 NON_INDIVIDUAL_EXISTS = "non_individual_exists"
 
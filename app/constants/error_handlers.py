@@ -93,6 +93,13 @@ handlers = {
             "message": msg.INVALID_CREDENTIALS,
             "allow_registration": True,
         },
+        {
+            "class": MetricsClientNotAllowed,
+            "error_code": err.METRICS_CLIENT_NOT_ALLOWED,
+            "status_code": status.HTTP_403_FORBIDDEN,
+            "message": msg.METRICS_CLIENT_NOT_ALLOWED,
+            "allow_registration": True,
+        },
     ],
     "emails": [
         {
@@ -153,6 +160,13 @@ handlers = {
             "message": msg.ENTITY_TYPE_INVALID,
             "allow_registration": True,
         },
+        {
+            "class": LookupKeyInvalid,
+            "error_code": err.LOOKUP_KEY_INVALID,
+            "status_code": status.HTTP_400_BAD_REQUEST,
+            "message": msg.LOOKUP_KEY_INVALID,
+            "allow_registration": True,
+        },
     ],
     "entity_accounts": [
         {
@@ -346,6 +360,15 @@ handlers = {
             "allow_registration": True,
         },
     ],
+    "pagination": [
+        {
+            "class": InvalidCursor,
+            "error_code": err.INVALID_CURSOR,
+            "status_code": status.HTTP_400_BAD_REQUEST,
+            "message": msg.INVALID_CURSOR,
+            "allow_registration": True,
+        },
+    ],
     "unhandled": [
         {
             "class": UnhandledException,
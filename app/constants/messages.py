@@ -35,17 +35,26 @@ ENTITY_NON_INDIV_DATA_INVALID = (
 
 ENTITY_TYPE_INVALID = "entity_type is invalid."
 
+IMPORT_ROW_MALFORMED = "Row could not be parsed."
+IMPORT_ROW_NOT_WRITTEN = "Row could not be written, it references a missing record or holds an invalid value."
+
 INDIVIDUAL_NOT_EXIST = f"Individual {_RECORD_NOT_EXIST}"
 INDIVIDUAL_EXISTS = f"Individual {_RECORD_EXISTS}"
 
 INVALID_CREDENTIALS = "Invalid credentials."
 
+INVALID_CURSOR = "cursor is invalid, use the next_cursor value of a previous page."
+
+METRICS_CLIENT_NOT_ALLOWED = "Client is not allowed to read metrics."
+
 INVOICE_ITEM_NOT_EXIST = f"Invoice item {_RECORD_NOT_EXIST}"
 INVOICE_ITEM_EXISTS = f"Invoice item {_RECORD_EXISTS}"
 
 INVOICE_NOT_EXIST = f"Invoice {_RECORD_NOT_EXIST}"
 INVOICE_EXISTS = f"Invoice {_RECORD_EXISTS}"
 
+LOOKUP_KEY_INVALID = "Provide exactly one valid email, phone or domain to look up."
+
 NON_INDIVIDUAL_NOT_EXIST = f"Non-Individual {_RECORD_NOT_EXIST}"
 NON_INDIVIDUAL_EXISTS = f"Non-Individual {_RECORD_EXISTS}"
 
@@ -67,6 +76,8 @@ PRODUCT_LIST_EXISTS = f"Product list {_RECORD_EXISTS}"
 PRODUCT_NOT_EXIST = f"Product {_RECORD_NOT_EXIST}"
 PRODUCT_EXISTS = f"Product {_RECORD_EXISTS}"
 
+SCHEMA_OUT_OF_DATE = "Database schema is not at the latest migration, run `alembic -c app/alembic.ini upgrade head`."
+
 SYS_USER_NOT_EXIST = f"Sys user {_RECORD_NOT_EXIST}"
 SYS_USER_EXISTS = f"Sys user credential combination invalid."
 
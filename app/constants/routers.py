@@ -16,6 +16,8 @@ from ..routes.v1.individuals import router as individuals_router
 from ..routes.v1.invoice_items import router as invoice_items_router
 from ..routes.v1.invoices import router as invoices_router
 from ..routes.v1.login import router as login_router
+from ..routes.v1.lookup import router as lookup_router
+from ..routes.v1.metrics import router as metrics_router
 from ..routes.v1.non_individuals import router as non_individuals_router
 from ..routes.v1.numbers import router as numbers_router
 from ..routes.v1.order_items import router as order_items_router
@@ -23,6 +25,7 @@ from ..routes.v1.orders import router as orders_router
 from ..routes.v1.product_list_items import router as product_list_items_router
 from ..routes.v1.product_lists import router as product_lists_router
 from ..routes.v1.products import router as products_router
+from ..routes.v1.prometheus import router as prometheus_router
 from ..routes.v1.signup import router as signup_router
 from ..routes.v1.sys_users import router as sys_users_router
 from ..routes.v1.websites import router as websites_router
@@ -100,6 +103,20 @@ routers = {
             "generate_unique_id": generate_unique_id,
             "allow_registration": True,
         },
+        {
+            "name": "lookup_router",
+            "router": lookup_router,
+            "prefix": "/v1/entity-management/lookup",
+            "tags": [cnst.TAG_ENTITY_LOOKUP],
+            "dependencies": None,
+            "responses": None,
+            "deprecated": False,
+            "include_in_schema": True,
+            "default_response_class": JSONResponse,
+            "callbacks": None,
+            "generate_unique_id": generate_unique_id,
+            "allow_registration": True,
+        },
         {
             "name": "individuals_router",
             "router": individuals_router,
@@ -380,5 +397,33 @@ routers = {
             "generate_unique_id": generate_unique_id,
             "allow_registration": True,
         },
+        {
+            "name": "metrics_router",
+            "router": metrics_router,
+            "prefix": "/v1/system-management/metrics",
+            "tags": [cnst.TAG_METRICS],
+            "dependencies": None,
+            "responses": None,
+            "deprecated": False,
+            "include_in_schema": True,
+            "default_response_class": JSONResponse,
+            "callbacks": None,
+            "generate_unique_id": generate_unique_id,
+            "allow_registration": True,
+        },
+        {
+            "name": "prometheus_router",
+            "router": prometheus_router,
+            "prefix": "",
+            "tags": [cnst.TAG_METRICS],
+            "dependencies": None,
+            "responses": None,
+            "deprecated": False,
+            "include_in_schema": False,
+            "default_response_class": JSONResponse,
+            "callbacks": None,
+            "generate_unique_id": generate_unique_id,
+            "allow_registration": True,
+        },
     ]
 }
@@ -33,13 +33,16 @@ from ..services import entities as entities_srvcs
 from ..services import individuals as individuals_srvcs
 from ..services import invoice_items as invoice_items_srvcs
 from ..services import invoices as invoices_srvcs
+from ..services import lookup as lookup_srvcs
 from ..services import non_individuals as non_individual_srvcs
 from ..services import numbers as numbers_srvcs
 from ..services import order_items as order_items_srvcs
 from ..services import orders as orders_srvcs
+from ..services import overviews as overviews_srvcs
 from ..services import product_list_items as product_list_items_srvcs
 from ..services import product_lists as product_lists_srvcs
 from ..services import products as products_srvcs
+from ..services import search as search_srvcs
 from ..services import sys_users as sys_users_srvcs
 from ..services import websites as websites_srvcs
 
@@ -106,6 +109,8 @@ class ServicesContainer(TypedDict):
     invoices_read: invoices_srvcs.ReadSrvc
     invoices_update: invoices_srvcs.UpdateSrvc
     invoices_delete: invoices_srvcs.DelSrvc
+    # lookup services
+    lookup_read: lookup_srvcs.ReadSrvc
     # non-individual services
     non_individuals_create: non_individual_srvcs.CreateSrvc
     non_individuals_read: non_individual_srvcs.ReadSrvc
@@ -126,6 +131,8 @@ class ServicesContainer(TypedDict):
     orders_read: orders_srvcs.ReadSrvc
     orders_update: orders_srvcs.UpdateSrvc
     orders_delete: orders_srvcs.DelSrvc
+    # overviews services
+    overviews_read: overviews_srvcs.ReadSrvc
     # product list items services
     product_list_items_create: product_list_items_srvcs.CreateSrvc
     product_list_items_read: product_list_items_srvcs.ReadSrvc
@@ -141,6 +148,8 @@ class ServicesContainer(TypedDict):
     products_read: products_srvcs.ReadSrvc
     products_update: products_srvcs.UpdateSrvc
     products_delete: products_srvcs.DelSrvc
+    # search services
+    search_read: search_srvcs.ReadSrvc
     # sys_users services
     sys_users_create: sys_users_srvcs.CreateSrvc
     sys_users_read: sys_users_srvcs.ReadSrvc
@@ -160,7 +169,7 @@ container: ServicesContainer = {
         db_operations=database_container["operations"](), model=AccountContracts
     ),
     "account_contracts_read": lambda: account_contracts_srvcs.ReadSrvc(
-        operationsdb_operations=database_container["operations"](),
+        db_operations=database_container["operations"](),
         statements=statements_container["account_contracts_stms"](),
     ),
     "account_contracts_update": lambda: account_contracts_srvcs.UpdateSrvc(
@@ -177,7 +186,7 @@ container: ServicesContainer = {
         statements=statements_container["account_lists_stms"](),
         db_operations=database_container["operations"](),
     ),
-    "account_lists_read": lambda: account_lists_srvcs.ReadSrvcSrvc(
+    "account_lists_read": lambda: account_lists_srvcs.ReadSrvc(
         statements=statements_container["account_lists_stms"](),
         db_operations=database_container["operations"](),
     ),
@@ -349,6 +358,11 @@ container: ServicesContainer = {
         statements=statements_container["invoice_stms"](),
         db_operations=database_container["operations"](),
     ),
+    # lookup services
+    "lookup_read": lambda: lookup_srvcs.ReadSrvc(
+        statements=statements_container["lookup_stms"](),
+        db_operations=database_container["operations"](),
+    ),
     # non-individual services
     "non_individuals_create": lambda: non_individual_srvcs.CreateSrvc(
         statements=statements_container["non_individuals"](),
@@ -419,6 +433,11 @@ container: ServicesContainer = {
         statements=statements_container["orders_stms"](),
         db_operations=database_container["operations"](),
     ),
+    # overviews services
+    "overviews_read": lambda: overviews_srvcs.ReadSrvc(
+        statements=statements_container["overviews_stms"](),
+        db_operations=database_container["operations"](),
+    ),
     # product list items services
     "product_list_items_create": lambda: product_list_items_srvcs.CreateSrvc(
         statements=statements_container["product_list_items_stms"](),
@@ -473,6 +492,11 @@ container: ServicesContainer = {
         statements=statements_container["products_stms"](),
         db_operations=database_container["operations"](),
     ),
+    # search services
+    "search_read": lambda: search_srvcs.ReadSrvc(
+        statements=statements_container["search_stms"](),
+        db_operations=database_container["operations"](),
+    ),
     # sys_users services
     "sys_users_create": lambda: sys_users_srvcs.CreateSrvc(
         statements=statements_container["sys_users_stms"](),
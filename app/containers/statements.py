@@ -33,13 +33,16 @@ from ..statements.entities import EntitiesStms
 from ..statements.individuals import IndividualsStms
 from ..statements.invoice_items import InvoiceItemsStms
 from ..statements.invoices import InvoicesStms
+from ..statements.lookup import LookupStms
 from ..statements.non_individuals import NonIndivididualsStms
 from ..statements.numbers import NumbersStms
 from ..statements.order_items import OrderItemsStms
 from ..statements.orders import OrdersStms
+from ..statements.overviews import OverviewsStms
 from ..statements.product_list_items import ProductListItemsStms
 from ..statements.product_lists import ProductListsStms
 from ..statements.products import ProductsStms
+from ..statements.search import SearchStms
 from ..statements.sys_users import SysUsersStms
 from ..statements.websites import WebsitesStms
 
@@ -62,12 +65,15 @@ class StatementsContainer(TypedDict):
     individuals_stms: IndividualsStms
     invoice_items_stms: InvoiceItemsStms
     invoice_stms: InvoicesStms
+    lookup_stms: LookupStms
     non_individuals: NonIndivididualsStms
     numbers_stms: NumbersStms
     order_items_stms: OrderItemsStms
     orders_stms: OrdersStms
+    overviews_stms: OverviewsStms
     product_lists: ProductListsStms
     products_stms: ProductsStms
+    search_stms: SearchStms
     sys_users_stms: SysUsersStms
     websites_stms: Websites
     product_list_items_stms: ProductListItems
@@ -76,24 +82,64 @@ class StatementsContainer(TypedDict):
 # Container for initializing statements classes and injecting their dependencies.
 container: StatementsContainer = {
     "account_contracts_stms": lambda: AccountContractStms(model=AccountContracts),
-    "account_lists_stms": lambda: AccountListsStms(model=AccountLists),
-    "account_products_stms": lambda: AccountProductsStms(model=AccountProducts),
+    "account_lists_stms": lambda: AccountListsStms(
+        model=AccountLists, product_lists=ProductLists
+    ),
+    "account_products_stms": lambda: AccountProductsStms(
+        model=AccountProducts, products=Products
+    ),
     "accounts_stms": lambda: AccountsStms(model=Accounts),
     "addresses_stms": lambda: AddressesStms(model=Addresses),
     "emails_stms": lambda: EmailsStms(model=Emails),
-    "entity_accounts_stms": lambda: EntityAccountsStms(model=EntityAccounts),
+    "entity_accounts_stms": lambda: EntityAccountsStms(
+        model=EntityAccounts,
+        accounts=Accounts,
+        entities=Entities,
+        individuals=Individuals,
+        non_individuals=NonIndividuals,
+    ),
     "entites_stms": lambda: EntitiesStms(
         entities=Entities, individuals=Individuals, non_individuals=NonIndividuals
     ),
     "individuals_stms": lambda: IndividualsStms(model=Individuals),
     "invoice_items_stms": lambda: InvoiceItemsStms(model=InvoiceItems),
     "invoice_stms": lambda: InvoicesStms(model=Invoices),
+    "lookup_stms": lambda: LookupStms(
+        entities=Entities,
+        individuals=Individuals,
+        non_individuals=NonIndividuals,
+        emails=Emails,
+        numbers=Numbers,
+        websites=Websites,
+    ),
     "non_individuals": lambda: NonIndivididualsStms(model=NonIndividuals),
     "numbers_stms": lambda: NumbersStms(model=Numbers),
     "order_items_stms": lambda: OrderItemsStms(model=OrderItems),
     "orders_stms": lambda: OrdersStms(model=Orders),
+    "overviews_stms": lambda: OverviewsStms(
+        accounts=Accounts,
+        account_contracts=AccountContracts,
+        account_lists=AccountLists,
+        account_products=AccountProducts,
+        addresses=Addresses,
+        emails=Emails,
+        entities=Entities,
+        entity_accounts=EntityAccounts,
+        individuals=Individuals,
+        non_individuals=NonIndividuals,
+        numbers=Numbers,
+        product_lists=ProductLists,
+        products=Products,
+        websites=Websites,
+    ),
     "product_lists": lambda: ProductListsStms(model=ProductLists),
     "products_stms": lambda: ProductsStms(model=Products),
+    "search_stms": lambda: SearchStms(
+        entities=Entities,
+        individuals=Individuals,
+        non_individuals=NonIndividuals,
+        products=Products,
+    ),
     "websites_stms": lambda: WebsitesStms(model=Websites),
     "sys_users_stms": lambda: SysUsersStms(model=SysUsers),
     "product_list_items_stms": lambda: ProductListItemsStms(model=ProductListItems),
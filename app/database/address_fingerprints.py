@@ -0,0 +1,120 @@
+"""
+Backfill of the fingerprint of addresses created before it existed.
+
+Addresses are read in batches of `backfill_batch_size`, in id order, and every batch is
+fingerprinted and committed in its own transaction so no lock is held for long. An
+address that is not soft deleted and whose fingerprint is already taken by another
+address of its parent is a duplicate, it is left without a fingerprint and reported so
+it can be merged or deleted before the command is run again.
+
+Run against a database migrated with the `address fingerprints` migration with:
+
+    python -m app.database.address_fingerprints
+"""
+
+import asyncio
+import sys
+from typing import Dict, List, Set, Tuple
+
+from pydantic import UUID4
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings as set
+
+from ..containers.statements import container as stms
+from ..statements.addresses import AddressesStms
+from ..utilities.addresses import address_fingerprint
+from .database import LocalAsyncSession
+
+
+async def backfill_batch(
+    statements: AddressesStms, after: int, limit: int, db: AsyncSession
+) -> Tuple[int, int, List[UUID4]]:
+    """
+    Fingerprints one batch of addresses.
+
+    :param statements: AddressesStms: the addresses statements
+    :param after: int: the id of the last address of the previous batch
+    :param limit: int: the number of addresses of the batch
+    :param db: AsyncSession: the database session
+    :return: Tuple[int, int, List[UUID4]]: the id of the last address read, the number of
+        addresses updated and the UUIDs of the duplicates left without a fingerprint
+    """
+    result = await db.execute(
+        statements.get_addresses_without_fingerprint(after=after, limit=limit)
+    )
+    rows = result.all()
+    if not rows:
+        return after, 0, []
+    fingerprints: Dict[int, str] = {
+        row.id: address_fingerprint(
+            address_line1=row.address_line1,
+            address_line2=row.address_line2,
+            city=row.city,
+            zip=row.zip,
+        )
+        for row in rows
+    }
+    # Only addresses that are not soft deleted are held unique by the index.
+    keys = [
+        (row.parent_uuid, fingerprints[row.id])
+        for row in rows
+        if row.sys_deleted_at is None
+    ]
+    taken: Set[Tuple[UUID4, str]] = {
+        tuple(key)
+        for key in (
+            await db.execute(statements.get_fingerprints(keys=keys)) if keys else []
+        )
+    }
+    values = []
+    duplicates = []
+    for row in rows:
+        key = (row.parent_uuid, fingerprints[row.id])
+        if row.sys_deleted_at is None:
+            if key in taken:
+                duplicates.append(row.uuid)
+                continue
+            taken.add(key)
+        values.append({"id": row.id, "fingerprint": fingerprints[row.id]})
+    if values:
+        await db.execute(statements.update_fingerprints(), values)
+    return rows[-1].id, len(values), duplicates
+
+
+async def backfill(db: AsyncSession, batch_size: int) -> List[UUID4]:
+    """
+    Fingerprints every address without one, one transaction per batch.
+
+    :param db: AsyncSession: the database session
+    :param batch_size: int: the number of addresses per batch
+    :return: List[UUID4]: the UUIDs of the duplicates left without a fingerprint
+    """
+    statements: AddressesStms = stms["addresses_stms"]()
+    after = 0
+    updated = 0
+    duplicates: List[UUID4] = []
+    while True:
+        async with db.begin():
+            last, count, skipped = await backfill_batch(
+                statements=statements, after=after, limit=batch_size, db=db
+            )
+        if last == after:
+            break
+        after = last
+        updated += count
+        duplicates.extend(skipped)
+        print(f"ok   addresses up to id {after}: {updated} fingerprinted")
+    for uuid in duplicates:
+        print(f"FAIL address {uuid}: duplicate of another address of its parent")
+    return duplicates
+
+
+async def main() -> int:
+    async with LocalAsyncSession() as db:
+        duplicates = await backfill(db=db, batch_size=set.backfill_batch_size)
+    return 1 if duplicates else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,16 +1,71 @@
 from contextlib import asynccontextmanager
-from typing import List
+from itertools import cycle
 from config import settings as set
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base
 
+from ..constants import constants as cnst
+from .pool import InstrumentedAsyncQueuePool
+from .query_log import instrument_engine
+
 # Connection string for database connection.
 connection_string = f"{set.db_connector}://{set.db_usrnm}:{set.db_pwd}@{set.db_hst}:{set.db_port}/{set.db_nm}"
 
+# Connection strings for read replicas, "host" or "host:port" entries share the primary credentials.
+read_connection_strings = [
+    f"{set.db_connector}://{set.db_usrnm}:{set.db_pwd}@{host if ':' in host else f'{host}:{set.db_port}'}/{set.db_nm}"
+    for host in (host.strip() for host in set.db_read_hsts.split(","))
+    if host
+]
+
+# asyncpg caches prepared statements per connection, set to 0 when running behind pgbouncer.
+connect_args = (
+    {
+        "prepared_statement_cache_size": set.db_statement_cache_size,
+        "statement_cache_size": set.db_statement_cache_size,
+    }
+    if "asyncpg" in set.db_connector
+    else {}
+)
+
+
+def create_pooled_engine(url: str) -> AsyncEngine:
+    """
+    Creates an asynchronous engine with the configured, instrumented connection pool.
+
+    Statements are logged according to `SQL_LOG_MODE`, see `query_log`.
+
+    :param url: The connection string of the database server.
+    :type url: str
+    :return: The asynchronous engine.
+    :rtype: AsyncEngine
+    """
+    engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=set.db_pool_size,
+        max_overflow=set.db_max_overflow,
+        pool_pre_ping=set.db_pool_pre_ping,
+        pool_recycle=set.db_pool_recycle,
+        pool_timeout=set.db_pool_timeout,
+        connect_args=connect_args,
+    )
+    instrument_engine(engine=engine)
+    return engine
+
+
 try:
-    # Create asynchronous engine for the database connection.
-    async_engine = create_async_engine(connection_string, echo=True)
+    # Create asynchronous engines for the primary and read replica connections.
+    async_engine = create_pooled_engine(url=connection_string)
+    async_read_engines = [
+        create_pooled_engine(url=url) for url in read_connection_strings
+    ]
     print("connection made asynchronously")
 except:
     print("ConnectionError")
@@ -20,73 +75,134 @@ LocalAsyncSession = async_sessionmaker(
     bind=async_engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# Factory for sessions on the primary whose transactions begin as `READ ONLY`.
+LocalAsyncReadOnlySession = async_sessionmaker(
+    bind=async_engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+# Factories for read replica sessions, falls back to the primary when no replica is configured.
+# Transactions begin as `READ ONLY` once a connection is first used, not when the session opens.
+LocalAsyncReadSessions = [
+    async_sessionmaker(
+        bind=engine.execution_options(postgresql_readonly=True),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    for engine in async_read_engines
+] or [LocalAsyncReadOnlySession]
+_read_session_cycle = cycle(LocalAsyncReadSessions)
+
 # Base class for SQLAlchemy models.
 Base = declarative_base()
 
 
-async def init_db_tables(model: object):
+async def get_unit_of_work(request: Request):
     """
-    Initializes database tables based on the provided model.
+    Provides the session and transaction shared by everything handling a request.
+
+    One transaction is opened per request and committed when the handler returns, or
+    rolled back when it raises. Session validation and the path operation both resolve
+    their session through this dependency, so they run in the same transaction.
 
-    This function creates all the tables defined in the SQLAlchemy model's `Base.metadata`.
+    Safe methods are served by a read replica, selected round-robin, inside a
+    `BEGIN READ ONLY` transaction. A request carrying the read-primary header is served
+    by the primary instead, keeping read-your-writes for clients that just issued a write.
 
-    :param model: The SQLAlchemy model class that defines the table structure.
-    :type model: object
-    :return: None
-    :raises: SQLAlchemy exceptions if there is an issue with creating tables.
+    :param request: The incoming request.
+    :type request: Request
+    :return: The database session.
+    :rtype: AsyncSession
+    :raises: SQLAlchemy exceptions if there is an issue with session creation.
     """
-    async with async_engine.begin() as conn:
-        await conn.run_sync(model.Base.metadata.create_all)
+    read_only = request.method in cnst.READ_ONLY_METHODS
+    read_primary = (
+        request.headers.get(cnst.READ_PRIMARY_HEADER, "").lower() in cnst.TRUTHY_VALUES
+    )
+    if not read_only:
+        session_factory = LocalAsyncSession
+    elif read_primary:
+        session_factory = LocalAsyncReadOnlySession
+    else:
+        session_factory = next(_read_session_cycle)
+    async with session_factory() as db:
+        async with db.begin():
+            yield db
 
 
-async def init_db_table_schema(schema: str):
+async def get_db(db: AsyncSession = Depends(get_unit_of_work)):
     """
-    Initializes a database schema if it does not already exist.
-
-    This function checks if a schema exists, and if not, creates the schema in the database.
+    Provides the request session for database operations.
 
-    :param schema: The name of the schema to create.
-    :type schema: str
-    :return: None
-    :raises: SQLAlchemy exceptions if there is an issue with schema creation.
+    :param db: The session of the request unit of work.
+    :type db: AsyncSession
+    :return: The database session.
+    :rtype: AsyncSession
     """
-    async with async_engine.begin() as conn:
-        stm = f"create schema if not exists {schema};"
-        await conn.execute(text(stm))
-        await conn.commit()
+    return db
 
 
-async def init_db_table_schema_factory(schemas: List[str]):
+async def get_read_db(db: AsyncSession = Depends(get_unit_of_work)):
     """
-    Initializes multiple database schemas.
+    Provides the request session for read-only operations.
 
-    This function iterates over a list of schema names and creates each schema if it does not exist.
+    The session is bound to a read replica for safe methods, see `get_unit_of_work`.
 
-    :param schemas: A list of schema names to create.
-    :type schemas: List[str]
-    :return: None
-    :raises: SQLAlchemy exceptions if there is an issue with schema creation.
+    :param db: The session of the request unit of work.
+    :type db: AsyncSession
+    :return: The database session.
+    :rtype: AsyncSession
     """
-    for schema in schemas:
-        await init_db_table_schema(schema=schema)
+    return db
 
 
-async def get_db():
+@asynccontextmanager
+async def batch_session():
     """
-    Provides a session for database operations.
+    Provides a primary session committing on its own, apart from the request unit of work.
 
-    This is an asynchronous generator that yields a database session object for use in operations,
-    ensuring proper session closure when done.
+    Long running writes, such as imports, commit in bounded batches with one of these
+    sessions per batch instead of holding one transaction for the whole request.
 
-    :return: The database session.
+    :yield: The database session, inside a transaction committed on exit.
     :rtype: AsyncSession
-    :raises: SQLAlchemy exceptions if there is an issue with session creation.
     """
     async with LocalAsyncSession() as db:
-        try:
+        async with db.begin():
+            yield db
+
+
+@asynccontextmanager
+async def stream_session():
+    """
+    Provides a read-only replica session outliving the request unit of work.
+
+    Streaming responses are written after the path operation returned and the request
+    session closed, so they read through a session of their own.
+
+    :yield: The database session, inside a `READ ONLY` transaction.
+    :rtype: AsyncSession
+    """
+    async with next(_read_session_cycle)() as db:
+        async with db.begin():
+            yield db
+
+
+@asynccontextmanager
+async def primary_read_session():
+    """
+    Provides a read-only primary session apart from the request unit of work.
+
+    Reads whose result outlives the request, such as the answers of the catalog cache,
+    go to the primary so a replica lagging behind a write is never cached.
+
+    :yield: The database session, inside a `READ ONLY` transaction.
+    :rtype: AsyncSession
+    """
+    async with LocalAsyncReadOnlySession() as db:
+        async with db.begin():
             yield db
-        finally:
-            await db.close()
 
 
 @asynccontextmanager
@@ -95,7 +211,9 @@ async def transaction_manager(db: AsyncSession):
     Manages database transactions for a given session.
 
     This context manager starts a transaction, yields the session for use in operations,
-    and commits or rolls back the transaction depending on the outcome.
+    and commits or rolls back the transaction depending on the outcome. A session that is
+    already in a transaction, such as the request unit of work, is yielded as is and the
+    outer transaction decides the outcome.
 
     :param db: The database session to manage transactions.
     :type db: AsyncSession
@@ -103,5 +221,8 @@ async def transaction_manager(db: AsyncSession):
     :rtype: AsyncSession
     :raises: SQLAlchemy exceptions if there is an issue with transaction management.
     """
+    if db.in_transaction():
+        yield db
+        return
     async with db.begin():
         yield db
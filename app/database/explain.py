@@ -0,0 +1,404 @@
+"""
+Index usage check for the statements that read records which are not soft deleted.
+
+Every list, count and parent lookup statement is compiled with sample values and run
+through `EXPLAIN (FORMAT JSON)` with sequential scans disabled. A plan that still reads
+a table with a `Seq Scan` has no index able to serve the statement, so the check fails.
+
+Run against a migrated database with:
+
+    python -m app.database.explain
+"""
+
+import asyncio
+import json
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from sqlalchemy import Select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..containers.statements import container as stms
+from .database import LocalAsyncSession
+
+CURSOR = {"limit": 11, "offset": 0, "after": 1000}
+
+# Label and builder of every statement whose access path is covered by an `active_index`.
+STATEMENTS: List[Tuple[str, Callable[[], Select]]] = [
+    (
+        "account_contracts.get_account_contracts",
+        lambda: stms["account_contracts_stms"]().get_account_contracts(
+            account_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "account_contracts.account_contracts_count",
+        lambda: stms["account_contracts_stms"]().account_contracts_count(
+            account_uuid=uuid4()
+        ),
+    ),
+    (
+        "account_lists.get_account_lists_account",
+        lambda: stms["account_lists_stms"]().get_account_lists_account(
+            account_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "account_lists.get_account_list_count",
+        lambda: stms["account_lists_stms"]().get_account_list_count(
+            account_uuid=uuid4()
+        ),
+    ),
+    (
+        "account_lists.get_account_lists_joined",
+        lambda: stms["account_lists_stms"]().get_account_lists_joined(
+            account_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "account_lists.get_account_lists_joined_count",
+        lambda: stms["account_lists_stms"]().get_account_lists_joined_count(
+            account_uuid=uuid4()
+        ),
+    ),
+    (
+        "account_lists.get_account_lists_product_list",
+        lambda: stms["account_lists_stms"]().get_account_lists_product_list(
+            account_uuid=uuid4(), product_list_uuid=uuid4()
+        ),
+    ),
+    (
+        "account_products.get_account_products",
+        lambda: stms["account_products_stms"]().get_account_products(
+            account_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "account_products.get_account_products_ct",
+        lambda: stms["account_products_stms"]().get_account_products_ct(
+            account_uuid=uuid4()
+        ),
+    ),
+    (
+        "account_products.get_account_products_joined",
+        lambda: stms["account_products_stms"]().get_account_products_joined(
+            account_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "account_products.get_account_products_joined_ct",
+        lambda: stms["account_products_stms"]().get_account_products_joined_ct(
+            account_uuid=uuid4()
+        ),
+    ),
+    (
+        "account_products.validate_account_product",
+        lambda: stms["account_products_stms"]().validate_account_product(
+            account_uuid=uuid4(), product_uuid=uuid4()
+        ),
+    ),
+    (
+        "accounts.get_accounts",
+        lambda: stms["accounts_stms"]().get_accounts(**CURSOR),
+    ),
+    (
+        "addresses.get_address_by_entity",
+        lambda: stms["addresses_stms"]().get_address_by_entity(
+            parent_uuid=uuid4(), parent_table="entities", **CURSOR
+        ),
+    ),
+    (
+        "addresses.get_address_by_fingerprint",
+        lambda: stms["addresses_stms"]().get_address_by_fingerprint(
+            parent_uuid=uuid4(), fingerprint="0" * 64
+        ),
+    ),
+    (
+        "addresses.get_addresses_ct",
+        lambda: stms["addresses_stms"]().get_addresses_ct(
+            parent_uuid=uuid4(), parent_table="entities"
+        ),
+    ),
+    (
+        "emails.get_emails",
+        lambda: stms["emails_stms"]().get_emails(entity_uuid=uuid4(), **CURSOR),
+    ),
+    (
+        "emails.get_email_ct",
+        lambda: stms["emails_stms"]().get_email_ct(entity_uuid=uuid4()),
+    ),
+    (
+        "emails.get_email_by_email",
+        lambda: stms["emails_stms"]().get_email_by_email(
+            entity_uuid=uuid4(), email="name@example.com"
+        ),
+    ),
+    (
+        "entities.get_entities",
+        lambda: stms["entites_stms"]().get_entities(**CURSOR),
+    ),
+    (
+        "entity_accounts.get_entity_accounts",
+        lambda: stms["entity_accounts_stms"]().get_entity_accounts(
+            entity_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "entity_accounts.get_entity_account_ct",
+        lambda: stms["entity_accounts_stms"]().get_entity_account_ct(
+            entity_uuid=uuid4()
+        ),
+    ),
+    (
+        "entity_accounts.get_account_entities",
+        lambda: stms["entity_accounts_stms"]().get_account_entities(
+            account_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "entity_accounts.get_account_entities_ct",
+        lambda: stms["entity_accounts_stms"]().get_account_entities_ct(
+            account_uuid=uuid4()
+        ),
+    ),
+    (
+        "entity_accounts.get_entity_accounts_joined",
+        lambda: stms["entity_accounts_stms"]().get_entity_accounts_joined(
+            entity_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "entity_accounts.get_entity_accounts_joined_ct",
+        lambda: stms["entity_accounts_stms"]().get_entity_accounts_joined_ct(
+            entity_uuid=uuid4()
+        ),
+    ),
+    (
+        "entity_accounts.get_account_entities_joined",
+        lambda: stms["entity_accounts_stms"]().get_account_entities_joined(
+            account_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "entity_accounts.get_account_entities_joined_ct",
+        lambda: stms["entity_accounts_stms"]().get_account_entities_joined_ct(
+            account_uuid=uuid4()
+        ),
+    ),
+    (
+        "individuals.get_individual",
+        lambda: stms["individuals_stms"]().get_individual(entity_uuid=uuid4()),
+    ),
+    (
+        "individuals.get_individuals",
+        lambda: stms["individuals_stms"]().get_individuals(**CURSOR),
+    ),
+    (
+        "invoice_items.get_invoice_items",
+        lambda: stms["invoice_items_stms"]().get_invoice_items(
+            invoice_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "invoice_items.get_invoice_items_ct",
+        lambda: stms["invoice_items_stms"]().get_invoice_items_ct(invoice_uuid=uuid4()),
+    ),
+    (
+        "invoices.get_invoices",
+        lambda: stms["invoice_stms"]().get_invoices(**CURSOR),
+    ),
+    (
+        "invoices.get_invoices_by_order",
+        lambda: stms["invoice_stms"]().get_invoices_by_order(order_uuid=uuid4()),
+    ),
+    (
+        "lookup.get_entities_by_domain",
+        lambda: stms["lookup_stms"]().get_entities_by_domain(
+            domain="example.com", limit=11
+        ),
+    ),
+    (
+        "lookup.get_entities_by_email",
+        lambda: stms["lookup_stms"]().get_entities_by_email(
+            email="name@example.com", limit=11
+        ),
+    ),
+    (
+        "lookup.get_entities_by_phone",
+        lambda: stms["lookup_stms"]().get_entities_by_phone(
+            phone="15550100199", limit=11
+        ),
+    ),
+    (
+        "non_individuals.get_non_individual",
+        lambda: stms["non_individuals"]().get_non_individual(entity_uuid=uuid4()),
+    ),
+    (
+        "non_individuals.sel_non_indivs",
+        lambda: stms["non_individuals"]().sel_non_indivs(**CURSOR),
+    ),
+    (
+        "numbers.get_number_by_entity",
+        lambda: stms["numbers_stms"]().get_number_by_entity(
+            entity_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "numbers.get_number_by_entity_ct",
+        lambda: stms["numbers_stms"]().get_number_by_entity_ct(entity_uuid=uuid4()),
+    ),
+    (
+        "order_items.get_order_items",
+        lambda: stms["order_items_stms"]().get_order_items(
+            order_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "order_items.get_order_item_ct",
+        lambda: stms["order_items_stms"]().get_order_item_ct(order_uuid=uuid4()),
+    ),
+    (
+        "orders.get_orders",
+        lambda: stms["orders_stms"]().get_orders(**CURSOR),
+    ),
+    (
+        "product_list_items.get_product_list_items",
+        lambda: stms["product_list_items_stms"]().get_product_list_items(
+            product_list_uuid=uuid4(), **CURSOR
+        ),
+    ),
+    (
+        "product_list_items.get_product_list_items_ct",
+        lambda: stms["product_list_items_stms"]().get_product_list_items_ct(
+            product_list_uuid=uuid4()
+        ),
+    ),
+    (
+        "product_list_items.get_product_list_items_by_uuids",
+        lambda: stms["product_list_items_stms"]().get_product_list_items_by_uuids(
+            product_list_uuid=uuid4(), product_uuid_list=[uuid4(), uuid4()]
+        ),
+    ),
+    (
+        "product_lists.get_product_lists",
+        lambda: stms["product_lists"]().get_product_lists(**CURSOR),
+    ),
+    (
+        "product_lists.get_product_list_by_name",
+        lambda: stms["product_lists"]().get_product_list_by_name(
+            product_list_name="list"
+        ),
+    ),
+    (
+        "products.get_products",
+        lambda: stms["products_stms"]().get_products(**CURSOR),
+    ),
+    (
+        "products.get_products_by_name",
+        lambda: stms["products_stms"]().get_products_by_name(product_name="product"),
+    ),
+    (
+        "search.search_entities",
+        lambda: stms["search_stms"]().search_entities(
+            query="smith", limit=11, after=(0.5, 1000)
+        ),
+    ),
+    (
+        "search.search_products",
+        lambda: stms["search_stms"]().search_products(
+            query="product", limit=11, after=(0.5, 1000)
+        ),
+    ),
+    (
+        "sys_users.get_sys_users",
+        lambda: stms["sys_users_stms"]().get_sys_users(**CURSOR),
+    ),
+    (
+        "sys_users.get_sys_user_by_username",
+        lambda: stms["sys_users_stms"]().get_sys_user_by_username(username="user"),
+    ),
+    (
+        "websites.get_websites",
+        lambda: stms["websites_stms"]().get_websites(entity_uuid=uuid4(), **CURSOR),
+    ),
+    (
+        "websites.get_websites_ct",
+        lambda: stms["websites_stms"]().get_websites_ct(entity_uuid=uuid4()),
+    ),
+    (
+        "websites.get_website_by_url",
+        lambda: stms["websites_stms"]().get_website_by_url(
+            entity_uuid=uuid4(), website_name="https://example.com", db=None
+        ),
+    ),
+]
+
+
+def plan_nodes(plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flattens an `EXPLAIN (FORMAT JSON)` plan into its nodes.
+
+    :param plan: Dict[str, Any]: the plan node to flatten
+    :return: List[Dict[str, Any]]: the node and all of its children
+    """
+    nodes = [plan]
+    for child in plan.get("Plans", []):
+        nodes.extend(plan_nodes(plan=child))
+    return nodes
+
+
+async def explain(statement: Select, db: AsyncSession) -> List[Dict[str, Any]]:
+    """
+    Returns the plan nodes of a statement compiled with literal sample values.
+
+    :param statement: Select: the statement to explain
+    :param db: AsyncSession: the database session
+    :return: List[Dict[str, Any]]: the plan nodes
+    """
+    sql = statement.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    result = await db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan_nodes(plan=plan[0]["Plan"])
+
+
+async def check_index_scans(db: AsyncSession) -> List[str]:
+    """
+    Explains every registered statement and collects the ones reading a table sequentially.
+
+    Sequential scans are disabled for the transaction so the planner picks an index
+    whenever one can serve the statement, regardless of how small the tables are.
+
+    :param db: AsyncSession: the database session
+    :return: List[str]: labels of the statements without a usable index
+    """
+    failures = []
+    await db.execute(text("SET LOCAL enable_seqscan = off"))
+    for label, build in STATEMENTS:
+        nodes = await explain(statement=build(), db=db)
+        seq_scans = [
+            node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"
+        ]
+        indexes = sorted({node["Index Name"] for node in nodes if "Index Name" in node})
+        if seq_scans:
+            failures.append(label)
+            print(f"FAIL {label}: Seq Scan on {', '.join(seq_scans)}")
+        else:
+            print(f"ok   {label}: {', '.join(indexes)}")
+    return failures
+
+
+async def main() -> int:
+    async with LocalAsyncSession() as db:
+        failures = await check_index_scans(db=db)
+        await db.rollback()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
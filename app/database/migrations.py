@@ -0,0 +1,63 @@
+"""
+Schema version check run when the service starts.
+
+Tables, schemas and indexes are owned by the Alembic migrations in `app/alembic`, the
+service never creates them itself. On startup it only compares the revision recorded in
+the database with the head revision of the migration scripts and refuses to serve
+requests against a database that has not been migrated.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..constants.messages import SCHEMA_OUT_OF_DATE
+from ..exceptions import SchemaOutOfDate
+
+ALEMBIC_INI = Path(__file__).resolve().parents[1] / "alembic.ini"
+
+
+def head_revision() -> Optional[str]:
+    """
+    Returns the head revision of the migration scripts.
+
+    :return: The head revision identifier.
+    :rtype: Optional[str]
+    """
+    config = Config(str(ALEMBIC_INI))
+    return ScriptDirectory.from_config(config).get_current_head()
+
+
+def current_revision(connection: Connection) -> Optional[str]:
+    """
+    Returns the revision recorded in the `alembic_version` table of the database.
+
+    :param connection: A synchronous connection to the database.
+    :type connection: Connection
+    :return: The current revision identifier, None for a database that was never migrated.
+    :rtype: Optional[str]
+    """
+    return MigrationContext.configure(connection).get_current_revision()
+
+
+async def check_schema_version(engine: AsyncEngine) -> None:
+    """
+    Verifies that the database is migrated to the head revision.
+
+    :param engine: The engine of the primary database.
+    :type engine: AsyncEngine
+    :return: None
+    :raises SchemaOutOfDate: If the database revision is not the head revision.
+    """
+    expected = head_revision()
+    async with engine.connect() as conn:
+        current = await conn.run_sync(current_revision)
+    if current != expected:
+        raise SchemaOutOfDate(
+            f"{SCHEMA_OUT_OF_DATE} current: {current}, head: {expected}"
+        )
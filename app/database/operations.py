@@ -1,8 +1,30 @@
-from typing import Any, List
+import time
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from uuid import uuid4
+from config import settings as set
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import Select, Update
+from sqlalchemy import Insert, Select, Table, Update, func, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from ..constants import constants as cnst
+from ..constants.enums import BulkInsertMode, CountStrategy
+from ..models.sys_base import ACTIVE_ROWS, record_version
+from ..utilities.cache import TTLCache
 from ..utilities.logger import logger
 from ..utilities.data import m_dumps
+from .query_stats import record_query, timed_operation
+
+# Totals of paginated lists, keyed by the count statement and its filter values.
+count_cache = TTLCache(maxsize=set.count_cache_size, ttl=set.count_cache_ttl)
 
 
 class Operations:
@@ -11,7 +33,8 @@ class Operations:
 
     This class provides static methods for common database operations such as
     fetching rows, counting rows, and inserting instances. It works asynchronously
-    with SQLAlchemy's `AsyncSession`.
+    with SQLAlchemy's `AsyncSession`. Fetching, counting and inserting calls are timed
+    and recorded per service, see `query_stats`.
 
     ivars:
         ivar: _logger: A logger utility for logging database operations.
@@ -21,6 +44,7 @@ class Operations:
     """
 
     @staticmethod
+    @timed_operation
     async def return_one_row(
         service: str,
         statement: Select | Update,
@@ -41,12 +65,44 @@ class Operations:
         :return: The first row of the result or `None` if no rows are returned.
         :rtype: Any
         """
-        logger.info({"statement": str(statement)})
-        logger.info(f"Executing database operation for service: {service}.")
-        result = await db.execute(statement=statement)
+        logger.debug("Executing database operation for service: %s.", service)
+        result = await db.execute(
+            statement=statement, execution_options={cnst.SQL_SERVICE_OPTION: service}
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    @timed_operation
+    async def return_version(
+        service: str,
+        statement: Select,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Executes a single record statement reduced to the version of the record.
+
+        The statement keeps its filters, only the selected columns are replaced by the
+        version of its first entity, see `record_version`, so the record is not loaded.
+
+        :param service: The name of the service requesting the operation.
+        :type service: str
+        :param statement: The statement selecting the record.
+        :type statement: Select
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The time the record was last written, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        logger.debug("Executing database operation for service: %s.", service)
+        model = statement.column_descriptions[0]["entity"]
+        result = await db.execute(
+            statement=statement.with_only_columns(record_version(model=model)).limit(1),
+            execution_options={cnst.SQL_SERVICE_OPTION: service},
+        )
         return result.scalars().first()
 
     @staticmethod
+    @timed_operation
     async def return_all_rows(
         service: str,
         statement: Select | Update,
@@ -67,12 +123,14 @@ class Operations:
         :return: A list of all rows returned by the query.
         :rtype: List[Any]
         """
-        logger.info({"statement": str(statement)})
-        logger.info(f"Executing database operation for service: {service}.")
-        result = await db.execute(statement=statement)
+        logger.debug("Executing database operation for service: %s.", service)
+        result = await db.execute(
+            statement=statement, execution_options={cnst.SQL_SERVICE_OPTION: service}
+        )
         return result.scalars().all()
 
     @staticmethod
+    @timed_operation
     async def return_all_rows_and_values(
         service: str,
         statement: Select | Update,
@@ -93,12 +151,14 @@ class Operations:
         :return: A list of rows with their corresponding values.
         :rtype: List[tuple]
         """
-        logger.info({"statement": str(statement)})
-        logger.info(f"Executing database operation for service: {service}.")
-        result = await db.execute(statement=statement)
+        logger.debug("Executing database operation for service: %s.", service)
+        result = await db.execute(
+            statement=statement, execution_options={cnst.SQL_SERVICE_OPTION: service}
+        )
         return result.all()
 
     @staticmethod
+    @timed_operation
     async def return_count(
         service: str,
         statement: Select | Update,
@@ -119,24 +179,230 @@ class Operations:
         :return: The count value returned by the query.
         :rtype: int
         """
-        logger.info({"statement": str(statement)})
-        logger.info(f"Executing database operation for service: {service}.")
-        result = await db.execute(statement=statement)
+        logger.debug("Executing database operation for service: %s.", service)
+        result = await db.execute(
+            statement=statement, execution_options={cnst.SQL_SERVICE_OPTION: service}
+        )
         return result.scalar()
 
     @staticmethod
+    async def return_cached_count(
+        service: str,
+        statement: Select,
+        db: AsyncSession,
+    ) -> int:
+        """
+        Executes a count statement, reusing the result for the same filter values for a short time.
+
+        The cache key is the compiled statement together with its bound parameters, so every
+        distinct filter (for example every `entity_uuid`) is cached separately.
+
+        :param service: The name of the service requesting the operation.
+        :type service: str
+        :param statement: The count statement to execute.
+        :type statement: Select
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The count value returned by the query or the cache.
+        :rtype: int
+        """
+        compiled = statement.compile()
+        key: Hashable = (str(compiled), tuple(sorted(compiled.params.items())))
+        total = count_cache.get(key=key)
+        if total is None:
+            total = await Operations.return_count(
+                service=service, statement=statement, db=db
+            )
+            count_cache.set(key=key, value=total)
+        return total
+
+    @staticmethod
+    @timed_operation
+    async def return_estimated_count(
+        service: str,
+        statement: Select,
+        db: AsyncSession,
+    ) -> Optional[int]:
+        """
+        Returns the planner row estimate of the table a count statement reads from.
+
+        `pg_class.reltuples` is only meaningful for an unfiltered table, so None is returned
+        when the count statement binds filter values, reads from more than one table, or the
+        table has not been analyzed yet.
+
+        :param service: The name of the service requesting the operation.
+        :type service: str
+        :param statement: The count statement to estimate.
+        :type statement: Select
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The estimated number of rows, or None when no estimate applies.
+        :rtype: Optional[int]
+        """
+        froms = statement.get_final_froms()
+        if (
+            statement.compile().params
+            or len(froms) != 1
+            or not isinstance(froms[0], Table)
+        ):
+            return None
+        key: Hashable = (cnst.COUNT_ESTIMATE, froms[0].fullname)
+        estimate = count_cache.get(key=key)
+        if estimate is None:
+            logger.debug("Executing database operation for service: %s.", service)
+            result = await db.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"
+                ),
+                {"name": froms[0].fullname},
+                execution_options={cnst.SQL_SERVICE_OPTION: service},
+            )
+            estimate = result.scalar()
+            if estimate is None or estimate < 0:
+                return None
+            count_cache.set(key=key, value=estimate)
+        return estimate
+
+    @staticmethod
+    async def return_page(
+        service: str,
+        statement: Select,
+        count_statement: Select,
+        count: CountStrategy,
+        db: AsyncSession,
+        rows: bool = False,
+    ) -> Tuple[List[Any], Optional[int]]:
+        """
+        Executes a paginated statement and resolves the total with the requested count strategy.
+
+        - `exact`: runs the count statement, cached per filter for `COUNT_CACHE_TTL` seconds.
+        - `window`: fuses `count(*) OVER ()` into the page statement so a single round trip
+          returns both the page and the total. With a cursor, the total covers the rows after it.
+        - `estimate`: reads `pg_class.reltuples` for unfiltered tables and falls back to `exact`.
+        - `none`: skips counting, the total is None.
+
+        :param service: The name of the service requesting the operation.
+        :type service: str
+        :param statement: The paginated statement to execute, selecting a single model unless `rows` is set.
+        :type statement: Select
+        :param count_statement: The statement counting the same filtered set.
+        :type count_statement: Select
+        :param count: The strategy used to resolve the total.
+        :type count: CountStrategy
+        :param db: The database session.
+        :type db: AsyncSession
+        :param rows: Whether to return whole rows, for statements joining several models or columns.
+        :type rows: bool
+        :return: The rows of the page and the total, None when not counted.
+        :rtype: Tuple[List[Any], Optional[int]]
+        """
+        if count == CountStrategy.WINDOW:
+            statement = statement.add_columns(
+                func.count().over().label(cnst.COUNT_WINDOW_LABEL)
+            )
+            results = await Operations.return_all_rows_and_values(
+                service=service, statement=statement, db=db
+            )
+            if results:
+                # Whole rows keep the window column, it is not part of any model.
+                items = results if rows else [result[0] for result in results]
+                return items, results[0][-1]
+            # An empty page carries no window value, the total is counted instead.
+            count = CountStrategy.EXACT
+            items = []
+        elif rows:
+            items = await Operations.return_all_rows_and_values(
+                service=service, statement=statement, db=db
+            )
+        else:
+            items = await Operations.return_all_rows(
+                service=service, statement=statement, db=db
+            )
+        if count == CountStrategy.NONE:
+            return items, None
+        if count == CountStrategy.ESTIMATE:
+            estimate = await Operations.return_estimated_count(
+                service=service, statement=count_statement, db=db
+            )
+            if estimate is not None:
+                return items, estimate
+        total = await Operations.return_cached_count(
+            service=service, statement=count_statement, db=db
+        )
+        return items, total
+
+    @staticmethod
+    async def stream_rows(
+        service: str,
+        statement: Select,
+        db: AsyncSession,
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Executes a SQL statement on a server-side cursor and yields its rows in batches.
+
+        Rows are fetched `EXPORT_BATCH_SIZE` at a time, so memory use does not depend on
+        the size of the result. The session must stay open until the iteration ends.
+
+        The time spent fetching, without the time the caller holds each batch, is recorded
+        once the iteration ends or fails. Streams are consumed after the response started,
+        so it is not added to the `Server-Timing` phases of the request.
+
+        :param service: The name of the service requesting the operation.
+        :type service: str
+        :param statement: The SQL statement to execute.
+        :type statement: Select
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: Batches of rows, fetched with `scalars()`.
+        :rtype: AsyncIterator[List[Any]]
+        """
+        logger.debug("Streaming database operation for service: %s.", service)
+        fetching_ms, streamed = 0.0, 0
+        fetch_start = time.perf_counter()
+        try:
+            result = await db.stream(
+                statement,
+                execution_options={
+                    "yield_per": set.export_batch_size,
+                    cnst.SQL_SERVICE_OPTION: service,
+                },
+            )
+            async for rows in result.scalars().partitions():
+                fetching_ms += (time.perf_counter() - fetch_start) * 1000
+                fetch_start = None
+                streamed += len(rows)
+                yield rows
+                fetch_start = time.perf_counter()
+        finally:
+            if fetch_start is not None:
+                fetching_ms += (time.perf_counter() - fetch_start) * 1000
+            record_query(
+                service=service,
+                operation="stream_rows",
+                elapsed_ms=fetching_ms,
+                rows=streamed,
+            )
+
+    @staticmethod
+    @timed_operation
     async def add_instance(
         service: str,
         model: object,
         data: object,
         db: AsyncSession,
-    ) -> object:
+        unique: Optional[Sequence[str]] = None,
+        unique_where: Optional[str] = ACTIVE_ROWS,
+    ) -> Optional[object]:
         """
         Inserts a single instance (row) into the database.
 
         This method commits one item into the database after dumping the data
         into the model.
 
+        With `unique`, the row is inserted with `INSERT ... ON CONFLICT DO NOTHING RETURNING`
+        against the unique index on those columns, in a single round trip. No instance is
+        returned when a record with the same values exists.
+
         :param service: The name of the service requesting the operation.
         :type service: str
         :param model: The model class to insert the data into.
@@ -145,28 +411,60 @@ class Operations:
         :type data: object
         :param db: The database session.
         :type db: AsyncSession
-        :return: The inserted instance.
-        :rtype: object
+        :param unique: The columns of the unique index the record must not conflict with.
+        :type unique: Optional[Sequence[str]]
+        :param unique_where: The predicate of the unique index, None for a unique constraint.
+        :type unique_where: Optional[str]
+        :return: The inserted instance, None when it conflicts with an existing record.
+        :rtype: Optional[object]
         """
-        logger.info("Dumping data into model.")
+        if unique:
+            instances = await Operations._insert_returning(
+                service=service,
+                model=model,
+                data=[data],
+                db=db,
+                unique=unique,
+                unique_where=unique_where,
+            )
+            return instances[0] if instances else None
+        logger.debug("Dumping data into model.")
         instance = model(**m_dumps(data=data))
-        logger.info(f"Executing database operation for service: {service}.")
+        logger.debug("Executing database operation for service: %s.", service)
         db.add(instance=instance)
-        logger.info(f"Committing entry to the database for service: {service}.")
+        logger.debug("Committing entry to the database for service: %s.", service)
         return instance
 
     @staticmethod
+    @timed_operation
     async def add_instances(
         service: str,
         model: object,
         data: object,
         db: AsyncSession,
+        mode: BulkInsertMode = BulkInsertMode.ORM,
+        unique: Optional[Sequence[str]] = None,
     ) -> List[object]:
         """
         Inserts multiple instances (rows) into the database.
 
-        This method commits many items into the database after dumping the data
-        into the model.
+        The `mode` selects how the rows are written:
+
+        - `orm` builds one model instance per row and adds them to the session, they are
+          flushed with the rest of the unit of work.
+        - `returning` sends multi-row `INSERT ... RETURNING` statements of
+          `BULK_INSERT_BATCH_SIZE` rows, without tracking changes on the instances.
+        - `copy` streams the rows with the PostgreSQL `COPY` protocol, then selects the
+          inserted rows back by uuid. Meant for very large loads, the model must have a
+          `uuid` column.
+
+        With `returning` and `copy`, None values of columns with a server default are
+        left out so the default applies.
+
+        With `unique`, `orm` and `returning` insert with `ON CONFLICT DO NOTHING` against
+        the partial unique index on those columns, rows conflicting with an existing record
+        or an earlier row are not returned. `copy` only leaves out rows repeating an earlier
+        row on those columns, a conflict with an existing record fails it.
 
         :param service: The name of the service requesting the operation.
         :type service: str
@@ -176,11 +474,191 @@ class Operations:
         :type data: object
         :param db: The database session.
         :type db: AsyncSession
+        :param mode: How the rows are written.
+        :type mode: BulkInsertMode
+        :param unique: The columns of the unique index the records must not conflict with.
+        :type unique: Optional[Sequence[str]]
         :return: A list of inserted instances.
         :rtype: List[object]
         """
-        logger.info("Dumping data into model.")
+        if mode == BulkInsertMode.RETURNING or (unique and mode == BulkInsertMode.ORM):
+            return await Operations._insert_returning(
+                service=service, model=model, data=data, db=db, unique=unique
+            )
+        if mode == BulkInsertMode.COPY:
+            return await Operations._insert_copy(
+                service=service, model=model, data=data, db=db, unique=unique
+            )
+        logger.debug("Dumping data into model.")
         instances = [model(**m_dumps(instance)) for instance in data]
         db.add_all(instances=instances)
-        logger.info(f"Committing entries to the database for service: {service}.")
+        logger.debug("Committing entries to the database for service: %s.", service)
+        return instances
+
+    @staticmethod
+    def _bulk_rows(model: object, data: object) -> List[Dict[str, Any]]:
+        """
+        Dumps data into column dictionaries for Core level inserts.
+
+        :param model: The model class the rows belong to.
+        :type model: object
+        :param data: A list of data to dump.
+        :type data: object
+        :return: One dictionary per row, without None values of server default columns.
+        :rtype: List[Dict[str, Any]]
+        """
+        server_defaults = {
+            column.key
+            for column in model.__table__.columns
+            if column.server_default is not None
+        }
+        return [
+            {
+                key: value
+                for key, value in m_dumps(data=instance).items()
+                if value is not None or key not in server_defaults
+            }
+            for instance in data
+        ]
+
+    @staticmethod
+    def _first_unique_rows(
+        rows: List[Dict[str, Any]], unique: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Leaves out the rows repeating an earlier row on the columns of a unique index.
+
+        :param rows: The rows to insert, see `_bulk_rows`.
+        :type rows: List[Dict[str, Any]]
+        :param unique: The columns of the unique index.
+        :type unique: Sequence[str]
+        :return: The first row of each key, in the order of the data.
+        :rtype: List[Dict[str, Any]]
+        """
+        first_rows: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        for row in rows:
+            first_rows.setdefault(tuple(row.get(column) for column in unique), row)
+        return list(first_rows.values())
+
+    @staticmethod
+    async def _insert_returning(
+        service: str,
+        model: object,
+        data: object,
+        db: AsyncSession,
+        unique: Optional[Sequence[str]] = None,
+        unique_where: Optional[str] = ACTIVE_ROWS,
+    ) -> List[object]:
+        """
+        Inserts rows with batched multi-row `INSERT ... RETURNING` statements.
+
+        :param service: The name of the service requesting the operation.
+        :type service: str
+        :param model: The model class to insert the data into.
+        :type model: object
+        :param data: A list of data to insert into the model.
+        :type data: object
+        :param db: The database session.
+        :type db: AsyncSession
+        :param unique: The columns of the unique index, rows conflicting on them are skipped.
+        :type unique: Optional[Sequence[str]]
+        :param unique_where: The predicate of the unique index, None for a unique constraint.
+        :type unique_where: Optional[str]
+        :return: The inserted instances, in the order of the data unless `unique` is set.
+        :rtype: List[object]
+        """
+        rows = Operations._bulk_rows(model=model, data=data)
+        if not rows:
+            return []
+        logger.debug(
+            "Executing bulk insert of %d rows for service: %s.", len(rows), service
+        )
+        statement: Insert = insert(model).returning(model, sort_by_parameter_order=True)
+        if unique:
+            # Skipped rows leave nothing to match the parameters with, so the order of
+            # the returned rows is not guaranteed.
+            statement = (
+                pg_insert(model)
+                .on_conflict_do_nothing(
+                    index_elements=list(unique),
+                    index_where=text(unique_where) if unique_where else None,
+                )
+                .returning(model)
+            )
+        result = await db.execute(
+            statement,
+            rows,
+            execution_options={
+                "insertmanyvalues_page_size": set.bulk_insert_batch_size,
+                cnst.SQL_SERVICE_OPTION: service,
+            },
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def _insert_copy(
+        service: str,
+        model: object,
+        data: object,
+        db: AsyncSession,
+        unique: Optional[Sequence[str]] = None,
+    ) -> List[object]:
+        """
+        Inserts rows with the PostgreSQL `COPY` protocol inside the session transaction.
+
+        The uuids are generated here so the rows can be selected back, rows are copied in
+        groups sharing the same columns.
+
+        :param service: The name of the service requesting the operation.
+        :type service: str
+        :param model: The model class to insert the data into.
+        :type model: object
+        :param data: A list of data to insert into the model.
+        :type data: object
+        :param db: The database session.
+        :type db: AsyncSession
+        :param unique: The columns of the unique index, rows repeating an earlier row on
+                       them are left out.
+        :type unique: Optional[Sequence[str]]
+        :return: The inserted instances.
+        :rtype: List[object]
+        """
+        rows = Operations._bulk_rows(model=model, data=data)
+        if unique:
+            rows = Operations._first_unique_rows(rows=rows, unique=unique)
+        if not rows:
+            return []
+        groups: Dict[Tuple[str, ...], List[Tuple[Any, ...]]] = {}
+        uuids = []
+        for row in rows:
+            row.setdefault("uuid", uuid4())
+            uuids.append(row["uuid"])
+            columns = tuple(row)
+            groups.setdefault(columns, []).append(tuple(row.values()))
+
+        connection = await db.connection(
+            execution_options={cnst.SQL_SERVICE_OPTION: service}
+        )
+        # COPY runs on the driver connection, a first statement through SQLAlchemy makes
+        # sure the driver transaction of the session has begun.
+        await connection.execute(select(1))
+        raw_connection = await connection.get_raw_connection()
+        table = model.__table__
+        logger.debug("Copying %d rows for service: %s.", len(rows), service)
+        for columns, records in groups.items():
+            await raw_connection.driver_connection.copy_records_to_table(
+                table.name,
+                schema_name=table.schema,
+                columns=list(columns),
+                records=records,
+            )
+
+        instances = []
+        for start in range(0, len(uuids), set.bulk_insert_batch_size):
+            batch = uuids[start : start + set.bulk_insert_batch_size]
+            result = await db.execute(
+                select(model).where(model.uuid.in_(batch)),
+                execution_options={cnst.SQL_SERVICE_OPTION: service},
+            )
+            instances.extend(result.scalars().all())
         return instances
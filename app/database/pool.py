@@ -0,0 +1,109 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolStats:
+    """
+    Accumulates connection checkout statistics for an instrumented connection pool.
+
+    ivars:
+        ivar: checkouts: Number of successful connection checkouts.
+        varType: int
+        ivar: timeouts: Number of checkouts that failed waiting on the pool timeout.
+        varType: int
+        ivar: wait_total: Total seconds spent waiting for a connection.
+        varType: float
+        ivar: wait_max: Longest single wait, in seconds, for a connection.
+        varType: float
+    """
+
+    def __init__(self) -> None:
+        self.checkouts: int = 0
+        self.timeouts: int = 0
+        self.wait_total: float = 0.0
+        self.wait_max: float = 0.0
+
+    def record_wait(self, elapsed: float) -> None:
+        """
+        Records the time spent waiting on a successful checkout.
+
+        :param elapsed: Seconds spent acquiring the connection.
+        :type elapsed: float
+        """
+        self.checkouts += 1
+        self.wait_total += elapsed
+        if elapsed > self.wait_max:
+            self.wait_max = elapsed
+
+    def record_timeout(self) -> None:
+        """
+        Records a checkout that exceeded the pool timeout.
+        """
+        self.timeouts += 1
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records wait time and timeouts for every connection checkout.
+
+    The statistics survive `recreate()`, which SQLAlchemy calls when the engine is disposed,
+    so counters are continuous for the lifetime of the worker process.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats: PoolStats = PoolStats()
+
+    @property
+    def stats(self) -> PoolStats:
+        """
+        Returns the checkout statistics collected by this pool.
+
+        :return: The pool statistics.
+        :rtype: PoolStats
+        """
+        return self._stats
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        pool = super().recreate()
+        pool._stats = self._stats
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self._stats.record_timeout()
+            raise
+        self._stats.record_wait(time.perf_counter() - start)
+        return connection
+
+
+def pool_status(pool: InstrumentedAsyncQueuePool) -> Dict[str, Any]:
+    """
+    Builds a snapshot of the live pool state and accumulated checkout statistics.
+
+    :param pool: The instrumented pool of an engine.
+    :type pool: InstrumentedAsyncQueuePool
+    :return: A dictionary of pool gauges and counters.
+    :rtype: Dict[str, Any]
+    """
+    stats = pool.stats
+    return {
+        "pool_size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "checkouts": stats.checkouts,
+        "timeouts": stats.timeouts,
+        "wait_total_seconds": stats.wait_total,
+        "wait_max_seconds": stats.wait_max,
+        "wait_avg_seconds": (
+            stats.wait_total / stats.checkouts if stats.checkouts else 0.0
+        ),
+    }
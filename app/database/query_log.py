@@ -0,0 +1,81 @@
+"""
+SQL statement logging for the database engines, replacing `echo=True`.
+
+The statement text already compiled for the driver is reused, nothing is compiled a
+second time, and a log record is only built for statements that are actually logged.
+Bound parameters are never logged. The mode is set with `SQL_LOG_MODE`:
+
+- `off`: statements are not timed or logged.
+- `slow`: statements taking at least `SQL_LOG_SLOW_MS` are logged as warnings.
+- `sampled`: slow statements, plus a random `SQL_LOG_SAMPLE_RATE` share of the others.
+- `all`: every statement, slow ones still as warnings.
+"""
+
+import logging
+import random
+import time
+from typing import Any, Optional
+
+from config import settings as set
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..constants import constants as cnst
+from ..constants.enums import SqlLogMode
+from ..utilities.logger import logger
+
+SQL_LOG_MODE = SqlLogMode(set.sql_log_mode)
+# Attribute of the execution context holding the start time of its statement. The
+# context belongs to one execution, a statement that fails leaves nothing behind.
+QUERY_START_ATTR = "_query_start"
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Optional[ExecutionContext],
+    executemany: bool,
+) -> None:
+    if context is not None:
+        setattr(context, QUERY_START_ATTR, time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Optional[ExecutionContext],
+    executemany: bool,
+) -> None:
+    start = getattr(context, QUERY_START_ATTR, None)
+    if start is None:
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if elapsed_ms >= set.sql_log_slow_ms:
+        level = logging.WARNING
+    elif SQL_LOG_MODE == SqlLogMode.ALL or (
+        SQL_LOG_MODE == SqlLogMode.SAMPLED and random.random() < set.sql_log_sample_rate
+    ):
+        level = logging.INFO
+    else:
+        return
+    service = context.execution_options.get(cnst.SQL_SERVICE_OPTION)
+    logger.log(level, "%.1fms service=%s statement=%s", elapsed_ms, service, statement)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Registers the statement timing and logging listeners on an engine.
+
+    :param engine: The engine to instrument.
+    :type engine: AsyncEngine
+    :return: None
+    """
+    if SQL_LOG_MODE == SqlLogMode.OFF:
+        return
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
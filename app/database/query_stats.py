@@ -0,0 +1,170 @@
+"""
+In-process latency histograms and row counters for database operations.
+
+Every timed `Operations` call is recorded under its service name and operation, so slow
+services can be found without logging statements. Histograms use fixed millisecond
+buckets and are cumulative per worker process.
+"""
+
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List, Tuple
+
+from ..constants import constants as cnst
+from ..utilities.timing import add_timing
+
+# Upper bounds, in milliseconds, of the latency histogram buckets.
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    1,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    float("inf"),
+)
+
+
+class QueryStats:
+    """
+    Accumulates latency and row statistics for one service and operation.
+
+    ivars:
+        ivar: calls: Number of recorded calls.
+        varType: int
+        ivar: rows: Number of rows returned or staged by the calls.
+        varType: int
+        ivar: total_ms: Total time spent in the calls, in milliseconds.
+        varType: float
+        ivar: max_ms: Longest single call, in milliseconds.
+        varType: float
+        ivar: buckets: Number of calls per latency bucket, aligned with LATENCY_BUCKETS_MS.
+        varType: List[int]
+    """
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+        self.rows: int = 0
+        self.total_ms: float = 0.0
+        self.max_ms: float = 0.0
+        self.buckets: List[int] = [0] * len(LATENCY_BUCKETS_MS)
+
+    def record(self, elapsed_ms: float, rows: int) -> None:
+        """
+        Records one call.
+
+        :param elapsed_ms: Duration of the call, in milliseconds.
+        :type elapsed_ms: float
+        :param rows: Number of rows returned or staged by the call.
+        :type rows: int
+        """
+        self.calls += 1
+        self.rows += rows
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[index] += 1
+                break
+
+
+# Statistics keyed by service name and operation.
+query_stats: Dict[Tuple[str, str], QueryStats] = {}
+
+
+def record_query(service: str, operation: str, elapsed_ms: float, rows: int) -> None:
+    """
+    Records one call of an operation on behalf of a service.
+
+    :param service: The name of the service requesting the operation.
+    :type service: str
+    :param operation: The name of the database operation.
+    :type operation: str
+    :param elapsed_ms: Duration of the call, in milliseconds.
+    :type elapsed_ms: float
+    :param rows: Number of rows returned or staged by the call.
+    :type rows: int
+    """
+    stats = query_stats.get((service, operation))
+    if stats is None:
+        stats = query_stats[(service, operation)] = QueryStats()
+    stats.record(elapsed_ms=elapsed_ms, rows=rows)
+
+
+def _row_count(result: Any) -> int:
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    return 0 if result is None else 1
+
+
+def timed_operation(func: Callable) -> Callable:
+    """
+    Decorator timing an `Operations` call and recording it under its service name.
+
+    The service is the `service` argument of the call, the operation is the name of the
+    decorated function. Rows are the length of a returned list, otherwise one for a
+    returned value and zero for None. A call that raises, a timeout, a constraint
+    violation or a cancellation, is recorded with zero rows. The time is also added to
+    the `db` phase of the current request.
+
+    :param func: The operation to time.
+    :type func: Callable
+    :returns: The wrapped operation.
+    :rtype: Callable
+    """
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        service = kwargs.get("service", args[0] if args else None)
+        start = time.perf_counter()
+        rows = 0
+        try:
+            result = await func(*args, **kwargs)
+            rows = _row_count(result=result)
+            return result
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            record_query(
+                service=service,
+                operation=func.__name__,
+                elapsed_ms=elapsed_ms,
+                rows=rows,
+            )
+            add_timing(phase=cnst.TIMING_DB, elapsed_ms=elapsed_ms)
+
+    return wrapper
+
+
+def query_stats_status() -> List[Dict[str, Any]]:
+    """
+    Builds a snapshot of the statistics of every service and operation, slowest first.
+
+    Bucket counts are cumulative, each one counts the calls at or below its bound.
+
+    :return: A list of dictionaries of counters and histogram buckets.
+    :rtype: List[Dict[str, Any]]
+    """
+    snapshot = []
+    for (service, operation), stats in query_stats.items():
+        cumulative, buckets = 0, {}
+        for bound, calls in zip(LATENCY_BUCKETS_MS, stats.buckets):
+            cumulative += calls
+            buckets["+Inf" if bound == float("inf") else f"{bound:g}"] = cumulative
+        snapshot.append(
+            {
+                "service": service,
+                "operation": operation,
+                "calls": stats.calls,
+                "rows": stats.rows,
+                "total_ms": stats.total_ms,
+                "max_ms": stats.max_ms,
+                "avg_ms": stats.total_ms / stats.calls if stats.calls else 0.0,
+                "buckets_ms": buckets,
+            }
+        )
+    return sorted(snapshot, key=lambda item: item["total_ms"], reverse=True)
@@ -1,4 +1,4 @@
-from ..constants.messages import INVALID_CREDENTIALS
+from ..constants.messages import INVALID_CREDENTIALS, METRICS_CLIENT_NOT_ALLOWED
 from .crm_exceptions import CRMExceptions
 
 
@@ -21,3 +21,23 @@ class InvalidCredentials(CRMExceptions):
         self, message: str = INVALID_CREDENTIALS, *args: object, **kwargs
     ) -> None:
         super().__init__(message, *args, **kwargs)
+
+
+class MetricsClientNotAllowed(CRMExceptions):
+    """
+    Custom exception raised when a client outside of the allowed networks reads metrics.
+
+    Inherits from the base CRMExceptions class. The default message for this exception
+    is specified by the constant `METRICS_CLIENT_NOT_ALLOWED`. The allowed networks are
+    set with `METRICS_ALLOWED_NETWORKS`.
+
+    :param message: The error message to display when the exception is raised.
+                    Defaults to the value of METRICS_CLIENT_NOT_ALLOWED.
+    :param args: Additional positional arguments to pass to the parent exception class.
+    :param kwargs: Additional keyword arguments to pass to the parent exception class.
+    """
+
+    def __init__(
+        self, message: str = METRICS_CLIENT_NOT_ALLOWED, *args: object, **kwargs
+    ) -> None:
+        super().__init__(message, *args, **kwargs)
@@ -6,6 +6,7 @@ from ..constants.messages import (
     ENTITY_NON_INDIV_DATA_INVALID,
     ENTITY_NOT_EXIST,
     ENTITY_TYPE_INVALID,
+    LOOKUP_KEY_INVALID,
 )
 
 
@@ -125,3 +126,24 @@ class EntityTypeInvalid(CRMExceptions):
         self, message: str = ENTITY_TYPE_INVALID, *args: object, **kwargs
     ) -> None:
         super().__init__(message, *args, **kwargs)
+
+
+class LookupKeyInvalid(CRMExceptions):
+    """
+    Custom exception raised when an entity lookup is not given exactly one valid key.
+
+    Inherits from the base CRMExceptions class. The default message for this exception
+    is specified by the constant `LOOKUP_KEY_INVALID`. This exception is typically raised
+    when none or several of email, phone and domain are provided, or when the provided
+    value normalizes to nothing.
+
+    :param message: The error message to display when the exception is raised.
+                    Defaults to the value of LOOKUP_KEY_INVALID.
+    :param args: Additional positional arguments to pass to the parent exception class.
+    :param kwargs: Additional keyword arguments to pass to the parent exception class.
+    """
+
+    def __init__(
+        self, message: str = LOOKUP_KEY_INVALID, *args: object, **kwargs
+    ) -> None:
+        super().__init__(message, *args, **kwargs)
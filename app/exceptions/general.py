@@ -1,5 +1,42 @@
+from ..constants.messages import INVALID_CURSOR, SCHEMA_OUT_OF_DATE
 from .crm_exceptions import CRMExceptions
 
 
 class UnhandledException(CRMExceptions):
     pass
+
+
+class InvalidCursor(CRMExceptions):
+    """
+    Custom exception raised when a pagination cursor cannot be decoded.
+
+    Inherits from the base CRMExceptions class. The default message for this exception
+    is specified by the constant `INVALID_CURSOR`.
+
+    :param message: The error message to display when the exception is raised.
+                    Defaults to the value of INVALID_CURSOR.
+    :param args: Additional positional arguments to pass to the parent exception class.
+    :param kwargs: Additional keyword arguments to pass to the parent exception class.
+    """
+
+    def __init__(self, message: str = INVALID_CURSOR, *args: object, **kwargs) -> None:
+        super().__init__(message, *args, **kwargs)
+
+
+class SchemaOutOfDate(CRMExceptions):
+    """
+    Custom exception raised at startup when the database is not migrated to the latest revision.
+
+    Inherits from the base CRMExceptions class. The default message for this exception
+    is specified by the constant `SCHEMA_OUT_OF_DATE`.
+
+    :param message: The error message to display when the exception is raised.
+                    Defaults to the value of SCHEMA_OUT_OF_DATE.
+    :param args: Additional positional arguments to pass to the parent exception class.
+    :param kwargs: Additional keyword arguments to pass to the parent exception class.
+    """
+
+    def __init__(
+        self, message: str = SCHEMA_OUT_OF_DATE, *args: object, **kwargs
+    ) -> None:
+        super().__init__(message, *args, **kwargs)
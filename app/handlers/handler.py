@@ -1,3 +1,4 @@
+import time
 from functools import wraps
 from typing import Any, Callable, Dict, List, Optional, Sequence, Type, Union
 
@@ -5,9 +6,11 @@ from fastapi import APIRouter, Depends, FastAPI, Response, routing
 from fastapi.requests import Request
 from fastapi.responses import JSONResponse
 
+from ..constants import constants as cnst
 from ..exceptions import SysUserNotExist, UnhandledException
 from ..exceptions.crm_exceptions import CRMExceptions
 from ..utilities.logger import logger
+from ..utilities.timing import add_timing, get_timing
 
 """
 This module contains functions for dynamically handling the registration of exception handlers and routers in FastAPI applications.
@@ -54,7 +57,8 @@ def handle_exceptions(exception_classes: List[Type[Exception]]):
     This decorator is used to wrap a function, intercepting any exceptions
     that match the types provided in the `exception_classes` list. It also
     catches `SysUserNotExist` and any general `Exception`, raising an
-    `UnhandledException` for any unhandled cases.
+    `UnhandledException` for any unhandled cases. The time spent in the function is
+    recorded for the `Server-Timing` header, excluding database time as `orch`.
 
     :param exception_classes: A list of exception types to catch and re-raise.
     :return: A decorator that wraps a function with exception handling logic.
@@ -63,6 +67,8 @@ def handle_exceptions(exception_classes: List[Type[Exception]]):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            db_start = get_timing(phase=cnst.TIMING_DB)
             try:
                 return await func(*args, **kwargs)
             except tuple(exception_classes):
@@ -71,6 +77,11 @@ def handle_exceptions(exception_classes: List[Type[Exception]]):
                 raise
             except Exception as e:
                 raise UnhandledException
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                db_ms = get_timing(phase=cnst.TIMING_DB) - db_start
+                add_timing(phase=cnst.TIMING_HANDLER, elapsed_ms=elapsed_ms)
+                add_timing(phase=cnst.TIMING_ORCH, elapsed_ms=elapsed_ms - db_ms)
 
         return wrapper
 
@@ -0,0 +1,141 @@
+"""
+Request metrics middleware.
+
+Records, per route template, a latency histogram and status code counters, and tracks
+the requests in flight per method. When `SERVER_TIMING` is enabled, every response
+carries a `Server-Timing` header breaking the request into session validation (`auth`),
+database (`db`), path operation logic (`orch`), response serialization and framework
+overhead (`serialize`) and `total` time.
+
+The middleware is plain ASGI so it adds no task or body buffering to the request.
+"""
+
+import time
+from typing import Dict, Tuple
+
+from config import settings as set
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..constants import constants as cnst
+from ..database.query_stats import QueryStats
+from ..utilities.timing import start_timings
+
+
+class HttpStats:
+    """
+    Accumulates request statistics of the worker process.
+
+    ivars:
+        ivar: in_flight: Number of requests being served, keyed by method.
+        varType: Dict[str, int]
+        ivar: latency: Latency statistics keyed by method and route template.
+        varType: Dict[Tuple[str, str], QueryStats]
+        ivar: responses: Number of responses keyed by method, route template and status code.
+        varType: Dict[Tuple[str, str, int], int]
+    """
+
+    def __init__(self) -> None:
+        self.in_flight: Dict[str, int] = {}
+        self.latency: Dict[Tuple[str, str], QueryStats] = {}
+        self.responses: Dict[Tuple[str, str, int], int] = {}
+
+    def record(self, method: str, route: str, status: int, elapsed_ms: float) -> None:
+        """
+        Records a completed request.
+
+        :param method: The request method.
+        :type method: str
+        :param route: The route template that served the request.
+        :type route: str
+        :param status: The response status code.
+        :type status: int
+        :param elapsed_ms: Duration of the request, in milliseconds.
+        :type elapsed_ms: float
+        """
+        stats = self.latency.get((method, route))
+        if stats is None:
+            stats = self.latency[(method, route)] = QueryStats()
+        stats.record(elapsed_ms=elapsed_ms, rows=0)
+        key = (method, route, status)
+        self.responses[key] = self.responses.get(key, 0) + 1
+
+
+http_stats = HttpStats()
+
+
+def _server_timing(timings: Dict[str, float], total_ms: float) -> bytes:
+    """
+    Builds the `Server-Timing` header value of a request.
+
+    The phases do not overlap, the database time of the session lookup is only counted
+    under `db`, and serialization is what remains of the total.
+
+    :param timings: The phase durations recorded for the request, in milliseconds.
+    :type timings: Dict[str, float]
+    :param total_ms: Time from the start of the request to the start of the response.
+    :type total_ms: float
+    :return: The header value.
+    :rtype: bytes
+    """
+    auth = timings.get(cnst.TIMING_AUTH, 0.0)
+    db = timings.get(cnst.TIMING_DB, 0.0)
+    orch = timings.get(cnst.TIMING_ORCH, 0.0)
+    phases = (
+        (cnst.TIMING_AUTH, auth),
+        (cnst.TIMING_DB, db),
+        (cnst.TIMING_ORCH, orch),
+        (cnst.TIMING_SERIALIZE, max(total_ms - auth - db - orch, 0.0)),
+        (cnst.TIMING_TOTAL, total_ms),
+    )
+    return ", ".join(f"{name};dur={value:.1f}" for name, value in phases).encode()
+
+
+class RequestMetricsMiddleware:
+    """
+    ASGI middleware recording request metrics and adding the `Server-Timing` header.
+
+    :param app: The wrapped ASGI application.
+    :type app: ASGIApp
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        start = time.perf_counter()
+        timings = start_timings()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if set.server_timing:
+                    total_ms = (time.perf_counter() - start) * 1000
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (
+                            cnst.SERVER_TIMING_HEADER.encode(),
+                            _server_timing(timings=timings, total_ms=total_ms),
+                        )
+                    ]
+            await send(message)
+
+        http_stats.in_flight[method] = http_stats.in_flight.get(method, 0) + 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_stats.in_flight[method] -= 1
+            # The route is only known once routing matched, unmatched paths share a label
+            # so the number of series stays bounded.
+            route = scope.get("route")
+            http_stats.record(
+                method=method,
+                route=route.path if route else cnst.METRICS_UNMATCHED_ROUTE,
+                status=status,
+                elapsed_ms=(time.perf_counter() - start) * 1000,
+            )
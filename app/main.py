@@ -4,19 +4,18 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from pydantic import UUID4
 
-from . import models
-from .constants import constants as cnst
 from .constants.error_handlers import handlers
 from .constants.routers import routers
-from .database.database import init_db_table_schema_factory, init_db_tables
+from .database.database import async_engine
+from .database.migrations import check_schema_version
 from .handlers.handler import (handle_exeception_registration,
                                handle_router_registration)
+from .handlers.middleware import RequestMetricsMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await init_db_table_schema_factory(schemas=cnst.SCHEMAS)
-    await init_db_tables(model=models.base)
+    await check_schema_version(engine=async_engine)
     yield
 
 
@@ -27,5 +26,6 @@ app = FastAPI(
     version="v1",
 )
 
+app.add_middleware(RequestMetricsMiddleware)
 handle_router_registration(app=app, routers=routers)
 handle_exeception_registration(app=app, handlers=handlers)
@@ -10,6 +10,7 @@ from .account_contracts import AccountContracts
 from .account_lists import AccountLists
 from .account_products import AccountProducts
 from .accounts import Accounts
+from .addresses import Addresses
 from .base import Base
 from .contacts import Contacts
 from .document_metadata import DocumentMetadata
@@ -28,5 +29,6 @@ from .product_lists import ProductLists
 from .products import Products
 from .statement_items import StatementItems
 from .sys_base import SysBase
+from .sys_users import SysUsers
 from .sys_values import SysValues
 from .websites import Websites
@@ -4,7 +4,7 @@ from uuid import UUID
 from sqlalchemy import UUID, Date, Integer, String, text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index
 
 
 class AccountContracts(SysBase):
@@ -39,7 +39,10 @@ class AccountContracts(SysBase):
     """
 
     __tablename__ = "acc_account_contracts"
-    __table_args__ = {"schema": "sales"}
+    __table_args__ = (
+        active_index("acc_account_contracts", "account_uuid", "id"),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
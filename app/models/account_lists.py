@@ -4,7 +4,7 @@ from uuid import UUID
 from sqlalchemy import UUID, Date, ForeignKey, Integer, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index
 
 
 class AccountLists(SysBase):
@@ -32,7 +32,11 @@ class AccountLists(SysBase):
     """
 
     __tablename__ = "acc_account_lists"
-    __table_args__ = {"schema": "sales"}
+    __table_args__ = (
+        active_index("acc_account_lists", "account_uuid", "id"),
+        active_index("acc_account_lists", "account_uuid", "product_list_uuid"),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
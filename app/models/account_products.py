@@ -4,7 +4,7 @@ from uuid import UUID
 from sqlalchemy import UUID, Date, Integer, text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index
 
 
 class AccountProducts(SysBase):
@@ -33,7 +33,11 @@ class AccountProducts(SysBase):
     """
 
     __tablename__ = "acc_account_products"
-    __table_args__ = {"schema": "sales"}
+    __table_args__ = (
+        active_index("acc_account_products", "account_uuid", "id"),
+        active_index("acc_account_products", "account_uuid", "product_uuid"),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
@@ -4,7 +4,7 @@ from uuid import UUID
 from sqlalchemy import UUID, Date, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index
 
 
 class Accounts(SysBase):
@@ -33,7 +33,10 @@ class Accounts(SysBase):
     """
 
     __tablename__ = "acc_accounts"
-    __table_args__ = {"schema": "sales"}
+    __table_args__ = (
+        active_index("acc_accounts", "id"),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
@@ -4,7 +4,7 @@ from pydantic import UUID4
 from sqlalchemy import UUID, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index, active_unique_index
 
 
 class Addresses(SysBase):
@@ -40,10 +40,20 @@ class Addresses(SysBase):
         :vartype zip: str, optional
         zip_plus4: The optional 4-digit extension of the postal code (if applicable).
         :vartype zip_plus4: str, optional
+        fingerprint: The normalized fingerprint of the address lines, city and ZIP code, see `address_fingerprint`.
+        :vartype fingerprint: str, optional
     """
 
     __tablename__ = "em_addresses"
-    __table_args__ = {"schema": "sales"}
+    # Columns unique together among records not soft deleted, see `active_unique_index`.
+    # Records created before the fingerprint have none until they are backfilled, they
+    # must not conflict with each other meanwhile.
+    unique_columns = ("parent_uuid", "fingerprint")
+    __table_args__ = (
+        active_index("em_addresses", "parent_uuid", "parent_table", "id"),
+        active_unique_index("em_addresses", *unique_columns, nulls_not_distinct=False),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, autoincrement=True, nullable=False
@@ -69,3 +79,4 @@ class Addresses(SysBase):
     country: Mapped[str] = mapped_column(String(325), nullable=True)
     zip: Mapped[str] = mapped_column(String(5), nullable=True)
     zip_plus4: Mapped[str] = mapped_column(String(4), nullable=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=True)
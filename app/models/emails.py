@@ -3,7 +3,7 @@ from uuid import UUID
 from sqlalchemy import UUID, Integer, String, text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index, active_unique_index, lookup_index
 
 
 class Emails(SysBase):
@@ -28,7 +28,16 @@ class Emails(SysBase):
     """
 
     __tablename__ = "em_emails"
-    __table_args__ = {"schema": "sales"}
+    # Columns unique together among records not soft deleted, see `active_unique_index`.
+    unique_columns = ("entity_uuid", "email")
+    # Global lookup by address, whatever the case, see `lookup_index`.
+    lookup_key = "lower(email)"
+    __table_args__ = (
+        active_index("em_emails", "entity_uuid", "id"),
+        active_unique_index("em_emails", *unique_columns),
+        lookup_index("em_emails", "email", lookup_key),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
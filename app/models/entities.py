@@ -4,7 +4,7 @@ from uuid import UUID
 from sqlalchemy import UUID, CheckConstraint, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index, search_index
 
 
 class Entities(SysBase):
@@ -37,10 +37,14 @@ class Entities(SysBase):
     """
 
     __tablename__ = "em_entities"
+    # Columns matched by searches, see `search_text`.
+    search_columns = ("tin",)
     __table_args__ = (
         CheckConstraint(
             "type in ('individual', 'non-individual')", name="entities_type_check"
         ),
+        active_index("em_entities", "id"),
+        search_index("em_entities", *search_columns),
         {"schema": "sales"},
     )
 
@@ -4,7 +4,7 @@ from uuid import UUID
 from sqlalchemy import UUID, Date, Integer, text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index
 
 
 class EntityAccounts(SysBase):
@@ -32,7 +32,11 @@ class EntityAccounts(SysBase):
     """
 
     __tablename__ = "em_entity_accounts"
-    __table_args__ = {"schema": "sales"}
+    __table_args__ = (
+        active_index("em_entity_accounts", "entity_uuid", "id"),
+        active_index("em_entity_accounts", "account_uuid", "id"),
+        {"schema": "sales"},
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     uuid: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -3,7 +3,7 @@ from uuid import UUID
 from sqlalchemy import UUID, Integer, String, text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index, search_index
 
 
 class Individuals(SysBase):
@@ -27,7 +27,14 @@ class Individuals(SysBase):
     """
 
     __tablename__ = "em_individuals"
-    __table_args__ = {"schema": "sales"}
+    # Columns matched by searches, see `search_text`.
+    search_columns = ("first_name", "last_name")
+    __table_args__ = (
+        active_index("em_individuals", "id"),
+        active_index("em_individuals", "entity_uuid"),
+        search_index("em_individuals", *search_columns),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
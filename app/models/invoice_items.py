@@ -4,7 +4,7 @@ from uuid import UUID
 from sqlalchemy import UUID, CheckConstraint, Integer, Numeric, String, text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index
 
 
 class InvoiceItems(SysBase):
@@ -48,6 +48,7 @@ class InvoiceItems(SysBase):
             "adjustment_type in ('dollar', 'percentage')",
             name="inovice_items_adjustement_type",
         ),
+        active_index("om_invoice_items", "invoice_uuid", "id"),
         {"schema": "sales"},
     )
     id: Mapped[int] = mapped_column(
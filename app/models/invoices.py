@@ -4,7 +4,7 @@ from colorama import Fore
 from sqlalchemy import UUID, Date, ForeignKey, Integer, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index, active_unique_index
 
 
 class Invoices(SysBase):
@@ -36,7 +36,13 @@ class Invoices(SysBase):
     """
 
     __tablename__ = "om_invoices"
-    __table_args__ = {"schema": "sales"}
+    # Columns unique together among records not soft deleted, see `active_unique_index`.
+    unique_columns = ("order_uuid",)
+    __table_args__ = (
+        active_index("om_invoices", "id"),
+        active_unique_index("om_invoices", *unique_columns),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
@@ -3,7 +3,7 @@ from uuid import UUID
 from sqlalchemy import UUID, Integer, String, text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index, search_index
 
 
 class NonIndividuals(SysBase):
@@ -27,7 +27,14 @@ class NonIndividuals(SysBase):
     """
 
     __tablename__ = "em_non_individuals"
-    __table_args__ = {"schema": "sales"}
+    # Columns matched by searches, see `search_text`.
+    search_columns = ("name", "legal_name")
+    __table_args__ = (
+        active_index("em_non_individuals", "id"),
+        active_index("em_non_individuals", "entity_uuid"),
+        search_index("em_non_individuals", *search_columns),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
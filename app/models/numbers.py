@@ -3,7 +3,8 @@ from uuid import UUID
 from sqlalchemy import UUID, Integer, String, text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from ..constants import constants as cnst
+from .sys_base import SysBase, active_index, active_unique_index, lookup_index
 
 
 class Numbers(SysBase):
@@ -33,7 +34,26 @@ class Numbers(SysBase):
     """
 
     __tablename__ = "em_numbers"
-    __table_args__ = {"schema": "sales"}
+    # Columns unique together among records not soft deleted, see `active_unique_index`.
+    unique_columns = (
+        "entity_uuid",
+        "country_code",
+        "area_code",
+        "line_number",
+        "extension",
+    )
+    # Global lookup by E.164 digits without extension, numbers are North American like
+    # their 3-digit area code and 4-digit line number when the country code is missing.
+    lookup_key = (
+        f"coalesce(country_code, '{cnst.LOOKUP_COUNTRY_CODE}')"
+        " || area_code || line_number"
+    )
+    __table_args__ = (
+        active_index("em_numbers", "entity_uuid", "id"),
+        active_unique_index("em_numbers", *unique_columns, name="number"),
+        lookup_index("em_numbers", "phone", lookup_key),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
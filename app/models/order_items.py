@@ -4,7 +4,7 @@ from uuid import UUID
 from sqlalchemy import UUID, CheckConstraint, Integer, Numeric, String, text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index
 
 
 class OrderItems(SysBase):
@@ -44,6 +44,7 @@ class OrderItems(SysBase):
             "adjustment_type in ('dollar', 'percentage')",
             name="oder_items_adjustement_type",
         ),
+        active_index("om_order_items", "order_uuid", "id"),
         {"schema": "sales"},
     )
     id: Mapped[int] = mapped_column(
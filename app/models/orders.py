@@ -4,7 +4,7 @@ from uuid import UUID
 from sqlalchemy import UUID, Date, Integer, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index
 
 
 class Orders(SysBase):
@@ -38,7 +38,10 @@ class Orders(SysBase):
     """
 
     __tablename__ = "om_sales_orders"
-    __table_args__ = {"schema": "sales"}
+    __table_args__ = (
+        active_index("om_sales_orders", "id"),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
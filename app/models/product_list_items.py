@@ -4,7 +4,7 @@ from uuid import UUID
 from sqlalchemy import UUID, Boolean, Integer, Numeric, text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index, active_unique_index
 
 
 class ProductListItems(SysBase):
@@ -44,7 +44,13 @@ class ProductListItems(SysBase):
     """
 
     __tablename__ = "pm_product_list_items"
-    __table_args__ = {"schema": "sales"}
+    # Columns unique together among records not soft deleted, see `active_unique_index`.
+    unique_columns = ("product_list_uuid", "product_uuid")
+    __table_args__ = (
+        active_index("pm_product_list_items", "product_list_uuid", "id"),
+        active_unique_index("pm_product_list_items", *unique_columns),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
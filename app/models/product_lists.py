@@ -4,7 +4,7 @@ from uuid import UUID
 from sqlalchemy import UUID, Date, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index
 
 
 class ProductLists(SysBase):
@@ -29,7 +29,11 @@ class ProductLists(SysBase):
     """
 
     __tablename__ = "pm_product_lists"
-    __table_args__ = {"schema": "sales"}
+    __table_args__ = (
+        active_index("pm_product_lists", "id"),
+        active_index("pm_product_lists", "name"),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
@@ -3,7 +3,7 @@ from uuid import UUID
 from sqlalchemy import UUID, Boolean, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from .sys_base import SysBase, active_index, search_index
 
 
 class Products(SysBase):
@@ -40,7 +40,14 @@ class Products(SysBase):
     """
 
     __tablename__ = "pm_products"
-    __table_args__ = {"schema": "sales"}
+    # Columns matched by searches, see `search_text`.
+    search_columns = ("name", "code", "description")
+    __table_args__ = (
+        active_index("pm_products", "id"),
+        active_index("pm_products", "name"),
+        search_index("pm_products", *search_columns),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
@@ -1,13 +1,172 @@
 from datetime import datetime
+from typing import Optional, Sequence
 from uuid import uuid4
 
-from sqlalchemy import TIMESTAMP, UUID, String, text
+from sqlalchemy import (
+    TIMESTAMP,
+    UUID,
+    ColumnElement,
+    Index,
+    String,
+    func,
+    literal_column,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
 
 """ base table containing sys fields applicable to all tables """
 
+# Predicate shared by every statement that reads records which are not soft deleted.
+ACTIVE_ROWS = "sys_deleted_at IS NULL"
+
+
+def active_index(table: str, *columns: str) -> Index:
+    """
+    Builds a partial index limited to records that are not soft deleted.
+
+    Statements filter on `sys_deleted_at == None`, which lets the planner use these
+    smaller indexes. Append `id` as the last column for lists paged by `id`.
+
+    :param table: str: name of the table the index belongs to
+    :param columns: str: names of the indexed columns, in order
+    :return: Index: the partial index, named `ix_<table>_<columns>_active`
+    """
+    return Index(
+        f"ix_{table}_{'_'.join(columns)}_active",
+        *columns,
+        postgresql_where=text(ACTIVE_ROWS),
+    )
+
+
+def active_unique_index(
+    table: str,
+    *columns: str,
+    name: Optional[str] = None,
+    nulls_not_distinct: bool = True,
+) -> Index:
+    """
+    Builds a partial unique index limited to records that are not soft deleted.
+
+    Creates insert with `ON CONFLICT DO NOTHING` against it instead of looking the record
+    up first, the model keeps the columns in `unique_columns` for them. Missing values
+    are not distinct by default, as the lookups of the statements compare them with `IS NULL`.
+
+    :param table: str: name of the table the index belongs to
+    :param columns: str: names of the columns unique together, in order
+    :param name: Optional[str]: replaces the columns in the index name, when they are too long for it
+    :param nulls_not_distinct: bool: whether missing values conflict with each other
+    :return: Index: the partial unique index, named `ux_<table>_<name or columns>_active`
+    """
+    return Index(
+        f"ux_{table}_{name or '_'.join(columns)}_active",
+        *columns,
+        unique=True,
+        postgresql_where=text(ACTIVE_ROWS),
+        postgresql_nulls_not_distinct=nulls_not_distinct,
+    )
+
+
+def lookup_index(table: str, name: str, key: str) -> Index:
+    """
+    Builds a global index over the normalized lookup key of a table.
+
+    The key is an SQL expression of the columns of the table, the model keeps it in
+    `lookup_key` and statements compare `lookup_key_of` with an already normalized value.
+    Postgres evaluates the expression on every write, the index never falls behind.
+
+    :param table: str: name of the table the index belongs to
+    :param name: str: name of the key in the index name
+    :param key: str: SQL expression of the lookup key
+    :return: Index: the partial index, named `ix_<table>_<name>_lookup_active`
+    """
+    # Colons are escaped, `text` would take `(?:www` in a pattern for a bind parameter.
+    return Index(
+        f"ix_{table}_{name}_lookup_active",
+        text(f"({key})".replace(":", "\\:")),
+        postgresql_where=text(ACTIVE_ROWS),
+    )
+
+
+def lookup_key_of(model: object) -> ColumnElement[str]:
+    """
+    Builds the lookup key of a model, matched by the index built by `lookup_index`.
+
+    The expression is rendered as written in the `lookup_key` of the model, its columns
+    are not qualified, so it is only meant for statements reading the table alone.
+
+    :param model: object: the model, having `lookup_key`
+    :return: ColumnElement[str]: the lookup key
+    """
+    return literal_column(f"({model.lookup_key})")
+
+
+def record_version(model: object) -> ColumnElement[datetime]:
+    """
+    Builds the version of the records of a model, the time they were last written.
+
+    Every update of a record, soft deletes included, sets `sys_updated_at`, from its update
+    schema or else from the `onupdate` default of the column. Maintenance writes that do not
+    change the record, such as the address fingerprint backfill, keep it as it was. Records
+    never updated fall back on `sys_created_at`.
+
+    :param model: object: the model, deriving from `SysBase`
+    :return: ColumnElement[datetime]: the version
+    """
+    return func.coalesce(model.sys_updated_at, model.sys_created_at)
+
+
+def _search_sql(columns: Sequence[str]) -> str:
+    if len(columns) == 1:
+        return columns[0]
+    return (
+        "(" + " || ' ' || ".join(f"coalesce({column}, '')" for column in columns) + ")"
+    )
+
+
+def search_index(table: str, *columns: str) -> Index:
+    """
+    Builds a pg_trgm GIN index over the searchable text of a table.
+
+    The indexed expression is the one returned by `search_text`, so both must be given
+    the same columns in the same order, the model keeps them in `search_columns`.
+    Postgres evaluates the expression on every write, the index never falls behind.
+
+    :param table: str: name of the table the index belongs to
+    :param columns: str: names of the searched columns, in order
+    :return: Index: the partial index, named `ix_<table>_<columns>_trgm_active`
+    """
+    return Index(
+        f"ix_{table}_{'_'.join(columns)}_trgm_active",
+        text(f"{_search_sql(columns=columns)} gin_trgm_ops"),
+        postgresql_using="gin",
+        postgresql_where=text(ACTIVE_ROWS),
+    )
+
+
+def search_text(model: object) -> ColumnElement[str]:
+    """
+    Builds the searchable text of a model, matched by trigram searches.
+
+    The columns listed in the `search_columns` of the model are joined by a space,
+    missing values are empty. Constants are rendered inline so the expression matches
+    the index built by `search_index`, and the expression is parenthesized as it is
+    compared with operators of the same precedence as `||`.
+
+    :param model: object: the model, having `search_columns`
+    :return: ColumnElement[str]: the searchable text
+    """
+    columns = [getattr(model, column) for column in model.search_columns]
+    if len(columns) == 1:
+        return columns[0]
+    text_ = func.coalesce(columns[0], literal_column("''"))
+    for column in columns[1:]:
+        text_ = (
+            text_ + literal_column("' '") + func.coalesce(column, literal_column("''"))
+        )
+    return text_.self_group()
+
 
 class SysBase(Base):
     __tablename__ = "sys_base"
@@ -19,7 +178,7 @@ class SysBase(Base):
     )
     sys_created_by: Mapped[uuid4] = mapped_column(UUID(as_uuid=True), nullable=True)
     sys_updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), nullable=True
+        TIMESTAMP(timezone=True), nullable=True, onupdate=func.now()
     )
     sys_updated_by: Mapped[uuid4] = mapped_column(UUID(as_uuid=True), nullable=True)
     sys_deleted_at: Mapped[datetime] = mapped_column(
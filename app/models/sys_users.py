@@ -4,7 +4,7 @@ from uuid import uuid4
 from sqlalchemy import TIMESTAMP, UUID, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.sys_base import SysBase
+from app.models.sys_base import SysBase, active_index
 
 
 class SysUsers(SysBase):
@@ -33,7 +33,11 @@ class SysUsers(SysBase):
     """
 
     __tablename__ = "sys_users"
-    __table_args__ = {"schema": "sales"}
+    __table_args__ = (
+        active_index("sys_users", "id"),
+        active_index("sys_users", "username"),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
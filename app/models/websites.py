@@ -3,7 +3,8 @@ from uuid import UUID
 from sqlalchemy import UUID, Integer, String, text, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .sys_base import SysBase
+from ..constants import constants as cnst
+from .sys_base import SysBase, active_index, active_unique_index, lookup_index
 
 
 class Websites(SysBase):
@@ -29,7 +30,17 @@ class Websites(SysBase):
     """
 
     __tablename__ = "em_websites"
-    __table_args__ = {"schema": "sales"}
+    # Columns unique together among records not soft deleted, see `active_unique_index`.
+    unique_columns = ("entity_uuid", "url")
+    # Global lookup by domain, the host of the URL lower-cased without scheme, `www.`,
+    # port or path, see `domain_key`.
+    lookup_key = f"substring(lower(url), '{cnst.LOOKUP_DOMAIN_PATTERN}')"
+    __table_args__ = (
+        active_index("em_websites", "entity_uuid", "id"),
+        active_unique_index("em_websites", *unique_columns),
+        lookup_index("em_websites", "domain", lookup_key),
+        {"schema": "sales"},
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, nullable=False, autoincrement=True
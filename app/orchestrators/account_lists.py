@@ -1,6 +1,9 @@
+from typing import Optional
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import UUID4
 
+from ..constants.enums import CountStrategy
 from ..schemas.account_lists import AccountListsOrchPgRes
 from ..services import account_lists as account_lists_srvcs
 from ..services import product_lists as product_lists_srvcs
@@ -64,14 +67,19 @@ class AccountListsReadOrch:
         return self._product_lists_read_srvc
 
     async def paginated_product_lists(
-        self, account_uuid: UUID4, page: int, limit: int, db: AsyncSession
+        self,
+        account_uuid: UUID4,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> AccountListsOrchPgRes:
         """
         Retrieves paginated account lists along with the corresponding product lists for a given account UUID.
 
-        This method calculates the total count of account lists, computes the offset, and checks if there
-        are more items available for the next page. It then fetches the account lists and product lists based
-        on the pagination parameters.
+        The account lists are read joined to their product lists, so a page takes one statement besides
+        the total count, which the `window` strategy fuses into it.
 
         :param account_uuid: The UUID of the account to filter the account lists by.
         :type account_uuid: UUID4
@@ -81,31 +89,35 @@ class AccountListsReadOrch:
         :type limit: int
         :param db: The database session for performing queries.
         :type db: AsyncSession
+        :param after: The id of the last link record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :return: A paginated result containing the product lists.
         :rtype: AccountListsOrchPgRes
         """
-        total_count = await self._account_lists_read_srvc.get_account_list_ct(
-            account_uuid=account_uuid, db=db
-        )
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        account_lists, total_count = (
+            await self._account_lists_read_srvc.get_account_lists_page(
+                account_uuid=account_uuid,
+                offset=offset,
+                limit=limit + 1,
+                after=after,
+                count=count,
+                db=db,
+            )
         )
-        account_lists = await self._account_lists_read_srvc.get_account_lists(
-            account_uuid=account_uuid, offset=offset, limit=limit, db=db
+        account_lists, has_more = pagination.split_page(
+            items=account_lists, limit=limit
         )
-        product_list_uuids = [account_list.uuid for account_list in account_lists]
-        product_lists = await self._product_lists_read_srvc.get_product_lists_by_uuids(
-            product_list_uuids=product_list_uuids, db=db
-        )
-        if not isinstance(product_lists, list):
-            product_lists = [product_lists]
-
         return AccountListsOrchPgRes(
             total=total_count,
             page=page,
             limit=limit,
             has_more=has_more,
-            data=product_lists,
+            next_cursor=pagination.next_cursor(
+                items=[row.AccountLists for row in account_lists], has_more=has_more
+            ),
+            data=[row.ProductLists for row in account_lists],
         )
@@ -1,6 +1,9 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..constants.enums import CountStrategy
 from ..services.account_products import ReadSrvc as AccountProductsReadSrvc
 from ..services.products import ReadSrvc as ProductsReadSrvc
 from ..schemas.account_products import AccountProductsOrchPgRes
@@ -62,14 +65,19 @@ class AccountProductsReadOrch:
         return self._account_products_read_srvc
 
     async def paginated_products(
-        self, account_uuid: UUID4, page: int, limit: int, db: AsyncSession
+        self,
+        account_uuid: UUID4,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> AccountProductsOrchPgRes:
         """
         Retrieves paginated account products along with the corresponding product data for a given account UUID.
 
-        This method calculates the total count of account products, computes the offset, and checks if there
-        are more items available for the next page. It then fetches the account products and their associated
-        product data based on the pagination parameters.
+        The account products are read joined to their products, so a page takes one statement besides
+        the total count, which the `window` strategy fuses into it.
 
         :param account_uuid: The UUID of the account to filter the account products by.
         :type account_uuid: UUID4
@@ -79,29 +87,36 @@ class AccountProductsReadOrch:
         :type limit: int
         :param db: The database session for performing queries.
         :type db: AsyncSession
+        :param after: The id of the last link record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :return: A paginated result containing the corresponding product data for account products.
         :rtype: AccountProductsOrchPgRes
         """
-        total_count = await self._account_products_read_srvc.get_account_product_ct(
-            account_uuid=account_uuid, db=db
-        )
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        account_products, total_count = (
+            await self._account_products_read_srvc.get_account_products_page(
+                account_uuid=account_uuid,
+                offset=offset,
+                limit=limit + 1,
+                after=after,
+                count=count,
+                db=db,
+            )
         )
-        account_products = await self._account_products_read_srvc.get_account_products(
-            account_uuid=account_uuid, offset=offset, limit=limit, db=db
+        account_products, has_more = pagination.split_page(
+            items=account_products, limit=limit
         )
-        product_uuids = [
-            account_product.product_uuid for account_product in account_products
-        ]
-        products = await self._products_read_srvc.get_product_by_uuids(
-            product_uuids=product_uuids, db=db
-        )
-        if not isinstance(products, list):
-            products = [products]
-
         return AccountProductsOrchPgRes(
-            total=total_count, page=page, limit=limit, has_more=has_more, data=products
+            total=total_count,
+            page=page,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=pagination.next_cursor(
+                items=[row.AccountProducts for row in account_products],
+                has_more=has_more,
+            ),
+            data=[row.Products for row in account_products],
         )
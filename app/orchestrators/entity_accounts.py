@@ -1,6 +1,9 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..constants.enums import CountStrategy
 from ..schemas.accounts import AccountsInternalCreate
 from ..schemas.entity_accounts import (
     AccountEntitiesPgRes,
@@ -88,11 +91,20 @@ class EntityAccountsReadOrch:
         return self._entity_accounts_read_srvc
 
     async def paginated_account_entities(
-        self, account_uuid: UUID4, page: int, limit: int, db: AsyncSession
+        self,
+        account_uuid: UUID4,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> AccountEntitiesPgRes:
         """
         Retrieves paginated account entities based on the account UUID, page, and limit.
 
+        The links are read joined to their entities, so a page takes one statement besides the total
+        count, which the `window` strategy fuses into it.
+
         :param account_uuid: The UUID of the account to fetch associated entities.
         :type account_uuid: UUID4
         :param page: The current page number.
@@ -101,34 +113,55 @@ class EntityAccountsReadOrch:
         :type limit: int
         :param db: The database session for performing queries.
         :type db: AsyncSession
+        :param after: The id of the last link record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :return: Paginated response containing account entities.
         :rtype: AccountEntitiesPgRes
         """
-        total_count = await self.entity_accounts_read_srvc.get_account_entities_ct(
-            account_uuid=account_uuid, db=db
-        )
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(page=page, limit=limit)
-        account_entities = await self.entity_accounts_read_srvc.get_account_entities(
-            account_uuid=account_uuid, offset=offset, limit=limit, db=db
+        account_entities, total_count = (
+            await self.entity_accounts_read_srvc.get_account_entities_page(
+                account_uuid=account_uuid,
+                offset=offset,
+                limit=limit + 1,
+                after=after,
+                count=count,
+                db=db,
+            )
         )
-        entity_uuids = [account_entity.uuid for account_entity in account_entities]
-        entities = await self.entities_read_srvc.get_entities_by_uuids(
-            entity_uuids=entity_uuids, db=db
+        account_entities, has_more = pagination.split_page(
+            items=account_entities, limit=limit
         )
-        if not isinstance(entities, list):
-            entities = [entities]
         return AccountEntitiesPgRes(
-            total=total_count, page=page, limit=limit, has_more=has_more, data=entities
+            total=total_count,
+            page=page,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=pagination.next_cursor(
+                items=[row.EntityAccounts for row in account_entities],
+                has_more=has_more,
+            ),
+            data=account_entities,
         )
 
     async def paginated_entity_accounts(
-        self, entity_uuid: UUID4, page: int, limit: int, db: AsyncSession
+        self,
+        entity_uuid: UUID4,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> EntityAccountsPgRes:
         """
         Retrieves paginated entity accounts based on the entity UUID, page, and limit.
 
+        The links are read joined to their accounts, so a page takes one statement besides the total
+        count, which the `window` strategy fuses into it.
+
         :param entity_uuid: The UUID of the entity to fetch associated accounts.
         :type entity_uuid: UUID4
         :param page: The current page number.
@@ -137,28 +170,38 @@ class EntityAccountsReadOrch:
         :type limit: int
         :param db: The database session for performing queries.
         :type db: AsyncSession
+        :param after: The id of the last link record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :return: Paginated response containing entity accounts.
         :rtype: EntityAccountsPgRes
         """
-        total_count = await self.entity_accounts_read_srvc.get_entity_accounts_ct(
-            entity_uuid=entity_uuid, db=db
-        )
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
-        )
-        entity_accounts = await self.entity_accounts_read_srvc.get_entity_accounts(
-            entity_uuid=entity_uuid, offset=offset, limit=limit, db=db
+        entity_accounts, total_count = (
+            await self.entity_accounts_read_srvc.get_entity_accounts_page(
+                entity_uuid=entity_uuid,
+                offset=offset,
+                limit=limit + 1,
+                after=after,
+                count=count,
+                db=db,
+            )
         )
-        account_uuids = [entity_account.uuid for entity_account in entity_accounts]
-        accounts = await self.accounts_read_srvc.get_accounts_by_uuids(
-            account_uuids=account_uuids, db=db
+        entity_accounts, has_more = pagination.split_page(
+            items=entity_accounts, limit=limit
         )
-        if not isinstance(accounts, list):
-            accounts = [accounts]
         return EntityAccountsPgRes(
-            total=total_count, page=page, limit=limit, has_more=has_more, data=accounts
+            total=total_count,
+            page=page,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=pagination.next_cursor(
+                items=[row.EntityAccounts for row in entity_accounts],
+                has_more=has_more,
+            ),
+            data=[row.Accounts for row in entity_accounts],
         )
 
 
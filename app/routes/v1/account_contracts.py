@@ -1,11 +1,12 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import AccContractExists, AccContractNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -20,9 +21,10 @@ from ...schemas.account_contracts import (
 )
 from ...services.account_contracts import ReadSrvc, CreateSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.data import internal_schema_validation
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 
 router = APIRouter()
 
@@ -36,10 +38,11 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([AccContractNotExist])
 async def get_account_contract(
+    request: Request,
     response: Response,
     account_uuid: UUID4,
     account_contract_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     account_contract_read_srvc: ReadSrvc = Depends(
         services_container["account_contracts_read"]
@@ -49,12 +52,21 @@ async def get_account_contract(
     Fetch one account contract by account and account contract uuid.
     """
 
-    async with transaction_manager(db=db):
-        return await account_contract_read_srvc.get_account_contract(
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: account_contract_read_srvc.get_account_contract_version(
             account_uuid=account_uuid,
             account_contract_uuid=account_contract_uuid,
             db=db,
-        )
+        ),
+        read=lambda: account_contract_read_srvc.get_account_contract(
+            account_uuid=account_uuid,
+            account_contract_uuid=account_contract_uuid,
+            db=db,
+        ),
+    )
 
 
 @router.get(
@@ -69,7 +81,9 @@ async def get_account_contracts(
     account_uuid: UUID4,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     account_contract_read_srvc: ReadSrvc = Depends(
         services_container["account_contracts_read"]
@@ -81,7 +95,12 @@ async def get_account_contracts(
 
     async with transaction_manager(db=db):
         return await account_contract_read_srvc.paginated_account_contracts(
-            account_uuid=account_uuid, page=page, limit=limit, db=db
+            account_uuid=account_uuid,
+            page=page,
+            limit=limit,
+            after=after,
+            count=count,
+            db=db,
         )
 
 
@@ -1,12 +1,13 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.orchestrators import container as orchs_container
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import AccsNotExist, EntityAccNotExist, EntityNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -22,8 +23,9 @@ from ...schemas.entity_accounts import (
 )
 from ...services import entity_accounts as entity_accounts_srvcs
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -38,10 +40,11 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([EntityAccNotExist])
 async def get_account_entity(
+    request: Request,
     response: Response,
     account_uuid: UUID4,
     entity_account_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     entity_account_read_srvc: entity_accounts_srvcs.ReadSrvc = Depends(
         services_container["entity_accounts_read"]
@@ -49,10 +52,17 @@ async def get_account_entity(
 ) -> EntityAccountsRes:
     """get active account relationship"""
 
-    async with transaction_manager(db=db):
-        return await entity_account_read_srvc.get_account_entity(
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: entity_account_read_srvc.get_account_entity_version(
             account_uuid=account_uuid, entity_account_uuid=entity_account_uuid, db=db
-        )
+        ),
+        read=lambda: entity_account_read_srvc.get_account_entity(
+            account_uuid=account_uuid, entity_account_uuid=entity_account_uuid, db=db
+        ),
+    )
 
 
 @router.get(
@@ -67,7 +77,9 @@ async def get_account_entities(
     account_uuid: UUID4,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     entity_accounts_read_orch: EntityAccountsReadOrch = Depends(
         orchs_container["entity_accounts_read_orch"]
@@ -78,7 +90,12 @@ async def get_account_entities(
     """
     async with transaction_manager(db=db):
         return await entity_accounts_read_orch.paginated_account_entities(
-            account_uuid=account_uuid, page=page, limit=limit, db=db
+            account_uuid=account_uuid,
+            page=page,
+            limit=limit,
+            after=after,
+            count=count,
+            db=db,
         )
 
 
@@ -1,12 +1,13 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.orchestrators import container as orchs_container
 from ...containers.services import container as service_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import AccListExists, AccListNotExist, ProductsNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -22,8 +23,9 @@ from ...schemas.account_lists import (
 )
 from ...services.account_lists import ReadSrvc, CreateSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 
@@ -39,11 +41,12 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([AccListNotExist])
 async def get_account_list(
+    request: Request,
     account_uuid: UUID4,
     account_list_uuid: UUID4,
     response: Response,
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     account_lists_read_srvc: ReadSrvc = Depends(
         service_container["account_lists_read"]
     ),
@@ -52,10 +55,17 @@ async def get_account_list(
     Get one account list.
     """
 
-    async with transaction_manager(db=db):
-        return await account_lists_read_srvc.get_account_list(
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: account_lists_read_srvc.get_account_list_version(
             account_uuid=account_uuid, account_list_uuid=account_list_uuid, db=db
-        )
+        ),
+        read=lambda: account_lists_read_srvc.get_account_list(
+            account_uuid=account_uuid, account_list_uuid=account_list_uuid, db=db
+        ),
+    )
 
 
 @router.get(
@@ -70,7 +80,9 @@ async def get_account_lists(
     account_uuid: UUID4,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     account_lists_read_orch: AccountListsReadOrch = Depends(
         orchs_container["accounts_lists_read_orch"]
@@ -84,7 +96,12 @@ async def get_account_lists(
 
     async with transaction_manager(db=db):
         return await account_lists_read_orch.paginated_product_lists(
-            account_uuid=account_uuid, page=page, limit=limit, db=db
+            account_uuid=account_uuid,
+            page=page,
+            limit=limit,
+            after=after,
+            count=count,
+            db=db,
         )
 
 
@@ -1,12 +1,13 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.orchestrators import container as orchs_container
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import AccProductsExists, AccProductstNotExist, ProductsNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -22,8 +23,9 @@ from ...schemas.account_products import (
 )
 from ...services import account_products as account_products_srvcs
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 
@@ -39,10 +41,11 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([AccProductstNotExist])
 async def get_account_products(
+    request: Request,
     response: Response,
     account_uuid: UUID4,
     account_product_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     account_products_read_srvc: account_products_srvcs.ReadSrvc = Depends(
         services_container["account_products_read"]
@@ -50,12 +53,17 @@ async def get_account_products(
 ) -> AccountProductsRes:
     """get one active allowed account product"""
 
-    async with transaction_manager(db=db):
-        return await account_products_read_srvc.get_account_product(
-            account_uuid=account_uuid,
-            account_product_uuid=account_product_uuid,
-            db=db,
-        )
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: account_products_read_srvc.get_account_product_version(
+            account_uuid=account_uuid, account_product_uuid=account_product_uuid, db=db
+        ),
+        read=lambda: account_products_read_srvc.get_account_product(
+            account_uuid=account_uuid, account_product_uuid=account_product_uuid, db=db
+        ),
+    )
 
 
 @router.get(
@@ -70,7 +78,9 @@ async def get_account_products(
     account_uuid: UUID4,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     account_products_read_orchs: AccountProductsReadOrch = Depends(
         orchs_container["account_products_read_orch"]
@@ -81,7 +91,12 @@ async def get_account_products(
     """
     async with transaction_manager(db=db):
         return await account_products_read_orchs.paginated_products(
-            account_uuid=account_uuid, page=page, limit=limit, db=db
+            account_uuid=account_uuid,
+            page=page,
+            limit=limit,
+            after=after,
+            count=count,
+            db=db,
         )
 
 
@@ -1,11 +1,12 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import AccsNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -17,10 +18,13 @@ from ...schemas.accounts import (
     AccountsDel,
     AccountsUpdate,
 )
+from ...schemas.overviews import AccountOverviewRes
+from ...services import overviews as overviews_srvcs
 from ...services.accounts import CreateSrvc, ReadSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -34,9 +38,10 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([AccsNotExist])
 async def get_account(
+    request: Request,
     response: Response,
     account_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     accounts_read_srvc: ReadSrvc = Depends(services_container["accounts_read"]),
 ) -> AccountsRes:
@@ -44,8 +49,55 @@ async def get_account(
     Get one account by account_uuid.
     """
 
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: accounts_read_srvc.get_account_version(
+            account_uuid=account_uuid, db=db
+        ),
+        read=lambda: accounts_read_srvc.get_account(account_uuid=account_uuid, db=db),
+    )
+
+
+@router.get(
+    "/{account_uuid}/overview/",
+    response_model=AccountOverviewRes,
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([AccsNotExist])
+async def get_account_overview(
+    response: Response,
+    account_uuid: UUID4,
+    entities_limit: int = Query(10, ge=1, le=100),
+    addresses_limit: int = Query(10, ge=1, le=100),
+    contracts_limit: int = Query(10, ge=1, le=100),
+    lists_limit: int = Query(10, ge=1, le=100),
+    products_limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
+    overviews_read_srvc: overviews_srvcs.ReadSrvc = Depends(
+        services_container["overviews_read"]
+    ),
+) -> AccountOverviewRes:
+    """
+    Get one account by account_uuid with its entities, addresses, contracts, product lists and products.
+
+    Everything is read in one query. Each section returns its total and up to its own limit of records,
+    the full lists remain available from the paginated endpoints of the account.
+    """
+
     async with transaction_manager(db=db):
-        return await accounts_read_srvc.get_account(account_uuid=account_uuid, db=db)
+        return await overviews_read_srvc.get_account_overview(
+            account_uuid=account_uuid,
+            entities_limit=entities_limit,
+            addresses_limit=addresses_limit,
+            contracts_limit=contracts_limit,
+            lists_limit=lists_limit,
+            products_limit=products_limit,
+            db=db,
+        )
 
 
 @router.get(
@@ -59,7 +111,9 @@ async def get_accounts(
     response: Response,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     accounts_read_srvc: ReadSrvc = Depends(services_container["accounts_read"]),
 ) -> AccountsPgRes:
@@ -69,7 +123,7 @@ async def get_accounts(
 
     async with transaction_manager(db=db):
         return await accounts_read_srvc.paginated_accounts(
-            page=page, limit=limit, db=db
+            page=page, limit=limit, after=after, count=count, db=db
         )
 
 
@@ -1,12 +1,14 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy, DataFormat
 from ...containers.orchestrators import container as orchs_container
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import (
     EntityDataInvalid,
     EntityIndivDataInvalid,
@@ -28,15 +30,84 @@ from ...schemas.entities import (
 )
 from ...schemas.individuals import IndividualsRes, IndividualsCreate
 from ...schemas.non_individuals import NonIndividualsRes, NonIndividualsCreate
+from ...schemas.overviews import EntityOverviewRes
+from ...schemas.search import EntitiesSearchPgRes
+from ...services import overviews as overviews_srvcs
+from ...services import search as search_srvcs
 from ...services.entities import ReadSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import export, pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
 
 
+@router.get(
+    "/export/",
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([])
+async def export_entities(
+    response: Response,
+    format: DataFormat = Query(
+        DataFormat.NDJSON, description="Export format, `ndjson` or `csv`."
+    ),
+    gzip: bool = Query(False, description="Compress the export with gzip."),
+    user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
+    entities_read_srvc: ReadSrvc = Depends(services_container["entities_read"]),
+) -> StreamingResponse:
+    """
+    Export all entities, streamed as NDJSON or CSV without pagination.
+    """
+    return export.export_response(
+        response=response,
+        source=lambda db: entities_read_srvc.stream_entities(db=db),
+        schema=EntitiesRes,
+        format=format,
+        compress=gzip,
+        filename="entities",
+    )
+
+
+@router.get(
+    "/search/",
+    response_model=EntitiesSearchPgRes,
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([EntityNotExist])
+async def search_entities(
+    response: Response,
+    q: str = Query(
+        ...,
+        min_length=3,
+        max_length=100,
+        description="Part of a first or last name, a company name or a TIN.",
+    ),
+    limit: int = Query(10, ge=1, le=100),
+    after: Optional[Tuple[float, int]] = Depends(pagination.get_ranked_cursor),
+    db: AsyncSession = Depends(get_read_db),
+    user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
+    search_read_srvc: search_srvcs.ReadSrvc = Depends(
+        services_container["search_read"]
+    ),
+) -> EntitiesSearchPgRes:
+    """
+    Search entities by partial name or TIN, best matches first.
+
+    Matches are found with trigram indexes, typos and partial words still match. Pages are
+    requested with `next_cursor`, the number of matches is not counted.
+    """
+
+    async with transaction_manager(db=db):
+        return await search_read_srvc.search_entities(
+            query=q, limit=limit, after=after, db=db
+        )
+
+
 @router.get(
     "/{entity_uuid}/",
     response_model=EntitiesRes,
@@ -45,18 +116,65 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([EntityNotExist])
 async def get_entity(
+    request: Request,
     entity_uuid: UUID4,
     response: Response,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     entities_read_srvc: ReadSrvc = Depends(services_container["entities_read"]),
 ) -> EntitiesRes:
     """
     Get one entity by entity_uuid.
 
+    """
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: entities_read_srvc.get_entity_version(
+            entity_uuid=entity_uuid, db=db
+        ),
+        read=lambda: entities_read_srvc.get_entity(entity_uuid=entity_uuid, db=db),
+    )
+
+
+@router.get(
+    "/{entity_uuid}/overview/",
+    response_model=EntityOverviewRes,
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([EntityNotExist])
+async def get_entity_overview(
+    entity_uuid: UUID4,
+    response: Response,
+    emails_limit: int = Query(10, ge=1, le=100),
+    numbers_limit: int = Query(10, ge=1, le=100),
+    websites_limit: int = Query(10, ge=1, le=100),
+    addresses_limit: int = Query(10, ge=1, le=100),
+    accounts_limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
+    overviews_read_srvc: overviews_srvcs.ReadSrvc = Depends(
+        services_container["overviews_read"]
+    ),
+) -> EntityOverviewRes:
+    """
+    Get one entity by entity_uuid with its individual or non-individual, emails, numbers, websites, addresses and account links.
+
+    Everything is read in one query. Each section returns its total and up to its own limit of records,
+    the full lists remain available from the paginated endpoints of the entity.
     """
     async with transaction_manager(db=db):
-        return await entities_read_srvc.get_entity(entity_uuid=entity_uuid, db=db)
+        return await overviews_read_srvc.get_entity_overview(
+            entity_uuid=entity_uuid,
+            emails_limit=emails_limit,
+            numbers_limit=numbers_limit,
+            websites_limit=websites_limit,
+            addresses_limit=addresses_limit,
+            accounts_limit=accounts_limit,
+            db=db,
+        )
 
 
 @router.get(
@@ -70,7 +188,9 @@ async def get_entities(
     response: Response,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     entities_read_srvc: ReadSrvc = Depends(services_container["entities_read"]),
 ) -> EntitiesPgRes:
@@ -79,7 +199,7 @@ async def get_entities(
     """
     async with transaction_manager(db=db):
         return await entities_read_srvc.paginated_entities(
-            page=page, limit=limit, db=db
+            page=page, limit=limit, after=after, count=count, db=db
         )
 
 
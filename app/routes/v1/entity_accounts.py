@@ -1,12 +1,13 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.orchestrators import container as orchs_container
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import (
     AccsExists,
     AccsNotExist,
@@ -34,8 +35,9 @@ from ...schemas.entity_accounts import (
 )
 from ...services import entity_accounts as entity_accounts_srvcs
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -50,10 +52,11 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([EntityAccNotExist])
 async def get_entity_account(
+    request: Request,
     response: Response,
     entity_uuid: UUID4,
     entity_account_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     entity_accounts_read_srvc: entity_accounts_srvcs.ReadSrvc = Depends(
         services_container["entity_accounts_read"]
@@ -61,10 +64,17 @@ async def get_entity_account(
 ) -> EntityAccountsRes:
     """get active account relationship"""
 
-    async with transaction_manager(db=db):
-        return await entity_accounts_read_srvc.get_entity_account(
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: entity_accounts_read_srvc.get_entity_account_version(
             entity_uuid=entity_uuid, entity_account_uuid=entity_account_uuid, db=db
-        )
+        ),
+        read=lambda: entity_accounts_read_srvc.get_entity_account(
+            entity_uuid=entity_uuid, entity_account_uuid=entity_account_uuid, db=db
+        ),
+    )
 
 
 @router.get(
@@ -79,7 +89,9 @@ async def get_entity_accounts(
     entity_uuid: UUID4,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     entity_accounts_read_orch: EntityAccountsReadOrch = Depends(
         orchs_container["entity_accounts_read_orch"]
@@ -93,7 +105,12 @@ async def get_entity_accounts(
 
     async with transaction_manager(db=db):
         return await entity_accounts_read_orch.paginated_entity_accounts(
-            entity_uuid=entity_uuid, page=page, limit=limit, db=db
+            entity_uuid=entity_uuid,
+            page=page,
+            limit=limit,
+            after=after,
+            count=count,
+            db=db,
         )
 
 
@@ -1,11 +1,12 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import AddressExists, AddressNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -20,8 +21,9 @@ from ...schemas.addresses import (
 )
 from ...services.addresses import ReadSrvc, CreateSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -36,22 +38,33 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([AddressNotExist])
 async def get_address(
+    request: Request,
     response: Response,
     entity_uuid: UUID4,
     address_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     addresses_read_srvc: ReadSrvc = Depends(services_container["addresses_read"]),
 ) -> AddressesRes:
     """get one address"""
 
-    async with transaction_manager(db=db):
-        return await addresses_read_srvc.get_address(
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: addresses_read_srvc.get_address_version(
             parent_uuid=entity_uuid,
             parent_table="entities",
             address_uuid=address_uuid,
             db=db,
-        )
+        ),
+        read=lambda: addresses_read_srvc.get_address(
+            parent_uuid=entity_uuid,
+            parent_table="entities",
+            address_uuid=address_uuid,
+            db=db,
+        ),
+    )
 
 
 @router.get(
@@ -66,7 +79,9 @@ async def get_addresses(
     entity_uuid: UUID4,
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     addresses_read_srvc: ReadSrvc = Depends(services_container["addresses_read"]),
 ) -> AddressesPgRes:
@@ -76,7 +91,12 @@ async def get_addresses(
 
     async with transaction_manager(db=db):
         return await addresses_read_srvc.paginated_addresses(
-            parent_uuid=entity_uuid, page=page, limit=limit, db=db
+            parent_uuid=entity_uuid,
+            page=page,
+            limit=limit,
+            after=after,
+            count=count,
+            db=db,
         )
 
 
@@ -118,7 +138,7 @@ async def create_address(
     status_code=status.HTTP_200_OK,
 )
 @set_auth_cookie
-@handle_exceptions([AddressNotExist])
+@handle_exceptions([AddressExists, AddressNotExist])
 async def update_address(
     response: Response,
     entity_uuid: UUID4,
@@ -1,11 +1,11 @@
 from typing import Tuple
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import IndividualExists, IndividualNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -20,6 +20,7 @@ from ...services.individuals import ReadSrvc, CreateSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
 from ...utilities import sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -33,19 +34,27 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([IndividualNotExist])
 async def get_individual(
+    request: Request,
     response: Response,
     entity_uuid: UUID4,
     individual_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     individuals_read_srvc: ReadSrvc = Depends(services_container["individuals_read"]),
 ) -> IndividualsRes:
     """get one individual"""
 
-    async with transaction_manager(db=db):
-        return await individuals_read_srvc.get_individual(
-            entity_uuid=entity_uuid, individual_uuid=individual_uuid, db=db
-        )
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: individuals_read_srvc.get_individual_version(
+            entity_uuid=entity_uuid, db=db
+        ),
+        read=lambda: individuals_read_srvc.get_individual(
+            entity_uuid=entity_uuid, db=db
+        ),
+    )
 
 
 # Deprecating this, the entities router operations will create all entities.
@@ -1,11 +1,13 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy, DataFormat
 from ...containers.services import container as service_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import InvoiceItemExists, InvoiceItemNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -19,13 +21,47 @@ from ...schemas.invoice_items import (
 )
 from ...services.invoice_items import CreateSrvc, ReadSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import export, pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
 
 
+@router.get(
+    "/{invoice_uuid}/invoice-items/export/",
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([])
+async def export_invoice_items(
+    response: Response,
+    invoice_uuid: UUID4,
+    format: DataFormat = Query(
+        DataFormat.NDJSON, description="Export format, `ndjson` or `csv`."
+    ),
+    gzip: bool = Query(False, description="Compress the export with gzip."),
+    user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
+    invoice_items_read_srvc: ReadSrvc = Depends(
+        service_container["invoice_items_read"]
+    ),
+) -> StreamingResponse:
+    """
+    Export all items of an invoice, streamed as NDJSON or CSV without pagination.
+    """
+    return export.export_response(
+        response=response,
+        source=lambda db: invoice_items_read_srvc.stream_invoice_items(
+            invoice_uuid=invoice_uuid, db=db
+        ),
+        schema=InvoiceItemsRes,
+        format=format,
+        compress=gzip,
+        filename=f"invoice-items-{invoice_uuid}",
+    )
+
+
 @router.get(
     "/{invoice_uuid}/invoice-items/{invoice_item_uuid}/",
     response_model=InvoiceItemsRes,
@@ -35,10 +71,11 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([InvoiceItemNotExist])
 async def get_invoice_item(
+    request: Request,
     response: Response,
     invoice_uuid: UUID4,
     invoice_item_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     invoice_items_read_srvc: ReadSrvc = Depends(
         service_container["invoice_items_read"]
@@ -48,10 +85,17 @@ async def get_invoice_item(
     Get one invoice item.
     """
 
-    async with transaction_manager(db=db):
-        return await invoice_items_read_srvc.get_invoice_item(
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: invoice_items_read_srvc.get_invoice_item_version(
             invoice_uuid=invoice_uuid, invoice_item_uuid=invoice_item_uuid, db=db
-        )
+        ),
+        read=lambda: invoice_items_read_srvc.get_invoice_item(
+            invoice_uuid=invoice_uuid, invoice_item_uuid=invoice_item_uuid, db=db
+        ),
+    )
 
 
 @router.get(
@@ -67,7 +111,9 @@ async def get_invoice_items(
     invoice_uuid: UUID4,
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=10, ge=1, le=10),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     invoice_items_read_srvc: ReadSrvc = Depends(
         service_container["invoice_items_read"]
@@ -79,7 +125,12 @@ async def get_invoice_items(
 
     async with transaction_manager(db=db):
         return await invoice_items_read_srvc.paginated_invoice_items(
-            invoice_uuid=invoice_uuid, page=page, limit=limit, db=db
+            invoice_uuid=invoice_uuid,
+            page=page,
+            limit=limit,
+            after=after,
+            count=count,
+            db=db,
         )
 
 
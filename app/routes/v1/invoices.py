@@ -1,11 +1,12 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.services import container as service_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import InvoiceExists, InvoiceNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -20,8 +21,9 @@ from ...schemas.invoices import (
 )
 from ...services.invoices import ReadSrvc, CreateSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -36,9 +38,10 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([InvoiceNotExist])
 async def get_invoice(
+    request: Request,
     response: Response,
     invoice_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     invoices_read_srvc: ReadSrvc = Depends(service_container["invoices_read"]),
 ) -> InvoicesRes:
@@ -46,8 +49,15 @@ async def get_invoice(
     Get one invoice.
     """
 
-    async with transaction_manager(db=db):
-        return await invoices_read_srvc.get_invoice(invoice_uuid=invoice_uuid, db=db)
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: invoices_read_srvc.get_invoice_version(
+            invoice_uuid=invoice_uuid, db=db
+        ),
+        read=lambda: invoices_read_srvc.get_invoice(invoice_uuid=invoice_uuid, db=db),
+    )
 
 
 @router.get(
@@ -61,7 +71,9 @@ async def get_invoices(
     response: Response,
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     invoices_read_srvc: ReadSrvc = Depends(service_container["invoices_read"]),
 ) -> InvoicesPgRes:
@@ -71,7 +83,7 @@ async def get_invoices(
 
     async with transaction_manager(db=db):
         return await invoices_read_srvc.paginated_invoices(
-            page=page, limit=limit, db=db
+            page=page, limit=limit, after=after, count=count, db=db
         )
 
 
@@ -0,0 +1,56 @@
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...containers.services import container as services_container
+from ...database.database import get_read_db, transaction_manager
+from ...exceptions import EntityNotExist, LookupKeyInvalid
+from ...handlers.handler import handle_exceptions
+from ...models.sys_users import SysUsers
+from ...schemas.lookup import EntitiesLookupRes
+from ...services.lookup import ReadSrvc
+from ...services.token import set_auth_cookie
+from ...utilities.auth import get_validated_session
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    response_model=EntitiesLookupRes,
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([EntityNotExist, LookupKeyInvalid])
+async def lookup_entities(
+    response: Response,
+    email: Optional[str] = Query(
+        None, max_length=325, description="Email address, whatever the case."
+    ),
+    phone: Optional[str] = Query(
+        None,
+        max_length=30,
+        description="Phone number in any format, 10 digits are taken as North American.",
+    ),
+    domain: Optional[str] = Query(
+        None,
+        max_length=325,
+        description="Domain or URL of a website, `www.` and the path are ignored.",
+    ),
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
+    lookup_read_srvc: ReadSrvc = Depends(services_container["lookup_read"]),
+) -> EntitiesLookupRes:
+    """
+    Find the entities having an email address, a phone number or a website domain.
+
+    Exactly one of `email`, `phone` and `domain` is given. The value is normalized and
+    matched with one probe of a global index, entities are returned oldest first.
+    """
+
+    async with transaction_manager(db=db):
+        return await lookup_read_srvc.lookup_entities(
+            email=email, phone=phone, domain=domain, limit=limit, db=db
+        )
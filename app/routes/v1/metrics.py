@@ -0,0 +1,102 @@
+from typing import List, Tuple
+
+from fastapi import APIRouter, Depends, Response, status
+
+from ...database.database import async_engine, async_read_engines
+from ...database.operations import count_cache
+from ...database.pool import pool_status
+from ...database.query_stats import query_stats_status
+from ...handlers.handler import handle_exceptions
+from ...models.sys_users import SysUsers
+from ...schemas.metrics import (
+    CacheRes,
+    DatabasePoolRes,
+    PasswordHashPoolRes,
+    QueryStatsRes,
+)
+from ...services.sys_users import sys_user_cache
+from ...services.token import set_auth_cookie
+from ...utilities.auth import get_validated_session
+from ...utilities.catalog import catalog_cache
+from ...utilities.password import hash_pool_status
+
+router = APIRouter()
+
+
+@router.get(
+    "/database-pool/",
+    response_model=List[DatabasePoolRes],
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([])
+async def get_database_pool(
+    response: Response,
+    user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
+) -> List[DatabasePoolRes]:
+    """
+    Get live connection pool statistics for this worker, primary first then read replicas.
+    """
+    pools = [("primary", async_engine.pool)] + [
+        (f"replica-{index}", engine.pool)
+        for index, engine in enumerate(async_read_engines)
+    ]
+    return [
+        DatabasePoolRes(name=name, **pool_status(pool=pool)) for name, pool in pools
+    ]
+
+
+@router.get(
+    "/caches/",
+    response_model=List[CacheRes],
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([])
+async def get_caches(
+    response: Response,
+    user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
+) -> List[CacheRes]:
+    """
+    Get size and hit and miss counters of the in-process caches for this worker.
+    """
+    caches = [
+        ("catalog", catalog_cache),
+        ("count", count_cache),
+        ("sys_users", sys_user_cache),
+    ]
+    return [CacheRes(name=name, **cache.stats()) for name, cache in caches]
+
+
+@router.get(
+    "/password-hashing/",
+    response_model=PasswordHashPoolRes,
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([])
+async def get_password_hashing(
+    response: Response,
+    user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
+) -> PasswordHashPoolRes:
+    """
+    Get queue depth and wait statistics of the password hashing pool for this worker.
+    """
+    return PasswordHashPoolRes(**hash_pool_status())
+
+
+@router.get(
+    "/queries/",
+    response_model=List[QueryStatsRes],
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([])
+async def get_queries(
+    response: Response,
+    user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
+) -> List[QueryStatsRes]:
+    """
+    Get latency histograms and row counts of database operations per service for this worker, slowest first.
+    """
+    return [QueryStatsRes(**stats) for stats in query_stats_status()]
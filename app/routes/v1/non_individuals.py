@@ -1,11 +1,11 @@
 from typing import List, Tuple
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...containers.services import container as service_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import NonIndividualExists, NonIndividualNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -20,6 +20,7 @@ from ...services.non_individuals import ReadSrvc, CreateSrvc, UpdateSrvc, DelSrv
 from ...services.token import set_auth_cookie
 from ...utilities import sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -33,10 +34,11 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([NonIndividualNotExist])
 async def get_non_individual(
+    request: Request,
     response: Response,
     entity_uuid: UUID4,
     non_individual_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     non_invdivuals_read_srvc: ReadSrvc = Depends(
         service_container["non_individuals_read"]
@@ -44,10 +46,17 @@ async def get_non_individual(
 ) -> NonIndividualsRes:
     """get one non_individual"""
 
-    async with transaction_manager(db=db):
-        return await non_invdivuals_read_srvc.get_non_individual(
-            entity_uuid=entity_uuid, non_individual_uuid=non_individual_uuid, db=db
-        )
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: non_invdivuals_read_srvc.get_non_individual_version(
+            entity_uuid=entity_uuid, db=db
+        ),
+        read=lambda: non_invdivuals_read_srvc.get_non_individual(
+            entity_uuid=entity_uuid, db=db
+        ),
+    )
 
 
 # Deprecating this, the entities router operations will create all entities.
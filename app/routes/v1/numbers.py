@@ -1,11 +1,12 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import NumberExists, NumbersNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -20,8 +21,9 @@ from ...schemas.numbers import (
 )
 from ...services.numbers import ReadSrvc, CreateSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -36,21 +38,27 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([NumbersNotExist])
 async def get_number(
+    request: Request,
     response: Response,
     entity_uuid: UUID4,
     number_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple = Depends(get_validated_session),
     numbers_read_srvc: ReadSrvc = Depends(services_container["numbers_read"]),
 ) -> NumbersRes:
     """get one number by entity"""
 
-    async with transaction_manager(db=db):
-        return await numbers_read_srvc.get_number(
-            entity_uuid=entity_uuid,
-            number_uuid=number_uuid,
-            db=db,
-        )
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: numbers_read_srvc.get_number_version(
+            entity_uuid=entity_uuid, number_uuid=number_uuid, db=db
+        ),
+        read=lambda: numbers_read_srvc.get_number(
+            entity_uuid=entity_uuid, number_uuid=number_uuid, db=db
+        ),
+    )
 
 
 @router.get(
@@ -65,7 +73,9 @@ async def get_numbers(
     entity_uuid: UUID4,
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     numbers_read_srvc: ReadSrvc = Depends(services_container["numbers_read"]),
 ) -> NumbersPgRes:
@@ -75,7 +85,12 @@ async def get_numbers(
 
     async with transaction_manager(db=db):
         return await numbers_read_srvc.paginated_numbers(
-            entity_uuid=entity_uuid, page=page, limit=limit, db=db
+            entity_uuid=entity_uuid,
+            page=page,
+            limit=limit,
+            after=after,
+            count=count,
+            db=db,
         )
 
 
@@ -1,11 +1,12 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import OrderItemNotExist, OrderItemExists
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -20,8 +21,9 @@ from ...schemas.order_items import (
 )
 from ...services.order_items import ReadSrvc, CreateSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -36,10 +38,11 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([OrderItemNotExist])
 async def get_order_item(
+    request: Request,
     response: Response,
     order_uuid: UUID4,
     order_item_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     order_items_read_srvc: ReadSrvc = Depends(services_container["order_items_read"]),
 ) -> OrderItemsRes:
@@ -47,10 +50,17 @@ async def get_order_item(
     Get one order item.
     """
 
-    async with transaction_manager(db=db):
-        return await order_items_read_srvc.get_order_item(
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: order_items_read_srvc.get_order_item_version(
             order_uuid=order_uuid, order_item_uuid=order_item_uuid, db=db
-        )
+        ),
+        read=lambda: order_items_read_srvc.get_order_item(
+            order_uuid=order_uuid, order_item_uuid=order_item_uuid, db=db
+        ),
+    )
 
 
 @router.get(
@@ -65,7 +75,9 @@ async def get_order_items(
     order_uuid: UUID4,
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     order_items_read_srvc: ReadSrvc = Depends(services_container["order_items_read"]),
 ) -> OrderItemsPgRes:
@@ -75,7 +87,12 @@ async def get_order_items(
 
     async with transaction_manager(db=db):
         return await order_items_read_srvc.paginated_order_items(
-            order_uuid=order_uuid, page=page, limit=limit, db=db
+            order_uuid=order_uuid,
+            page=page,
+            limit=limit,
+            after=after,
+            count=count,
+            db=db,
         )
 
 
@@ -1,11 +1,13 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy, DataFormat
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import OrderExists, OrderNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -20,13 +22,42 @@ from ...schemas.orders import (
 )
 from ...services.orders import CreateSrvc, ReadSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import export, pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
 
 
+@router.get(
+    "/export/",
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([])
+async def export_orders(
+    response: Response,
+    format: DataFormat = Query(
+        DataFormat.NDJSON, description="Export format, `ndjson` or `csv`."
+    ),
+    gzip: bool = Query(False, description="Compress the export with gzip."),
+    user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
+    orders_read_srvc: ReadSrvc = Depends(services_container["orders_read"]),
+) -> StreamingResponse:
+    """
+    Export all sales orders, streamed as NDJSON or CSV without pagination.
+    """
+    return export.export_response(
+        response=response,
+        source=lambda db: orders_read_srvc.stream_orders(db=db),
+        schema=OrdersRes,
+        format=format,
+        compress=gzip,
+        filename="orders",
+    )
+
+
 @router.get(
     "/{order_uuid}/",
     response_model=OrdersRes,
@@ -36,9 +67,10 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([OrderNotExist])
 async def get_order(
+    request: Request,
     response: Response,
     order_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     orders_read_srvc: ReadSrvc = Depends(services_container["orders_read"]),
 ) -> OrdersRes:
@@ -46,8 +78,13 @@ async def get_order(
     Get one sales order.
     """
 
-    async with transaction_manager(db=db):
-        return await orders_read_srvc.get_order(order_uuid=order_uuid, db=db)
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: orders_read_srvc.get_order_version(order_uuid=order_uuid, db=db),
+        read=lambda: orders_read_srvc.get_order(order_uuid=order_uuid, db=db),
+    )
 
 
 @router.get(
@@ -61,7 +98,9 @@ async def get_orders(
     response: Response,
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     orders_read_srvc: ReadSrvc = Depends(services_container["orders_read"]),
 ) -> OrdersPgRes:
@@ -70,7 +109,9 @@ async def get_orders(
     """
 
     async with transaction_manager(db=db):
-        return await orders_read_srvc.paginated_orders(page=page, limit=limit, db=db)
+        return await orders_read_srvc.paginated_orders(
+            page=page, limit=limit, after=after, count=count, db=db
+        )
 
 
 @router.post(
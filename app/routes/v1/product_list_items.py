@@ -1,14 +1,22 @@
-from typing import List, Tuple
+from datetime import UTC, datetime
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants import messages as msg
+from ...constants.enums import BulkInsertMode, CountStrategy, DataFormat
 from ...containers.services import container as service_container
-from ...database.database import get_db, transaction_manager
-from ...exceptions import ProductListItemExists, ProductListItemNotExist
+from ...database.database import get_db, primary_read_session, transaction_manager
+from ...exceptions import (
+    ProductListItemExists,
+    ProductListItemNotExist,
+    ProductListNotExist,
+)
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
+from ...schemas.imports import ImportRes
 from ...schemas.product_list_items import (
     ProductListItemsCreate,
     ProductListItemsDel,
@@ -18,10 +26,12 @@ from ...schemas.product_list_items import (
     ProductListItemsRes,
     ProductListItemsUpdate,
 )
+from ...services import product_lists as product_lists_srvcs
 from ...services.product_list_items import CreateSrvc, ReadSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
-from ...utilities.auth import get_validated_session
+from ...utilities import imports, pagination, sys_values
+from ...utilities.auth import get_short_validated_session, get_validated_session
+from ...utilities.catalog import catalog_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -36,23 +46,27 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([ProductListItemNotExist])
 async def get_product_list_item(
+    request: Request,
     response: Response,
     product_list_uuid: UUID4,
     product_list_item_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     product_list_items_read_srvc: ReadSrvc = Depends(
         service_container["product_list_items_read"]
     ),
-) -> ProductListItemsRes:
+) -> Response:
     """get one product list item"""
 
-    async with transaction_manager(db=db):
-        return await product_list_items_read_srvc.get_product_list_item(
+    return await catalog_response(
+        request=request,
+        response=response,
+        schema=ProductListItemsRes,
+        read=lambda db: product_list_items_read_srvc.get_product_list_item(
             product_list_uuid=product_list_uuid,
             product_list_item_uuid=product_list_item_uuid,
             db=db,
-        )
+        ),
+    )
 
 
 @router.get(
@@ -63,25 +77,38 @@ async def get_product_list_item(
 @set_auth_cookie
 @handle_exceptions([ProductListItemNotExist])
 async def get_product_list_item(
+    request: Request,
     response: Response,
     product_list_uuid: UUID4,
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     product_list_items_read_srvc: ReadSrvc = Depends(
         service_container["product_list_items_read"]
     ),
-) -> ProductListItemsPgRes:
+) -> Response:
     """
     Get active products linked to the product list.
 
+    Answers are cached until the catalog changes, send the `ETag` back in
+    `If-None-Match` to get a `304` while the page is unchanged.
     """
 
-    async with transaction_manager(db=db):
-        return await product_list_items_read_srvc.paginated_product_list_items(
-            product_list_uuid=product_list_uuid, page=page, limit=limit, db=db
-        )
+    return await catalog_response(
+        request=request,
+        response=response,
+        schema=ProductListItemsPgRes,
+        read=lambda db: product_list_items_read_srvc.paginated_product_list_items(
+            product_list_uuid=product_list_uuid,
+            page=page,
+            limit=limit,
+            after=after,
+            count=count,
+            db=db,
+        ),
+    )
 
 
 @router.post(
@@ -95,6 +122,13 @@ async def create_product_list_items(
     response: Response,
     product_list_uuid: UUID4,
     product_list_item_data: List[ProductListItemsCreate],
+    mode: BulkInsertMode = Query(
+        BulkInsertMode.ORM,
+        description=(
+            "How the items are inserted: `orm` instances, batched `returning` inserts, "
+            "or `copy` for very large lists."
+        ),
+    ),
     db: AsyncSession = Depends(get_db),
     user_token: str = Depends(get_validated_session),
     product_list_items_create_srvc: CreateSrvc = Depends(
@@ -122,9 +156,68 @@ async def create_product_list_items(
             product_list_uuid=product_list_uuid,
             product_list_item_data=_product_list_item_data,
             db=db,
+            mode=mode,
         )
 
 
+@router.post(
+    "/{product_list_uuid}/product-list-items/import/",
+    response_model=ImportRes,
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([ProductListNotExist])
+async def import_product_list_items(
+    request: Request,
+    response: Response,
+    product_list_uuid: UUID4,
+    format: DataFormat = Query(
+        DataFormat.NDJSON,
+        description="Upload format, `ndjson` or `csv` with a header row.",
+    ),
+    mode: BulkInsertMode = Query(
+        BulkInsertMode.RETURNING, description="How each batch is inserted."
+    ),
+    user_token: Tuple[SysUsers, str] = Depends(get_short_validated_session),
+    product_lists_read_srvc: product_lists_srvcs.ReadSrvc = Depends(
+        service_container["product_lists_read"]
+    ),
+    product_list_items_create_srvc: CreateSrvc = Depends(
+        service_container["product_list_items_create"]
+    ),
+) -> ImportRes:
+    """
+    Import product list items from an NDJSON or CSV upload, optionally sent with `Content-Encoding: gzip`.
+
+    The upload is read and written in batches, products already in the product list are
+    skipped. The response reports the rows that were not imported.
+    """
+    sys_user, _ = user_token
+    # Checked once up front, every batch would otherwise fail on the missing product list.
+    async with primary_read_session() as db:
+        await product_lists_read_srvc.get_product_list(
+            product_list_uuid=product_list_uuid, db=db
+        )
+    return await imports.import_records(
+        stream=request.stream(),
+        format=format,
+        compressed=request.headers.get("content-encoding") == "gzip",
+        schema=ProductListItemsInternalCreate,
+        values={
+            "product_list_uuid": product_list_uuid,
+            "sys_created_at": datetime.now(UTC),
+            "sys_created_by": sys_user.uuid,
+        },
+        write=lambda batch, db: product_list_items_create_srvc.import_product_list_items(
+            product_list_uuid=product_list_uuid,
+            product_list_item_data=batch,
+            db=db,
+            mode=mode,
+        ),
+        exists_message=msg.PRODUCT_LIST_ITEM_EXISTS,
+    )
+
+
 @router.put(
     "/{product_list_uuid}/product-list-items/{product_list_item_uuid}/",
     response_model=ProductListItemsRes,
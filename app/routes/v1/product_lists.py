@@ -1,9 +1,10 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.services import container as service_container
 from ...database.database import get_db, transaction_manager
 from ...exceptions import ProductListExists, ProductListNotExist
@@ -20,8 +21,9 @@ from ...schemas.product_lists import (
 )
 from ...services.product_lists import ReadSrvc, CreateSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.catalog import catalog_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -36,20 +38,24 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([ProductListNotExist])
 async def get_product_list(
+    request: Request,
     response: Response,
     product_list_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     product_lists_read_srvc: ReadSrvc = Depends(
         service_container["product_lists_read"]
     ),
-) -> ProductListsRes:
+) -> Response:
     """get one product list"""
 
-    async with transaction_manager(db=db):
-        return await product_lists_read_srvc.get_product_list(
+    return await catalog_response(
+        request=request,
+        response=response,
+        schema=ProductListsRes,
+        read=lambda db: product_lists_read_srvc.get_product_list(
             product_list_uuid=product_list_uuid, db=db
-        )
+        ),
+    )
 
 
 @router.get(
@@ -60,23 +66,32 @@ async def get_product_list(
 @set_auth_cookie
 @handle_exceptions([ProductListNotExist])
 async def get_product_lists(
+    request: Request,
     response: Response,
     page: int = Query(default=10, ge=1),
     limit: int = Query(default=10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     product_lists_read_srvc: ReadSrvc = Depends(
         service_container["product_lists_read"]
     ),
-) -> ProductListsPgRes:
+) -> Response:
     """
     Get many product lists.
+
+    Answers are cached until the catalog changes, send the `ETag` back in
+    `If-None-Match` to get a `304` while the page is unchanged.
     """
 
-    async with transaction_manager(db=db):
-        return await product_lists_read_srvc.paginated_product_lists(
-            page=page, limit=limit, db=db
-        )
+    return await catalog_response(
+        request=request,
+        response=response,
+        schema=ProductListsPgRes,
+        read=lambda db: product_lists_read_srvc.paginated_product_lists(
+            page=page, limit=limit, after=after, count=count, db=db
+        ),
+    )
 
 
 @router.post(
@@ -1,14 +1,18 @@
-from typing import Tuple
+from datetime import UTC, datetime
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants import messages as msg
+from ...constants.enums import BulkInsertMode, CountStrategy, DataFormat
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import ProductsExists, ProductsNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
+from ...schemas.imports import ImportRes
 from ...schemas.products import (
     ProductsCreate,
     ProductsDel,
@@ -18,15 +22,51 @@ from ...schemas.products import (
     ProductsUpdate,
     ProductsRes,
 )
+from ...schemas.search import ProductsSearchPgRes
+from ...services import search as search_srvcs
 from ...services.products import ReadSrvc, CreateSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
-from ...utilities.auth import get_validated_session
+from ...utilities import imports, pagination, sys_values
+from ...utilities.auth import get_short_validated_session, get_validated_session
+from ...utilities.catalog import catalog_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
 
 
+@router.get(
+    "/search/",
+    response_model=ProductsSearchPgRes,
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([ProductsNotExist])
+async def search_products(
+    response: Response,
+    q: str = Query(
+        ...,
+        min_length=3,
+        max_length=100,
+        description="Part of a product name, code or description.",
+    ),
+    limit: int = Query(default=10, ge=1, le=100),
+    after: Optional[Tuple[float, int]] = Depends(pagination.get_ranked_cursor),
+    db: AsyncSession = Depends(get_read_db),
+    user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
+    search_read_srvc: search_srvcs.ReadSrvc = Depends(
+        services_container["search_read"]
+    ),
+) -> ProductsSearchPgRes:
+    """
+    Search active products by partial name, code or description, best matches first.
+    """
+
+    async with transaction_manager(db=db):
+        return await search_read_srvc.search_products(
+            query=q, limit=limit, after=after, db=db
+        )
+
+
 @router.get(
     "/{product_uuid}",
     response_model=ProductsRes,
@@ -36,15 +76,21 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([ProductsNotExist])
 async def get_product(
+    request: Request,
     response: Response,
     product_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     products_read_srvc: ReadSrvc = Depends(services_container["products_read"]),
-) -> ProductsRes:
+) -> Response:
 
-    async with transaction_manager(db=db):
-        return await products_read_srvc.get_product(product_uuid=product_uuid, db=db)
+    return await catalog_response(
+        request=request,
+        response=response,
+        schema=ProductsRes,
+        read=lambda db: products_read_srvc.get_product(
+            product_uuid=product_uuid, db=db
+        ),
+    )
 
 
 @router.get(
@@ -55,21 +101,30 @@ async def get_product(
 @set_auth_cookie
 @handle_exceptions([ProductsNotExist])
 async def get_products(
+    request: Request,
     response: Response,
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     products_read_srvc: ReadSrvc = Depends(services_container["products_read"]),
-) -> ProductsPgRes:
+) -> Response:
     """
     Get many active products.
+
+    Answers are cached until the catalog changes, send the `ETag` back in
+    `If-None-Match` to get a `304` while the page is unchanged.
     """
 
-    async with transaction_manager(db=db):
-        return await products_read_srvc.paginated_products(
-            page=page, limit=limit, db=db
-        )
+    return await catalog_response(
+        request=request,
+        response=response,
+        schema=ProductsPgRes,
+        read=lambda db: products_read_srvc.paginated_products(
+            page=page, limit=limit, after=after, count=count, db=db
+        ),
+    )
 
 
 @router.post(
@@ -102,6 +157,46 @@ async def create_product(
         )
 
 
+@router.post(
+    "/import/",
+    response_model=ImportRes,
+    status_code=status.HTTP_200_OK,
+)
+@set_auth_cookie
+@handle_exceptions([])
+async def import_products(
+    request: Request,
+    response: Response,
+    format: DataFormat = Query(
+        DataFormat.NDJSON,
+        description="Upload format, `ndjson` or `csv` with a header row.",
+    ),
+    mode: BulkInsertMode = Query(
+        BulkInsertMode.RETURNING, description="How each batch is inserted."
+    ),
+    user_token: Tuple[SysUsers, str] = Depends(get_short_validated_session),
+    products_create_srvc: CreateSrvc = Depends(services_container["products_create"]),
+) -> ImportRes:
+    """
+    Import products from an NDJSON or CSV upload, optionally sent with `Content-Encoding: gzip`.
+
+    The upload is read and written in batches, products whose name exists are skipped.
+    The response reports the rows that were not imported.
+    """
+    sys_user, _ = user_token
+    return await imports.import_records(
+        stream=request.stream(),
+        format=format,
+        compressed=request.headers.get("content-encoding") == "gzip",
+        schema=ProductsInternalCreate,
+        values={"sys_created_at": datetime.now(UTC), "sys_created_by": sys_user.uuid},
+        write=lambda batch, db: products_create_srvc.import_products(
+            product_data=batch, db=db, mode=mode
+        ),
+        exists_message=msg.PRODUCT_EXISTS,
+    )
+
+
 @router.put(
     "/{product_uuid}",
     response_model=ProductsRes,
@@ -0,0 +1,124 @@
+from fastapi import APIRouter, Depends, Response, status
+
+from ...database.database import async_engine, async_read_engines
+from ...database.operations import count_cache
+from ...database.pool import pool_status
+from ...database.query_stats import query_stats
+from ...handlers.middleware import http_stats
+from ...services.sys_users import sys_user_cache
+from ...utilities.auth import require_metrics_client
+from ...utilities.catalog import catalog_cache
+from ...utilities.password import hash_pool_status
+from ...utilities.prometheus import CONTENT_TYPE, histogram_lines, metric_lines
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    include_in_schema=False,
+    dependencies=[Depends(require_metrics_client)],
+)
+async def get_metrics() -> Response:
+    """
+    Get the request, database, cache and password hashing statistics of this worker in the Prometheus text format.
+
+    Only clients of the networks set in `METRICS_ALLOWED_NETWORKS` are served.
+    """
+    pools = [("primary", async_engine.pool)] + [
+        (f"replica-{index}", engine.pool)
+        for index, engine in enumerate(async_read_engines)
+    ]
+    pool_stats = [(name, pool_status(pool=pool)) for name, pool in pools]
+    caches = [
+        ("catalog", catalog_cache.stats()),
+        ("count", count_cache.stats()),
+        ("sys_users", sys_user_cache.stats()),
+    ]
+    hashing = hash_pool_status()
+
+    lines = []
+    lines += metric_lines(
+        "crm_http_requests_in_flight",
+        "gauge",
+        "Requests currently being served.",
+        (({"method": method}, value) for method, value in http_stats.in_flight.items()),
+    )
+    lines += histogram_lines(
+        "crm_http_request_duration_seconds",
+        "Request latency by route template.",
+        (
+            ({"method": method, "route": route}, stats)
+            for (method, route), stats in http_stats.latency.items()
+        ),
+    )
+    lines += metric_lines(
+        "crm_http_responses_total",
+        "counter",
+        "Responses by route template and status code.",
+        (
+            ({"method": method, "route": route, "status": str(code)}, value)
+            for (method, route, code), value in http_stats.responses.items()
+        ),
+    )
+    lines += histogram_lines(
+        "crm_db_operation_duration_seconds",
+        "Database operation latency by service.",
+        (
+            ({"service": service, "operation": operation}, stats)
+            for (service, operation), stats in query_stats.items()
+        ),
+    )
+    lines += metric_lines(
+        "crm_db_operation_rows_total",
+        "counter",
+        "Rows returned or staged by database operations by service.",
+        (
+            ({"service": service, "operation": operation}, stats.rows)
+            for (service, operation), stats in query_stats.items()
+        ),
+    )
+    lines += metric_lines(
+        "crm_db_pool_checked_out",
+        "gauge",
+        "Connections currently in use.",
+        (({"pool": name}, stats["checked_out"]) for name, stats in pool_stats),
+    )
+    lines += metric_lines(
+        "crm_db_pool_overflow",
+        "gauge",
+        "Connections open beyond the persistent pool size.",
+        (({"pool": name}, stats["overflow"]) for name, stats in pool_stats),
+    )
+    lines += metric_lines(
+        "crm_db_pool_timeouts_total",
+        "counter",
+        "Checkouts that failed after waiting for the pool timeout.",
+        (({"pool": name}, stats["timeouts"]) for name, stats in pool_stats),
+    )
+    lines += metric_lines(
+        "crm_cache_hits_total",
+        "counter",
+        "Lookups served from an in-process cache.",
+        (({"cache": name}, stats["hits"]) for name, stats in caches),
+    )
+    lines += metric_lines(
+        "crm_cache_misses_total",
+        "counter",
+        "Lookups absent or expired in an in-process cache.",
+        (({"cache": name}, stats["misses"]) for name, stats in caches),
+    )
+    lines += metric_lines(
+        "crm_password_hash_queued",
+        "gauge",
+        "Password hashing calls waiting for a free thread.",
+        [({}, hashing["queued"])],
+    )
+    lines += metric_lines(
+        "crm_password_hash_running",
+        "gauge",
+        "Password hashing calls currently running.",
+        [({}, hashing["running"])],
+    )
+    return Response(content="\n".join(lines) + "\n", media_type=CONTENT_TYPE)
@@ -1,11 +1,12 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.services import container as services_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import SysUserExists, SysUserNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -20,8 +21,9 @@ from ...schemas.sys_users import (
 )
 from ...services.sys_users import ReadSrvc, CreateSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -35,18 +37,26 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([SysUserNotExist])
 async def get_sys_user(
+    request: Request,
     response: Response,
     sys_user_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     sys_users_read_srvc: ReadSrvc = Depends(services_container["sys_users_read"]),
 ) -> SysUsersRes:
     """get one user"""
 
-    async with transaction_manager(db=db):
-        return await sys_users_read_srvc.get_sys_user(
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: sys_users_read_srvc.get_sys_user_version(
             sys_user_uuid=sys_user_uuid, db=db
-        )
+        ),
+        read=lambda: sys_users_read_srvc.get_sys_user(
+            sys_user_uuid=sys_user_uuid, db=db
+        ),
+    )
 
 
 @router.get(
@@ -59,7 +69,9 @@ async def get_sys_users(
     response: Response,
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     sys_users_read_srvc: ReadSrvc = Depends(services_container["sys_users_read"]),
 ) -> SysUsersPgRes:
@@ -68,7 +80,9 @@ async def get_sys_users(
     """
 
     async with transaction_manager(db=db):
-        return await sys_users_read_srvc.paginated_users(page=page, limit=limit, db=db)
+        return await sys_users_read_srvc.paginated_users(
+            page=page, limit=limit, after=after, count=count, db=db
+        )
 
 
 @router.post(
@@ -1,11 +1,12 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...constants.enums import CountStrategy
 from ...containers.services import container as service_container
-from ...database.database import get_db, transaction_manager
+from ...database.database import get_db, get_read_db, transaction_manager
 from ...exceptions import WebsitesExists, WebsitesNotExist
 from ...handlers.handler import handle_exceptions
 from ...models.sys_users import SysUsers
@@ -20,8 +21,9 @@ from ...schemas.websites import (
 )
 from ...services.websites import CreateSrvc, ReadSrvc, UpdateSrvc, DelSrvc
 from ...services.token import set_auth_cookie
-from ...utilities import sys_values
+from ...utilities import pagination, sys_values
 from ...utilities.auth import get_validated_session
+from ...utilities.conditional import record_response
 from ...utilities.data import internal_schema_validation
 
 router = APIRouter()
@@ -36,21 +38,27 @@ router = APIRouter()
 @set_auth_cookie
 @handle_exceptions([WebsitesNotExist])
 async def get_website(
+    request: Request,
     response: Response,
     entity_uuid: UUID4,
     website_uuid: UUID4,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     websites_read_srvc: ReadSrvc = Depends(service_container["websites_read"]),
 ) -> WebsitesRes:
     """Retrieve single website by entity_uuid and website_uuid"""
 
-    async with transaction_manager(db=db):
-        return await websites_read_srvc.get_website(
-            entity_uuid=entity_uuid,
-            website_uuid=website_uuid,
-            db=db,
-        )
+    return await record_response(
+        request=request,
+        response=response,
+        db=db,
+        probe=lambda: websites_read_srvc.get_website_version(
+            entity_uuid=entity_uuid, website_uuid=website_uuid, db=db
+        ),
+        read=lambda: websites_read_srvc.get_website(
+            entity_uuid=entity_uuid, website_uuid=website_uuid, db=db
+        ),
+    )
 
 
 @router.get(
@@ -65,7 +73,9 @@ async def get_website(
     entity_uuid: UUID4,
     page: int,
     limit: int,
-    db: AsyncSession = Depends(get_db),
+    after: Optional[int] = Depends(pagination.get_cursor),
+    count: CountStrategy = Depends(pagination.get_count_strategy),
+    db: AsyncSession = Depends(get_read_db),
     user_token: Tuple[SysUsers, str] = Depends(get_validated_session),
     websites_read_srvc: ReadSrvc = Depends(service_container["websites_read"]),
 ) -> WebsitesPgRes:
@@ -75,7 +85,12 @@ async def get_website(
 
     async with transaction_manager(db=db):
         return await websites_read_srvc.paginated_websites(
-            entity_uuid=entity_uuid, page=page, limit=limit, db=db
+            entity_uuid=entity_uuid,
+            page=page,
+            limit=limit,
+            after=after,
+            count=count,
+            db=db,
         )
 
 
@@ -7,5 +7,8 @@ from pydantic import EmailStr, Field, StringConstraints
 ConstrainedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
 ConstrainedEmailStr = Annotated[EmailStr, StringConstraints(strip_whitespace=True)]
 ConstrainedDec = Annotated[Decimal, Field(decimal_places=2, gt=0)]
-TimeStamp = datetime.now(tz=UTC)
-TimeStamp.strftime("%Y-%m-%d")
+
+
+def timestamp() -> datetime:
+    """Default factory of the system timestamps, the time the schema is validated."""
+    return datetime.now(tz=UTC)
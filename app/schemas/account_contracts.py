@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import TimeStamp
+from ._variables import timestamp
 
 
 class AccountContractsCreate(BaseModel):
@@ -26,7 +26,8 @@ class AccountContractsInternalCreate(AccountContractsCreate):
     """
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the contract was created."
+        default_factory=timestamp,
+        description="Timestamp of when the contract was created.",
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the contract."
@@ -52,7 +53,8 @@ class AccountContractsInternalUpdate(AccountContractsUpdate):
     """
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the contract was last updated."
+        default_factory=timestamp,
+        description="Timestamp of when the contract was last updated.",
     )
     sys_updated_by: UUID4 = Field(
         ...,
@@ -66,7 +68,8 @@ class AccountContractsDel(BaseModel):
     """
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the contract was deleted."
+        default_factory=timestamp,
+        description="Timestamp of when the contract was deleted.",
     )
     sys_deleted_by: UUID4 = Field(
         ..., description="UUID of the user who deleted the contract."
@@ -88,7 +91,8 @@ class AccountContractsRes(BaseModel):
         description="End date of the contract.", default=None
     )
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the contract was created."
+        default_factory=timestamp,
+        description="Timestamp of when the contract was created.",
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the contract."
@@ -111,13 +115,20 @@ class AccountContractsPgRes(BaseModel):
     Represents a paginated response for account contracts.
     """
 
-    total: int = Field(..., description="Total number of contracts available.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of contracts available. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Number of contracts per page.")
     has_more: bool = Field(
         ...,
         description="Indicates if there are more contracts available beyond the current page.",
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     account_contracts: List[AccountContractsRes] = Field(
         ..., description="List of account contract responses."
     )
@@ -129,7 +140,8 @@ class AccountContractsDelRes(AccountContractsRes):
     """
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the contract was deleted."
+        default_factory=timestamp,
+        description="Timestamp of when the contract was deleted.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the contract."
@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import TimeStamp
+from ._variables import timestamp
 from .product_lists import ProductListsRes
 
 
@@ -31,7 +31,8 @@ class AccountListsInternalCreate(AccountListsCreate):
     """
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the account list was created."
+        default_factory=timestamp,
+        description="Timestamp of when the account list was created.",
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the account list."
@@ -44,7 +45,8 @@ class AccountListsUpdate(BaseModel):
     """
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the account list was last updated."
+        default_factory=timestamp,
+        description="Timestamp of when the account list was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None,
@@ -58,7 +60,8 @@ class AccountListsDel(BaseModel):
     """
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the account list was deleted."
+        default_factory=timestamp,
+        description="Timestamp of when the account list was deleted.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the account list."
@@ -106,13 +109,20 @@ class AccountListsOrchPgRes(BaseModel):
     Represents a paginated response for account lists.
     """
 
-    total: int = Field(..., description="Total number of account lists available.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of account lists available. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Number of account lists per page.")
     has_more: bool = Field(
         ...,
         description="Indicates if there are more account lists available beyond the current page.",
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     data: Optional[List[ProductListsRes]] = Field(
         None,
         description="List of product list responses associated with the account lists.",
@@ -125,7 +135,8 @@ class AccountListsDelRes(AccountListsRes):
     """
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the account list was deleted."
+        default_factory=timestamp,
+        description="Timestamp of when the account list was deleted.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the account list."
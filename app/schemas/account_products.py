@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import TimeStamp
+from ._variables import timestamp
 from .products import ProductsRes
 
 
@@ -30,7 +30,8 @@ class AccountProductsInternalCreate(AccountProductsCreate):
     """
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the account product was created."
+        default_factory=timestamp,
+        description="Timestamp of when the account product was created.",
     )
     sys_created_by: UUID4 = Field(
         ...,
@@ -59,7 +60,8 @@ class AccountProductsInternalUpdate(AccountProductsUpdate):
     """
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the account product was last updated."
+        default_factory=timestamp,
+        description="Timestamp of when the account product was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None,
@@ -73,7 +75,8 @@ class AccountProductsDel(BaseModel):
     """
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the account product was deleted."
+        default_factory=timestamp,
+        description="Timestamp of when the account product was deleted.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None,
@@ -121,13 +124,20 @@ class AccountProductsOrchPgRes(BaseModel):
     Represents a paginated response for account products.
     """
 
-    total: int = Field(..., description="Total number of account products available.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of account products available. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Number of account products per page.")
     has_more: bool = Field(
         ...,
         description="Indicates if there are more account products available beyond the current page.",
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     data: Optional[List[ProductsRes]] = Field(
         None,
         description="List of product responses associated with the account products.",
@@ -139,13 +149,20 @@ class AccountProductsPgRes(BaseModel):
     Represents a paginated response for account products.
     """
 
-    total: int = Field(..., description="Total number of account products available.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of account products available. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Number of account products per page.")
     has_more: bool = Field(
         ...,
         description="Indicates if there are more account products available beyond the current page.",
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     account_products: Optional[List[AccountProductsRes]] = Field(
         None, description="List of account product responses."
     )
@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import ConstrainedStr, TimeStamp
+from ._variables import ConstrainedStr, timestamp
 
 
 class AccountsCreate(BaseModel):
@@ -28,7 +28,8 @@ class AccountsInternalCreate(AccountsCreate):
     """
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the account was created."
+        default_factory=timestamp,
+        description="Timestamp of when the account was created.",
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the account."
@@ -41,7 +42,8 @@ class AccountsUpdate(BaseModel):
     """
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the account was last updated."
+        default_factory=timestamp,
+        description="Timestamp of when the account was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None, description="UUID of the user who last updated the account."
@@ -54,7 +56,8 @@ class AccountsDel(BaseModel):
     """
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the account was deleted."
+        default_factory=timestamp,
+        description="Timestamp of when the account was deleted.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the account."
@@ -98,13 +101,20 @@ class AccountsPgRes(BaseModel):
     Represents a paginated response for accounts.
     """
 
-    total: int = Field(..., description="Total number of accounts available.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of accounts available. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Number of accounts per page.")
     has_more: bool = Field(
         ...,
         description="Indicates if there are more accounts available beyond the current page.",
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     accounts: List[AccountsRes] = Field(
         ..., description="List of account response objects."
     )
@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import TimeStamp
+from ._variables import timestamp
 from ..enums.addresses import AddressesParentTable
 
 
@@ -47,8 +47,11 @@ class AccountAddressesInternalCreate(AccountAddressesCreate):
         default=AddressesParentTable.ACCOUNTS,
         description="Table the address belongs to.",
     )
+    fingerprint: Optional[str] = Field(
+        None, description="Normalized fingerprint of the address, set by the service."
+    )
     sys_created_at: datetime = Field(
-        TimeStamp,
+        default_factory=timestamp,
         description="Timestamp of when the address was created.",
         exclude=True,
     )
@@ -78,8 +81,12 @@ class EntityAddressesInternalCreate(EntityAddressesCreate):
         default=AddressesParentTable.ENTITIES,
         description="Table the address belongs to.",
     )
+    fingerprint: Optional[str] = Field(
+        None, description="Normalized fingerprint of the address, set by the service."
+    )
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the address was created."
+        default_factory=timestamp,
+        description="Timestamp of when the address was created.",
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the address."
@@ -102,8 +109,12 @@ class AddressesInternalUpdate(AddressesUpdate):
     Model for intrnal updating an address hiding system level fields from client.
     """
 
+    fingerprint: Optional[str] = Field(
+        None, description="Normalized fingerprint of the address, set by the service."
+    )
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the address was last updated."
+        default_factory=timestamp,
+        description="Timestamp of when the address was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None, description="UUID of the user who last updated the address."
@@ -116,7 +127,8 @@ class AddressesDel(BaseModel):
     """
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the address was deleted."
+        default_factory=timestamp,
+        description="Timestamp of when the address was deleted.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the address."
@@ -186,13 +198,20 @@ class AddressesPgRes(BaseModel):
     Represents a paginated response for addresses.
     """
 
-    total: int = Field(..., description="Total number of addresses available.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of addresses available. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Number of addresses per page.")
     has_more: bool = Field(
         ...,
         description="Indicates if there are more addresses beyond the current page.",
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     addresses: Optional[List[AddressesRes]] = Field(
         None, description="List of address response objects."
     )
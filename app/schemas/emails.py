@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel
 
-from ._variables import ConstrainedEmailStr, TimeStamp
+from ._variables import ConstrainedEmailStr, timestamp
 
 
 from datetime import datetime
@@ -11,7 +11,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import ConstrainedEmailStr, TimeStamp
+from ._variables import ConstrainedEmailStr, timestamp
 
 
 class EmailsCreate(BaseModel):
@@ -33,7 +33,8 @@ class EmailsInternalCreate(EmailsCreate):
     """
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the email record was created."
+        default_factory=timestamp,
+        description="Timestamp of when the email record was created.",
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the email record."
@@ -58,7 +59,8 @@ class EmailsInternalUpdate(EmailsUpdate):
     """
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the email record was last updated."
+        default_factory=timestamp,
+        description="Timestamp of when the email record was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None, description="UUID of the user who last updated the email record."
@@ -71,7 +73,8 @@ class EmailsDel(BaseModel):
     """
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the email record was deleted."
+        default_factory=timestamp,
+        description="Timestamp of when the email record was deleted.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the email record."
@@ -108,13 +111,20 @@ class EmailsPgRes(BaseModel):
     Represents a paginated response for emails.
     """
 
-    total: int = Field(..., description="Total number of email records available.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of email records available. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Number of email records per page.")
     has_more: bool = Field(
         ...,
         description="Indicates if there are more email records beyond the current page.",
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     emails: Optional[List[EmailsRes]] = Field(
         None, description="List of email response objects."
     )
@@ -129,7 +139,8 @@ class EmailsDelRes(EmailsRes):
     """
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the email record was deleted."
+        default_factory=timestamp,
+        description="Timestamp of when the email record was deleted.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the email record."
@@ -4,7 +4,7 @@ from typing import Annotated, List, Optional
 from pydantic import UUID4, BaseModel, Field
 
 from ..constants.enums import EntityTypes
-from ._variables import TimeStamp
+from ._variables import timestamp
 from .individuals import IndividualsDelRes, IndividualsRes
 from .non_individuals import NonIndividualsDelRes, NonIndividualsRes
 
@@ -25,7 +25,8 @@ class EntitiesCreate(Entities):
     """
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the entity was created."
+        default_factory=timestamp,
+        description="Timestamp of when the entity was created.",
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the entity."
@@ -38,7 +39,8 @@ class EntitiesUpdate(Entities):
     """
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the entity was last updated."
+        default_factory=timestamp,
+        description="Timestamp of when the entity was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None, description="UUID of the user who last updated the entity."
@@ -51,7 +53,8 @@ class EntitiesDel(BaseModel):
     """
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the entity was deleted."
+        default_factory=timestamp,
+        description="Timestamp of when the entity was deleted.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the entity."
@@ -148,13 +151,20 @@ class EntitiesPgRes(BaseModel):
     Paginated response model for entities.
     """
 
-    total: int = Field(..., description="Total number of entity records available.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of entity records available. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Number of entity records per page.")
     has_more: bool = Field(
         ...,
         description="Indicates if there are more entity records beyond the current page.",
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     data: List[EntitiesRes] = Field(..., description="List of entity response objects.")
 
 
@@ -164,7 +174,8 @@ class EntitiesDelRes(EntitiesRes):
     """
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp of when the entity was deleted."
+        default_factory=timestamp,
+        description="Timestamp of when the entity was deleted.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the entity."
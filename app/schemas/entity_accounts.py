@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import TimeStamp
+from ._variables import timestamp
 from .accounts import AccountsRes
 from .entities import IndividualNonIndividualRes
 
@@ -28,7 +28,7 @@ class EntityAccountsInternalCreate(EntityAccountsCreate):
     """
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp when the record was created."
+        default_factory=timestamp, description="Timestamp when the record was created."
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the record."
@@ -50,7 +50,7 @@ class AccountEntityInternalCreate(AccountEntityCreate):
     """Model for creating an account-entity association hiding system level fields from the client."""
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp when the record was created."
+        default_factory=timestamp, description="Timestamp when the record was created."
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the record."
@@ -75,7 +75,8 @@ class EntityAccountsInternalUpdate(EntityAccountsUpdate):
     """
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp when the record was last updated."
+        default_factory=timestamp,
+        description="Timestamp when the record was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None, description="UUID of the user who last updated the record."
@@ -86,7 +87,7 @@ class EntityAccountsDel(BaseModel):
     """Model for deleting an entity-account association."""
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp when the record was deleted."
+        default_factory=timestamp, description="Timestamp when the record was deleted."
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the record."
@@ -105,7 +106,7 @@ class EntityAccountsRes(BaseModel):
     start_on: Optional[date] = Field(None, description="Start date of the association.")
     end_on: Optional[date] = Field(None, description="End date of the association.")
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp when the record was created."
+        default_factory=timestamp, description="Timestamp when the record was created."
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the record."
@@ -124,24 +125,38 @@ class EntityAccountsRes(BaseModel):
 class EntityAccountsPgRes(BaseModel):
     """Paginated response model for entity-account associations."""
 
-    total: int = Field(..., description="Total number of entity-account associations.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of entity-account associations. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Number of records per page.")
     has_more: bool = Field(
         ..., description="Indicates if there are more records available."
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     data: List[AccountsRes] = Field(..., description="List of account records.")
 
 
 class AccountEntitiesPgRes(BaseModel):
     """Paginated response model for account-entity associations."""
 
-    total: int = Field(..., description="Total number of account-entity associations.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of account-entity associations. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Number of records per page.")
     has_more: bool = Field(
         ..., description="Indicates if there are more records available."
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     data: List[IndividualNonIndividualRes] = Field(
         ..., description="List of entity records."
     )
@@ -0,0 +1,30 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class ImportRowError(BaseModel):
+    """
+    Response model representing a row rejected by an import.
+    """
+
+    row: int = Field(
+        ..., description="Position of the row in the upload, starting at 1."
+    )
+    message: str = Field(..., description="Why the row was not imported.")
+
+
+class ImportRes(BaseModel):
+    """
+    Response model representing the outcome of an import.
+    """
+
+    rows: int = Field(..., description="Number of rows read from the upload.")
+    imported: int = Field(..., description="Number of rows inserted.")
+    rejected: int = Field(..., description="Number of rows not inserted.")
+    errors: List[ImportRowError] = Field(
+        ..., description="Rejected rows, up to `IMPORT_MAX_ERRORS` of them."
+    )
+    errors_truncated: bool = Field(
+        ..., description="True when more rows were rejected than listed in `errors`."
+    )
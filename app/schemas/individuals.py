@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import ConstrainedStr, TimeStamp
+from ._variables import ConstrainedStr, timestamp
 
 
 class IndividualsCreate(BaseModel):
@@ -22,7 +22,7 @@ class IndividualsInitCreate(IndividualsCreate):
         ..., description="Unique identifier of the associated entity."
     )
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp when the record was created."
+        default_factory=timestamp, description="Timestamp when the record was created."
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the record."
@@ -44,7 +44,8 @@ class IndividualsInternalUpdate(IndividualsUpdate):
     """Model for updating an individual entity."""
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp when the record was last updated."
+        default_factory=timestamp,
+        description="Timestamp when the record was last updated.",
     )
     sys_updated_by: UUID4 = Field(
         ..., description="UUID of the user who last updated the record."
@@ -55,7 +56,7 @@ class IndividualsDel(BaseModel):
     """Model for deleting an individual entity."""
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp when the record was deleted."
+        default_factory=timestamp, description="Timestamp when the record was deleted."
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the record."
@@ -76,7 +77,7 @@ class IndividualsRes(BaseModel):
         None, description="Last name of the individual."
     )
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp when the record was created."
+        default_factory=timestamp, description="Timestamp when the record was created."
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the record."
@@ -95,7 +96,10 @@ class IndividualsRes(BaseModel):
 class IndividualsPgRes(BaseModel):
     """Paginated response model for individual entities."""
 
-    total: int = Field(..., description="Total number of individual records.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of individual records. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(
         ..., description="Number of records per page."
@@ -103,6 +107,10 @@ class IndividualsPgRes(BaseModel):
     has_more: bool = Field(
         ..., description="Indicates if there are more records available."
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     individuals: Optional[List[IndividualsRes]] = Field(
         None, description="List of individual records."
     )
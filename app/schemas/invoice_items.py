@@ -5,7 +5,7 @@ from typing import Annotated, List, Optional
 from pydantic import UUID4, BaseModel, Field, field_validator
 
 from ..constants.enums import ItemAdjustmentType
-from ._variables import ConstrainedDec, TimeStamp
+from ._variables import ConstrainedDec, timestamp
 
 
 class InvoiceItemsCreate(BaseModel):
@@ -50,7 +50,7 @@ class InvoiceItemsInternalCreate(InvoiceItemsCreate):
     """
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp when the item was created."
+        default_factory=timestamp, description="Timestamp when the item was created."
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the item."
@@ -61,7 +61,8 @@ class InvoiceItemsUpdate(BaseModel):
     """Model for updating an invoice item."""
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp when the item was last updated."
+        default_factory=timestamp,
+        description="Timestamp when the item was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None, description="UUID of the user who last updated the item."
@@ -72,7 +73,7 @@ class InvoiceItemsDel(BaseModel):
     """Model for marking an invoice item as deleted."""
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp when the item was deleted."
+        default_factory=timestamp, description="Timestamp when the item was deleted."
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the item."
@@ -124,12 +125,19 @@ class InvoiceItemsRes(BaseModel):
 class InvoiceItemsPgRes(BaseModel):
     """Paginated response model for invoice items."""
 
-    total: int = Field(..., description="Total number of invoice items.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of invoice items. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Number of records per page.")
     has_more: bool = Field(
         ..., description="Indicates if there are more records available."
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     invoice_items: Optional[List[InvoiceItemsRes]] = Field(
         None, description="List of invoice items."
     )
@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import TimeStamp
+from ._variables import timestamp
 
 
 class InvoicesCreate(BaseModel):
@@ -29,7 +29,7 @@ class InvoicesInternalCreate(InvoicesCreate):
     """
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp when the invoice was created."
+        default_factory=timestamp, description="Timestamp when the invoice was created."
     )
     sys_created_by: Optional[UUID4] = Field(
         None, description="UUID of the user who created the invoice."
@@ -71,7 +71,7 @@ class InvoicesDel(BaseModel):
     """Represents a soft-delete action on an invoice, tracking deletion metadata."""
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp when the invoice was deleted."
+        default_factory=timestamp, description="Timestamp when the invoice was deleted."
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the invoice."
@@ -114,10 +114,17 @@ class InvoicesRes(BaseModel):
 class InvoicesPgRes(BaseModel):
     """Represents a paginated response for invoices."""
 
-    total: int = Field(..., description="Total number of invoices available.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of invoices available. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Number of invoices per page.")
     has_more: bool = Field(..., description="Indicates if more invoices are available.")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     invoices: Optional[List[InvoicesRes]] = Field(
         None, description="List of invoices in the current page."
     )
@@ -127,7 +134,7 @@ class InvoicesDelRes(InvoicesRes):
     """Represents an invoice response including soft-deletion details."""
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp when the invoice was deleted."
+        default_factory=timestamp, description="Timestamp when the invoice was deleted."
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the invoice."
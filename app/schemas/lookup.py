@@ -0,0 +1,28 @@
+from typing import Annotated, List, Optional
+
+from pydantic import BaseModel, Field
+
+from ..constants.enums import EntityTypes
+from .entities import IndividualNonIndividualRes
+
+
+class EntityLookupRes(IndividualNonIndividualRes):
+    """
+    Represents the summary of an entity found by one of its contacts.
+    """
+
+    type: Annotated[EntityTypes, EntityTypes] = Field(
+        ..., description="Type of the entity."
+    )
+    tin: Optional[str] = Field(None, description="Tax identification number.")
+
+
+class EntitiesLookupRes(BaseModel):
+    """
+    Represents the entities found by one of their contacts.
+    """
+
+    limit: int = Field(..., description="Maximum number of entities returned.")
+    data: List[EntityLookupRes] = Field(
+        ..., description="The entities having the contact, oldest first."
+    )
@@ -0,0 +1,94 @@
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+
+class DatabasePoolRes(BaseModel):
+    """
+    Response model representing the live state of a database connection pool.
+    """
+
+    name: str = Field(
+        ..., description="Name of the database server the pool connects to."
+    )
+    pool_size: int = Field(
+        ..., description="Number of persistent connections in the pool."
+    )
+    checked_in: int = Field(..., description="Idle connections available for checkout.")
+    checked_out: int = Field(..., description="Connections currently in use.")
+    overflow: int = Field(
+        ..., description="Connections currently open beyond the persistent pool size."
+    )
+    max_overflow: int = Field(
+        ..., description="Maximum number of overflow connections allowed."
+    )
+    checkouts: int = Field(..., description="Successful checkouts since worker start.")
+    timeouts: int = Field(
+        ..., description="Checkouts that failed after waiting for the pool timeout."
+    )
+    wait_total_seconds: float = Field(
+        ..., description="Total time spent waiting for a connection."
+    )
+    wait_max_seconds: float = Field(
+        ..., description="Longest single wait for a connection."
+    )
+    wait_avg_seconds: float = Field(
+        ..., description="Average wait for a connection per checkout."
+    )
+
+
+class PasswordHashPoolRes(BaseModel):
+    """
+    Response model representing the state of the password hashing pool.
+    """
+
+    workers: int = Field(..., description="Number of hashing threads.")
+    queued: int = Field(..., description="Calls currently waiting for a free thread.")
+    queued_max: int = Field(
+        ..., description="Highest number of calls waiting at once since worker start."
+    )
+    running: int = Field(..., description="Calls currently hashing.")
+    completed: int = Field(..., description="Calls completed since worker start.")
+    wait_total_seconds: float = Field(
+        ..., description="Total time spent waiting for a free thread."
+    )
+    wait_max_seconds: float = Field(
+        ..., description="Longest single wait for a free thread."
+    )
+    wait_avg_seconds: float = Field(
+        ..., description="Average wait for a free thread per completed call."
+    )
+
+
+class CacheRes(BaseModel):
+    """
+    Response model representing the state of an in-process cache.
+    """
+
+    name: str = Field(..., description="Name of the cache.")
+    size: int = Field(..., description="Number of entries currently cached.")
+    maxsize: int = Field(..., description="Maximum number of entries kept.")
+    hits: int = Field(
+        ..., description="Lookups served from the cache since worker start."
+    )
+    misses: int = Field(
+        ..., description="Lookups that were absent or expired since worker start."
+    )
+
+
+class QueryStatsRes(BaseModel):
+    """
+    Response model representing the latency histogram of one service and database operation.
+    """
+
+    service: str = Field(..., description="Name of the service issuing the operation.")
+    operation: str = Field(..., description="Name of the database operation.")
+    calls: int = Field(..., description="Calls since worker start.")
+    rows: int = Field(..., description="Rows returned or staged since worker start.")
+    total_ms: float = Field(..., description="Total time spent in the calls.")
+    max_ms: float = Field(..., description="Longest single call.")
+    avg_ms: float = Field(..., description="Average time per call.")
+    buckets_ms: Dict[str, int] = Field(
+        ...,
+        description="Cumulative number of calls at or below each bound, in milliseconds.",
+    )
@@ -3,7 +3,7 @@ from typing import Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import ConstrainedStr, TimeStamp
+from ._variables import ConstrainedStr, timestamp
 
 
 class NonIndividualsCreate(BaseModel):
@@ -25,7 +25,7 @@ class NonIndividualsInitCreate(NonIndividualsCreate):
         ..., description="UUID of the user who created the entity."
     )
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp when the entity was created."
+        default_factory=timestamp, description="Timestamp when the entity was created."
     )
 
 
@@ -47,7 +47,8 @@ class NonIndividualsInternalUpdate(NonIndividualsUpdate):
     """
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp when the entity was last updated."
+        default_factory=timestamp,
+        description="Timestamp when the entity was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None, description="UUID of the user who last updated the entity."
@@ -58,7 +59,7 @@ class NonIndividualsDel(BaseModel):
     """Model for marking a non-individual entity as deleted."""
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp when the entity was deleted."
+        default_factory=timestamp, description="Timestamp when the entity was deleted."
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the entity."
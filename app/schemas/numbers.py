@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import ConstrainedStr, TimeStamp
+from ._variables import ConstrainedStr, timestamp
 
 
 class NumbersCreate(BaseModel):
@@ -28,7 +28,7 @@ class NumbersInternalCreate(NumbersCreate):
     """Model for creating a new phone number entry."""
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp when the entry was created."
+        default_factory=timestamp, description="Timestamp when the entry was created."
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the entry."
@@ -62,7 +62,8 @@ class NumbersInternalUpdate(NumbersUpdate):
     """
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp when the entry was last updated."
+        default_factory=timestamp,
+        description="Timestamp when the entry was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None, description="UUID of the user who last updated the entry."
@@ -73,7 +74,7 @@ class NumbersDel(BaseModel):
     """Model for marking a phone number entry as deleted."""
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp when the entry was deleted."
+        default_factory=timestamp, description="Timestamp when the entry was deleted."
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the entry."
@@ -104,12 +105,19 @@ class NumbersRes(BaseModel):
 class NumbersPgRes(BaseModel):
     """Paginated response model for phone number entries."""
 
-    total: int = Field(..., description="Total number of phone number entries.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of phone number entries. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Maximum number of entries per page.")
     has_more: bool = Field(
         ..., description="Indicates whether there are more pages available."
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     numbers: Optional[List[NumbersRes]] = Field(
         None, description="List of phone number entries."
     )
@@ -5,7 +5,7 @@ from typing import List, Optional
 from pydantic import UUID4, BaseModel, Field, field_validator
 
 from ..constants.enums import ItemAdjustmentType
-from ._variables import ConstrainedDec, TimeStamp
+from ._variables import ConstrainedDec, timestamp
 
 
 class OrderItemsCreate(BaseModel):
@@ -46,7 +46,8 @@ class OrderItemsInternalCreate(OrderItemsCreate):
     """
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp when the order item was created."
+        default_factory=timestamp,
+        description="Timestamp when the order item was created.",
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the order item."
@@ -92,7 +93,8 @@ class OrderItemsInternalUpdate(OrderItemsUpdate):
     """
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp when the order item was last updated."
+        default_factory=timestamp,
+        description="Timestamp when the order item was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None, description="UUID of the user who last updated the order item."
@@ -103,7 +105,8 @@ class OrderItemsDel(BaseModel):
     """Model for marking an order item as deleted."""
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp when the order item was deleted."
+        default_factory=timestamp,
+        description="Timestamp when the order item was deleted.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the order item."
@@ -146,12 +149,18 @@ class OrderItemsRes(BaseModel):
 class OrderItemsPgRes(BaseModel):
     """Paginated response model for order items."""
 
-    total: int = Field(..., description="Total number of order items.")
+    total: Optional[int] = Field(
+        None, description="Total number of order items. Null when counting is skipped."
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Maximum number of order items per page.")
     has_more: bool = Field(
         ..., description="Indicates whether there are more pages available."
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     order_items: Optional[List[OrderItemsRes]] = Field(
         None, description="List of order items."
     )
@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import TimeStamp
+from ._variables import timestamp
 
 
 class OrdersCreate(BaseModel):
@@ -31,7 +31,7 @@ class OrdersInternalCreate(OrdersCreate):
     """
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp when the order was created."
+        default_factory=timestamp, description="Timestamp when the order was created."
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the order."
@@ -59,7 +59,8 @@ class OrdersInternalUpdate(OrdersUpdate):
     """
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp when the order was last updated."
+        default_factory=timestamp,
+        description="Timestamp when the order was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None, description="UUID of the user who last updated the order."
@@ -70,7 +71,7 @@ class OrdersDel(BaseModel):
     """Model for marking an order as deleted."""
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp when the order was deleted."
+        default_factory=timestamp, description="Timestamp when the order was deleted."
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the order."
@@ -113,12 +114,18 @@ class OrdersRes(BaseModel):
 class OrdersPgRes(BaseModel):
     """Paginated response model for orders."""
 
-    total: int = Field(..., description="Total number of orders.")
+    total: Optional[int] = Field(
+        None, description="Total number of orders. Null when counting is skipped."
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Maximum number of orders per page.")
     has_more: bool = Field(
         ..., description="Indicates whether there are more pages available."
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     orders: Optional[List[OrdersRes]] = Field(None, description="List of orders.")
 
 
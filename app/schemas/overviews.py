@@ -0,0 +1,81 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+from .account_contracts import AccountContractsRes
+from .accounts import AccountsRes
+from .addresses import AddressesRes
+from .emails import EmailsRes
+from .entities import EntitiesRes, IndividualNonIndividualRes
+from .entity_accounts import EntityAccountsRes
+from .individuals import IndividualsRes
+from .non_individuals import NonIndividualsRes
+from .numbers import NumbersRes
+from .product_lists import ProductListsRes
+from .products import ProductsRes
+from .websites import WebsitesRes
+
+Item = TypeVar("Item", bound=BaseModel)
+
+
+class OverviewSection(BaseModel, Generic[Item]):
+    """
+    Represents the first records of a section of an overview.
+    """
+
+    total: int = Field(..., description="Total number of records in the section.")
+    limit: int = Field(..., description="Maximum number of records returned.")
+    has_more: bool = Field(
+        ..., description="Indicates if the section has more records than returned."
+    )
+    data: List[Item] = Field(..., description="The first records of the section.")
+
+
+class AccountOverviewRes(BaseModel):
+    """
+    Represents an account with its related records.
+    """
+
+    account: AccountsRes = Field(..., description="The account.")
+    entities: OverviewSection[IndividualNonIndividualRes] = Field(
+        ..., description="Entities linked to the account."
+    )
+    addresses: OverviewSection[AddressesRes] = Field(
+        ..., description="Addresses of the account."
+    )
+    contracts: OverviewSection[AccountContractsRes] = Field(
+        ..., description="Contracts of the account."
+    )
+    lists: OverviewSection[ProductListsRes] = Field(
+        ..., description="Product lists of the account."
+    )
+    products: OverviewSection[ProductsRes] = Field(
+        ..., description="Products of the account."
+    )
+
+
+class EntityOverviewRes(BaseModel):
+    """
+    Represents an entity with its related records.
+    """
+
+    entity: EntitiesRes = Field(..., description="The entity.")
+    individual: Optional[IndividualsRes] = Field(
+        None, description="Individual response object (if applicable)."
+    )
+    non_individual: Optional[NonIndividualsRes] = Field(
+        None, description="Non-individual response object (if applicable)."
+    )
+    emails: OverviewSection[EmailsRes] = Field(..., description="Emails of the entity.")
+    numbers: OverviewSection[NumbersRes] = Field(
+        ..., description="Numbers of the entity."
+    )
+    websites: OverviewSection[WebsitesRes] = Field(
+        ..., description="Websites of the entity."
+    )
+    addresses: OverviewSection[AddressesRes] = Field(
+        ..., description="Addresses of the entity."
+    )
+    accounts: OverviewSection[EntityAccountsRes] = Field(
+        ..., description="Account links of the entity."
+    )
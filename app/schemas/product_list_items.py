@@ -1,10 +1,10 @@
 from datetime import datetime
-from decimal import ROUND_DOWN, Decimal
+from decimal import ROUND_DOWN, Decimal, InvalidOperation
 from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field, field_validator
 
-from ._variables import ConstrainedDec, TimeStamp
+from ._variables import ConstrainedDec, timestamp
 
 
 class ProductListItemsCreate(BaseModel):
@@ -35,10 +35,13 @@ class ProductListItemsCreate(BaseModel):
 
     @field_validator("price", mode="before")
     def round_price(cls, value):
-        """Rounds the price to two decimal places."""
-        if isinstance(value, (float, int)):
-            value = Decimal(value)
-        elif not isinstance(value, Decimal):
+        """Rounds the price to two decimal places, numeric strings such as CSV cells are accepted."""
+        if isinstance(value, (float, int, str)):
+            try:
+                value = Decimal(str(value))
+            except InvalidOperation:
+                raise ValueError("Price must be a number")
+        if not isinstance(value, Decimal) or not value.is_finite():
             raise ValueError("Price must be a number")
         return value.quantize(Decimal("0.01"), rounding=ROUND_DOWN)
 
@@ -50,7 +53,8 @@ class ProductListItemsInternalCreate(ProductListItemsCreate):
     """
 
     sys_created_at: datetime = Field(
-        TimeStamp, description="Timestamp when the product list item was created."
+        default_factory=timestamp,
+        description="Timestamp when the product list item was created.",
     )
     sys_created_by: UUID4 = Field(
         ..., description="UUID of the user who created the product list item."
@@ -78,10 +82,13 @@ class ProductListItemsUpdate(BaseModel):
 
     @field_validator("price", mode="before")
     def round_price(cls, value):
-        """Rounds the price to two decimal places."""
-        if isinstance(value, (float, int)):
-            value = Decimal(value)
-        elif not isinstance(value, Decimal):
+        """Rounds the price to two decimal places, numeric strings such as CSV cells are accepted."""
+        if isinstance(value, (float, int, str)):
+            try:
+                value = Decimal(str(value))
+            except InvalidOperation:
+                raise ValueError("Price must be a number")
+        if not isinstance(value, Decimal) or not value.is_finite():
             raise ValueError("Price must be a number")
         return value.quantize(Decimal("0.01"), rounding=ROUND_DOWN)
 
@@ -93,7 +100,8 @@ class ProductListItemsInternalUpdate(ProductListItemsUpdate):
     """
 
     sys_updated_at: datetime = Field(
-        TimeStamp, description="Timestamp when the product list item was last updated."
+        default_factory=timestamp,
+        description="Timestamp when the product list item was last updated.",
     )
     sys_updated_by: Optional[UUID4] = Field(
         None, description="UUID of the user who last updated the product list item."
@@ -104,7 +112,8 @@ class ProductListItemsDel(BaseModel):
     """Model for marking a product list item as deleted."""
 
     sys_deleted_at: datetime = Field(
-        TimeStamp, description="Timestamp when the product list item was deleted."
+        default_factory=timestamp,
+        description="Timestamp when the product list item was deleted.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="UUID of the user who deleted the product list item."
@@ -155,7 +164,10 @@ class ProductListItemsRes(BaseModel):
 class ProductListItemsPgRes(BaseModel):
     """Paginated response model for product list items."""
 
-    total: int = Field(..., description="Total number of product list items.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of product list items. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(
         ..., description="Maximum number of product list items per page."
@@ -163,6 +175,10 @@ class ProductListItemsPgRes(BaseModel):
     has_more: bool = Field(
         ..., description="Indicates whether there are more pages available."
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     product_list_items: Optional[List[ProductListItemsRes]] = Field(
         None, description="List of product list items."
     )
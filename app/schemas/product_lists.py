@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import ConstrainedStr, TimeStamp
+from ._variables import ConstrainedStr, timestamp
 
 
 class ProductListsCreate(BaseModel):
@@ -28,7 +28,7 @@ class ProductListsInternalCreate(ProductListsCreate):
     """
 
     sys_created_at: datetime = Field(
-        ...,
+        default_factory=timestamp,
         description="The timestamp when the product list was created, automatically set.",
     )
     sys_created_by: UUID4 = Field(
@@ -63,7 +63,7 @@ class ProductListsInternalUpdate(ProductListsUpdate):
     """
 
     sys_updated_at: datetime = Field(
-        ...,
+        default_factory=timestamp,
         description="The timestamp when the product list was last updated, automatically set.",
     )
     sys_updated_by: Optional[UUID4] = Field(
@@ -75,7 +75,7 @@ class ProductListsDel(BaseModel):
     """Model for deleting a product list."""
 
     sys_deleted_at: datetime = Field(
-        ...,
+        default_factory=timestamp,
         description="The timestamp when the product list was deleted, automatically set.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
@@ -120,12 +120,19 @@ class ProductListsRes(BaseModel):
 class ProductListsPgRes(BaseModel):
     """Paginated response model for product lists."""
 
-    total: int = Field(..., description="Total number of product lists.")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of product lists. Null when counting is skipped.",
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Maximum number of product lists per page.")
     has_more: bool = Field(
         ..., description="Indicates whether there are more pages available."
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     product_lists: Optional[List[ProductListsRes]] = Field(
         None, description="List of product lists."
     )
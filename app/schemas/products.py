@@ -2,7 +2,7 @@ from datetime import UTC, datetime
 from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
-from ._variables import ConstrainedStr, TimeStamp
+from ._variables import ConstrainedStr, timestamp
 
 
 class ProductsCreate(BaseModel):
@@ -39,7 +39,7 @@ class ProductsInternalCreate(ProductsCreate):
     """
 
     sys_created_at: datetime = Field(
-        ...,
+        default_factory=timestamp,
         description="The timestamp when the product was created, automatically set.",
     )
     sys_created_by: UUID4 = Field(
@@ -87,7 +87,7 @@ class ProductsInternalUpdate(ProductsUpdate):
     """
 
     sys_updated_at: datetime = Field(
-        ...,
+        default_factory=timestamp,
         description="The timestamp when the product was last updated, automatically set.",
     )
     sys_updated_by: Optional[UUID4] = Field(
@@ -99,7 +99,7 @@ class ProductsDel(BaseModel):
     """Model for deleting a product."""
 
     sys_deleted_at: datetime = Field(
-        ...,
+        default_factory=timestamp,
         description="The timestamp when the product was deleted, automatically set.",
     )
     sys_deleted_by: Optional[UUID4] = Field(
@@ -152,12 +152,18 @@ class ProductsRes(BaseModel):
 class ProductsPgRes(BaseModel):
     """Paginated response model for products."""
 
-    total: int = Field(..., description="Total number of products.")
+    total: Optional[int] = Field(
+        None, description="Total number of products. Null when counting is skipped."
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Maximum number of products per page.")
     has_more: bool = Field(
         ..., description="Indicates whether there are more pages available."
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     products: Optional[List[ProductsRes]] = Field(
         None, description="List of products in the current page."
     )
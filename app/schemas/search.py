@@ -0,0 +1,64 @@
+from typing import Annotated, List, Optional
+
+from pydantic import BaseModel, Field
+
+from ..constants.enums import EntityTypes
+from .entities import IndividualNonIndividualRes
+from .products import ProductsRes
+
+
+class EntitiesSearchRes(IndividualNonIndividualRes):
+    """
+    Represents an entity matching a search.
+    """
+
+    type: Annotated[EntityTypes, EntityTypes] = Field(
+        ..., description="Type of the entity."
+    )
+    tin: Optional[str] = Field(None, description="Tax identification number.")
+    rank: float = Field(
+        ..., description="Similarity of the best matching name or TIN, from 0 to 1."
+    )
+
+
+class EntitiesSearchPgRes(BaseModel):
+    """
+    Represents a page of entities matching a search, best matches first.
+    """
+
+    limit: int = Field(..., description="Maximum number of entities per page.")
+    has_more: bool = Field(
+        ..., description="Indicates whether there are more pages available."
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
+    data: List[EntitiesSearchRes] = Field(
+        ..., description="The matching entities, best matches first."
+    )
+
+
+class ProductsSearchRes(ProductsRes):
+    """Response model for a product matching a search."""
+
+    rank: float = Field(
+        ...,
+        description="Similarity of the best matching word of the name, code or description, from 0 to 1.",
+    )
+
+
+class ProductsSearchPgRes(BaseModel):
+    """Paginated response model for products matching a search, best matches first."""
+
+    limit: int = Field(..., description="Maximum number of products per page.")
+    has_more: bool = Field(
+        ..., description="Indicates whether there are more pages available."
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
+    products: List[ProductsSearchRes] = Field(
+        ..., description="The matching products, best matches first."
+    )
@@ -4,7 +4,7 @@ import re
 
 from pydantic import UUID4, BaseModel, Field, field_validator
 
-from ._variables import ConstrainedEmailStr, ConstrainedStr, TimeStamp
+from ._variables import ConstrainedEmailStr, ConstrainedStr, timestamp
 
 
 class SysUsers(BaseModel):
@@ -39,7 +39,7 @@ class SysUsersCreate(SysUsers):
             - No more than 30 characters long \
             - At least one lowercase letter, one uppercase letter, and one numerical character.",
     )
-    sys_created_at: datetime = TimeStamp
+    sys_created_at: datetime = Field(default_factory=timestamp)
 
     @field_validator("password")
     def validate_password(cls, value):
@@ -100,7 +100,7 @@ class SysUsersInternalUpdate(SysUsersUpdate):
     Hides system level fields from client.
     """
 
-    sys_updated_at: datetime = TimeStamp
+    sys_updated_at: datetime = Field(default_factory=timestamp)
     sys_updated_by: Optional[UUID4] = Field(
         None, description="The UUID of the user who updated the record."
     )
@@ -109,7 +109,7 @@ class SysUsersInternalUpdate(SysUsersUpdate):
 class SysUsersDel(BaseModel):
     """Model for deleting a system user."""
 
-    sys_deleted_at: datetime = TimeStamp
+    sys_deleted_at: datetime = Field(default_factory=timestamp)
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="The UUID of the user who deleted the record."
     )
@@ -118,7 +118,7 @@ class SysUsersDel(BaseModel):
 class SysUsersDisable(BaseModel):
     """Model for disabling a system user."""
 
-    disabled_at: datetime = TimeStamp
+    disabled_at: datetime = Field(default_factory=timestamp)
 
 
 class SysUsersRes(BaseModel):
@@ -148,12 +148,18 @@ class SysUsersRes(BaseModel):
 class SysUsersPgRes(BaseModel):
     """Paginated response model for system users."""
 
-    total: int = Field(..., description="Total number of system users.")
+    total: Optional[int] = Field(
+        None, description="Total number of system users. Null when counting is skipped."
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Maximum number of users per page.")
     has_more: bool = Field(
         ..., description="Indicates whether there are more pages available."
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     sys_users: Optional[List[SysUsersRes]] = Field(
         None, description="List of system users in the current page."
     )
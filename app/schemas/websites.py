@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from pydantic import UUID4, BaseModel, Field
 
-from ._variables import ConstrainedStr, TimeStamp
+from ._variables import ConstrainedStr, timestamp
 
 
 class WebsitesCreate(BaseModel):
@@ -31,7 +31,7 @@ class WebsitesInternalCreate(WebsitesCreate):
     sys_created_by: UUID4 = Field(
         ..., description="The UUID of the user who created the record (optional)."
     )
-    sys_created_at: datetime = TimeStamp
+    sys_created_at: datetime = Field(default_factory=timestamp)
 
 
 class WebsitesUpdate(BaseModel):
@@ -54,7 +54,7 @@ class WebsitesInternalUpdate(WebsitesUpdate):
     Hides system level fields from client.
     """
 
-    sys_updated_at: datetime = TimeStamp
+    sys_updated_at: datetime = Field(default_factory=timestamp)
     sys_updated_by: Optional[UUID4] = Field(
         None, description="The UUID of the user who updated the record (optional)."
     )
@@ -66,7 +66,7 @@ class WebsitesDel(BaseModel):
     sys_deleted_by: Optional[UUID4] = Field(
         None, description="The UUID of the user who deleted the record (optional)."
     )
-    sys_deleted_at: datetime = TimeStamp
+    sys_deleted_at: datetime = Field(default_factory=timestamp)
 
 
 class WebsitesRes(BaseModel):
@@ -105,12 +105,18 @@ class WebsitesRes(BaseModel):
 class WebsitesPgRes(BaseModel):
     """Paginated response model for websites."""
 
-    total: int = Field(..., description="Total number of websites.")
+    total: Optional[int] = Field(
+        None, description="Total number of websites. Null when counting is skipped."
+    )
     page: int = Field(..., description="Current page number.")
     limit: int = Field(..., description="Maximum number of websites per page.")
     has_more: bool = Field(
         ..., description="Indicates whether there are more pages available."
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor to request the following page, null when there are no more records.",
+    )
     websites: Optional[List[WebsitesRes]] = Field(
         None, description="List of website records in the current page."
     )
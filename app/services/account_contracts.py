@@ -1,7 +1,11 @@
+from datetime import datetime
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import AccContractNotExist
 from ..models import AccountContracts
@@ -78,12 +82,38 @@ class ReadSrvc:
             instance=account_contract, exception=AccContractNotExist
         )
 
+    async def get_account_contract_version(
+        self,
+        account_uuid: UUID4,
+        account_contract_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the account contract, the time it was last written.
+
+        :param account_uuid: The UUID of the account.
+        :type account_uuid: UUID4
+        :param account_contract_uuid: The UUID of the account contract.
+        :type account_contract_uuid: UUID4
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The version of the account contract, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_account_contract(
+            account_uuid=account_uuid, account_contract_uuid=account_contract_uuid
+        )
+        return await self._db_ops.return_version(
+            service=cnst.ACCOUNTS_CONTRACTS_READ_SERVICE, statement=statement, db=db
+        )
+
     async def get_account_contracts(
         self,
         account_uuid: UUID4,
         limit: int,
         offset: int,
         db: AsyncSession,
+        after: Optional[int] = None,
     ) -> AccountContractsRes:
         """
         Fetches account contracts from the database by account.
@@ -96,6 +126,8 @@ class ReadSrvc:
         :type offset: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
         :return: The account contracts.
         :rtype: AccountContracts
         :raises AccContractNotExist: If the account contracts do not exist.
@@ -105,6 +137,7 @@ class ReadSrvc:
             account_uuid=account_uuid,
             limit=limit,
             offset=offset,
+            after=after,
         )
         account_contracts: AccountContractsRes = await self._db_ops.return_all_rows(
             service=cnst.ACCOUNTS_CONTRACTS_READ_SERVICE, statement=statement, db=db
@@ -136,7 +169,13 @@ class ReadSrvc:
         )
 
     async def paginated_account_contracts(
-        self, account_uuid: UUID4, page: int, limit: int, db: AsyncSession
+        self,
+        account_uuid: UUID4,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> AccountContractsPgRes:
         """
         Fetches a paginated list of account contracts for a specific account.
@@ -144,20 +183,30 @@ class ReadSrvc:
         This method is has a dependency on
         """
         offset = pagination.page_offset(page=page, limit=limit)
-        total_count = await self.get_account_contracts_count(
-            account_uuid=account_uuid, db=db
+        statement = self._statements.get_account_contracts(
+            account_uuid=account_uuid, limit=limit + 1, offset=offset, after=after
         )
-        account_contracts = await self.get_account_contracts(
-            account_uuid=account_uuid, limit=limit, offset=offset, db=db
+        account_contracts, total_count = await self._db_ops.return_page(
+            service=cnst.ACCOUNTS_CONTRACTS_READ_SERVICE,
+            statement=statement,
+            count_statement=self._statements.account_contracts_count(
+                account_uuid=account_uuid
+            ),
+            count=count,
+            db=db,
         )
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        record_not_exist(instance=account_contracts, exception=AccContractNotExist)
+        account_contracts, has_more = pagination.split_page(
+            items=account_contracts, limit=limit
         )
         return AccountContractsPgRes(
             total=total_count,
             page=page,
             limit=limit,
             has_more=has_more,
+            next_cursor=pagination.next_cursor(
+                items=account_contracts, has_more=has_more
+            ),
             account_contracts=account_contracts,
         )
 
@@ -1,9 +1,12 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 from pydantic import UUID4
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..exceptions import AccListExists, AccListNotExist
 from ..models.account_lists import AccountLists
 from ..schemas.account_lists import (
@@ -74,12 +77,38 @@ class ReadSrvc:
         )
         return record_not_exist(instance=account_list, exception=AccListNotExist)
 
+    async def get_account_list_version(
+        self,
+        account_uuid: UUID4,
+        account_list_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the account list, the time it was last written.
+
+        :param account_uuid: The UUID of the account.
+        :type account_uuid: UUID4
+        :param account_list_uuid: The UUID of the account list.
+        :type account_list_uuid: UUID4
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The version of the account list, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_account_list(
+            account_uuid=account_uuid, account_list_uuid=account_list_uuid
+        )
+        return await self._db_ops.return_version(
+            service=cnst.ACCOUNTS_LISTS_READ_SERVICE, statement=statement, db=db
+        )
+
     async def get_account_lists(
         self,
         account_uuid: UUID4,
         limit: int,
         offset: int,
         db: AsyncSession,
+        after: Optional[int] = None,
     ) -> List[AccountLists]:
         """
         Retrieves a list of account lists for a given account UUID, with pagination support.
@@ -92,12 +121,14 @@ class ReadSrvc:
         :type offset: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
         :return: A list of account lists.
         :rtype: List[AccountLists]
         :raises AccListNotExist: If no account lists are found.
         """
         statement = self._statements.get_account_lists_account(
-            account_uuid=account_uuid, limit=limit, offset=offset
+            account_uuid=account_uuid, limit=limit, offset=offset, after=after
         )
         account_lists: List[AccountLists] = await self._db_ops.return_all_rows(
             service=cnst.ACCOUNTS_LISTS_READ_SERVICE, statement=statement, db=db
@@ -120,6 +151,53 @@ class ReadSrvc:
             service=cnst.ACCOUNTS_LISTS_READ_SERVICE, statement=statement, db=db
         )
 
+    async def get_account_lists_page(
+        self,
+        account_uuid: UUID4,
+        limit: int,
+        offset: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
+    ) -> Tuple[List[Row], Optional[int]]:
+        """
+        Retrieves a page of account lists for a given account UUID together with the total count.
+
+        The links are read with their product lists in one statement, each row holds the `AccountLists`
+        link and its `ProductLists` record.
+
+        :param account_uuid: The UUID of the account.
+        :type account_uuid: UUID4
+        :param limit: The maximum number of records to retrieve.
+        :type limit: int
+        :param offset: The starting point for retrieving records.
+        :type offset: int
+        :param db: The database session.
+        :type db: AsyncSession
+        :param after: The id of the last link of the previous page, replaces offset when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
+        :return: The page of account lists with their product lists and the total count, None when not counted.
+        :rtype: Tuple[List[Row], Optional[int]]
+        :raises AccListNotExist: If no account lists are found.
+        """
+        statement = self._statements.get_account_lists_joined(
+            account_uuid=account_uuid, limit=limit, offset=offset, after=after
+        )
+        account_lists, total_count = await self._db_ops.return_page(
+            service=cnst.ACCOUNTS_LISTS_READ_SERVICE,
+            statement=statement,
+            count_statement=self._statements.get_account_lists_joined_count(
+                account_uuid=account_uuid
+            ),
+            count=count,
+            db=db,
+            rows=True,
+        )
+        record_not_exist(instance=account_lists, exception=AccListNotExist)
+        return account_lists, total_count
+
     async def paginated_account_lists(
         self, account_uuid: UUID4, page: int, limit: int, db: AsyncSession
     ) -> AccountListsOrchPgRes:
@@ -1,9 +1,12 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
 from pydantic import UUID4
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..statements.accounts_products import AccountProductsStms
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import AccProductsExists, AccProductstNotExist
 from ..models.account_products import AccountProducts
@@ -67,7 +70,7 @@ class ReadSrvc:
         :rtype: AccountProductsRes
         :raises AccProductstNotExist: If the account product does not exist.
         """
-        statement = self._statements.get_accout_product(
+        statement = self._statements.get_account_product(
             account_uuid=account_uuid, account_product_uuid=account_product_uuid
         )
         account_product = await self._db_ops.return_one_row(
@@ -77,12 +80,38 @@ class ReadSrvc:
             instance=account_product, exception=AccProductstNotExist
         )
 
+    async def get_account_product_version(
+        self,
+        account_uuid: UUID4,
+        account_product_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the account product, the time it was last written.
+
+        :param account_uuid: The UUID of the account.
+        :type account_uuid: UUID4
+        :param account_product_uuid: The UUID of the account product.
+        :type account_product_uuid: UUID4
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The version of the account product, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_account_product(
+            account_uuid=account_uuid, account_product_uuid=account_product_uuid
+        )
+        return await self._db_ops.return_version(
+            service=cnst.ACCOUNTS_PRODUCTS_READ_SERVICE, statement=statement, db=db
+        )
+
     async def get_account_products(
         self,
         account_uuid: UUID4,
         limit: int,
         offset: int,
         db: AsyncSession,
+        after: Optional[int] = None,
     ) -> List[AccountProductsRes]:
         """
         Retrieves a list of account products with pagination.
@@ -95,12 +124,17 @@ class ReadSrvc:
         :type offset: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
         :return: A list of account products.
         :rtype: List[AccountProductsRes]
         :raises AccProductstNotExist: If no account products exist.
         """
         statement = self._statements.get_account_products(
-            account_uuid=account_uuid, limit=limit, offset=offset
+            account_uuid=account_uuid,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
         account_products: List[AccountProductsRes] = await self._db_ops.return_all_rows(
             service=cnst.ACCOUNTS_PRODUCTS_READ_SERVICE, statement=statement, db=db
@@ -127,12 +161,61 @@ class ReadSrvc:
             service=cnst.ACCOUNTS_PRODUCTS_READ_SERVICE, statement=statement, db=db
         )
 
+    async def get_account_products_page(
+        self,
+        account_uuid: UUID4,
+        limit: int,
+        offset: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
+    ) -> Tuple[List[Row], Optional[int]]:
+        """
+        Retrieves a page of account products for a given account UUID together with the total count.
+
+        The links are read with their products in one statement, each row holds the `AccountProducts`
+        link and its `Products` record.
+
+        :param account_uuid: The UUID of the account.
+        :type account_uuid: UUID4
+        :param limit: The maximum number of records to retrieve.
+        :type limit: int
+        :param offset: The starting point for retrieving records.
+        :type offset: int
+        :param db: The database session.
+        :type db: AsyncSession
+        :param after: The id of the last link of the previous page, replaces offset when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
+        :return: The page of account products with their products and the total count, None when not counted.
+        :rtype: Tuple[List[Row], Optional[int]]
+        :raises AccProductstNotExist: If no account products are found.
+        """
+        statement = self._statements.get_account_products_joined(
+            account_uuid=account_uuid, limit=limit, offset=offset, after=after
+        )
+        account_products, total_count = await self._db_ops.return_page(
+            service=cnst.ACCOUNTS_PRODUCTS_READ_SERVICE,
+            statement=statement,
+            count_statement=self._statements.get_account_products_joined_ct(
+                account_uuid=account_uuid
+            ),
+            count=count,
+            db=db,
+            rows=True,
+        )
+        record_not_exist(instance=account_products, exception=AccProductstNotExist)
+        return account_products, total_count
+
     async def paginated_products(
         self,
         account_uuid: UUID4,
         page: int,
         limit: int,
         db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> AccountProductsPgRes:
         """
         Retrieves paginated account products for a specific account.
@@ -145,24 +228,38 @@ class ReadSrvc:
         :type limit: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
         :return: A paginated response with account products.
         :rtype: AccountProductsPgRes
         """
-        total_count = await self.get_account_product_ct(
-            account_uuid=account_uuid, db=db
-        )
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_account_products(
+            account_uuid=account_uuid, limit=limit + 1, offset=offset, after=after
+        )
+        account_products, total_count = await self._db_ops.return_page(
+            service=cnst.ACCOUNTS_PRODUCTS_READ_SERVICE,
+            statement=statement,
+            count_statement=self._statements.get_account_products_ct(
+                account_uuid=account_uuid
+            ),
+            count=count,
+            db=db,
         )
-        account_products = await self.get_account_products(
-            account_uuid=account_uuid, offset=offset, limit=limit, db=db
+        record_not_exist(instance=account_products, exception=AccProductstNotExist)
+        account_products, has_more = pagination.split_page(
+            items=account_products, limit=limit
         )
         return AccountProductsPgRes(
             total=total_count,
             page=page,
             limit=limit,
             has_more=has_more,
+            next_cursor=pagination.next_cursor(
+                items=account_products, has_more=has_more
+            ),
             products=account_products,
         )
 
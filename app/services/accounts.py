@@ -1,11 +1,13 @@
+from datetime import datetime
 from re import A
 from token import OP
-from typing import List
+from typing import List, Optional
 
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import AccsNotExist
 from ..models.accounts import Accounts
@@ -87,6 +89,24 @@ class ReadSrvc:
         )
         return record_not_exist(instance=account, exception=AccsNotExist)
 
+    async def get_account_version(
+        self, account_uuid: UUID4, db: AsyncSession
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the account, the time it was last written.
+
+        :param account_uuid: The UUID of the account to retrieve.
+        :type account_uuid: UUID4
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The version of the account, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_account(account_uuid=account_uuid)
+        return await self._db_ops.return_version(
+            service=cnst.ACCOUNTS_READ_SERVICE, statement=statement, db=db
+        )
+
     async def get_accounts_by_uuids(self, account_uuids: List[UUID4], db: AsyncSession):
         """
         Retrieves multiple accounts from the database by a list of UUIDs.
@@ -105,7 +125,9 @@ class ReadSrvc:
         )
         return record_not_exist(instance=accounts, exception=AccsNotExist)
 
-    async def get_accounts(self, offset: int, limit: int, db: AsyncSession):
+    async def get_accounts(
+        self, offset: int, limit: int, db: AsyncSession, after: Optional[int] = None
+    ):
         """
         Retrieves a paginated list of accounts from the database.
 
@@ -115,10 +137,14 @@ class ReadSrvc:
         :type limit: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
         :return: The list of accounts within the given pagination parameters.
         :rtype: List[AccountsRes]
         """
-        statement = self._statements.get_accounts(offset=offset, limit=limit)
+        statement = self._statements.get_accounts(
+            offset=offset, limit=limit, after=after
+        )
         return await self._db_ops.return_all_rows(
             service=cnst.ACCOUNTS_READ_SERVICE, statement=statement, db=db
         )
@@ -140,7 +166,12 @@ class ReadSrvc:
         )
 
     async def paginated_accounts(
-        self, page: int, limit: int, db: AsyncSession
+        self,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> AccountsPgRes:
         """
         Retrieves a paginated list of accounts, including metadata such as the total count and pagination details.
@@ -151,20 +182,31 @@ class ReadSrvc:
         :type limit: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
         :return: A paginated response with account data and pagination metadata.
         :rtype: AccountsPgRes
         """
-        total_count = await self.get_account_ct(db=db)
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_accounts(
+            offset=offset, limit=limit + 1, after=after
+        )
+        accounts, total_count = await self._db_ops.return_page(
+            service=cnst.ACCOUNTS_READ_SERVICE,
+            statement=statement,
+            count_statement=self._statements.get_accounts_ct(),
+            count=count,
+            db=db,
         )
-        accounts = await self.get_accounts(offset=offset, limit=limit, db=db)
+        accounts, has_more = pagination.split_page(items=accounts, limit=limit)
         return AccountsPgRes(
             total=total_count,
             page=page,
             limit=limit,
             has_more=has_more,
+            next_cursor=pagination.next_cursor(items=accounts, has_more=has_more),
             accounts=accounts,
         )
 
@@ -1,9 +1,12 @@
-from typing import Literal, List
+from datetime import datetime
+from typing import List, Literal, Optional
 
 from pydantic import UUID4
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import AddressExists, AddressNotExist
 from ..models.addresses import Addresses
@@ -18,7 +21,13 @@ from ..schemas.addresses import (
 )
 from ..statements.addresses import AddressesStms
 from ..utilities import pagination
-from ..utilities.data import record_not_exist, record_exists
+from ..utilities.addresses import address_fingerprint
+from ..utilities.data import record_not_exist, violates_index
+
+# Fields of an address its fingerprint is computed from.
+FINGERPRINT_FIELDS = ("address_line1", "address_line2", "city", "zip")
+# Unique index of the active addresses of a parent on their fingerprint.
+FINGERPRINT_INDEX = "ux_em_addresses_parent_uuid_fingerprint_active"
 
 
 class ReadSrvc:
@@ -98,6 +107,36 @@ class ReadSrvc:
         )
         return record_not_exist(instance=address, exception=AddressNotExist)
 
+    async def get_address_version(
+        self,
+        parent_uuid: UUID4,
+        parent_table: Literal["entities", "accounts"],
+        address_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the address, the time it was last written.
+
+        :param parent_uuid: The UUID of the parent (either an entity or an account).
+        :type parent_uuid: UUID4
+        :param parent_table: The table the address is associated with, either "entities" or "accounts".
+        :type parent_table: Literal["entities", "accounts"]
+        :param address_uuid: The UUID of the address to retrieve.
+        :type address_uuid: UUID4
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The version of the address, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_address(
+            parent_uuid=parent_uuid,
+            address_uuid=address_uuid,
+            parent_table=parent_table,
+        )
+        return await self._db_ops.return_version(
+            service=cnst.ADDRESSES_READ_SERVICE, statement=statement, db=db
+        )
+
     async def get_addresses(
         self,
         parent_uuid: UUID4,
@@ -105,6 +144,7 @@ class ReadSrvc:
         limit: int,
         offset: int,
         db: AsyncSession,
+        after: Optional[int] = None,
     ) -> List[AddressesRes]:
         """
         Retrieves a list of addresses for a specific parent (entity or account).
@@ -119,6 +159,8 @@ class ReadSrvc:
         :type offset: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
         :return: A list of addresses.
         :rtype: List[AddressesRes]
         :raises AddressNotExist: If no addresses exist for the given parent.
@@ -128,6 +170,7 @@ class ReadSrvc:
             parent_table=parent_table,
             offset=offset,
             limit=limit,
+            after=after,
         )
         addresses: List[AddressesRes] = await self._db_ops.return_all_rows(
             service=cnst.ADDRESSES_READ_SERVICE, statement=statement, db=db
@@ -166,6 +209,8 @@ class ReadSrvc:
         limit: int,
         page: int,
         db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> AddressesPgRes:
         """
         Retrieves paginated addresses for a specific parent (entity or account).
@@ -180,28 +225,38 @@ class ReadSrvc:
         :type page: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
         :return: A paginated result of addresses.
         :rtype: AddressesPgRes
         """
-        total_count = await self.get_addresses_ct(
-            parent_uuid=parent_uuid, parent_table=parent_table, db=db
-        )
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
-        )
-        addresses = await self.get_addresses(
+        statement = self._statements.get_address_by_entity(
             parent_uuid=parent_uuid,
             parent_table=parent_table,
             offset=offset,
-            limit=limit,
+            limit=limit + 1,
+            after=after,
+        )
+        addresses, total_count = await self._db_ops.return_page(
+            service=cnst.ADDRESSES_READ_SERVICE,
+            statement=statement,
+            count_statement=self._statements.get_addresses_ct(
+                parent_uuid=parent_uuid, parent_table=parent_table
+            ),
+            count=count,
             db=db,
         )
+        record_not_exist(instance=addresses, exception=AddressNotExist)
+        addresses, has_more = pagination.split_page(items=addresses, limit=limit)
         return AddressesPgRes(
             total=total_count,
             page=page,
             limit=limit,
             has_more=has_more,
+            next_cursor=pagination.next_cursor(items=addresses, has_more=has_more),
             addresses=addresses,
         )
 
@@ -285,26 +340,23 @@ class CreateSrvc:
         :return: The created address.
         :rtype: AddressesRes
         :raises AddressExists: If the address already exists.
-        :raises AddressNotExist: If the address creation failed.
         """
         addresses = self._model
-        statement = self._statements.get_address_by_address(
-            parent_uuid=parent_uuid,
+        address_data.fingerprint = address_fingerprint(
             address_line1=address_data.address_line1,
             address_line2=address_data.address_line2,
             city=address_data.city,
+            zip=address_data.zip,
         )
-        address_exists: AddressesRes = await self._db_ops.return_one_row(
-            service=cnst.ADDRESSES_CREATE_SERVICE, statement=statement, db=db
+        address: AddressesRes = await self._db_ops.add_instance(
+            service=cnst.ADDRESSES_CREATE_SERVICE,
+            model=addresses,
+            data=address_data,
+            db=db,
+            unique=addresses.unique_columns,
         )
-        if not record_exists(instance=address_exists, exception=AddressExists):
-            address: AddressesRes = await self._db_ops.add_instance(
-                service=cnst.ADDRESSES_CREATE_SERVICE,
-                model=addresses,
-                data=address_data,
-                db=db,
-            )
-            return record_not_exist(instance=address, exception=AddressNotExist)
+        # Nothing is returned when the parent already has an address with the same fingerprint.
+        return record_not_exist(instance=address, exception=AddressExists)
 
 
 class UpdateSrvc:
@@ -375,16 +427,50 @@ class UpdateSrvc:
         :return: The updated address.
         :rtype: AddressesRes
         :raises AddressNotExist: If the address does not exist.
+        :raises AddressExists: If the parent already has another address with the same fingerprint.
         """
+        # Empty strings clear a field, missing values keep the stored one.
+        changes = address_data.model_dump(
+            include=set(FINGERPRINT_FIELDS), exclude_none=True
+        )
+        if changes:
+            current: AddressesRes = await self._db_ops.return_one_row(
+                service=cnst.ADDRESSES_UPDATE_SERVICE,
+                statement=self._statements.get_address(
+                    parent_uuid=parent_uuid,
+                    parent_table=parent_table,
+                    address_uuid=address_uuid,
+                ),
+                db=db,
+            )
+            record_not_exist(instance=current, exception=AddressNotExist)
+            fields = {field: getattr(current, field) for field in FINGERPRINT_FIELDS}
+            fields.update({field: value or None for field, value in changes.items()})
+            address_data.fingerprint = address_fingerprint(**fields)
+            duplicate: AddressesRes = await self._db_ops.return_one_row(
+                service=cnst.ADDRESSES_UPDATE_SERVICE,
+                statement=self._statements.get_address_by_fingerprint(
+                    parent_uuid=parent_uuid, fingerprint=address_data.fingerprint
+                ),
+                db=db,
+            )
+            if duplicate and duplicate.uuid != address_uuid:
+                raise AddressExists
         statement = self._statements.update_address(
             parent_uuid=parent_uuid,
             parent_table=parent_table,
-            addresses_uuid=address_uuid,
+            address_uuid=address_uuid,
             address_data=address_data,
         )
-        address: AddressesRes = await self._db_ops.return_one_row(
-            service=cnst.ADDRESSES_UPDATE_SERVICE, statement=statement, db=db
-        )
+        try:
+            address: AddressesRes = await self._db_ops.return_one_row(
+                service=cnst.ADDRESSES_UPDATE_SERVICE, statement=statement, db=db
+            )
+        except IntegrityError as e:
+            # A concurrent write can take the fingerprint between the lookup and the update.
+            if violates_index(error=e, index=FINGERPRINT_INDEX):
+                raise AddressExists
+            raise
         return record_not_exist(instance=address, exception=AddressNotExist)
 
 
@@ -460,7 +546,7 @@ class DelSrvc:
         statement = self._statements.update_address(
             parent_uuid=parent_uuid,
             parent_table=parent_table,
-            addresses_uuid=address_uuid,
+            address_uuid=address_uuid,
             address_data=address_data,
         )
         address: AddressesDelRes = await self._db_ops.return_one_row(
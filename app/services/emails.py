@@ -1,10 +1,12 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
 from pydantic import UUID4
 from sqlalchemy import Select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import EmailExists, EmailNotExist
 from ..models.emails import Emails
@@ -18,7 +20,7 @@ from ..schemas.emails import (
 )
 from ..statements.emails import EmailsStms
 from ..utilities import pagination
-from ..utilities.data import record_not_exist, record_exists
+from ..utilities.data import record_not_exist
 
 
 class ReadSrvc:
@@ -92,12 +94,38 @@ class ReadSrvc:
         )
         return record_not_exist(instance=email, exception=EmailNotExist)
 
+    async def get_email_version(
+        self,
+        entity_uuid: UUID4,
+        email_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the email, the time it was last written.
+
+        :param entity_uuid: The UUID of the entity to which the email belongs.
+        :type entity_uuid: UUID4
+        :param email_uuid: The UUID of the email to retrieve.
+        :type email_uuid: UUID4
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The version of the email, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement: Select = self._statements.get_email(
+            entity_uuid=entity_uuid, email_uuid=email_uuid
+        )
+        return await self._db_ops.return_version(
+            service=cnst.EMAILS_READ_SERVICE, statement=statement, db=db
+        )
+
     async def get_emails(
         self,
         entity_uuid: UUID4,
         limit: int,
         offset: int,
         db: AsyncSession,
+        after: Optional[int] = None,
     ) -> List[EmailsRes]:
         """
         Retrieves a list of emails associated with a given entity UUID, paginated by limit and offset.
@@ -110,12 +138,17 @@ class ReadSrvc:
         :type offset: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
         :return: The list of emails.
         :rtype: List[EmailsRes]
         :raises EmailNotExist: If no emails are found.
         """
         statement: Select = self._statements.get_emails(
-            entity_uuid=entity_uuid, limit=limit, offset=offset
+            entity_uuid=entity_uuid,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
         emails: List[EmailsRes] = await self._db_ops.return_all_rows(
             service=cnst.EMAILS_READ_SERVICE, statement=statement, db=db
@@ -143,7 +176,13 @@ class ReadSrvc:
         )
 
     async def paginated_emails(
-        self, entity_uuid: UUID4, page: int, limit: int, db: AsyncSession
+        self,
+        entity_uuid: UUID4,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> EmailsPgRes:
         """
         Retrieves a paginated list of emails along with pagination metadata (total count, current page, etc.).
@@ -156,19 +195,33 @@ class ReadSrvc:
         :type limit: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
         :return: A paginated result including emails and pagination metadata.
         :rtype: EmailsPgRes
         """
-        total_count: int = await self.get_email_ct(entity_uuid=entity_uuid, db=db)
         offset: int = pagination.page_offset(page=page, limit=limit)
-        has_more: bool = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_emails(
+            entity_uuid=entity_uuid, limit=limit + 1, offset=offset, after=after
         )
-        emails: List[EmailsRes] = await self.get_emails(
-            entity_uuid=entity_uuid, offset=offset, limit=limit, db=db
+        emails, total_count = await self._db_ops.return_page(
+            service=cnst.EMAILS_READ_SERVICE,
+            statement=statement,
+            count_statement=self._statements.get_email_ct(entity_uuid=entity_uuid),
+            count=count,
+            db=db,
         )
+        record_not_exist(instance=emails, exception=EmailNotExist)
+        emails, has_more = pagination.split_page(items=emails, limit=limit)
         return EmailsPgRes(
-            total=total_count, page=page, limit=limit, has_more=has_more, emails=emails
+            total=total_count,
+            page=page,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=pagination.next_cursor(items=emails, has_more=has_more),
+            emails=emails,
         )
 
 
@@ -251,21 +304,17 @@ class CreateSrvc:
         :return: The result of the email creation operation.
         :rtype: EmailsRes
         :raises EmailExists: If an email already exists for the given entity.
-        :raises EmailNotExist: If the email could not be created.
         """
         emails = self._model
-        statement = self._statements.get_email_by_email(
-            entity_uuid=entity_uuid, email=email_data.email
-        )
-        email_exists: EmailsRes = await self._db_ops.return_one_row(
-            service=cnst.EMAILS_CREATE_SERVICE, statement=statement, db=db
-        )
-        record_exists(instance=email_exists, exception=EmailExists)
-
         email = await self._db_ops.add_instance(
-            service=cnst.EMAILS_CREATE_SERVICE, model=emails, data=email_data, db=db
+            service=cnst.EMAILS_CREATE_SERVICE,
+            model=emails,
+            data=email_data,
+            db=db,
+            unique=emails.unique_columns,
         )
-        return record_not_exist(instance=email, exception=EmailNotExist)
+        # Nothing is returned when the entity already has the email.
+        return record_not_exist(instance=email, exception=EmailExists)
 
 
 class UpdateSrvc:
@@ -1,10 +1,12 @@
-from typing import List
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 
 from pydantic import UUID4
 from sqlalchemy import Select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import EntityNotExist
 from ..models.entities import Entities
@@ -84,6 +86,24 @@ class ReadSrvc:
         )
         return record_not_exist(instance=entity, exception=EntityNotExist)
 
+    async def get_entity_version(
+        self, entity_uuid: UUID4, db: AsyncSession
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the entity, the time it was last written.
+
+        :param entity_uuid: The UUID of the entity to retrieve.
+        :type entity_uuid: UUID4
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The version of the entity, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_entity(entity_uuid=entity_uuid)
+        return await self._db_ops.return_version(
+            service=cnst.ENTITIES_READ_SERV, statement=statement, db=db
+        )
+
     async def get_entities_by_uuids(self, entity_uuids: List[UUID4], db: AsyncSession):
         """
         Retrieves multiple entities from the database by their UUIDs.
@@ -105,10 +125,7 @@ class ReadSrvc:
         return record_not_exist(instance=entities, exception=EntityNotExist)
 
     async def get_entities(
-        self,
-        limit: int,
-        offset: int,
-        db: AsyncSession,
+        self, limit: int, offset: int, db: AsyncSession, after: Optional[int] = None
     ) -> List[EntitiesRes]:
         """
         Retrieves a list of entities from the database with pagination support.
@@ -119,17 +136,35 @@ class ReadSrvc:
         :type offset: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
         :return: A list of the retrieved entity data.
         :rtype: List[EntitiesRes]
         :raises EntityNotExist: If no entities are found.
         """
-        statement: Select = self._statements.get_entities(limit=limit, offset=offset)
+        statement: Select = self._statements.get_entities(
+            limit=limit, offset=offset, after=after
+        )
         entities: List[EntitiesRes] = await self._db_ops.return_all_rows(
             service=cnst.ENTITIES_READ_SERV, statement=statement, db=db
         )
         record_not_exist(instance=entities, exception=EntityNotExist)
         return entities
 
+    def stream_entities(self, db: AsyncSession) -> AsyncIterator[List[EntitiesRes]]:
+        """
+        Streams all entities from the database in batches, for exports.
+
+        :param db: The database session, it must stay open until the iteration ends.
+        :type db: AsyncSession
+        :return: Batches of entities.
+        :rtype: AsyncIterator[List[EntitiesRes]]
+        """
+        statement: Select = self._statements.export_entities()
+        return self._db_ops.stream_rows(
+            service=cnst.ENTITIES_READ_SERV, statement=statement, db=db
+        )
+
     async def get_entity_ct(self, db: AsyncSession) -> int:
         """
         Retrieves the count of entities in the database.
@@ -145,7 +180,12 @@ class ReadSrvc:
         )
 
     async def paginated_entities(
-        self, page: int, limit: int, db: AsyncSession
+        self,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> EntitiesPgRes:
         """
         Retrieves entities with pagination support, including metadata about the result.
@@ -156,17 +196,33 @@ class ReadSrvc:
         :type limit: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
         :return: A paginated result with metadata about the total count and available pages.
         :rtype: EntitiesPgRes
         """
-        total_count: int = await self.get_entity_ct(db=db)
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_entities(
+            limit=limit + 1, offset=offset, after=after
         )
-        entities = await self.get_entities(offset=offset, limit=limit, db=db)
+        entities, total_count = await self._db_ops.return_page(
+            service=cnst.ENTITIES_READ_SERV,
+            statement=statement,
+            count_statement=self._statements.get_entity_ct(),
+            count=count,
+            db=db,
+        )
+        record_not_exist(instance=entities, exception=EntityNotExist)
+        entities, has_more = pagination.split_page(items=entities, limit=limit)
         return EntitiesPgRes(
-            total=total_count, page=page, limit=limit, has_more=has_more, data=entities
+            total=total_count,
+            page=page,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=pagination.next_cursor(items=entities, has_more=has_more),
+            data=entities,
         )
 
 
@@ -1,8 +1,11 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
 from pydantic import UUID4
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import EntityAccExists, EntityAccNotExist
 from ..models.entity_accounts import EntityAccounts
@@ -91,6 +94,31 @@ class ReadSrvc:
         )
         return record_not_exist(instance=entity_account, exception=EntityAccNotExist)
 
+    async def get_entity_account_version(
+        self,
+        entity_uuid: UUID4,
+        entity_account_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the entity account, the time it was last written.
+
+        :param entity_uuid: The UUID of the entity.
+        :type entity_uuid: UUID4
+        :param entity_account_uuid: The UUID of the entity account.
+        :type entity_account_uuid: UUID4
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The version of the entity account, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_entity_account(
+            entity_uuid=entity_uuid, entity_account_uuid=entity_account_uuid
+        )
+        return await self._db_ops.return_version(
+            service=cnst.ENTITY_ACCOUNTS_READ_SERV, statement=statement, db=db
+        )
+
     async def get_account_entity(
         self,
         account_uuid: UUID4,
@@ -118,12 +146,38 @@ class ReadSrvc:
         )
         return record_not_exist(instance=entity_account, exception=EntityAccNotExist)
 
+    async def get_account_entity_version(
+        self,
+        account_uuid: UUID4,
+        entity_account_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the entity account, the time it was last written.
+
+        :param account_uuid: The UUID of the account.
+        :type account_uuid: UUID4
+        :param entity_account_uuid: The UUID of the entity account.
+        :type entity_account_uuid: UUID4
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The version of the entity account, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_account_entity(
+            account_uuid=account_uuid, entity_account_uuid=entity_account_uuid
+        )
+        return await self._db_ops.return_version(
+            service=cnst.ENTITY_ACCOUNTS_READ_SERV, statement=statement, db=db
+        )
+
     async def get_account_entities(
         self,
         account_uuid: UUID4,
         limit: int,
         offset: int,
         db: AsyncSession,
+        after: Optional[int] = None,
     ) -> List[EntityAccountsRes]:
         """
         Fetches a list of entity account records for a specific account, with pagination support.
@@ -136,12 +190,14 @@ class ReadSrvc:
         :type offset: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
         :return: A list of entity account data.
         :rtype: List[EntityAccountsRes]
         :raises EntityAccNotExist: If no entity accounts are found.
         """
         statement = self._statements.get_account_entities(
-            account_uuid=account_uuid, limit=limit, offset=offset
+            account_uuid=account_uuid, limit=limit, offset=offset, after=after
         )
         entity_account: List[EntityAccountsRes] = await self._db_ops.return_all_rows(
             service=cnst.ENTITY_ACCOUNTS_READ_SERV, statement=statement, db=db
@@ -154,6 +210,7 @@ class ReadSrvc:
         limit: int,
         offset: int,
         db: AsyncSession,
+        after: Optional[int] = None,
     ) -> List[EntityAccountsRes]:
         """
         Fetches a list of entity account records for a specific entity, with pagination support.
@@ -166,12 +223,14 @@ class ReadSrvc:
         :type offset: int
         :param db: The database session.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
         :return: A list of entity account data.
         :rtype: List[EntityAccountsRes]
         :raises EntityAccNotExist: If no entity accounts are found.
         """
         statement = self._statements.get_entity_accounts(
-            entity_uuid=entity_uuid, limit=limit, offset=offset
+            entity_uuid=entity_uuid, limit=limit, offset=offset, after=after
         )
         entity_account = await self._db_ops.return_all_rows(
             service=cnst.ENTITY_ACCOUNTS_READ_SERV, statement=statement, db=db
@@ -198,6 +257,53 @@ class ReadSrvc:
             service=cnst.ENTITY_ACCOUNTS_READ_SERV, statement=statement, db=db
         )
 
+    async def get_entity_accounts_page(
+        self,
+        entity_uuid: UUID4,
+        limit: int,
+        offset: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
+    ) -> Tuple[List[Row], Optional[int]]:
+        """
+        Retrieves a page of entity accounts for a given entity UUID together with the total count.
+
+        The links are read with their accounts in one statement, each row holds the `EntityAccounts`
+        link and its `Accounts` record.
+
+        :param entity_uuid: The UUID of the entity.
+        :type entity_uuid: UUID4
+        :param limit: The maximum number of records to retrieve.
+        :type limit: int
+        :param offset: The starting point for retrieving records.
+        :type offset: int
+        :param db: The database session.
+        :type db: AsyncSession
+        :param after: The id of the last link of the previous page, replaces offset when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
+        :return: The page of entity accounts with their accounts and the total count, None when not counted.
+        :rtype: Tuple[List[Row], Optional[int]]
+        :raises EntityAccNotExist: If no entity accounts are found.
+        """
+        statement = self._statements.get_entity_accounts_joined(
+            entity_uuid=entity_uuid, limit=limit, offset=offset, after=after
+        )
+        entity_accounts, total_count = await self._db_ops.return_page(
+            service=cnst.ENTITY_ACCOUNTS_READ_SERV,
+            statement=statement,
+            count_statement=self._statements.get_entity_accounts_joined_ct(
+                entity_uuid=entity_uuid
+            ),
+            count=count,
+            db=db,
+            rows=True,
+        )
+        record_not_exist(instance=entity_accounts, exception=EntityAccNotExist)
+        return entity_accounts, total_count
+
     async def get_account_entities_ct(
         self,
         account_uuid: UUID4,
@@ -218,6 +324,53 @@ class ReadSrvc:
             service=cnst.ENTITY_ACCOUNTS_READ_SERV, statement=statement, db=db
         )
 
+    async def get_account_entities_page(
+        self,
+        account_uuid: UUID4,
+        limit: int,
+        offset: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
+    ) -> Tuple[List[Row], Optional[int]]:
+        """
+        Retrieves a page of account entities for a given account UUID together with the total count.
+
+        The links are read with their entities in one statement, each row holds the `EntityAccounts`
+        link and the `entity_uuid`, `first_name`, `last_name` and `company_name` of its entity.
+
+        :param account_uuid: The UUID of the account.
+        :type account_uuid: UUID4
+        :param limit: The maximum number of records to retrieve.
+        :type limit: int
+        :param offset: The starting point for retrieving records.
+        :type offset: int
+        :param db: The database session.
+        :type db: AsyncSession
+        :param after: The id of the last link of the previous page, replaces offset when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
+        :return: The page of account entities with their entities and the total count, None when not counted.
+        :rtype: Tuple[List[Row], Optional[int]]
+        :raises EntityAccNotExist: If no account entities are found.
+        """
+        statement = self._statements.get_account_entities_joined(
+            account_uuid=account_uuid, limit=limit, offset=offset, after=after
+        )
+        account_entities, total_count = await self._db_ops.return_page(
+            service=cnst.ENTITY_ACCOUNTS_READ_SERV,
+            statement=statement,
+            count_statement=self._statements.get_account_entities_joined_ct(
+                account_uuid=account_uuid
+            ),
+            count=count,
+            db=db,
+            rows=True,
+        )
+        record_not_exist(instance=account_entities, exception=EntityAccNotExist)
+        return account_entities, total_count
+
 
 class CreateSrvc:
     """
@@ -1,4 +1,5 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from pydantic import UUID4
 from sqlalchemy import Select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -85,6 +86,27 @@ class ReadSrvc:
         )
         return record_not_exist(instance=individual, exception=IndividualNotExist)
 
+    async def get_individual_version(
+        self,
+        entity_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the individual, the time it was last written.
+
+        :param entity_uuid: The UUID of the entity for which the individual record is being fetched.
+        :type entity_uuid: UUID4
+        :param db: The asynchronous session for database operations.
+        :type db: AsyncSession
+
+        :returns: The version of the individual, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement: Select = self._statements.get_individual(entity_uuid=entity_uuid)
+        return await self._db_ops.return_version(
+            service=cnst.INDIVIDUALS_READ_SERV, statement=statement, db=db
+        )
+
     async def get_individuals(
         self,
         offset: int,
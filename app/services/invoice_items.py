@@ -1,10 +1,12 @@
-from typing import List
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import InvoiceItemNotExist
 from ..models.invoice_items import InvoiceItems
@@ -93,12 +95,39 @@ class ReadSrvc:
         )
         return record_not_exist(instance=invoice_item, exception=InvoiceItemNotExist)
 
+    async def get_invoice_item_version(
+        self,
+        invoice_uuid: UUID4,
+        invoice_item_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the invoice item, the time it was last written.
+
+        :param invoice_uuid: The UUID of the invoice to which the item belongs.
+        :type invoice_uuid: UUID4
+        :param invoice_item_uuid: The UUID of the invoice item being retrieved.
+        :type invoice_item_uuid: UUID4
+        :param db: The asynchronous session for database operations.
+        :type db: AsyncSession
+
+        :returns: The version of the invoice item, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_invoice_item(
+            invoice_uuid=invoice_uuid, invoice_item_uuid=invoice_item_uuid
+        )
+        return await self._db_ops.return_version(
+            service=cnst.INVOICE_ITEMS_READ_SERV, statement=statement, db=db
+        )
+
     async def get_invoices_items(
         self,
         invoice_uuid: UUID4,
         limit: int,
         offset: int,
         db: AsyncSession,
+        after: Optional[int] = None,
     ) -> List[InvoiceItemsRes]:
         """
         Retrieves a list of invoice items for a given invoice UUID with pagination.
@@ -111,18 +140,42 @@ class ReadSrvc:
         :type offset: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
 
         :returns: A list of invoice items for the given invoice, or an error if no items are found.
         :rtype: List[InvoiceItemsRes]
         """
         statement = self._statements.get_invoice_items(
-            invoice_uuid=invoice_uuid, limit=limit, offset=offset
+            invoice_uuid=invoice_uuid,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
         invoice_items: List[InvoiceItemsRes] = await self._db_ops.return_all_rows(
             cnst.INVOICE_ITEMS_READ_SERV, statement=statement, db=db
         )
         return record_not_exist(instance=invoice_items, exception=InvoiceItemNotExist)
 
+    def stream_invoice_items(
+        self, invoice_uuid: UUID4, db: AsyncSession
+    ) -> AsyncIterator[List[InvoiceItemsRes]]:
+        """
+        Streams all invoice items of a given invoice UUID in batches, for exports.
+
+        :param invoice_uuid: The UUID of the invoice whose items are exported.
+        :type invoice_uuid: UUID4
+        :param db: The asynchronous session for database operations, it must stay open until the iteration ends.
+        :type db: AsyncSession
+
+        :returns: Batches of invoice items.
+        :rtype: AsyncIterator[List[InvoiceItemsRes]]
+        """
+        statement = self._statements.export_invoice_items(invoice_uuid=invoice_uuid)
+        return self._db_ops.stream_rows(
+            service=cnst.INVOICE_ITEMS_READ_SERV, statement=statement, db=db
+        )
+
     async def get_invoices_items_ct(
         self,
         invoice_uuid: UUID4,
@@ -151,6 +204,8 @@ class ReadSrvc:
         page: int,
         limit: int,
         db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> InvoiceItemsPgRes:
         """
         Retrieves invoice items for a given invoice with pagination details, including the total count
@@ -164,20 +219,36 @@ class ReadSrvc:
         :type limit: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :returns: A paginated response with invoice items, including total count and pagination status.
         :rtype: InvoiceItemsPgRes
         """
-        total_count = await self.get_invoices_items_ct(invoice_uuid=invoice_uuid, db=db)
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_invoice_items(
+            invoice_uuid=invoice_uuid, limit=limit + 1, offset=offset, after=after
+        )
+        invoice_items, total_count = await self._db_ops.return_page(
+            service=cnst.INVOICE_ITEMS_READ_SERV,
+            statement=statement,
+            count_statement=self._statements.get_invoice_items_ct(
+                invoice_uuid=invoice_uuid
+            ),
+            count=count,
+            db=db,
         )
-        invoice_items: InvoiceItemsPgRes = await self.get_invoices_items(
-            invoice_uuid=invoice_uuid, offset=offset, limit=limit, db=db
+        record_not_exist(instance=invoice_items, exception=InvoiceItemNotExist)
+        invoice_items, has_more = pagination.split_page(
+            items=invoice_items, limit=limit
         )
         return InvoiceItemsPgRes(
-            total=total_count, items=invoice_items, has_more=has_more
+            total=total_count,
+            items=invoice_items,
+            has_more=has_more,
+            next_cursor=pagination.next_cursor(items=invoice_items, has_more=has_more),
         )
 
 
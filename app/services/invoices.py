@@ -1,9 +1,11 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from pydantic import UUID4
 from sqlalchemy import Select, and_, func, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import InvoiceExists, InvoiceNotExist
 from ..models.invoices import Invoices
@@ -17,7 +19,7 @@ from ..schemas.invoices import (
 )
 from ..statements.invoices import InvoicesStms
 from ..utilities import pagination
-from ..utilities.data import record_exists, record_not_exist
+from ..utilities.data import record_not_exist
 
 
 class ReadSrvc:
@@ -77,14 +79,33 @@ class ReadSrvc:
         :returns: The invoice record if found, or an error if the invoice does not exist.
         :rtype: InvoicesRes
         """
-        statement = self._statements.get_invoices(invoice_uuid=invoice_uuid)
+        statement = self._statements.get_invoice(invoice_uuid=invoice_uuid)
         invoice = await self._db_ops.return_one_row(
             service=cnst.INVOICES_READ_SERV, statement=statement, db=db
         )
         return record_not_exist(instance=invoice, exception=InvoiceNotExist)
 
+    async def get_invoice_version(
+        self, invoice_uuid: UUID4, db: AsyncSession
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the invoice, the time it was last written.
+
+        :param invoice_uuid: The UUID of the invoice to be fetched.
+        :type invoice_uuid: UUID4
+        :param db: The asynchronous session for database operations.
+        :type db: AsyncSession
+
+        :returns: The version of the invoice, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_invoice(invoice_uuid=invoice_uuid)
+        return await self._db_ops.return_version(
+            service=cnst.INVOICES_READ_SERV, statement=statement, db=db
+        )
+
     async def get_invoices(
-        self, limit: int, offset: int, db: AsyncSession
+        self, limit: int, offset: int, db: AsyncSession, after: Optional[int] = None
     ) -> InvoicesRes:
         """
         Retrieves a list of invoice records with pagination support.
@@ -95,11 +116,15 @@ class ReadSrvc:
         :type offset: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
 
         :returns: A list of invoices if found, or an error if no invoices exist.
         :rtype: InvoicesRes
         """
-        statement = self._statements.get_invoices(limit=limit, offset=offset)
+        statement = self._statements.get_invoices(
+            limit=limit, offset=offset, after=after
+        )
         invoices: InvoicesRes = await self._db_ops.return_all_rows(
             service=cnst.INVOICES_READ_SERV, statement=statement, db=db
         )
@@ -121,7 +146,12 @@ class ReadSrvc:
         )
 
     async def paginated_invoices(
-        self, page: int, limit: int, db: AsyncSession
+        self,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> InvoicesPgRes:
         """
         Retrieves a paginated list of invoices based on the specified page and limit.
@@ -132,23 +162,33 @@ class ReadSrvc:
         :type limit: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :returns: A paginated result containing invoices and pagination metadata.
         :rtype: InvoicesPgRes
         """
-        total_count: int = await self.get_invoices_ct(db=db)
         offset: int = pagination.page_offset(page=page, limit=limit)
-        has_more: bool = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_invoices(
+            limit=limit + 1, offset=offset, after=after
         )
-        invoices: List[InvoicesRes] = await self.get_invoices(
-            limit=limit, offset=offset, db=db
+        invoices, total_count = await self._db_ops.return_page(
+            service=cnst.INVOICES_READ_SERV,
+            statement=statement,
+            count_statement=self._statements.get_invoices_ct(),
+            count=count,
+            db=db,
         )
+        record_not_exist(instance=invoices, exception=InvoiceNotExist)
+        invoices, has_more = pagination.split_page(items=invoices, limit=limit)
         return InvoicesPgRes(
             total=total_count,
             page=page,
             limit=limit,
             has_more=has_more,
+            next_cursor=pagination.next_cursor(items=invoices, has_more=has_more),
             invoices=invoices,
         )
 
@@ -229,22 +269,18 @@ class CreateSrvc:
 
         :returns: The created invoice record if successful, or an error if the invoice creation fails.
         :rtype: InvoicesRes
+        :raises InvoiceExists: If the order already has an invoice.
         """
         invoices = self._model
-        statement = self._statements.get_invoices_by_order(
-            order_uuid=invoice_data.order_uuid
-        )
-        invoice_exists: InvoicesRes = await self._db_ops.return_one_row(
-            service=cnst.INVOICES_CREATE_SERV, statement=statement, db=db
-        )
-        record_exists(instance=invoice_exists, exception=InvoiceExists)
         invoice = await self._db_ops.add_instance(
             service=cnst.INVOICES_CREATE_SERV,
             model=invoices,
             data=invoice_data,
             db=db,
+            unique=invoices.unique_columns,
         )
-        return record_not_exist(instance=invoice, exception=InvoiceNotExist)
+        # Nothing is returned when the order already has an invoice.
+        return record_not_exist(instance=invoice, exception=InvoiceExists)
 
 
 class UpdateSrvc:
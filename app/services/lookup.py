@@ -0,0 +1,103 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..constants import constants as cnst
+from ..database.operations import Operations
+from ..exceptions import EntityNotExist, LookupKeyInvalid
+from ..schemas.lookup import EntitiesLookupRes
+from ..statements.lookup import LookupStms
+from ..utilities.data import record_not_exist
+from ..utilities.lookup import domain_key, email_key, phone_key
+
+
+class ReadSrvc:
+    """
+    Service for finding entities by an email address, a phone number or a domain.
+
+    The looked up value is normalized like the lookup key of the contacts, so the
+    entities are found with one probe of a global index.
+
+    :param statements: The statements used to look entities up.
+    :type statements: LookupStms
+    :param db_operations: The database operations object used for querying and returning data.
+    :type db_operations: Operations
+    """
+
+    def __init__(self, statements: LookupStms, db_operations: Operations) -> None:
+        """
+        Initializes the ReadSrvc class with the given database statements and operations.
+
+        :param statements: The statements used to look entities up.
+        :type statements: LookupStms
+        :param db_operations: The database operations object used for querying and returning data.
+        :type db_operations: Operations
+        """
+        self._statements: LookupStms = statements
+        self._db_ops: Operations = db_operations
+
+    @property
+    def statements(self) -> LookupStms:
+        """
+        Returns the statements object for lookups.
+
+        :return: The statements object for looking entities up.
+        :rtype: LookupStms
+        """
+        return self._statements
+
+    @property
+    def db_operations(self) -> Operations:
+        """
+        Returns the database operations object.
+
+        :return: The database operations object.
+        :rtype: Operations
+        """
+        return self._db_ops
+
+    async def lookup_entities(
+        self,
+        limit: int,
+        db: AsyncSession,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        domain: Optional[str] = None,
+    ) -> EntitiesLookupRes:
+        """
+        Retrieves the entities having a contact, exactly one of the contacts must be given.
+
+        :param limit: The maximum number of entities returned.
+        :type limit: int
+        :param db: The database session.
+        :type db: AsyncSession
+        :param email: An email address of the entities.
+        :type email: Optional[str]
+        :param phone: A phone number of the entities, in any format.
+        :type phone: Optional[str]
+        :param domain: A domain or URL of a website of the entities.
+        :type domain: Optional[str]
+        :return: The entities having the contact, oldest first.
+        :rtype: EntitiesLookupRes
+        :raises LookupKeyInvalid: If not exactly one contact is given, or it is empty once normalized.
+        :raises EntityNotExist: If no entity has the contact.
+        """
+        given = [value for value in (email, phone, domain) if value is not None]
+        if len(given) != 1:
+            raise LookupKeyInvalid
+        if email is not None:
+            key = email_key(value=email)
+            statement = self._statements.get_entities_by_email(email=key, limit=limit)
+        elif phone is not None:
+            key = phone_key(value=phone)
+            statement = self._statements.get_entities_by_phone(phone=key, limit=limit)
+        else:
+            key = domain_key(value=domain)
+            statement = self._statements.get_entities_by_domain(domain=key, limit=limit)
+        if not key:
+            raise LookupKeyInvalid
+        entities = await self._db_ops.return_all_rows_and_values(
+            service=cnst.LOOKUP_READ_SERVICE, statement=statement, db=db
+        )
+        record_not_exist(instance=entities, exception=EntityNotExist)
+        return EntitiesLookupRes(limit=limit, data=entities)
@@ -1,4 +1,5 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -88,6 +89,27 @@ class ReadSrvc:
             instance=non_individual, exception=NonIndividualNotExist
         )
 
+    async def get_non_individual_version(
+        self,
+        entity_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the non-individual, the time it was last written.
+
+        :param entity_uuid: The UUID of the non-individual entity to retrieve.
+        :type entity_uuid: UUID4
+        :param db: The asynchronous session for database operations.
+        :type db: AsyncSession
+
+        :returns: The version of the non-individual, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_non_individual(entity_uuid=entity_uuid)
+        return await self._db_ops.return_version(
+            service=cnst.NON_INDIVIDUALS_READ_SERV, statement=statement, db=db
+        )
+
     async def get_non_individuals(
         self, offset: int, limit: int, db: AsyncSession
     ) -> List[NonIndividualsRes]:
@@ -1,8 +1,10 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import NumberExists, NumbersNotExist
 from ..models.numbers import Numbers
@@ -16,7 +18,7 @@ from ..schemas.numbers import (
 )
 from ..statements.numbers import NumbersStms
 from ..utilities import pagination
-from ..utilities.data import record_exists, record_not_exist
+from ..utilities.data import record_not_exist
 
 
 class ReadSrvc:
@@ -92,12 +94,40 @@ class ReadSrvc:
         )
         return record_not_exist(instance=number, exception=NumbersNotExist)
 
+    async def get_number_version(
+        self,
+        entity_uuid: UUID4,
+        number_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the number, the time it was last written.
+
+        :param entity_uuid: The UUID of the entity to which the number belongs.
+        :type entity_uuid: UUID4
+        :param number_uuid: The UUID of the number to be retrieved.
+        :type number_uuid: UUID4
+        :param db: The asynchronous session for database operations.
+        :type db: AsyncSession
+
+        :returns: The version of the number, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_number(
+            entity_uuid=entity_uuid,
+            number_uuid=number_uuid,
+        )
+        return await self._db_ops.return_version(
+            service=cnst.NUMBERS_READ_SERVICE, statement=statement, db=db
+        )
+
     async def get_numbers(
         self,
         entity_uuid: UUID4,
         limit: int,
         offset: int,
         db: AsyncSession,
+        after: Optional[int] = None,
     ) -> List[NumbersRes]:
         """
         Retrieves a list of numbers associated with a specific entity.
@@ -110,12 +140,17 @@ class ReadSrvc:
         :type offset: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
 
         :returns: A list of numbers associated with the given entity.
         :rtype: List[NumbersRes]
         """
         statement = self._statements.get_number_by_entity(
-            entity_uuid=entity_uuid, limit=limit, offset=offset
+            entity_uuid=entity_uuid,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
         numbers: List[NumbersRes] = await self._db_ops.return_all_rows(
             service=cnst.NUMBERS_READ_SERVICE, statement=statement, db=db
@@ -144,7 +179,13 @@ class ReadSrvc:
         )
 
     async def paginated_numbers(
-        self, entity_uuid: UUID4, page: int, limit: int, db: AsyncSession
+        self,
+        entity_uuid: UUID4,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> NumbersPgRes:
         """
         Retrieves paginated numbers for a specific entity.
@@ -160,23 +201,35 @@ class ReadSrvc:
         :type limit: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :returns: A paginated result containing numbers, total count, and pagination information.
         :rtype: NumbersPgRes
         """
-        total_count = await self.get_numbers_ct(entity_uuid=entity_uuid, db=db)
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_number_by_entity(
+            entity_uuid=entity_uuid, limit=limit + 1, offset=offset, after=after
         )
-        numbers = await self.get_numbers(
-            entity_uuid=entity_uuid, offset=offset, limit=limit, db=db
+        numbers, total_count = await self._db_ops.return_page(
+            service=cnst.NUMBERS_READ_SERVICE,
+            statement=statement,
+            count_statement=self._statements.get_number_by_entity_ct(
+                entity_uuid=entity_uuid
+            ),
+            count=count,
+            db=db,
         )
+        record_not_exist(instance=numbers, exception=NumbersNotExist)
+        numbers, has_more = pagination.split_page(items=numbers, limit=limit)
         return NumbersPgRes(
             total=total_count,
             page=page,
             limit=limit,
             has_more=has_more,
+            next_cursor=pagination.next_cursor(items=numbers, has_more=has_more),
             numbers=numbers,
         )
 
@@ -267,28 +320,17 @@ class CreateSrvc:
         :returns: The created number data if the operation is successful.
         :rtype: NumbersRes
         :raises NumberExists: If the number already exists in the database.
-        :raises NumbersNotExist: If the number could not be created.
         """
         numbers = self._model
-        statement = self._statements.get_number_by_number(
-            entity_uuid=entity_uuid,
-            country_code=number_data.country_code,
-            area_code=number_data.area_code,
-            line_number=number_data.line_number,
-            ext=number_data.extension,
-        )
-        number_exists: NumbersRes = await self._db_ops.return_one_row(
-            service=cnst.NUMBERS_CREATE_SERVICE, statement=statement, db=db
-        )
-        record_exists(instance=number_exists, exception=NumberExists)
-
         number: NumbersRes = await self._db_ops.add_instance(
             service=cnst.NUMBERS_CREATE_SERVICE,
             model=numbers,
             data=number_data,
             db=db,
+            unique=numbers.unique_columns,
         )
-        return record_not_exist(instance=number, exception=NumbersNotExist)
+        # Nothing is returned when the entity already has the number.
+        return record_not_exist(instance=number, exception=NumberExists)
 
 
 class UpdateSrvc:
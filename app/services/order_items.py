@@ -1,9 +1,11 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import OrderItemNotExist
 from ..models.order_items import OrderItems
@@ -93,12 +95,39 @@ class ReadSrvc:
         )
         return record_not_exist(instance=order_item, exception=OrderItemNotExist)
 
+    async def get_order_item_version(
+        self,
+        order_uuid: UUID4,
+        order_item_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the order item, the time it was last written.
+
+        :param order_uuid: The UUID of the order that contains the order item.
+        :type order_uuid: UUID4
+        :param order_item_uuid: The UUID of the order item to be fetched.
+        :type order_item_uuid: UUID4
+        :param db: The asynchronous session for database operations.
+        :type db: AsyncSession
+
+        :returns: The version of the order item, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_order_item(
+            order_uuid=order_uuid, order_item_uuid=order_item_uuid
+        )
+        return await self._db_ops.return_version(
+            service=cnst.ORDERS_ITEMS_READ_SERVICE, statement=statement, db=db
+        )
+
     async def get_order_items(
         self,
         order_uuid: UUID4,
         limit: int,
         offset: int,
         db: AsyncSession,
+        after: Optional[int] = None,
     ) -> List[OrderItemsRes]:
         """
         Retrieves a list of order items for a specific order, with pagination support.
@@ -111,13 +140,18 @@ class ReadSrvc:
         :type offset: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
 
         :returns: A list of order item data.
         :rtype: List[OrderItemsRes]
         :raises OrderItemNotExist: If no order items are found.
         """
         statement = self._statements.get_order_items(
-            order_uuid=order_uuid, limit=limit, offset=offset
+            order_uuid=order_uuid,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
         order_items: List[OrderItemsRes] = await self._db_ops.return_all_rows(
             service=cnst.ORDERS_ITEMS_READ_SERVICE, statement=statement, db=db
@@ -146,7 +180,13 @@ class ReadSrvc:
         )
 
     async def paginated_order_items(
-        self, order_uuid: UUID4, page: int, limit: int, db: AsyncSession
+        self,
+        order_uuid: UUID4,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> OrderItemsPgRes:
         """
         Retrieves order items for a specific order in a paginated format.
@@ -162,23 +202,33 @@ class ReadSrvc:
         :type limit: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :returns: A paginated response containing the order items, total count, and page information.
         :rtype: OrderItemsPgRes
         """
-        total_count = await self.get_order_items_ct(order_uuid=order_uuid, db=db)
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_order_items(
+            order_uuid=order_uuid, limit=limit + 1, offset=offset, after=after
         )
-        order_items = await self.get_order_items(
-            order_uuid=order_uuid, offset=offset, limit=limit, db=db
+        order_items, total_count = await self._db_ops.return_page(
+            service=cnst.ORDERS_ITEMS_READ_SERVICE,
+            statement=statement,
+            count_statement=self._statements.get_order_item_ct(order_uuid=order_uuid),
+            count=count,
+            db=db,
         )
+        record_not_exist(instance=order_items, exception=OrderItemNotExist)
+        order_items, has_more = pagination.split_page(items=order_items, limit=limit)
         return OrderItemsPgRes(
             total=total_count,
             page=page,
             limit=limit,
             has_more=has_more,
+            next_cursor=pagination.next_cursor(items=order_items, has_more=has_more),
             order_items=order_items,
         )
 
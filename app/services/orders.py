@@ -1,9 +1,11 @@
-from typing import List
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import OrderNotExist
 from ..models.orders import Orders
@@ -84,8 +86,27 @@ class ReadSrvc:
         )
         return record_not_exist(instance=order, exception=OrderNotExist)
 
+    async def get_order_version(
+        self, order_uuid: UUID4, db: AsyncSession
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the order, the time it was last written.
+
+        :param order_uuid: The UUID of the order to retrieve.
+        :type order_uuid: UUID4
+        :param db: The asynchronous session for database operations.
+        :type db: AsyncSession
+
+        :returns: The version of the order, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_order(order_uuid=order_uuid)
+        return await self._db_ops.return_version(
+            service=cnst.ORDERS_READ_SERVICE, statement=statement, db=db
+        )
+
     async def get_orders(
-        self, limt: int, offset: int, db: AsyncSession
+        self, limt: int, offset: int, db: AsyncSession, after: Optional[int] = None
     ) -> List[OrdersRes]:
         """
         Retrieves a list of orders based on the provided limit and offset.
@@ -96,17 +117,34 @@ class ReadSrvc:
         :type offset: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
 
         :returns: A list of orders matching the provided criteria.
         :rtype: List[OrdersRes]
         :raises OrderNotExist: If no orders are found.
         """
-        statement = self._statements.get_orders(limit=limt, offset=offset)
+        statement = self._statements.get_orders(limit=limt, offset=offset, after=after)
         orders: List[OrdersRes] = await self._db_ops.return_all_rows(
             service=cnst.ORDERS_READ_SERVICE, statement=statement, db=db
         )
         return record_not_exist(instance=orders, exception=OrderNotExist)
 
+    def stream_orders(self, db: AsyncSession) -> AsyncIterator[List[OrdersRes]]:
+        """
+        Streams all orders in batches, for exports.
+
+        :param db: The asynchronous session for database operations, it must stay open until the iteration ends.
+        :type db: AsyncSession
+
+        :returns: Batches of orders.
+        :rtype: AsyncIterator[List[OrdersRes]]
+        """
+        statement = self._statements.export_orders()
+        return self._db_ops.stream_rows(
+            service=cnst.ORDERS_READ_SERVICE, statement=statement, db=db
+        )
+
     async def get_orders_ct(self, db: AsyncSession) -> int:
         """
         Retrieves the total count of orders.
@@ -123,7 +161,12 @@ class ReadSrvc:
         )
 
     async def paginated_orders(
-        self, page: int, limit: int, db: AsyncSession
+        self,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> OrdersPgRes:
         """
         Retrieves orders in a paginated format, including total count and information
@@ -135,18 +178,34 @@ class ReadSrvc:
         :type limit: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :returns: A paginated response containing the orders.
         :rtype: OrdersPgRes
         """
-        total_count = await self.get_orders_ct(db=db)
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_orders(
+            limit=limit + 1, offset=offset, after=after
+        )
+        orders, total_count = await self._db_ops.return_page(
+            service=cnst.ORDERS_READ_SERVICE,
+            statement=statement,
+            count_statement=self._statements.get_orders_ct(),
+            count=count,
+            db=db,
         )
-        orders = await self.get_orders(offset=offset, limt=limit, db=db)
+        record_not_exist(instance=orders, exception=OrderNotExist)
+        orders, has_more = pagination.split_page(items=orders, limit=limit)
         return OrdersPgRes(
-            total=total_count, page=page, limit=limit, has_more=has_more, orders=orders
+            total=total_count,
+            page=page,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=pagination.next_cursor(items=orders, has_more=has_more),
+            orders=orders,
         )
 
 
@@ -0,0 +1,193 @@
+from typing import Any, Dict, List
+
+from pydantic import UUID4
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..constants import constants as cnst
+from ..database.operations import Operations
+from ..exceptions import AccsNotExist, EntityNotExist
+from ..schemas.overviews import AccountOverviewRes, EntityOverviewRes
+from ..statements.overviews import OverviewsStms
+from ..utilities.data import record_not_exist
+
+
+def _section(data: List[Dict[str, Any]], total: int, limit: int) -> Dict[str, Any]:
+    return {
+        "total": total,
+        "limit": limit,
+        "has_more": total > len(data),
+        "data": data,
+    }
+
+
+class ReadSrvc:
+    """
+    Service for reading records together with their related records.
+
+    An overview is read in one statement, each section limited to its own number of records.
+
+    :param statements: The statements used to query overviews.
+    :type statements: OverviewsStms
+    :param db_operations: The database operations object used for querying and returning data.
+    :type db_operations: Operations
+    """
+
+    def __init__(self, statements: OverviewsStms, db_operations: Operations) -> None:
+        """
+        Initializes the ReadSrvc class with the given database statements and operations.
+
+        :param statements: The statements used to query overviews.
+        :type statements: OverviewsStms
+        :param db_operations: The database operations object used for querying and returning data.
+        :type db_operations: Operations
+        """
+        self._statements: OverviewsStms = statements
+        self._db_ops: Operations = db_operations
+
+    @property
+    def statements(self) -> OverviewsStms:
+        """
+        Returns the statements object for overview queries.
+
+        :return: The statements object for querying overviews.
+        :rtype: OverviewsStms
+        """
+        return self._statements
+
+    @property
+    def db_operations(self) -> Operations:
+        """
+        Returns the database operations object.
+
+        :return: The database operations object.
+        :rtype: Operations
+        """
+        return self._db_ops
+
+    async def get_account_overview(
+        self,
+        account_uuid: UUID4,
+        entities_limit: int,
+        addresses_limit: int,
+        contracts_limit: int,
+        lists_limit: int,
+        products_limit: int,
+        db: AsyncSession,
+    ) -> AccountOverviewRes:
+        """
+        Retrieves an account with its entities, addresses, contracts, product lists and products.
+
+        :param account_uuid: The UUID of the account.
+        :type account_uuid: UUID4
+        :param entities_limit: The maximum number of entities returned.
+        :type entities_limit: int
+        :param addresses_limit: The maximum number of addresses returned.
+        :type addresses_limit: int
+        :param contracts_limit: The maximum number of contracts returned.
+        :type contracts_limit: int
+        :param lists_limit: The maximum number of product lists returned.
+        :type lists_limit: int
+        :param products_limit: The maximum number of products returned.
+        :type products_limit: int
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The account overview.
+        :rtype: AccountOverviewRes
+        :raises AccsNotExist: If the account does not exist.
+        """
+        statement = self._statements.get_account_overview(
+            account_uuid=account_uuid,
+            entities_limit=entities_limit,
+            addresses_limit=addresses_limit,
+            contracts_limit=contracts_limit,
+            lists_limit=lists_limit,
+            products_limit=products_limit,
+        )
+        rows = await self._db_ops.return_all_rows_and_values(
+            service=cnst.OVERVIEWS_READ_SERVICE, statement=statement, db=db
+        )
+        row = record_not_exist(
+            instance=rows[0] if rows else None, exception=AccsNotExist
+        )
+        return AccountOverviewRes(
+            account=row.Accounts,
+            entities=_section(
+                data=row.entities, total=row.entities_total, limit=entities_limit
+            ),
+            addresses=_section(
+                data=row.addresses, total=row.addresses_total, limit=addresses_limit
+            ),
+            contracts=_section(
+                data=row.contracts, total=row.contracts_total, limit=contracts_limit
+            ),
+            lists=_section(data=row.lists, total=row.lists_total, limit=lists_limit),
+            products=_section(
+                data=row.products, total=row.products_total, limit=products_limit
+            ),
+        )
+
+    async def get_entity_overview(
+        self,
+        entity_uuid: UUID4,
+        emails_limit: int,
+        numbers_limit: int,
+        websites_limit: int,
+        addresses_limit: int,
+        accounts_limit: int,
+        db: AsyncSession,
+    ) -> EntityOverviewRes:
+        """
+        Retrieves an entity with its individual or non-individual, emails, numbers, websites, addresses and account links.
+
+        :param entity_uuid: The UUID of the entity.
+        :type entity_uuid: UUID4
+        :param emails_limit: The maximum number of emails returned.
+        :type emails_limit: int
+        :param numbers_limit: The maximum number of numbers returned.
+        :type numbers_limit: int
+        :param websites_limit: The maximum number of websites returned.
+        :type websites_limit: int
+        :param addresses_limit: The maximum number of addresses returned.
+        :type addresses_limit: int
+        :param accounts_limit: The maximum number of account links returned.
+        :type accounts_limit: int
+        :param db: The database session.
+        :type db: AsyncSession
+        :return: The entity overview.
+        :rtype: EntityOverviewRes
+        :raises EntityNotExist: If the entity does not exist.
+        """
+        statement = self._statements.get_entity_overview(
+            entity_uuid=entity_uuid,
+            emails_limit=emails_limit,
+            numbers_limit=numbers_limit,
+            websites_limit=websites_limit,
+            addresses_limit=addresses_limit,
+            accounts_limit=accounts_limit,
+        )
+        rows = await self._db_ops.return_all_rows_and_values(
+            service=cnst.OVERVIEWS_READ_SERVICE, statement=statement, db=db
+        )
+        row = record_not_exist(
+            instance=rows[0] if rows else None, exception=EntityNotExist
+        )
+        return EntityOverviewRes(
+            entity=row.Entities,
+            individual=row.Individuals,
+            non_individual=row.NonIndividuals,
+            emails=_section(
+                data=row.emails, total=row.emails_total, limit=emails_limit
+            ),
+            numbers=_section(
+                data=row.numbers, total=row.numbers_total, limit=numbers_limit
+            ),
+            websites=_section(
+                data=row.websites, total=row.websites_total, limit=websites_limit
+            ),
+            addresses=_section(
+                data=row.addresses, total=row.addresses_total, limit=addresses_limit
+            ),
+            accounts=_section(
+                data=row.accounts, total=row.accounts_total, limit=accounts_limit
+            ),
+        )
@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import UUID4
 from sqlalchemy import Select, Update, and_, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import BulkInsertMode, CountStrategy
 from ..database.operations import Operations
 from ..exceptions import ProductListItemExists, ProductListItemNotExist
 from ..models import ProductListItems
@@ -18,6 +19,7 @@ from ..schemas.product_list_items import (
 )
 from ..statements.product_list_items import ProductListItemsStms
 from ..utilities import pagination
+from ..utilities.catalog import bump_catalog_version
 from ..utilities.data import record_not_exist, record_exists
 
 
@@ -105,6 +107,7 @@ class ReadSrvc:
         limit: int,
         offset: int,
         db: AsyncSession,
+        after: Optional[int] = None,
     ) -> List[ProductListItemsRes]:
         """
         Fetches a list of product list items with pagination support.
@@ -117,13 +120,18 @@ class ReadSrvc:
         :type offset: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
 
         :returns: A list of product list items.
         :rtype: List[ProductListItemsRes]
         :raises ProductListItemNotExist: If no product list items exist.
         """
         statement = self._statements.get_product_list_items(
-            product_list_uuid=product_list_uuid, limit=limit, offset=offset
+            product_list_uuid=product_list_uuid,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
         product_list_items: List[ProductListItemsRes] = (
             await self._db_ops.return_all_rows(
@@ -158,7 +166,13 @@ class ReadSrvc:
         )
 
     async def paginated_product_list_items(
-        self, product_list_uuid: UUID4, page: int, limit: int, db: AsyncSession
+        self,
+        product_list_uuid: UUID4,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> ProductListItemsPgRes:
         """
         Fetches paginated product list items, including metadata such as total count and whether
@@ -172,19 +186,33 @@ class ReadSrvc:
         :type limit: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :returns: A paginated response containing the total count, page number, and product list items.
         :rtype: ProductListItemsPgRes
         """
-        total_count = await self.get_product_list_items_ct(
-            product_list_uuid=product_list_uuid, db=db
-        )
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_product_list_items(
+            product_list_uuid=product_list_uuid,
+            limit=limit + 1,
+            offset=offset,
+            after=after,
         )
-        product_list_items = await self.get_product_list_items(
-            product_list_uuid=product_list_uuid, offset=offset, limit=limit, db=db
+        product_list_items, total_count = await self._db_ops.return_page(
+            service=cnst.PRODUCT_LIST_ITEMS_READ_SERV,
+            statement=statement,
+            count_statement=self._statements.get_product_list_items_ct(
+                product_list_uuid=product_list_uuid
+            ),
+            count=count,
+            db=db,
+        )
+        record_not_exist(instance=product_list_items, exception=ProductListItemNotExist)
+        product_list_items, has_more = pagination.split_page(
+            items=product_list_items, limit=limit
         )
 
         return ProductListItemsPgRes(
@@ -192,6 +220,9 @@ class ReadSrvc:
             page=page,
             limit=limit,
             has_more=has_more,
+            next_cursor=pagination.next_cursor(
+                items=product_list_items, has_more=has_more
+            ),
             product_list_items=product_list_items,
         )
 
@@ -266,6 +297,7 @@ class CreateSrvc:
         product_list_uuid: UUID4,
         product_list_item_data: List[ProductListItemsInternalCreate],
         db: AsyncSession,
+        mode: BulkInsertMode = BulkInsertMode.ORM,
     ) -> List[ProductListItemsRes]:
         """
         Creates multiple product list items in a specified product list.
@@ -276,48 +308,110 @@ class CreateSrvc:
         :type product_list_item_data: List[ProductListItemsInternalCreate]
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param mode: How the product list items are inserted, see `Operations.add_instances`.
+        :type mode: BulkInsertMode
 
         :returns: A list of created product list items.
         :rtype: List[ProductListItemsRes]
-        :raises ProductListItemExists: If the product list item already exists in the product list.
+        :raises ProductListItemExists: If a product is already in the product list, or repeated.
         :raises ProductListItemNotExist: If the product list items do not exist after creation.
         """
         product_list_items = self._model
 
-        # Prepare the data for checking if items already exist
-        list_data = [*product_list_item_data]
-        product_uuid_list = [dict.product_uuid for dict in list_data]
-
-        # Check if the product list item already exists
-        statement = self._statements.get_product_list_items(
-            product_list_uuid=product_list_uuid,
-            product_uuid_list=product_uuid_list,
-        )
-        product_list_item_exists: ProductListItemsRes = (
-            await self._db_ops.return_one_row(
-                service=cnst.PRODUCT_LIST_ITEMS_CREATE_SERV,
-                statement=statement,
-                db=db,
+        if mode == BulkInsertMode.COPY:
+            # COPY cannot skip conflicting rows, refuse repeated products and check if the
+            # product list items already exist
+            product_uuids = {item.product_uuid for item in product_list_item_data}
+            if len(product_uuids) < len(product_list_item_data):
+                raise ProductListItemExists()
+            statement = self._statements.get_product_list_items_by_uuids(
+                product_list_uuid=product_list_uuid,
+                product_uuid_list=[
+                    item.product_uuid for item in product_list_item_data
+                ],
             )
-        )
-        record_exists(
-            instance=product_list_item_exists, exception=ProductListItemExists
-        )
-
-        # Add the new product list items to the database
-        product_list_items: List[ProductListItemsRes] = (
-            await self._db_ops.add_instances(
-                service=cnst.PRODUCT_LIST_ITEMS_CREATE_SERV,
-                model=product_list_items,
-                data=product_list_item_data,
-                db=db,
+            product_list_item_exists: ProductListItemsRes = (
+                await self._db_ops.return_one_row(
+                    service=cnst.PRODUCT_LIST_ITEMS_CREATE_SERV,
+                    statement=statement,
+                    db=db,
+                )
+            )
+            record_exists(
+                instance=product_list_item_exists, exception=ProductListItemExists
             )
+
+        # Add the new product list items to the database, skipping existing products
+        created: List[ProductListItemsRes] = await self._db_ops.add_instances(
+            service=cnst.PRODUCT_LIST_ITEMS_CREATE_SERV,
+            model=product_list_items,
+            data=product_list_item_data,
+            db=db,
+            mode=mode,
+            unique=product_list_items.unique_columns,
         )
+        bump_catalog_version(db=db)
+
+        # A skipped item means its product is already in the product list, or repeated
+        if len(created) < len(product_list_item_data):
+            raise ProductListItemExists()
 
         # Ensure that records exist after the creation attempt
-        return record_not_exist(
-            instance=product_list_items, exception=ProductListItemNotExist
+        return record_not_exist(instance=created, exception=ProductListItemNotExist)
+
+    async def import_product_list_items(
+        self,
+        product_list_uuid: UUID4,
+        product_list_item_data: List[ProductListItemsInternalCreate],
+        db: AsyncSession,
+        mode: BulkInsertMode = BulkInsertMode.RETURNING,
+    ) -> List[int]:
+        """
+        Creates a batch of product list items with a bulk insert, skipping existing products.
+
+        An item is skipped when its product is already in the product list, or when it
+        appears earlier in the batch.
+
+        :param product_list_uuid: The UUID of the product list to add items to.
+        :type product_list_uuid: UUID4
+        :param product_list_item_data: The data for the product list items to create.
+        :type product_list_item_data: List[ProductListItemsInternalCreate]
+        :param db: The asynchronous session for database operations.
+        :type db: AsyncSession
+        :param mode: How the product list items are inserted, see `Operations.add_instances`.
+        :type mode: BulkInsertMode
+
+        :returns: The positions in the batch of the skipped product list items.
+        :rtype: List[int]
+        """
+        statement = self._statements.get_product_list_items_by_uuids(
+            product_list_uuid=product_list_uuid,
+            product_uuid_list=list(
+                {item.product_uuid for item in product_list_item_data}
+            ),
+        )
+        existing_items: List[ProductListItemsRes] = await self._db_ops.return_all_rows(
+            service=cnst.PRODUCT_LIST_ITEMS_CREATE_SERV, statement=statement, db=db
+        )
+        existing_products = {item.product_uuid for item in existing_items}
+
+        skipped, product_list_items = [], []
+        for position, item in enumerate(product_list_item_data):
+            if item.product_uuid in existing_products:
+                skipped.append(position)
+                continue
+            existing_products.add(item.product_uuid)
+            product_list_items.append(item)
+
+        await self._db_ops.add_instances(
+            service=cnst.PRODUCT_LIST_ITEMS_CREATE_SERV,
+            model=self._model,
+            data=product_list_items,
+            db=db,
+            mode=mode,
         )
+        bump_catalog_version(db=db)
+        return skipped
 
 
 class UpdateSrvc:
@@ -400,6 +494,7 @@ class UpdateSrvc:
         product_list_item: ProductListItemsRes = await self._db_ops.return_one_row(
             service=cnst.PRODUCT_LIST_ITEMS_UPDATE_SERV, statement=statement, db=db
         )
+        bump_catalog_version(db=db)
 
         # Ensure that the product list item exists after the update
         return record_not_exist(
@@ -487,6 +582,7 @@ class DelSrvc:
         product_list_item: ProductListItemsDelRes = await self._db_ops.return_one_row(
             service=cnst.PRODUCT_LIST_ITEMS_UPDATE_SERV, statement=statement, db=db
         )
+        bump_catalog_version(db=db)
 
         # Ensure that the product list item exists after the soft delete
         return record_not_exist(
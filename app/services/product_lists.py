@@ -1,9 +1,10 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import ProductListExists, ProductListNotExist
 from ..models.product_lists import ProductLists
@@ -17,6 +18,7 @@ from ..schemas.product_lists import (
 )
 from ..statements.product_lists import ProductListsStms
 from ..utilities import pagination
+from ..utilities.catalog import bump_catalog_version
 from ..utilities.data import record_exists, record_not_exist
 
 
@@ -111,7 +113,7 @@ class ReadSrvc:
         return record_not_exist(instance=product_lists, exception=ProductListNotExist)
 
     async def get_product_lists(
-        self, limit: int, offset: int, db: AsyncSession
+        self, limit: int, offset: int, db: AsyncSession, after: Optional[int] = None
     ) -> List[ProductListsRes]:
         """
         Retrieves product lists with pagination using a limit and offset.
@@ -122,12 +124,16 @@ class ReadSrvc:
         :type offset: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
 
         :returns: A list of product lists based on the provided pagination parameters.
         :rtype: List[ProductListsRes]
         :raises ProductListNotExist: If no product lists are found.
         """
-        statement = self._statements.get_product_lists(limit=limit, offset=offset)
+        statement = self._statements.get_product_lists(
+            limit=limit, offset=offset, after=after
+        )
         product_lists = await self._db_ops.return_all_rows(
             service=cnst.PRODUCT_LISTS_READ_SERV, statement=statement, db=db
         )
@@ -152,7 +158,12 @@ class ReadSrvc:
         return record_not_exist(instance=product_lists, exception=ProductListNotExist)
 
     async def paginated_product_lists(
-        self, page: int, limit: int, db: AsyncSession
+        self,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> ProductListsPgRes:
         """
         Retrieves paginated product lists along with metadata like total count and whether there are more items.
@@ -163,21 +174,35 @@ class ReadSrvc:
         :type limit: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :returns: A paginated response containing the product lists and metadata.
         :rtype: ProductListsPgRes
         """
-        total_count = await self.get_product_lists_ct(db=db)
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_product_lists(
+            limit=limit + 1, offset=offset, after=after
+        )
+        product_lists, total_count = await self._db_ops.return_page(
+            service=cnst.PRODUCT_LISTS_READ_SERV,
+            statement=statement,
+            count_statement=self._statements.get_product_lists_count(),
+            count=count,
+            db=db,
+        )
+        record_not_exist(instance=product_lists, exception=ProductListNotExist)
+        product_lists, has_more = pagination.split_page(
+            items=product_lists, limit=limit
         )
-        product_lists = await self.get_product_lists(offset=offset, limit=limit, db=db)
         return ProductListsPgRes(
             total=total_count,
             page=page,
             limit=limit,
             has_more=has_more,
+            next_cursor=pagination.next_cursor(items=product_lists, has_more=has_more),
             product_lists=product_lists,
         )
 
@@ -287,6 +312,7 @@ class CreateSrvc:
             data=product_list_data,
             db=db,
         )
+        bump_catalog_version(db=db)
         return record_not_exist(instance=product_list, exception=ProductListNotExist)
 
 
@@ -368,6 +394,7 @@ class UpdateSrvc:
         product_list: ProductListsRes = await self._db_ops.return_one_row(
             service=cnst.PRODUCT_LISTS_UPDATE_SERV, statement=statement, db=db
         )
+        bump_catalog_version(db=db)
 
         # Return the updated product list, raising an exception if it doesn't exist
         return record_not_exist(instance=product_list, exception=ProductListNotExist)
@@ -451,6 +478,7 @@ class DelSrvc:
         product_list: ProductListsDelRes = await self._db_ops.return_one_row(
             service=cnst.PRODUCT_LISTS_DEL_SERV, statement=statement, db=db
         )
+        bump_catalog_version(db=db)
 
         # Return the updated product list, raising an exception if it doesn't exist
         return record_not_exist(instance=product_list, exception=ProductListNotExist)
@@ -5,6 +5,7 @@ from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import BulkInsertMode, CountStrategy
 from ..database.operations import Operations
 from ..exceptions import ProductsExists, ProductsNotExist
 from ..models.products import Products
@@ -18,6 +19,7 @@ from ..schemas.products import (
 )
 from ..statements.products import ProductsStms
 from ..utilities import pagination
+from ..utilities.catalog import bump_catalog_version
 from ..utilities.data import record_not_exist, record_exists
 
 
@@ -87,7 +89,9 @@ class ReadSrvc:
         )
         return record_not_exist(instance=product, exception=ProductsNotExist)
 
-    async def get_products(self, limit: int, offset: int, db: AsyncSession):
+    async def get_products(
+        self, limit: int, offset: int, db: AsyncSession, after: Optional[int] = None
+    ):
         """
         Retrieves a list of products with pagination (limit and offset).
 
@@ -99,12 +103,16 @@ class ReadSrvc:
         :type offset: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
 
         :returns: A list of retrieved products.
         :rtype: List[ProductsRes]
         :raises ProductsNotExist: If no products are found.
         """
-        statement = self._statements.get_products(limit=limit, offset=offset)
+        statement = self._statements.get_products(
+            limit=limit, offset=offset, after=after
+        )
         products = await self._db_ops.return_all_rows(
             service=cnst.PRODUCTS_READ_SERV, statement=statement, db=db
         )
@@ -149,7 +157,12 @@ class ReadSrvc:
         )
 
     async def paginated_products(
-        self, page: int, limit: int, db: AsyncSession
+        self,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> ProductsPgRes:
         """
         Retrieves a paginated list of products along with the total count and pagination status.
@@ -160,21 +173,33 @@ class ReadSrvc:
         :type limit: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :returns: A paginated response containing total count, current page, and product list.
         :rtype: ProductsPgRes
         """
-        total_count = await self.get_products_ct(db=db)
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_products(
+            limit=limit + 1, offset=offset, after=after
         )
-        products = await self.get_products(limit=limit, offset=offset, db=db)
+        products, total_count = await self._db_ops.return_page(
+            service=cnst.PRODUCTS_READ_SERV,
+            statement=statement,
+            count_statement=self._statements.get_product_count(),
+            count=count,
+            db=db,
+        )
+        record_not_exist(instance=products, exception=ProductsNotExist)
+        products, has_more = pagination.split_page(items=products, limit=limit)
         return ProductsPgRes(
             total=total_count,
             page=page,
             limit=limit,
             has_more=has_more,
+            next_cursor=pagination.next_cursor(items=products, has_more=has_more),
             products=products,
         )
 
@@ -290,6 +315,7 @@ class CreateSrvc:
                 data=product_data,
                 db=db,
             )
+            bump_catalog_version(db=db)
             return product
 
         # If transaction_type is False, create the product directly
@@ -299,8 +325,58 @@ class CreateSrvc:
             data=product_data,
             db=db,
         )
+        bump_catalog_version(db=db)
         return record_not_exist(instance=product, exception=ProductsNotExist)
 
+    async def import_products(
+        self,
+        product_data: List[ProductsInternalCreate],
+        db: AsyncSession,
+        mode: BulkInsertMode = BulkInsertMode.RETURNING,
+    ) -> List[int]:
+        """
+        Creates a batch of products with a bulk insert, skipping existing names.
+
+        A product is skipped when a product with the same name exists, or when its name
+        appears earlier in the batch.
+
+        :param product_data: The data used to create the new products.
+        :type product_data: List[ProductsInternalCreate]
+        :param db: The asynchronous session for database operations.
+        :type db: AsyncSession
+        :param mode: How the products are inserted, see `Operations.add_instances`.
+        :type mode: BulkInsertMode
+
+        :returns: The positions in the batch of the skipped products.
+        :rtype: List[int]
+        """
+        statement = self._statements.get_products_by_names(
+            product_names=list({product.name for product in product_data})
+        )
+        existing_names = set(
+            await self._db_ops.return_all_rows(
+                service=cnst.PRODUCTS_CREATE_SERV, statement=statement, db=db
+            )
+        )
+
+        skipped, products = [], []
+        for position, product in enumerate(product_data):
+            if product.name in existing_names:
+                skipped.append(position)
+                continue
+            existing_names.add(product.name)
+            products.append(product)
+
+        await self._db_ops.add_instances(
+            service=cnst.PRODUCTS_CREATE_SERV,
+            model=self._model,
+            data=products,
+            db=db,
+            mode=mode,
+        )
+        bump_catalog_version(db=db)
+        return skipped
+
 
 class UpdateSrvc:
     """
@@ -376,6 +452,7 @@ class UpdateSrvc:
         product: ProductsRes = await self._db_ops.return_one_row(
             service=cnst.PRODUCTS_UPDATE_SERV, statement=statement, db=db
         )
+        bump_catalog_version(db=db)
         return record_not_exist(instance=product, exception=ProductsNotExist)
 
 
@@ -453,4 +530,5 @@ class DelSrvc:
         product: ProductsDelRes = await self._db_ops.return_one_row(
             service=cnst.PRODUCTS_DEL_SERV, statement=statement, db=db
         )
+        bump_catalog_version(db=db)
         return record_not_exist(instance=product, exception=ProductsNotExist)
@@ -0,0 +1,135 @@
+from typing import Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..constants import constants as cnst
+from ..database.operations import Operations
+from ..exceptions import EntityNotExist, ProductsNotExist
+from ..schemas.search import EntitiesSearchPgRes, ProductsSearchPgRes
+from ..statements.search import SearchStms
+from ..utilities import pagination
+from ..utilities.data import record_not_exist
+
+
+class ReadSrvc:
+    """
+    Service for searching records by partial text.
+
+    Results are ranked by similarity with the query and paged with a cursor, the number of
+    matches is not counted.
+
+    :param statements: The statements used to search records.
+    :type statements: SearchStms
+    :param db_operations: The database operations object used for querying and returning data.
+    :type db_operations: Operations
+    """
+
+    def __init__(self, statements: SearchStms, db_operations: Operations) -> None:
+        """
+        Initializes the ReadSrvc class with the given database statements and operations.
+
+        :param statements: The statements used to search records.
+        :type statements: SearchStms
+        :param db_operations: The database operations object used for querying and returning data.
+        :type db_operations: Operations
+        """
+        self._statements: SearchStms = statements
+        self._db_ops: Operations = db_operations
+
+    @property
+    def statements(self) -> SearchStms:
+        """
+        Returns the statements object for searches.
+
+        :return: The statements object for searching records.
+        :rtype: SearchStms
+        """
+        return self._statements
+
+    @property
+    def db_operations(self) -> Operations:
+        """
+        Returns the database operations object.
+
+        :return: The database operations object.
+        :rtype: Operations
+        """
+        return self._db_ops
+
+    async def search_entities(
+        self,
+        query: str,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> EntitiesSearchPgRes:
+        """
+        Searches entities by first and last name, company name or TIN.
+
+        :param query: The searched text.
+        :type query: str
+        :param limit: The maximum number of entities per page.
+        :type limit: int
+        :param db: The database session.
+        :type db: AsyncSession
+        :param after: The rank and id of the last entity of the previous page.
+        :type after: Optional[Tuple[float, int]]
+        :return: A page of matching entities, best matches first.
+        :rtype: EntitiesSearchPgRes
+        :raises EntityNotExist: If no entity matches the query.
+        """
+        statement = self._statements.search_entities(
+            query=query, limit=limit + 1, after=after
+        )
+        entities = await self._db_ops.return_all_rows_and_values(
+            service=cnst.SEARCH_READ_SERVICE, statement=statement, db=db
+        )
+        record_not_exist(instance=entities, exception=EntityNotExist)
+        entities, has_more = pagination.split_page(items=entities, limit=limit)
+        return EntitiesSearchPgRes(
+            limit=limit,
+            has_more=has_more,
+            next_cursor=pagination.next_ranked_cursor(
+                items=entities, has_more=has_more
+            ),
+            data=entities,
+        )
+
+    async def search_products(
+        self,
+        query: str,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> ProductsSearchPgRes:
+        """
+        Searches products by name, code or description.
+
+        :param query: The searched text.
+        :type query: str
+        :param limit: The maximum number of products per page.
+        :type limit: int
+        :param db: The database session.
+        :type db: AsyncSession
+        :param after: The rank and id of the last product of the previous page.
+        :type after: Optional[Tuple[float, int]]
+        :return: A page of matching products, best matches first.
+        :rtype: ProductsSearchPgRes
+        :raises ProductsNotExist: If no product matches the query.
+        """
+        statement = self._statements.search_products(
+            query=query, limit=limit + 1, after=after
+        )
+        products = await self._db_ops.return_all_rows_and_values(
+            service=cnst.SEARCH_READ_SERVICE, statement=statement, db=db
+        )
+        record_not_exist(instance=products, exception=ProductsNotExist)
+        products, has_more = pagination.split_page(items=products, limit=limit)
+        return ProductsSearchPgRes(
+            limit=limit,
+            has_more=has_more,
+            next_cursor=pagination.next_ranked_cursor(
+                items=products, has_more=has_more
+            ),
+            products=products,
+        )
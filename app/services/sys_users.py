@@ -1,11 +1,13 @@
-from datetime import UTC
-from typing import List
+from datetime import UTC, datetime
+from typing import List, Optional
 
 from config import settings
 from pydantic import UUID4
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import InvalidCredentials, SysUserExists, SysUserNotExist
 
@@ -21,8 +23,37 @@ from ..schemas.sys_users import (
 )
 from ..statements.sys_users import SysUsersStms
 from ..utilities import pagination
+from ..utilities.cache import TTLCache
 from ..utilities.password import create_hash
-from ..utilities.data import record_exists, record_not_exist
+from ..utilities.data import record_not_exist
+
+# Validated system users keyed by the token subject, shared by every request of the worker.
+sys_user_cache = TTLCache(
+    maxsize=settings.sys_user_cache_size, ttl=settings.sys_user_cache_ttl
+)
+
+
+def invalidate_sys_user(sys_user_uuid: UUID4, db: AsyncSession) -> None:
+    """
+    Removes a system user from the cache of validated users after a write of the user.
+
+    The user is removed right away, and again once the transaction of the write commits,
+    so a request validated in between, which still read the previous user, does not keep
+    it cached.
+
+    :param sys_user_uuid: The UUID of the written system user.
+    :type sys_user_uuid: UUID4
+    :param db: The session of the write.
+    :type db: AsyncSession
+    """
+    key = str(sys_user_uuid)
+    sys_user_cache.invalidate(key=key)
+    event.listen(
+        db.sync_session,
+        "after_commit",
+        lambda session: sys_user_cache.invalidate(key=key),
+        once=True,
+    )
 
 
 class ReadSrvc:
@@ -94,6 +125,27 @@ class ReadSrvc:
         )
         return record_not_exist(instance=sys_user, exception=SysUserNotExist)
 
+    async def get_sys_user_version(
+        self,
+        sys_user_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the system user, the time it was last written.
+
+        :param sys_user_uuid: The UUID of the system user to retrieve.
+        :type sys_user_uuid: UUID4
+        :param db: The asynchronous session for database operations.
+        :type db: AsyncSession
+
+        :returns: The version of the system user, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_sys_user(sys_user_uuid=sys_user_uuid)
+        return await self._db_ops.return_version(
+            service=cnst.SYS_USER_READ_SERV, statement=statement, db=db
+        )
+
     async def get_sys_user_by_username(
         self,
         username: str,
@@ -118,10 +170,7 @@ class ReadSrvc:
         return record_not_exist(instance=sys_user, exception=InvalidCredentials)
 
     async def get_sys_users(
-        self,
-        limit: int,
-        offset: int,
-        db: AsyncSession,
+        self, limit: int, offset: int, db: AsyncSession, after: Optional[int] = None
     ) -> List[SysUsersRes]:
         """
         Retrieves a list of system users with pagination support.
@@ -132,12 +181,16 @@ class ReadSrvc:
         :type offset: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
 
         :returns: A list of system users.
         :rtype: List[SysUsersRes]
         :raises SysUserNotExist: If no system users are found.
         """
-        statement = self._statements.get_sys_users(limit=limit, offset=offset)
+        statement = self._statements.get_sys_users(
+            limit=limit, offset=offset, after=after
+        )
         sys_users: List[SysUsersRes] = await self._db_ops.return_all_rows(
             service=cnst.SYS_USER_READ_SERV, statement=statement, db=db
         )
@@ -162,7 +215,12 @@ class ReadSrvc:
         )
 
     async def paginated_users(
-        self, page: int, limit: int, db: AsyncSession
+        self,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> SysUsersPgRes:
         """
         Retrieves a paginated list of system users, including the total count and pagination information.
@@ -173,21 +231,33 @@ class ReadSrvc:
         :type limit: int
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
 
         :returns: The paginated list of system users.
         :rtype: SysUsersPgRes
         """
-        total_count = await self.get_sys_users_ct(db=db)
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_sys_users(
+            limit=limit + 1, offset=offset, after=after
         )
-        users = await self.get_sys_users(offset=offset, limit=limit, db=db)
+        users, total_count = await self._db_ops.return_page(
+            service=cnst.SYS_USER_READ_SERV,
+            statement=statement,
+            count_statement=self._statements.get_sys_users_ct(),
+            count=count,
+            db=db,
+        )
+        record_not_exist(instance=users, exception=SysUserNotExist)
+        users, has_more = pagination.split_page(items=users, limit=limit)
         return SysUsersPgRes(
             total=total_count,
             page=page,
             limit=limit,
             has_more=has_more,
+            next_cursor=pagination.next_cursor(items=users, has_more=has_more),
             sys_users=users,
         )
 
@@ -266,9 +336,8 @@ class CreateSrvc:
         Creates a new system user in the database.
 
         This method performs the following steps:
-        1. Checks if a system user already exists with the same email.
-        2. Hashes the user's password.
-        3. Adds the new user to the database.
+        1. Hashes the user's password.
+        2. Adds the new user to the database, unless a system user exists with the same email.
 
         :param sys_user_data: The data to create the new system user.
         :type sys_user_data: SysUsersCreate
@@ -278,28 +347,24 @@ class CreateSrvc:
         :returns: The newly created system user.
         :rtype: SysUsersRes
         :raises SysUserExists: If a system user with the same email already exists.
-        :raises SysUserNotExist: If the newly created user does not exist after insertion.
         """
         sys_users = self._model
-        # Check if the user already exists by email
-        statement = self._statements.get_sys_user_by_email(email=sys_user_data.email)
-        user_exists: SysUsersRes = await self._db_ops.return_one_row(
-            service=cnst.SYS_USER_CREATE_SERV, statement=statement, db=db
-        )
-        record_exists(instance=user_exists, exception=SysUserExists)
 
         # Hash the password before saving
-        sys_user_data.password = create_hash(password=sys_user_data.password)
+        sys_user_data.password = await create_hash(password=sys_user_data.password)
 
-        # Create the new system user in the database
+        # Create the new system user in the database, emails are unique across all users
         sys_user: SysUsersRes = await self._db_ops.add_instance(
             service=cnst.SYS_USER_CREATE_SERV,
             model=sys_users,
             data=sys_user_data,
             db=db,
+            unique=("email",),
+            unique_where=None,
         )
 
-        return record_not_exist(instance=sys_user, exception=SysUserNotExist)
+        # Nothing is returned when a system user has the email.
+        return record_not_exist(instance=sys_user, exception=SysUserExists)
 
 
 class UpdateSrvc:
@@ -375,6 +440,7 @@ class UpdateSrvc:
         sys_user: SysUsersRes = await self._db_ops.return_one_row(
             service=cnst.SYS_USER_UPDATE_SERV, statement=statement, db=db
         )
+        invalidate_sys_user(sys_user_uuid=sys_user_uuid, db=db)
         return record_not_exist(instance=sys_user, exception=SysUserNotExist)
 
     async def disable_sys_user(
@@ -405,6 +471,7 @@ class UpdateSrvc:
         sys_user: SysUsersDisable = await self._db_ops.return_one_row(
             service=cnst.SYS_USER_UPDATE_SERV, statement=statement, db=db
         )
+        invalidate_sys_user(sys_user_uuid=sys_user_uuid, db=db)
         return record_not_exist(instance=sys_user, exception=SysUserNotExist)
 
 
@@ -482,4 +549,5 @@ class DelSrvc:
         sys_user: SysUsersDelRes = await self._db_ops.return_one_row(
             service=cnst.SYS_USER_UPDATE_SERV, statement=statement, db=db
         )
+        invalidate_sys_user(sys_user_uuid=sys_user_uuid, db=db)
         return record_not_exist(instance=sys_user, exception=SysUserNotExist)
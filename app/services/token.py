@@ -13,7 +13,7 @@ from ..constants import constants as cnst
 from ..database.database import transaction_manager, get_db
 from ..schemas.token import TokenData, TokenRequest
 from ..schemas.sys_users import SysUserLogin
-from ..services.sys_users import ReadSrvc
+from ..services.sys_users import ReadSrvc, sys_user_cache
 from ..utilities.password import validate_hash
 from ..utilities.data import m_dumps
 
@@ -65,6 +65,20 @@ class TokenSrvc:
             expire = datetime.now(timezone.utc) + timedelta(minutes=15)
         return expire
 
+    def _needs_refresh(self, exp: Optional[int]) -> bool:
+        """
+        Checks whether a token is close enough to expiry to be replaced.
+
+        :param exp: The expiration claim of the token, in seconds since the epoch.
+        :type exp: Optional[int]
+        :returns: True if the remaining lifetime is below the refresh threshold.
+        :rtype: bool
+        """
+        if exp is None:
+            return True
+        remaining = exp - datetime.now(timezone.utc).timestamp()
+        return remaining < set.jwt_refresh_threshold * 60
+
     async def _create_token_context(
         self, sys_user: object, expires_delta: Optional[timedelta] = None
     ):
@@ -111,7 +125,7 @@ class TokenSrvc:
         sys_user = await self._sys_user_read_srvc.get_sys_user_by_username(
             username=form_data.username, db=db
         )
-        if validate_hash(password=form_data.password, hash=sys_user.password):
+        if await validate_hash(password=form_data.password, hash=sys_user.password):
             return sys_user
 
     async def create_session(self, form_data: SysUserLogin, db: AsyncSession):
@@ -139,25 +153,42 @@ class TokenSrvc:
         """
         Validates an access token by decoding it and ensuring the user exists in the system.
 
+        A new token is only issued once the remaining lifetime of the incoming token drops
+        below the refresh threshold, otherwise the incoming token stays in use and None is
+        returned in its place.
+
+        Validated users are cached by the token subject, so a session whose user was seen
+        recently is validated without a database round trip. The system user services
+        invalidate an entry whenever that user is updated, disabled or deleted.
+
         :param token: The access token to be validated.
         :type token: TokenData
         :param db: The asynchronous session for database operations.
         :type db: AsyncSession
-        :returns: The system user and a new valid access token.
-        :rtype: tuple(SysUsersRes, any)
+        :returns: The system user and a new access token, None when no refresh is due.
+        :rtype: tuple(SysUsersRes, Optional[str])
         :raises: SysUserNotExist if the user does not exist.
         """
         token_data = jwt.decode(token, set.jwt_secret_key, set.jwt_algorithm)
+        sub = token_data.get("sub")
 
-        sys_user = await self._sys_user_read_srvc.get_sys_user(
-            sys_user_uuid=token_data.get("sub"), db=db
-        )
+        sys_user = sys_user_cache.get(key=sub)
+        if sys_user is None:
+            async with transaction_manager(db=db):
+                sys_user = await self._sys_user_read_srvc.get_sys_user(
+                    sys_user_uuid=sub, db=db
+                )
+            # Detached, so other requests' sessions never refresh the shared instance.
+            db.expunge(sys_user)
+            sys_user_cache.set(key=sub, value=sys_user)
 
-        if sys_user:
-            expires_delta = timedelta(minutes=set.jwt_expiration)
-            token_claims = await self._create_token_context(
-                sys_user=sys_user, expires_delta=expires_delta
-            )
+        if not self._needs_refresh(exp=token_data.get("exp")):
+            return sys_user, None
+
+        expires_delta = timedelta(minutes=set.jwt_expiration)
+        token_claims = await self._create_token_context(
+            sys_user=sys_user, expires_delta=expires_delta
+        )
         return sys_user, await self._create_access_token(token_claims=token_claims)
 
     async def validate_session(
@@ -172,13 +203,11 @@ class TokenSrvc:
         :type db: AsyncSession
         :param jwt: The JWT token provided in the request cookie.
         :type jwt: str
-        :returns: The system user and a valid access token.
-        :rtype: tuple(SysUsersRes, any)
+        :returns: The system user and a new access token, None when no refresh is due.
+        :rtype: tuple(SysUsersRes, Optional[str])
         :raises: SysUserNotExist if the user does not exist.
         """
-        async with transaction_manager(db=db):
-            sys_user, valid_token = await self._validate_access_token(token=jwt, db=db)
-            return sys_user, valid_token
+        return await self._validate_access_token(token=jwt, db=db)
 
 
 def set_auth_cookie(func: Callable) -> Callable:
@@ -186,7 +215,8 @@ def set_auth_cookie(func: Callable) -> Callable:
     Decorator for setting the authentication token in the response cookies.
 
     This decorator is used to add the authentication token to the HTTP response,
-    making it available for future requests.
+    making it available for future requests. The cookie is only set when the session
+    validation issued a new token.
 
     :param func: The function to be decorated.
     :type func: Callable
@@ -214,7 +244,9 @@ def set_auth_cookie(func: Callable) -> Callable:
         response = kwargs.get("response")
         user_token = kwargs.get("user_token")
         _, token = user_token
-        await set_cookie(response=response, token=token)
+        # No token means the incoming one is still fresh, so the response carries no cookie.
+        if token is not None:
+            await set_cookie(response=response, token=token)
         return await func(*args, **kwargs)
 
     return wrapper
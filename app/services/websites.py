@@ -1,8 +1,10 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import constants as cnst
+from ..constants.enums import CountStrategy
 from ..database.operations import Operations
 from ..exceptions import WebsitesExists, WebsitesNotExist
 from ..models.websites import Websites
@@ -16,7 +18,7 @@ from ..schemas.websites import (
 )
 from ..statements.websites import WebsitesStms
 from ..utilities import pagination
-from ..utilities.data import record_exists, record_not_exist
+from ..utilities.data import record_not_exist
 
 
 class ReadSrvc:
@@ -92,12 +94,38 @@ class ReadSrvc:
         )
         return record_not_exist(instance=website, exception=WebsitesNotExist)
 
+    async def get_website_version(
+        self,
+        entity_uuid: UUID4,
+        website_uuid: UUID4,
+        db: AsyncSession,
+    ) -> Optional[datetime]:
+        """
+        Retrieves the version of the website, the time it was last written.
+
+        :param entity_uuid: The UUID of the entity owning the website.
+        :type entity_uuid: UUID4
+        :param website_uuid: The UUID of the website to be fetched.
+        :type website_uuid: UUID4
+        :param db: The asynchronous database session for querying.
+        :type db: AsyncSession
+        :returns: The version of the website, or `None` if it does not exist.
+        :rtype: Optional[datetime]
+        """
+        statement = self._statements.get_website(
+            entity_uuid=entity_uuid, website_uuid=website_uuid
+        )
+        return await self._db_ops.return_version(
+            service=cnst.WEBSITES_READ_SERVICE, statement=statement, db=db
+        )
+
     async def get_websites(
         self,
         entity_uuid: UUID4,
         offset: int,
         limit: int,
         db: AsyncSession,
+        after: Optional[int] = None,
     ) -> List[WebsitesRes]:
         """
         Retrieves a list of websites for a given entity, with pagination support.
@@ -110,12 +138,17 @@ class ReadSrvc:
         :type limit: int
         :param db: The asynchronous database session for querying.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces offset when provided.
+        :type after: Optional[int]
         :returns: A list of website details.
         :rtype: List[WebsitesRes]
         :raises: WebsitesNotExist if no websites are found for the entity.
         """
         statement = self._statements.get_websites(
-            entity_uuid=entity_uuid, offset=offset, limit=limit
+            entity_uuid=entity_uuid,
+            offset=offset,
+            limit=limit,
+            after=after,
         )
         websites: List[WebsitesRes] = await self._db_ops.return_all_rows(
             service=cnst.WEBSITES_READ_SERVICE, statement=statement, db=db
@@ -143,7 +176,13 @@ class ReadSrvc:
         )
 
     async def paginated_websites(
-        self, entity_uuid: UUID4, page: int, limit: int, db: AsyncSession
+        self,
+        entity_uuid: UUID4,
+        page: int,
+        limit: int,
+        db: AsyncSession,
+        after: Optional[int] = None,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> WebsitesPgRes:
         """
         Retrieves a paginated list of websites for an entity, including metadata
@@ -157,22 +196,32 @@ class ReadSrvc:
         :type limit: int
         :param db: The asynchronous database session for querying.
         :type db: AsyncSession
+        :param after: The id of the last record of the previous page, replaces page when provided.
+        :type after: Optional[int]
+        :param count: The strategy used to compute the total count.
+        :type count: CountStrategy
         :returns: A paginated result with metadata about the total number of websites,
                   current page, and list of websites for that page.
         :rtype: WebsitesPgRes
         """
-        total_count = self.get_websites_ct(db=db)
         offset = pagination.page_offset(page=page, limit=limit)
-        has_more = pagination.has_more_items(
-            total_count=total_count, page=page, limit=limit
+        statement = self._statements.get_websites(
+            entity_uuid=entity_uuid, offset=offset, limit=limit + 1, after=after
         )
-        websites = await self.get_websites(
-            entity_uuid=entity_uuid, offset=offset, limit=limit, db=db
+        websites, total_count = await self._db_ops.return_page(
+            service=cnst.WEBSITES_READ_SERVICE,
+            statement=statement,
+            count_statement=self._statements.get_websites_ct(entity_uuid=entity_uuid),
+            count=count,
+            db=db,
         )
+        record_not_exist(instance=websites, exception=WebsitesNotExist)
+        websites, has_more = pagination.split_page(items=websites, limit=limit)
         return WebsitesPgRes(
             total=total_count,
             page=page,
             has_more=has_more,
+            next_cursor=pagination.next_cursor(items=websites, has_more=has_more),
             limit=limit,
             websites=websites,
         )
@@ -258,24 +307,17 @@ class CreateSrvc:
         :returns: The created website data.
         :rtype: WebsitesRes
         :raises: WebsitesExists if a website with the same URL already exists.
-        :raises: WebsitesNotExist if the website creation fails or the website does not exist.
         """
-        statement = self._statements.get_website_by_url(
-            entity_uuid=website_data.entity_uuid, website_name=website_data.url
-        )
         websites = self._model
-        website_exists = await self._db_ops.return_one_row(
-            service=cnst.WEBSITES_CREATE_SERVICE, statement=statement, db=db
-        )
-        record_exists(instance=website_exists, exception=WebsitesExists)
-
         website: WebsitesRes = await self._db_ops.add_instance(
             service=cnst.WEBSITES_CREATE_SERVICE,
             model=websites,
             data=website_data,
             db=db,
+            unique=websites.unique_columns,
         )
-        return record_not_exist(instance=website, exception=WebsitesNotExist)
+        # Nothing is returned when the entity already has the URL.
+        return record_not_exist(instance=website, exception=WebsitesExists)
 
 
 class UpdateSrvc:
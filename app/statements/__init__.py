@@ -1,5 +1,5 @@
 """
 The `statements` package contains several modules, each of which defines a class responsible for
-constructing SQLAlchemy statements. These classes generate SQL statements that return either 
+constructing SQLAlchemy statements. These classes generate SQL statements that return either
 `Select` or `Update` objects.
 """
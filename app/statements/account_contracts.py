@@ -1,8 +1,11 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, and_, func, update
 
 from ..models.account_contracts import AccountContracts
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class AccountContractStms:
@@ -40,7 +43,7 @@ class AccountContractStms:
         )
 
     def get_account_contracts(
-        self, account_uuid: UUID4, limit: int, offset: int
+        self, account_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
     ) -> Select:
         """
         Selects account contracts by account_uuid.
@@ -48,17 +51,20 @@ class AccountContractStms:
         :param account_uuid: UUID4: The account_uuid of the account contract.
         :param limit: int: The number of records to return.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement.
         """
         account_contacts = self._account_contacts
-        return (
-            Select(account_contacts)
-            .where(
-                account_contacts.account_uuid == account_uuid,
-                account_contacts.sys_deleted_at == None,
-            )
-            .offset(offset=offset)
-            .limit(limit=limit)
+        statement = Select(account_contacts).where(
+            account_contacts.account_uuid == account_uuid,
+            account_contacts.sys_deleted_at == None,
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=account_contacts.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def account_contracts_count(self, account_uuid: UUID4) -> Select:
@@ -1,9 +1,13 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, and_, func, update, values
 
 
 from ..models.account_lists import AccountLists
+from ..models.product_lists import ProductLists
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class AccountListsStms:
@@ -12,14 +16,17 @@ class AccountListsStms:
 
     ivars:
     ivar: _account_lists: AccountLists An instance of AccountLists
+    ivar: _product_lists: ProductLists An instance of ProductLists, joined to list the product lists of an account
     """
 
-    def __init__(self, model: AccountLists):
+    def __init__(self, model: AccountLists, product_lists: ProductLists):
         self._account_list = model
+        self._product_lists = product_lists
         """
         Initializes the AccountListsStms class.
 
         :param model: AccountLists: An instance of the AccountLists class.
+        :param product_lists: ProductLists: An instance of the ProductLists class.
         :return None
         """
 
@@ -50,30 +57,89 @@ class AccountListsStms:
         )
 
     def get_account_lists_account(
-        self, account_uuid: UUID4, limit: int, offset: int
+        self, account_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
     ) -> Select:
+        account_lists = self._account_list
+        statement = Select(account_lists).where(
+            and_(
+                account_lists.account_uuid == account_uuid,
+                account_lists.sys_deleted_at == None,
+            )
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=account_lists.id,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    def get_account_list_count(self, account_uuid: UUID4) -> Select:
         account_lists = self._account_list
         return (
-            Select(account_lists)
+            Select(func.count())
+            .select_from(account_lists)
             .where(
                 and_(
                     account_lists.account_uuid == account_uuid,
                     account_lists.sys_deleted_at == None,
                 )
             )
-            .offset(offset=offset)
-            .limit(limit=limit)
         )
 
-    def get_account_list_count(self, account_uuid: UUID4) -> Select:
+    def get_account_lists_joined(
+        self, account_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
+    ) -> Select:
+        """
+        Selects the account lists of an account with their product lists, with pagination.
+
+        Rows hold the `AccountLists` link and its `ProductLists` record, pages are keyed on the link id.
+
+        :param account_uuid: UUID4: The UUID of the account.
+        :param limit: int: The number of records to return.
+        :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last link of the previous page, replaces offset when provided.
+        :return: Select: A Select statement for the account lists and product lists.
+        """
+        account_lists = self._account_list
+        product_lists = self._product_lists
+        statement = (
+            Select(account_lists, product_lists)
+            .join(product_lists, product_lists.uuid == account_lists.product_list_uuid)
+            .where(
+                and_(
+                    account_lists.account_uuid == account_uuid,
+                    account_lists.sys_deleted_at == None,
+                    product_lists.sys_deleted_at == None,
+                )
+            )
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=account_lists.id,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    def get_account_lists_joined_count(self, account_uuid: UUID4) -> Select:
+        """
+        Selects the count of account lists of an account whose product list exists.
+
+        :param account_uuid: UUID4: The UUID of the account.
+        :return: Select: A Select statement for the account list count.
+        """
         account_lists = self._account_list
+        product_lists = self._product_lists
         return (
             Select(func.count())
             .select_from(account_lists)
+            .join(product_lists, product_lists.uuid == account_lists.product_list_uuid)
             .where(
                 and_(
                     account_lists.account_uuid == account_uuid,
                     account_lists.sys_deleted_at == None,
+                    product_lists.sys_deleted_at == None,
                 )
             )
         )
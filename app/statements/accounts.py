@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import UUID4
 from sqlalchemy import Select, and_, func, select, update, Update
 
 from ..models.accounts import Accounts
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class AccountsStms:
@@ -57,20 +58,26 @@ class AccountsStms:
             and_(accounts.uuid.in_(account_uuids), accounts.sys_deleted_at == None)
         )
 
-    def get_accounts(self, offset: int, limit: int) -> Select:
+    def get_accounts(
+        self, offset: int, limit: int, after: Optional[int] = None
+    ) -> Select:
         """
         Selects accounts with pagination support.
 
         :param offset: int: The number of records to skip.
+
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :param limit: int: The number of records to return.
         :return: Select: A Select statement.
         """
         accounts = self._accounts
-        return (
-            Select(accounts)
-            .where(accounts.sys_deleted_at == None)
-            .offset(offset=offset)
-            .limit(limit=limit)
+        statement = Select(accounts).where(accounts.sys_deleted_at == None)
+        return pagination.paginate(
+            statement=statement,
+            key=accounts.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def get_accounts_ct(self) -> Select:
@@ -1,8 +1,12 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, Update, and_, func, update
 from ..models.account_products import AccountProducts
+from ..models.products import Products
 
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class AccountProductsStms:
@@ -11,16 +15,19 @@ class AccountProductsStms:
 
     ivars:
     ivar: _model: AccountProducts: An instance of AccountProducts
+    ivar: _products: Products: An instance of Products, joined to list the products of an account
     """
 
-    def __init__(self, model: AccountProducts) -> None:
+    def __init__(self, model: AccountProducts, products: Products) -> None:
         """
         Initializes the AccountProductsStms class.
 
         :param model: AccountProducts: An instance of AccountProducts.
+        :param products: Products: An instance of Products.
         :return None
         """
         self._model: AccountProducts = model
+        self._products: Products = products
 
     def get_account_product(
         self, account_uuid: UUID4, account_product_uuid: UUID4
@@ -61,7 +68,7 @@ class AccountProductsStms:
         )
 
     def get_account_products(
-        self, account_uuid: UUID4, limit: int, offset: int
+        self, account_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
     ) -> Select:
         """
         Selects account products by account_uuid with pagination support.
@@ -69,36 +76,96 @@ class AccountProductsStms:
         :param account_uuid: UUID4: The account_uuid of the account products.
         :param limit: int: The number of records to return.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement.
         """
         account_products = self._model
+        statement = Select(account_products).where(
+            and_(
+                account_products.account_uuid == account_uuid,
+                account_products.sys_deleted_at == None,
+            )
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=account_products.id,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    def get_account_products_ct(self, account_uuid: UUID4) -> Select:
+        """
+        Selects the count of account products by account_uuid.
+
+        :param account_uuid: UUID4: The account_uuid of the account products.
+        :return: Select: A Select statement with a count of account products.
+        """
+        account_products = self._model
         return (
-            Select(account_products)
+            Select(func.count())
+            .select_from(account_products)
             .where(
                 and_(
                     account_products.account_uuid == account_uuid,
                     account_products.sys_deleted_at == None,
                 )
             )
-            .offset(offset=offset)
-            .limit(limit=limit)
         )
 
-    def get_account_products_ct(self, account_uuid: UUID4) -> Select:
+    def get_account_products_joined(
+        self, account_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
+    ) -> Select:
         """
-        Selects the count of account products by account_uuid.
+        Selects account products by account_uuid with their products, with pagination support.
+
+        Rows hold the `AccountProducts` link and its `Products` record, pages are keyed on the link id.
+
+        :param account_uuid: UUID4: The account_uuid of the account products.
+        :param limit: int: The number of records to return.
+        :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last link of the previous page, replaces offset when provided.
+        :return: Select: A Select statement.
+        """
+        account_products = self._model
+        products = self._products
+        statement = (
+            Select(account_products, products)
+            .join(products, products.uuid == account_products.product_uuid)
+            .where(
+                and_(
+                    account_products.account_uuid == account_uuid,
+                    account_products.sys_deleted_at == None,
+                    products.sys_deleted_at == None,
+                )
+            )
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=account_products.id,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    def get_account_products_joined_ct(self, account_uuid: UUID4) -> Select:
+        """
+        Selects the count of account products by account_uuid whose product exists.
 
         :param account_uuid: UUID4: The account_uuid of the account products.
         :return: Select: A Select statement with a count of account products.
         """
         account_products = self._model
+        products = self._products
         return (
             Select(func.count())
             .select_from(account_products)
+            .join(products, products.uuid == account_products.product_uuid)
             .where(
                 and_(
                     account_products.account_uuid == account_uuid,
                     account_products.sys_deleted_at == None,
+                    products.sys_deleted_at == None,
                 )
             )
         )
@@ -1,9 +1,10 @@
-from typing import Literal
+from typing import List, Literal, Optional, Tuple
 
 from pydantic import UUID4
-from sqlalchemy import Select, Update, and_, func, update, values
+from sqlalchemy import Select, Update, and_, func, tuple_, update, values
 from ..models.addresses import Addresses
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class AddressesStms:
@@ -56,39 +57,83 @@ class AddressesStms:
             )
         )
 
-    def get_address_by_address(
-        self,
-        parent_uuid: UUID4,
-        address_line1: str,
-        address_line2: str,
-        city: str,
+    def get_address_by_fingerprint(
+        self, parent_uuid: UUID4, fingerprint: str
     ) -> Select:
         """
-        Selects an address by its specific address fields.
+        Selects an address of a parent by its fingerprint, a probe of the unique index.
 
         :param parent_uuid: UUID4: The UUID of the parent (entity or account).
-        :param address_line1: str: The first line of the address.
-        :param address_line2: str: The second line of the address (if available).
-        :param city: str: The city of the address.
+        :param fingerprint: str: The fingerprint of the address, see `address_fingerprint`.
         :return: Select: A Select statement for the address.
         """
         addresses = self._model
         return Select(addresses).where(
             and_(
                 addresses.parent_uuid == parent_uuid,
-                addresses.address_line1 == address_line1,
-                addresses.address_line2 == address_line2,
-                addresses.city == city,
+                addresses.fingerprint == fingerprint,
                 addresses.sys_deleted_at == None,
             )
         )
 
+    def get_addresses_without_fingerprint(self, after: int, limit: int) -> Select:
+        """
+        Selects the fingerprinted fields of addresses created before the fingerprint, in id order.
+
+        :param after: int: The id of the last address of the previous batch.
+        :param limit: int: The number of addresses to return.
+        :return: Select: A Select statement for the addresses.
+        """
+        addresses = self._model
+        return (
+            Select(
+                addresses.id,
+                addresses.uuid,
+                addresses.parent_uuid,
+                addresses.address_line1,
+                addresses.address_line2,
+                addresses.city,
+                addresses.zip,
+                addresses.sys_deleted_at,
+            )
+            .where(and_(addresses.fingerprint == None, addresses.id > after))
+            .order_by(addresses.id)
+            .limit(limit)
+        )
+
+    def get_fingerprints(self, keys: List[Tuple[UUID4, str]]) -> Select:
+        """
+        Selects the parent and fingerprint pairs already taken among addresses that are not soft deleted.
+
+        :param keys: List[Tuple[UUID4, str]]: The parent UUID and fingerprint pairs to look up.
+        :return: Select: A Select statement for the taken pairs.
+        """
+        addresses = self._model
+        return Select(addresses.parent_uuid, addresses.fingerprint).where(
+            and_(
+                tuple_(addresses.parent_uuid, addresses.fingerprint).in_(keys),
+                addresses.sys_deleted_at == None,
+            )
+        )
+
+    def update_fingerprints(self) -> Update:
+        """
+        Updates the fingerprint of addresses by primary key, executed with one parameter set per address.
+
+        The backfill does not change the address, so `sys_updated_at` is kept instead of being
+        moved by its `onupdate` default.
+
+        :return: Update: A bulk Update statement expecting `id` and `fingerprint` parameters.
+        """
+        return update(self._model).values(sys_updated_at=self._model.sys_updated_at)
+
     def get_address_by_entity(
         self,
         parent_uuid: UUID4,
         parent_table: Literal["entities", "accounts"],
         offset: int,
         limit: int,
+        after: Optional[int] = None,
     ) -> Select:
         """
         Selects addresses by parent_uuid and parent_table with pagination support.
@@ -96,21 +141,24 @@ class AddressesStms:
         :param parent_uuid: UUID4: The UUID of the parent (entity or account).
         :param parent_table: Literal["entities", "accounts"]: The table name (entities or accounts) associated with the addresses.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :param limit: int: The number of records to return.
         :return: Select: A Select statement for the addresses.
         """
         addresses = self._model
-        return (
-            Select(addresses)
-            .where(
-                and_(
-                    addresses.parent_uuid == parent_uuid,
-                    addresses.parent_table == parent_table,
-                    addresses.sys_deleted_at == None,
-                )
+        statement = Select(addresses).where(
+            and_(
+                addresses.parent_uuid == parent_uuid,
+                addresses.parent_table == parent_table,
+                addresses.sys_deleted_at == None,
             )
-            .offset(offset=offset)
-            .limit(limit=limit)
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=addresses.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def get_addresses_ct(
@@ -1,8 +1,11 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, and_, func, update
 
 from ..models.emails import Emails
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class EmailsStms:
@@ -39,23 +42,24 @@ class EmailsStms:
             )
         )
 
-    def get_emails(self, entity_uuid: UUID4, limit: int, offset: int) -> Select:
+    def get_emails(
+        self, entity_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
+    ) -> Select:
         """
         Selects emails by entity_uuid with pagination support.
 
         :param entity_uuid: UUID4: The UUID of the entity associated with the emails.
         :param limit: int: The number of records to return.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement for the emails.
         """
         emails = self._emails
-        return (
-            Select(emails)
-            .where(
-                and_(emails.entity_uuid == entity_uuid, emails.sys_deleted_at == None)
-            )
-            .offset(offset=offset)
-            .limit(limit=limit)
+        statement = Select(emails).where(
+            and_(emails.entity_uuid == entity_uuid, emails.sys_deleted_at == None)
+        )
+        return pagination.paginate(
+            statement=statement, key=emails.id, limit=limit, offset=offset, after=after
         )
 
     def get_email_ct(self, entity_uuid: UUID4) -> int:
@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 from pydantic import UUID4
 from sqlalchemy import Select, and_, func, update
 
 from ..database.operations import Operations
 from ..models.entities import Entities
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class EntitiesStms:
@@ -51,20 +52,36 @@ class EntitiesStms:
             and_(entities.uuid == entity_uuid, entities.sys_deleted_at == None)
         )
 
-    def get_entities(self, limit: int, offset: int):
+    def get_entities(self, limit: int, offset: int, after: Optional[int] = None):
         """
         Selects entities with pagination support.
 
         :param limit: int: The number of records to return.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
+        :return: Select: A Select statement for the entities.
+        """
+        entities = self._entities
+        statement = Select(entities).where(entities.sys_deleted_at == None)
+        return pagination.paginate(
+            statement=statement,
+            key=entities.id,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    def export_entities(self) -> Select:
+        """
+        Selects all entities in id order, for streaming exports.
+
         :return: Select: A Select statement for the entities.
         """
         entities = self._entities
         return (
             Select(entities)
             .where(entities.sys_deleted_at == None)
-            .offset(offset=offset)
-            .limit(limit=limit)
+            .order_by(entities.id)
         )
 
     def get_entities_by_uuids(self, entity_uuids: List[UUID4]) -> Select:
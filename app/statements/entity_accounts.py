@@ -1,9 +1,15 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, Update, and_, func, update, values
 
+from ..models.accounts import Accounts
+from ..models.entities import Entities
 from ..models.entity_accounts import EntityAccounts
-
+from ..models.individuals import Individuals
+from ..models.non_individuals import NonIndividuals
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class EntityAccountsStms:
@@ -12,16 +18,35 @@ class EntityAccountsStms:
 
     ivars:
     ivar: _model: EntityAccounts: An instance of the EntityAccounts model.
+    ivar: _accounts: Accounts: An instance of the Accounts model, joined to list the accounts of an entity.
+    ivar: _entities: Entities: An instance of the Entities model, joined to list the entities of an account.
+    ivar: _individuals: Individuals: An instance of the Individuals model.
+    ivar: _non_individuals: NonIndividuals: An instance of the NonIndividuals model.
     """
 
-    def __init__(self, model: EntityAccounts) -> None:
+    def __init__(
+        self,
+        model: EntityAccounts,
+        accounts: Accounts,
+        entities: Entities,
+        individuals: Individuals,
+        non_individuals: NonIndividuals,
+    ) -> None:
         """
         Initializes the EntityAccountsStms class.
 
         :param model: EntityAccounts: An instance of the EntityAccounts model.
+        :param accounts: Accounts: An instance of the Accounts model.
+        :param entities: Entities: An instance of the Entities model.
+        :param individuals: Individuals: An instance of the Individuals model.
+        :param non_individuals: NonIndividuals: An instance of the NonIndividuals model.
         :return: None
         """
         self._model = model
+        self._accounts = accounts
+        self._entities = entities
+        self._individuals = individuals
+        self._non_individuals = non_individuals
 
     @property
     def model(self) -> EntityAccounts:
@@ -67,7 +92,7 @@ class EntityAccountsStms:
         )
 
     def get_entity_accounts(
-        self, entity_uuid: UUID4, limit: int, offset: int
+        self, entity_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
     ) -> Select:
         """
         Selects entity-account relationships by entity UUID with pagination.
@@ -75,23 +100,26 @@ class EntityAccountsStms:
         :param entity_uuid: UUID4: The UUID of the entity.
         :param limit: int: The number of records to return.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement for the entity-account relationships.
         """
         entity_accounts = self._model
-        return (
-            Select(entity_accounts)
-            .where(
-                and_(
-                    entity_accounts.entity_uuid == entity_uuid,
-                    entity_accounts.sys_deleted_at == None,
-                )
+        statement = Select(entity_accounts).where(
+            and_(
+                entity_accounts.entity_uuid == entity_uuid,
+                entity_accounts.sys_deleted_at == None,
             )
-            .offset(offset=offset)
-            .limit(limit=limit)
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=entity_accounts.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def get_account_entities(
-        self, account_uuid: UUID4, limit: int, offset: int
+        self, account_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
     ) -> Select:
         """
         Selects account-entity relationships by account UUID with pagination.
@@ -99,55 +127,191 @@ class EntityAccountsStms:
         :param account_uuid: UUID4: The UUID of the account.
         :param limit: int: The number of records to return.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement for the account-entity relationships.
         """
         entity_accounts = self._model
+        statement = Select(entity_accounts).where(
+            and_(
+                entity_accounts.account_uuid == account_uuid,
+                entity_accounts.sys_deleted_at == None,
+            )
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=entity_accounts.id,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    def get_entity_account_ct(self, entity_uuid: UUID4) -> Select:
+        """
+        Selects the count of entity-account relationships for a specific entity.
+
+        :param entity_uuid: UUID4: The UUID of the entity.
+        :return: Select: A Select statement for the entity-account count.
+        """
+        entity_accounts = self._model
+        return (
+            Select(func.count())
+            .select_from(entity_accounts)
+            .where(
+                and_(
+                    entity_accounts.entity_uuid == entity_uuid,
+                    entity_accounts.sys_deleted_at == None,
+                )
+            )
+        )
+
+    def get_account_entities_ct(self, account_uuid: UUID4) -> Select:
+        """
+        Selects the count of account-entity relationships for a specific account.
+
+        :param account_uuid: UUID4: The UUID of the account.
+        :return: Select: A Select statement for the account-entity count.
+        """
+        entity_accounts = self._model
         return (
-            Select(entity_accounts)
+            Select(func.count())
+            .select_from(entity_accounts)
             .where(
                 and_(
                     entity_accounts.account_uuid == account_uuid,
                     entity_accounts.sys_deleted_at == None,
                 )
             )
-            .offset(offset=offset)
-            .limit(limit=limit)
         )
 
-    def get_entity_account_ct(self, entity_uuid: UUID4) -> Select:
+    def get_entity_accounts_joined(
+        self, entity_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
+    ) -> Select:
         """
-        Selects the count of entity-account relationships for a specific entity.
+        Selects entity-account relationships by entity UUID with their accounts, with pagination.
+
+        Rows hold the `EntityAccounts` link and its `Accounts` record, pages are keyed on the link id.
+
+        :param entity_uuid: UUID4: The UUID of the entity.
+        :param limit: int: The number of records to return.
+        :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last link of the previous page, replaces offset when provided.
+        :return: Select: A Select statement for the entity-account relationships and accounts.
+        """
+        entity_accounts = self._model
+        accounts = self._accounts
+        statement = (
+            Select(entity_accounts, accounts)
+            .join(accounts, accounts.uuid == entity_accounts.account_uuid)
+            .where(
+                and_(
+                    entity_accounts.entity_uuid == entity_uuid,
+                    entity_accounts.sys_deleted_at == None,
+                    accounts.sys_deleted_at == None,
+                )
+            )
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=entity_accounts.id,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    def get_entity_accounts_joined_ct(self, entity_uuid: UUID4) -> Select:
+        """
+        Selects the count of entity-account relationships for a specific entity whose account exists.
 
         :param entity_uuid: UUID4: The UUID of the entity.
         :return: Select: A Select statement for the entity-account count.
         """
         entity_accounts = self._model
+        accounts = self._accounts
         return (
             Select(func.count())
             .select_from(entity_accounts)
+            .join(accounts, accounts.uuid == entity_accounts.account_uuid)
             .where(
                 and_(
                     entity_accounts.entity_uuid == entity_uuid,
                     entity_accounts.sys_deleted_at == None,
+                    accounts.sys_deleted_at == None,
                 )
             )
         )
 
-    def get_account_entities_ct(self, account_uuid: UUID4) -> Select:
+    def get_account_entities_joined(
+        self, account_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
+    ) -> Select:
         """
-        Selects the count of account-entity relationships for a specific account.
+        Selects account-entity relationships by account UUID with their entity names, with pagination.
+
+        Rows hold the `EntityAccounts` link and the entity columns of `EntitiesStms.get_entities_by_uuids`,
+        pages are keyed on the link id.
+
+        :param account_uuid: UUID4: The UUID of the account.
+        :param limit: int: The number of records to return.
+        :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last link of the previous page, replaces offset when provided.
+        :return: Select: A Select statement for the account-entity relationships and entities.
+        """
+        entity_accounts = self._model
+        entities = self._entities
+        individuals = self._individuals
+        non_individuals = self._non_individuals
+        statement = (
+            Select(
+                entity_accounts,
+                entities.uuid.label("entity_uuid"),
+                individuals.first_name,
+                individuals.last_name,
+                non_individuals.name.label("company_name"),
+            )
+            .join(entities, entities.uuid == entity_accounts.entity_uuid)
+            .join(
+                isouter=True,
+                target=individuals,
+                onclause=entities.uuid == individuals.entity_uuid,
+            )
+            .join(
+                isouter=True,
+                target=non_individuals,
+                onclause=entities.uuid == non_individuals.entity_uuid,
+            )
+            .where(
+                and_(
+                    entity_accounts.account_uuid == account_uuid,
+                    entity_accounts.sys_deleted_at == None,
+                    entities.sys_deleted_at == None,
+                )
+            )
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=entity_accounts.id,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    def get_account_entities_joined_ct(self, account_uuid: UUID4) -> Select:
+        """
+        Selects the count of account-entity relationships for a specific account whose entity exists.
 
         :param account_uuid: UUID4: The UUID of the account.
         :return: Select: A Select statement for the account-entity count.
         """
         entity_accounts = self._model
+        entities = self._entities
         return (
             Select(func.count())
             .select_from(entity_accounts)
+            .join(entities, entities.uuid == entity_accounts.entity_uuid)
             .where(
                 and_(
                     entity_accounts.account_uuid == account_uuid,
                     entity_accounts.sys_deleted_at == None,
+                    entities.sys_deleted_at == None,
                 )
             )
         )
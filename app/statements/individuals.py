@@ -1,8 +1,11 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, Update, and_, func, update, values
 
 from ..models.individuals import Individuals
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class IndividualsStms:
@@ -46,22 +49,28 @@ class IndividualsStms:
             )
         )
 
-    def get_individuals(self, offset: int, limit: int) -> Select:
+    def get_individuals(
+        self, offset: int, limit: int, after: Optional[int] = None
+    ) -> Select:
         """
         Selects individuals with pagination.
 
         :param offset: int: The number of records to skip.
+
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :param limit: int: The number of records to return.
         :return: Select: A Select statement for the individuals.
         """
         individuals = self._model
-        return (
-            Select(individuals)
-            .where(
-                individuals.sys_deleted_at == None,
-            )
-            .offset(offset=offset)
-            .limit(limit=limit)
+        statement = Select(individuals).where(
+            individuals.sys_deleted_at == None,
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=individuals.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def get_individuals_ct(self) -> Select:
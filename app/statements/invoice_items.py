@@ -1,8 +1,11 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, Update, and_, func, update, values
 
 from ..models.invoice_items import InvoiceItems
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class InvoiceItemsStms:
@@ -31,13 +34,38 @@ class InvoiceItemsStms:
         """
         return self._model
 
-    def get_invoice_items(self, invoice_uuid: UUID4, limit: int, offset: int) -> Select:
+    def get_invoice_items(
+        self, invoice_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
+    ) -> Select:
         """
         Selects invoice items for a given invoice UUID with pagination.
 
         :param invoice_uuid: UUID4: The UUID of the invoice.
         :param limit: int: The maximum number of invoice items to return.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
+        :return: Select: A Select statement for the invoice items.
+        """
+        invoice_items = self._model
+        statement = Select(invoice_items).where(
+            and_(
+                invoice_items.invoice_uuid == invoice_uuid,
+                invoice_items.sys_deleted_at == None,
+            )
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=invoice_items.id,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    def export_invoice_items(self, invoice_uuid: UUID4) -> Select:
+        """
+        Selects all invoice items of a given invoice UUID in id order, for streaming exports.
+
+        :param invoice_uuid: UUID4: The UUID of the invoice.
         :return: Select: A Select statement for the invoice items.
         """
         invoice_items = self._model
@@ -49,8 +77,7 @@ class InvoiceItemsStms:
                     invoice_items.sys_deleted_at == None,
                 )
             )
-            .offset(offset=offset)
-            .limit(limit=limit)
+            .order_by(invoice_items.id)
         )
 
     def get_invoice_items_ct(self, invoice_uuid: UUID4) -> Select:
@@ -1,8 +1,11 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, Update, and_, func, update, values
 
 from ..models.invoices import Invoices
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class InvoicesStms:
@@ -58,20 +61,25 @@ class InvoicesStms:
             )
         )
 
-    def get_invoices(self, limit: int, offset: int) -> Select:
+    def get_invoices(
+        self, limit: int, offset: int, after: Optional[int] = None
+    ) -> Select:
         """
         Selects invoices with pagination.
 
         :param limit: int: The maximum number of invoices to return.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement for invoices with pagination.
         """
         invoices = self._model
-        return (
-            Select(invoices)
-            .where(invoices.sys_deleted_at == None)
-            .offset(offset=offset)
-            .limit(limit=limit)
+        statement = Select(invoices).where(invoices.sys_deleted_at == None)
+        return pagination.paginate(
+            statement=statement,
+            key=invoices.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def get_invoices_count(self) -> Select:
@@ -0,0 +1,133 @@
+from sqlalchemy import Select, and_
+
+from ..models.emails import Emails
+from ..models.entities import Entities
+from ..models.individuals import Individuals
+from ..models.non_individuals import NonIndividuals
+from ..models.numbers import Numbers
+from ..models.sys_base import lookup_key_of
+from ..models.websites import Websites
+
+
+class LookupStms:
+    """
+    A class responsible for constructing SQLAlchemy queries finding entities by a contact.
+
+    Lookups compare the `lookup_key` of the emails, numbers or websites of every entity
+    with a normalized value, a probe of the index built by `lookup_index`.
+
+    ivars:
+    ivar: _entities: Entities: An instance of Entities.
+    ivar: _individuals: Individuals: An instance of Individuals.
+    ivar: _non_individuals: NonIndividuals: An instance of NonIndividuals.
+    ivar: _emails: Emails: An instance of Emails.
+    ivar: _numbers: Numbers: An instance of Numbers.
+    ivar: _websites: Websites: An instance of Websites.
+    """
+
+    def __init__(
+        self,
+        entities: Entities,
+        individuals: Individuals,
+        non_individuals: NonIndividuals,
+        emails: Emails,
+        numbers: Numbers,
+        websites: Websites,
+    ) -> None:
+        """
+        Initializes the LookupStms class.
+
+        :param entities: Entities: An instance of Entities.
+        :param individuals: Individuals: An instance of Individuals.
+        :param non_individuals: NonIndividuals: An instance of NonIndividuals.
+        :param emails: Emails: An instance of Emails.
+        :param numbers: Numbers: An instance of Numbers.
+        :param websites: Websites: An instance of Websites.
+        :return None
+        """
+        self._entities: Entities = entities
+        self._individuals: Individuals = individuals
+        self._non_individuals: NonIndividuals = non_individuals
+        self._emails: Emails = emails
+        self._numbers: Numbers = numbers
+        self._websites: Websites = websites
+
+    def _get_entities(self, contacts: object, key: str, limit: int) -> Select:
+        """
+        Selects the summaries of the entities having a contact with a lookup key.
+
+        :param contacts: object: The model of the contacts, having `lookup_key` and `entity_uuid`.
+        :param key: str: The normalized lookup key.
+        :param limit: int: The maximum number of entities to return.
+        :return: Select: A Select statement for the entities, in id order.
+        """
+        entities = self._entities
+        individuals = self._individuals
+        non_individuals = self._non_individuals
+        matched = Select(contacts.entity_uuid).where(
+            and_(lookup_key_of(contacts) == key, contacts.sys_deleted_at == None)
+        )
+        return (
+            Select(
+                entities.id,
+                entities.uuid.label("entity_uuid"),
+                entities.type,
+                entities.tin,
+                individuals.first_name,
+                individuals.last_name,
+                non_individuals.name.label("company_name"),
+            )
+            .select_from(entities)
+            .outerjoin(
+                individuals,
+                and_(
+                    individuals.entity_uuid == entities.uuid,
+                    individuals.sys_deleted_at == None,
+                ),
+            )
+            .outerjoin(
+                non_individuals,
+                and_(
+                    non_individuals.entity_uuid == entities.uuid,
+                    non_individuals.sys_deleted_at == None,
+                ),
+            )
+            .where(
+                and_(
+                    entities.uuid.in_(matched),
+                    entities.sys_deleted_at == None,
+                )
+            )
+            .order_by(entities.id)
+            .limit(limit)
+        )
+
+    def get_entities_by_email(self, email: str, limit: int) -> Select:
+        """
+        Selects the entities having an email address.
+
+        :param email: str: The email address, normalized by `email_key`.
+        :param limit: int: The maximum number of entities to return.
+        :return: Select: A Select statement for the entity summaries.
+        """
+        return self._get_entities(contacts=self._emails, key=email, limit=limit)
+
+    def get_entities_by_phone(self, phone: str, limit: int) -> Select:
+        """
+        Selects the entities having a phone number.
+
+        :param phone: str: The E.164 digits of the phone number, normalized by `phone_key`.
+        :param limit: int: The maximum number of entities to return.
+        :return: Select: A Select statement for the entity summaries.
+        """
+        return self._get_entities(contacts=self._numbers, key=phone, limit=limit)
+
+    def get_entities_by_domain(self, domain: str, limit: int) -> Select:
+        """
+        Selects the entities having a website on a domain.
+
+        :param domain: str: The domain, normalized by `domain_key`.
+        :param limit: int: The maximum number of entities to return.
+        :return: Select: A Select statement for the entity summaries.
+        """
+        return self._get_entities(contacts=self._websites, key=domain, limit=limit)
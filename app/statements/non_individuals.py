@@ -1,8 +1,11 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, and_, func, update, values, Update
 
 from ..models.non_individuals import NonIndividuals
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class NonIndivididualsStms:
@@ -46,20 +49,28 @@ class NonIndivididualsStms:
             )
         )
 
-    def sel_non_indivs(self, offset: int, limit: int) -> Select:
+    def sel_non_indivs(
+        self, offset: int, limit: int, after: Optional[int] = None
+    ) -> Select:
         """
         Selects non-individual entities with pagination.
 
         :param offset: int: The number of records to skip.
+
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :param limit: int: The maximum number of records to return.
         :return: Select: A Select statement for non-individual entities with pagination.
         """
         non_individuals = self._model
-        return (
-            Select(non_individuals)
-            .where(non_individuals.sys_deleted_at == None)
-            .offset(offset=offset)
-            .limit(limit=limit)
+        statement = Select(non_individuals).where(
+            non_individuals.sys_deleted_at == None
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=non_individuals.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def get_non_individuals_count(self) -> Select:
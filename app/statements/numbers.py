@@ -4,6 +4,7 @@ from sqlalchemy import Select, and_, func, update, values, Update
 
 from ..models.numbers import Numbers
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class NumbersStms:
@@ -49,10 +50,7 @@ class NumbersStms:
         )
 
     def get_number_by_entity(
-        self,
-        entity_uuid: UUID4,
-        limit: int,
-        offset: int,
+        self, entity_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
     ) -> Select:
         """
         Selects phone numbers by entity UUID with pagination.
@@ -60,19 +58,18 @@ class NumbersStms:
         :param entity_uuid: UUID4: The UUID of the entity.
         :param limit: int: The maximum number of records to return.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement for phone numbers filtered by entity UUID with pagination.
         """
         numbers = self._model
-        return (
-            Select(numbers)
-            .where(
-                and_(
-                    numbers.entity_uuid == entity_uuid,
-                    numbers.sys_deleted_at == None,
-                )
+        statement = Select(numbers).where(
+            and_(
+                numbers.entity_uuid == entity_uuid,
+                numbers.sys_deleted_at == None,
             )
-            .offset(offset=offset)
-            .limit(limit=limit)
+        )
+        return pagination.paginate(
+            statement=statement, key=numbers.id, limit=limit, offset=offset, after=after
         )
 
     def get_number_by_entity_ct(self, entity_uuid: UUID4) -> Select:
@@ -1,8 +1,11 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, Update, func, update, and_
 
 from ..models.order_items import OrderItems
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class OrderItemsStms:
@@ -48,26 +51,31 @@ class OrderItemsStms:
             )
         )
 
-    def get_order_items(self, order_uuid: UUID4, limit: int, offset: int) -> Select:
+    def get_order_items(
+        self, order_uuid: UUID4, limit: int, offset: int, after: Optional[int] = None
+    ) -> Select:
         """
         Selects order items for a given order UUID with pagination.
 
         :param order_uuid: UUID4: The UUID of the order.
         :param limit: int: The maximum number of records to return.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement for order items filtered by order UUID with pagination.
         """
         order_items = self._model
-        return (
-            Select(order_items)
-            .where(
-                and_(
-                    order_items.order_uuid == order_uuid,
-                    order_items.sys_deleted_at == None,
-                )
+        statement = Select(order_items).where(
+            and_(
+                order_items.order_uuid == order_uuid,
+                order_items.sys_deleted_at == None,
             )
-            .offset(offset=offset)
-            .limit(limit=limit)
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=order_items.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def get_order_item_ct(self, order_uuid: UUID4) -> Select:
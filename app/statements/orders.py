@@ -1,8 +1,11 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, Update, and_, func, update, values
 
 from ..models.orders import Orders
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class OrdersStms:
@@ -37,22 +40,32 @@ class OrdersStms:
             )
         )
 
-    def get_orders(self, limit: int, offset: int) -> Select:
+    def get_orders(
+        self, limit: int, offset: int, after: Optional[int] = None
+    ) -> Select:
         """
         Selects orders with pagination support.
 
         :param limit: int: The maximum number of records to return.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement for orders with pagination.
         """
         orders = self._model
-        return (
-            Select(orders)
-            .where(orders.sys_deleted_at == None)
-            .offset(offset=offset)
-            .limit(limit=limit)
+        statement = Select(orders).where(orders.sys_deleted_at == None)
+        return pagination.paginate(
+            statement=statement, key=orders.id, limit=limit, offset=offset, after=after
         )
 
+    def export_orders(self) -> Select:
+        """
+        Selects all orders in id order, for streaming exports.
+
+        :return: Select: A Select statement for the orders.
+        """
+        orders = self._model
+        return Select(orders).where(orders.sys_deleted_at == None).order_by(orders.id)
+
     def get_orders_ct(self) -> Select:
         """
         Selects the count of orders.
@@ -0,0 +1,425 @@
+from itertools import chain
+from typing import Any, Dict, List
+
+from pydantic import UUID4
+from sqlalchemy import (
+    ColumnElement,
+    FromClause,
+    Lateral,
+    Select,
+    and_,
+    func,
+    literal,
+    select,
+    text,
+    true,
+)
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
+
+from ..models.account_contracts import AccountContracts
+from ..models.account_lists import AccountLists
+from ..models.account_products import AccountProducts
+from ..models.accounts import Accounts
+from ..models.addresses import Addresses
+from ..models.emails import Emails
+from ..models.entities import Entities
+from ..models.entity_accounts import EntityAccounts
+from ..models.individuals import Individuals
+from ..models.non_individuals import NonIndividuals
+from ..models.numbers import Numbers
+from ..models.product_lists import ProductLists
+from ..models.products import Products
+from ..models.websites import Websites
+
+
+def json_section(
+    rows: Select, parent: object, key: ColumnElement, limit: int, name: str
+) -> Lateral:
+    """
+    Aggregates the first rows of a correlated Select into one JSON array.
+
+    The rows are ordered by `key` and limited to `limit`, a window count over the same
+    rows gives the total before the limit. The lateral returns exactly one row with
+    the `data` array, empty when there are no rows, and the `total`.
+
+    :param rows: Select: A Select filtered on the parent record, its column names are the JSON keys.
+    :param parent: object: The model of the parent record, the rows are correlated to it.
+    :param key: ColumnElement: The column ordering the rows.
+    :param limit: int: The maximum number of rows in the array.
+    :param name: str: The name of the lateral.
+    :return: Lateral: A lateral subquery with `data` and `total` columns.
+    """
+    page = (
+        rows.add_columns(
+            func.count().over().label("_total"),
+            func.row_number().over(order_by=key).label("_position"),
+        )
+        .order_by(key)
+        .limit(limit)
+        .correlate(parent)
+        .subquery(f"{name}_page")
+    )
+    item = func.jsonb_build_object(
+        *chain.from_iterable(
+            (literal(column.key), column)
+            for column in page.c
+            if column.key not in ("_total", "_position")
+        )
+    )
+    return select(
+        func.coalesce(
+            func.jsonb_agg(aggregate_order_by(item, page.c._position)),
+            text("'[]'::jsonb"),
+            type_=JSONB,
+        ).label("data"),
+        func.coalesce(func.max(page.c._total), 0).label("total"),
+    ).lateral(name)
+
+
+def with_sections(
+    columns: List[Any], from_: FromClause, sections: Dict[str, Lateral]
+) -> Select:
+    """
+    Selects columns of a record together with sections built by `json_section`.
+
+    Each section is joined laterally and adds a `<name>` and a `<name>_total` column.
+
+    :param columns: List[Any]: The models or columns of the record.
+    :param from_: FromClause: The FROM clause of the record.
+    :param sections: Dict[str, Lateral]: The sections by name.
+    :return: Select: A Select statement.
+    """
+    for section in sections.values():
+        from_ = from_.join(section, true())
+    return Select(
+        *columns,
+        *chain.from_iterable(
+            (section.c.data.label(name), section.c.total.label(f"{name}_total"))
+            for name, section in sections.items()
+        ),
+    ).select_from(from_)
+
+
+class OverviewsStms:
+    """
+    A class responsible for constructing SQLAlchemy queries assembling a record with its related records.
+
+    Each related section is a lateral subquery aggregated to JSON, see `json_section`, so
+    the whole overview is read in one statement.
+
+    ivars:
+    ivar: _accounts: Accounts: An instance of Accounts.
+    ivar: _account_contracts: AccountContracts: An instance of AccountContracts.
+    ivar: _account_lists: AccountLists: An instance of AccountLists.
+    ivar: _account_products: AccountProducts: An instance of AccountProducts.
+    ivar: _addresses: Addresses: An instance of Addresses.
+    ivar: _emails: Emails: An instance of Emails.
+    ivar: _entities: Entities: An instance of Entities.
+    ivar: _entity_accounts: EntityAccounts: An instance of EntityAccounts.
+    ivar: _individuals: Individuals: An instance of Individuals.
+    ivar: _non_individuals: NonIndividuals: An instance of NonIndividuals.
+    ivar: _numbers: Numbers: An instance of Numbers.
+    ivar: _product_lists: ProductLists: An instance of ProductLists.
+    ivar: _products: Products: An instance of Products.
+    ivar: _websites: Websites: An instance of Websites.
+    """
+
+    def __init__(
+        self,
+        accounts: Accounts,
+        account_contracts: AccountContracts,
+        account_lists: AccountLists,
+        account_products: AccountProducts,
+        addresses: Addresses,
+        emails: Emails,
+        entities: Entities,
+        entity_accounts: EntityAccounts,
+        individuals: Individuals,
+        non_individuals: NonIndividuals,
+        numbers: Numbers,
+        product_lists: ProductLists,
+        products: Products,
+        websites: Websites,
+    ) -> None:
+        """
+        Initializes the OverviewsStms class.
+
+        :param accounts: Accounts: An instance of Accounts.
+        :param account_contracts: AccountContracts: An instance of AccountContracts.
+        :param account_lists: AccountLists: An instance of AccountLists.
+        :param account_products: AccountProducts: An instance of AccountProducts.
+        :param addresses: Addresses: An instance of Addresses.
+        :param emails: Emails: An instance of Emails.
+        :param entities: Entities: An instance of Entities.
+        :param entity_accounts: EntityAccounts: An instance of EntityAccounts.
+        :param individuals: Individuals: An instance of Individuals.
+        :param non_individuals: NonIndividuals: An instance of NonIndividuals.
+        :param numbers: Numbers: An instance of Numbers.
+        :param product_lists: ProductLists: An instance of ProductLists.
+        :param products: Products: An instance of Products.
+        :param websites: Websites: An instance of Websites.
+        :return None
+        """
+        self._accounts: Accounts = accounts
+        self._account_contracts: AccountContracts = account_contracts
+        self._account_lists: AccountLists = account_lists
+        self._account_products: AccountProducts = account_products
+        self._addresses: Addresses = addresses
+        self._emails: Emails = emails
+        self._entities: Entities = entities
+        self._entity_accounts: EntityAccounts = entity_accounts
+        self._individuals: Individuals = individuals
+        self._non_individuals: NonIndividuals = non_individuals
+        self._numbers: Numbers = numbers
+        self._product_lists: ProductLists = product_lists
+        self._products: Products = products
+        self._websites: Websites = websites
+
+    def get_account_overview(
+        self,
+        account_uuid: UUID4,
+        entities_limit: int,
+        addresses_limit: int,
+        contracts_limit: int,
+        lists_limit: int,
+        products_limit: int,
+    ) -> Select:
+        """
+        Selects an account with its entities, addresses, contracts, product lists and products.
+
+        Every section is returned as a `<section>` JSON array of at most its limit of records
+        and a `<section>_total` count.
+
+        :param account_uuid: UUID4: The UUID of the account.
+        :param entities_limit: int: The maximum number of entities returned.
+        :param addresses_limit: int: The maximum number of addresses returned.
+        :param contracts_limit: int: The maximum number of contracts returned.
+        :param lists_limit: int: The maximum number of product lists returned.
+        :param products_limit: int: The maximum number of products returned.
+        :return: Select: A Select statement.
+        """
+        accounts = self._accounts
+        account_contracts = self._account_contracts
+        account_lists = self._account_lists
+        account_products = self._account_products
+        addresses = self._addresses
+        entities = self._entities
+        entity_accounts = self._entity_accounts
+        individuals = self._individuals
+        non_individuals = self._non_individuals
+        product_lists = self._product_lists
+        products = self._products
+
+        sections = {
+            "entities": json_section(
+                rows=Select(
+                    entities.uuid.label("entity_uuid"),
+                    individuals.first_name,
+                    individuals.last_name,
+                    non_individuals.name.label("company_name"),
+                )
+                .select_from(entity_accounts)
+                .join(entities, entities.uuid == entity_accounts.entity_uuid)
+                .join(
+                    isouter=True,
+                    target=individuals,
+                    onclause=entities.uuid == individuals.entity_uuid,
+                )
+                .join(
+                    isouter=True,
+                    target=non_individuals,
+                    onclause=entities.uuid == non_individuals.entity_uuid,
+                )
+                .where(
+                    and_(
+                        entity_accounts.account_uuid == accounts.uuid,
+                        entity_accounts.sys_deleted_at == None,
+                        entities.sys_deleted_at == None,
+                    )
+                ),
+                parent=accounts,
+                key=entity_accounts.id,
+                limit=entities_limit,
+                name="entities",
+            ),
+            "addresses": json_section(
+                rows=Select(*addresses.__table__.c).where(
+                    and_(
+                        addresses.parent_uuid == accounts.uuid,
+                        addresses.parent_table == "accounts",
+                        addresses.sys_deleted_at == None,
+                    )
+                ),
+                parent=accounts,
+                key=addresses.id,
+                limit=addresses_limit,
+                name="addresses",
+            ),
+            "contracts": json_section(
+                rows=Select(*account_contracts.__table__.c).where(
+                    and_(
+                        account_contracts.account_uuid == accounts.uuid,
+                        account_contracts.sys_deleted_at == None,
+                    )
+                ),
+                parent=accounts,
+                key=account_contracts.id,
+                limit=contracts_limit,
+                name="contracts",
+            ),
+            "lists": json_section(
+                rows=Select(*product_lists.__table__.c)
+                .select_from(account_lists)
+                .join(
+                    product_lists,
+                    product_lists.uuid == account_lists.product_list_uuid,
+                )
+                .where(
+                    and_(
+                        account_lists.account_uuid == accounts.uuid,
+                        account_lists.sys_deleted_at == None,
+                        product_lists.sys_deleted_at == None,
+                    )
+                ),
+                parent=accounts,
+                key=account_lists.id,
+                limit=lists_limit,
+                name="lists",
+            ),
+            "products": json_section(
+                rows=Select(*products.__table__.c)
+                .select_from(account_products)
+                .join(products, products.uuid == account_products.product_uuid)
+                .where(
+                    and_(
+                        account_products.account_uuid == accounts.uuid,
+                        account_products.sys_deleted_at == None,
+                        products.sys_deleted_at == None,
+                    )
+                ),
+                parent=accounts,
+                key=account_products.id,
+                limit=products_limit,
+                name="products",
+            ),
+        }
+
+        return with_sections(
+            columns=[accounts], from_=accounts.__table__, sections=sections
+        ).where(and_(accounts.uuid == account_uuid, accounts.sys_deleted_at == None))
+
+    def get_entity_overview(
+        self,
+        entity_uuid: UUID4,
+        emails_limit: int,
+        numbers_limit: int,
+        websites_limit: int,
+        addresses_limit: int,
+        accounts_limit: int,
+    ) -> Select:
+        """
+        Selects an entity with its individual or non-individual, emails, numbers, websites, addresses and account links.
+
+        The individual and non-individual are outer joined as in `EntitiesStms.get_entities_by_uuids`,
+        every other section is returned as a `<section>` JSON array of at most its limit of records
+        and a `<section>_total` count.
+
+        :param entity_uuid: UUID4: The UUID of the entity.
+        :param emails_limit: int: The maximum number of emails returned.
+        :param numbers_limit: int: The maximum number of numbers returned.
+        :param websites_limit: int: The maximum number of websites returned.
+        :param addresses_limit: int: The maximum number of addresses returned.
+        :param accounts_limit: int: The maximum number of account links returned.
+        :return: Select: A Select statement.
+        """
+        addresses = self._addresses
+        emails = self._emails
+        entities = self._entities
+        entity_accounts = self._entity_accounts
+        individuals = self._individuals
+        non_individuals = self._non_individuals
+        numbers = self._numbers
+        websites = self._websites
+
+        sections = {
+            "emails": json_section(
+                rows=Select(*emails.__table__.c).where(
+                    and_(
+                        emails.entity_uuid == entities.uuid,
+                        emails.sys_deleted_at == None,
+                    )
+                ),
+                parent=entities,
+                key=emails.id,
+                limit=emails_limit,
+                name="emails",
+            ),
+            "numbers": json_section(
+                rows=Select(*numbers.__table__.c).where(
+                    and_(
+                        numbers.entity_uuid == entities.uuid,
+                        numbers.sys_deleted_at == None,
+                    )
+                ),
+                parent=entities,
+                key=numbers.id,
+                limit=numbers_limit,
+                name="numbers",
+            ),
+            "websites": json_section(
+                rows=Select(*websites.__table__.c).where(
+                    and_(
+                        websites.entity_uuid == entities.uuid,
+                        websites.sys_deleted_at == None,
+                    )
+                ),
+                parent=entities,
+                key=websites.id,
+                limit=websites_limit,
+                name="websites",
+            ),
+            "addresses": json_section(
+                rows=Select(*addresses.__table__.c).where(
+                    and_(
+                        addresses.parent_uuid == entities.uuid,
+                        addresses.parent_table == "entities",
+                        addresses.sys_deleted_at == None,
+                    )
+                ),
+                parent=entities,
+                key=addresses.id,
+                limit=addresses_limit,
+                name="addresses",
+            ),
+            "accounts": json_section(
+                rows=Select(*entity_accounts.__table__.c).where(
+                    and_(
+                        entity_accounts.entity_uuid == entities.uuid,
+                        entity_accounts.sys_deleted_at == None,
+                    )
+                ),
+                parent=entities,
+                key=entity_accounts.id,
+                limit=accounts_limit,
+                name="accounts",
+            ),
+        }
+
+        from_ = entities.__table__.outerjoin(
+            individuals.__table__,
+            and_(
+                entities.uuid == individuals.entity_uuid,
+                individuals.sys_deleted_at == None,
+            ),
+        ).outerjoin(
+            non_individuals.__table__,
+            and_(
+                entities.uuid == non_individuals.entity_uuid,
+                non_individuals.sys_deleted_at == None,
+            ),
+        )
+        return with_sections(
+            columns=[entities, individuals, non_individuals],
+            from_=from_,
+            sections=sections,
+        ).where(and_(entities.uuid == entity_uuid, entities.sys_deleted_at == None))
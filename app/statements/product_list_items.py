@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import UUID4
 from sqlalchemy import Select, Update, and_, func, update
 
 from ..models import ProductListItems
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class ProductListItemsStms:
@@ -44,7 +45,11 @@ class ProductListItemsStms:
         )
 
     def get_product_list_items(
-        self, product_list_uuid: UUID4, limit: int, offset: int
+        self,
+        product_list_uuid: UUID4,
+        limit: int,
+        offset: int,
+        after: Optional[int] = None,
     ) -> Select:
         """
         Selects product list items for a given product list UUID with pagination support.
@@ -52,19 +57,22 @@ class ProductListItemsStms:
         :param product_list_uuid: UUID4: The UUID of the product list.
         :param limit: int: The maximum number of records to return.
         :param offset: int: The number of records to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement for the product list items with pagination.
         """
         product_list_items = self._model
-        return (
-            Select(product_list_items)
-            .where(
-                and_(
-                    product_list_items.product_list_uuid == product_list_uuid,
-                    product_list_items.sys_deleted_at == None,
-                )
+        statement = Select(product_list_items).where(
+            and_(
+                product_list_items.product_list_uuid == product_list_uuid,
+                product_list_items.sys_deleted_at == None,
             )
-            .offset(offset=offset)
-            .limit(limit=limit)
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=product_list_items.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def get_product_list_items_ct(self, product_list_uuid: UUID4) -> Select:
@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import UUID4
 from sqlalchemy import Select, Update, and_, func, update
 
 from ..models.product_lists import ProductLists
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class ProductListsStms:
@@ -60,20 +61,23 @@ class ProductListsStms:
             )
         )
 
-    def get_product_lists(self, limit: int, offset: int):
+    def get_product_lists(self, limit: int, offset: int, after: Optional[int] = None):
         """
         Selects product lists with pagination support.
 
         :param limit: int: The maximum number of product lists to return.
         :param offset: int: The number of product lists to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement for product lists with pagination.
         """
         product_lists = self._model
-        return (
-            Select(product_lists)
-            .where(product_lists.sys_deleted_at == None)
-            .offset(offset=offset)
-            .limit(limit=limit)
+        statement = Select(product_lists).where(product_lists.sys_deleted_at == None)
+        return pagination.paginate(
+            statement=statement,
+            key=product_lists.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def get_product_lists_by_uuids(self, product_list_uuids: List[UUID4]):
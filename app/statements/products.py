@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import UUID4
 from sqlalchemy import Select, Update, and_, func, update
 
 from ..models.products import Products
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class ProductsStms:
@@ -57,20 +58,37 @@ class ProductsStms:
             and_(products.name == product_name, products.sys_deleted_at == None)
         )
 
-    def get_products(self, limit: int, offset: int) -> Select:
+    def get_products_by_names(self, product_names: List[str]) -> Select:
+        """
+        Selects the names of products matching any of the given names.
+
+        :param product_names: List[str]: The names of the products.
+        :return: Select: A Select statement for the matching product names.
+        """
+        products = self._model
+        return Select(products.name).where(
+            and_(products.name.in_(product_names), products.sys_deleted_at == None)
+        )
+
+    def get_products(
+        self, limit: int, offset: int, after: Optional[int] = None
+    ) -> Select:
         """
         Selects products with pagination support.
 
         :param limit: int: The maximum number of products to return.
         :param offset: int: The number of products to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement for products with pagination.
         """
         products = self._model
-        return (
-            Select(products)
-            .where(products.sys_deleted_at == None)
-            .offset(offset=offset)
-            .limit(limit=limit)
+        statement = Select(products).where(products.sys_deleted_at == None)
+        return pagination.paginate(
+            statement=statement,
+            key=products.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def get_products_by_uuids(self, product_uuids: List[UUID4]) -> Select:
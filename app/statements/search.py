@@ -0,0 +1,193 @@
+from typing import Optional, Tuple
+
+from sqlalchemy import ColumnElement, Select, and_, func, literal, union_all
+
+from ..models.entities import Entities
+from ..models.individuals import Individuals
+from ..models.non_individuals import NonIndividuals
+from ..models.products import Products
+from ..models.sys_base import search_text
+from ..utilities import pagination
+
+
+def matches(query: str, text: ColumnElement[str]) -> ColumnElement[bool]:
+    """
+    Filters on text containing a word similar to the query, served by a `search_index`.
+
+    :param query: str: The searched text.
+    :param text: ColumnElement[str]: The searchable text, see `search_text`.
+    :return: ColumnElement[bool]: True when the word similarity reaches `pg_trgm.word_similarity_threshold`.
+    """
+    return literal(query).op("<%", is_comparison=True)(text)
+
+
+def rank(query: str, text: ColumnElement[str]) -> ColumnElement[float]:
+    """
+    Ranks text by its greatest similarity with the query over any of its words.
+
+    :param query: str: The searched text.
+    :param text: ColumnElement[str]: The searchable text, see `search_text`.
+    :return: ColumnElement[float]: The word similarity, between 0 and 1.
+    """
+    return func.word_similarity(query, text)
+
+
+class SearchStms:
+    """
+    A class responsible for constructing SQLAlchemy queries searching records by partial text.
+
+    Searches match trigrams of the query against the text indexed by `search_index` and
+    return the best matches first, paged by `(rank, id)`.
+
+    ivars:
+    ivar: _entities: Entities: An instance of Entities.
+    ivar: _individuals: Individuals: An instance of Individuals.
+    ivar: _non_individuals: NonIndividuals: An instance of NonIndividuals.
+    ivar: _products: Products: An instance of Products.
+    """
+
+    def __init__(
+        self,
+        entities: Entities,
+        individuals: Individuals,
+        non_individuals: NonIndividuals,
+        products: Products,
+    ) -> None:
+        """
+        Initializes the SearchStms class.
+
+        :param entities: Entities: An instance of Entities.
+        :param individuals: Individuals: An instance of Individuals.
+        :param non_individuals: NonIndividuals: An instance of NonIndividuals.
+        :param products: Products: An instance of Products.
+        :return None
+        """
+        self._entities: Entities = entities
+        self._individuals: Individuals = individuals
+        self._non_individuals: NonIndividuals = non_individuals
+        self._products: Products = products
+
+    def search_entities(
+        self, query: str, limit: int, after: Optional[Tuple[float, int]] = None
+    ) -> Select:
+        """
+        Selects entities whose names or TIN match a query, best matches first.
+
+        Individuals are matched on their first and last name, non-individuals on their name
+        and legal name, and every entity on its TIN. An entity matched several times is
+        ranked by its best match.
+
+        :param query: str: The searched text.
+        :param limit: int: The maximum number of entities to return.
+        :param after: Optional[Tuple[float, int]]: The rank and id of the last entity of the previous page.
+        :return: Select: A Select statement for the matching entities with their names and `rank`.
+        """
+        entities = self._entities
+        individuals = self._individuals
+        non_individuals = self._non_individuals
+        individual_text = search_text(individuals)
+        non_individual_text = search_text(non_individuals)
+        entity_text = search_text(entities)
+        found = union_all(
+            Select(
+                individuals.entity_uuid.label("entity_uuid"),
+                rank(query=query, text=individual_text).label("rank"),
+            ).where(
+                and_(
+                    matches(query=query, text=individual_text),
+                    individuals.sys_deleted_at == None,
+                )
+            ),
+            Select(
+                non_individuals.entity_uuid.label("entity_uuid"),
+                rank(query=query, text=non_individual_text).label("rank"),
+            ).where(
+                and_(
+                    matches(query=query, text=non_individual_text),
+                    non_individuals.sys_deleted_at == None,
+                )
+            ),
+            Select(
+                entities.uuid.label("entity_uuid"),
+                rank(query=query, text=entity_text).label("rank"),
+            ).where(
+                and_(
+                    matches(query=query, text=entity_text),
+                    entities.sys_deleted_at == None,
+                )
+            ),
+        ).subquery("found")
+        ranked = (
+            Select(found.c.entity_uuid, func.max(found.c.rank).label("rank"))
+            .group_by(found.c.entity_uuid)
+            .subquery("ranked")
+        )
+        statement = Select(
+            entities.id,
+            entities.uuid.label("entity_uuid"),
+            entities.type,
+            entities.tin,
+            individuals.first_name,
+            individuals.last_name,
+            non_individuals.name.label("company_name"),
+            ranked.c.rank,
+        ).select_from(
+            ranked.join(
+                entities,
+                and_(
+                    entities.uuid == ranked.c.entity_uuid,
+                    entities.sys_deleted_at == None,
+                ),
+            )
+            .outerjoin(
+                individuals,
+                and_(
+                    individuals.entity_uuid == entities.uuid,
+                    individuals.sys_deleted_at == None,
+                ),
+            )
+            .outerjoin(
+                non_individuals,
+                and_(
+                    non_individuals.entity_uuid == entities.uuid,
+                    non_individuals.sys_deleted_at == None,
+                ),
+            )
+        )
+        return pagination.paginate_ranked(
+            statement=statement,
+            rank=ranked.c.rank,
+            key=entities.id,
+            limit=limit,
+            after=after,
+        )
+
+    def search_products(
+        self, query: str, limit: int, after: Optional[Tuple[float, int]] = None
+    ) -> Select:
+        """
+        Selects products whose name, code or description match a query, best matches first.
+
+        :param query: str: The searched text.
+        :param limit: int: The maximum number of products to return.
+        :param after: Optional[Tuple[float, int]]: The rank and id of the last product of the previous page.
+        :return: Select: A Select statement for the columns of the matching products and their `rank`.
+        """
+        products = self._products
+        product_text = search_text(products)
+        product_rank = rank(query=query, text=product_text)
+        statement = Select(
+            *products.__table__.columns, product_rank.label("rank")
+        ).where(
+            and_(
+                matches(query=query, text=product_text),
+                products.sys_deleted_at == None,
+            )
+        )
+        return pagination.paginate_ranked(
+            statement=statement,
+            rank=product_rank,
+            key=products.id,
+            limit=limit,
+            after=after,
+        )
@@ -1,9 +1,12 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, Update, and_, func, update, values
 
 from ..models.sys_users import SysUsers
 
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class SysUsersStms:
@@ -80,20 +83,25 @@ class SysUsersStms:
             )
         )
 
-    def get_sys_users(self, limit: int, offset: int) -> Select:
+    def get_sys_users(
+        self, limit: int, offset: int, after: Optional[int] = None
+    ) -> Select:
         """
         Selects system users with pagination support.
 
         :param limit: int: The maximum number of system users to return.
         :param offset: int: The number of system users to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :return: Select: A Select statement for system users with pagination.
         """
         sys_users = self._model
-        return (
-            Select(sys_users)
-            .where(sys_users.sys_deleted_at == None)
-            .offset(offset=offset)
-            .limit(limit=limit)
+        statement = Select(sys_users).where(sys_users.sys_deleted_at == None)
+        return pagination.paginate(
+            statement=statement,
+            key=sys_users.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def get_sys_users_ct(self) -> Select:
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import UUID4
 from sqlalchemy import Select, Update, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -5,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.websites import Websites
 
 from ..utilities.data import set_empty_strs_null
+from ..utilities import pagination
 
 
 class WebsitesStms:
@@ -54,26 +57,31 @@ class WebsitesStms:
             )
         )
 
-    def get_websites(self, entity_uuid: UUID4, offset: int, limit: int) -> Select:
+    def get_websites(
+        self, entity_uuid: UUID4, offset: int, limit: int, after: Optional[int] = None
+    ) -> Select:
         """
         Selects websites associated with the given entity UUID, with pagination support.
 
         :param entity_uuid: UUID4: The UUID of the entity to filter websites by.
         :param offset: int: The number of websites to skip.
+        :param after: Optional[int]: The id of the last record of the previous page, replaces offset when provided.
         :param limit: int: The maximum number of websites to return.
         :return: Select: A Select statement for websites with the specified entity UUID and pagination.
         """
         websites = self._model
-        return (
-            Select(websites)
-            .where(
-                and_(
-                    websites.entity_uuid == entity_uuid,
-                    websites.sys_deleted_at == None,
-                )
+        statement = Select(websites).where(
+            and_(
+                websites.entity_uuid == entity_uuid,
+                websites.sys_deleted_at == None,
             )
-            .offset(offset=offset)
-            .limit(limit=limit)
+        )
+        return pagination.paginate(
+            statement=statement,
+            key=websites.id,
+            limit=limit,
+            offset=offset,
+            after=after,
         )
 
     def get_websites_ct(self, entity_uuid: UUID4) -> Select:
@@ -0,0 +1,55 @@
+"""
+Normalized fingerprints of addresses.
+
+Two addresses written differently, `12 North Main Street, Suite 4` and
+`12 n. main st ste #4`, describe the same place. Their fingerprint folds case,
+punctuation, whitespace and the common street words into one form, so a duplicate
+check is a single probe of the `(parent_uuid, fingerprint)` unique index instead of a
+comparison of raw strings.
+"""
+
+import hashlib
+import re
+from typing import Optional
+
+from ..constants import constants as cnst
+
+_NON_ALPHANUMERIC = re.compile(r"[^0-9a-z]+")
+_NON_DIGIT = re.compile(r"[^0-9]+")
+
+
+def normalize_address_part(value: Optional[str]) -> str:
+    """
+    Normalizes one part of an address for comparison.
+
+    :param value: Optional[str]: the address line or city to normalize
+    :return: str: the lowercase words of the value, punctuation dropped and street words abbreviated
+    """
+    if not value:
+        return ""
+    words = _NON_ALPHANUMERIC.sub(" ", value.lower()).split()
+    return " ".join(cnst.ADDRESS_ABBREVIATIONS.get(word, word) for word in words)
+
+
+def address_fingerprint(
+    address_line1: Optional[str],
+    address_line2: Optional[str],
+    city: Optional[str],
+    zip: Optional[str],
+) -> str:
+    """
+    Computes the fingerprint of an address from its lines, city and ZIP code.
+
+    :param address_line1: Optional[str]: the first line of the address
+    :param address_line2: Optional[str]: the second line of the address
+    :param city: Optional[str]: the city of the address
+    :param zip: Optional[str]: the 5-digit ZIP code of the address
+    :return: str: the hex SHA-256 digest of the normalized parts
+    """
+    parts = (
+        normalize_address_part(value=address_line1),
+        normalize_address_part(value=address_line2),
+        normalize_address_part(value=city),
+        _NON_DIGIT.sub("", zip or "")[:5],
+    )
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
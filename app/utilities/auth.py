@@ -2,14 +2,27 @@
 Auth utilities for session validation and creation, assisting with dependency injection.
 """
 
-from typing import Callable, Tuple
-from fastapi import Depends, Cookie
+import ipaddress
+import time
+from typing import Callable, Optional, Tuple
+from fastapi import Depends, Cookie, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import settings as set
+
+from ..constants import constants as cnst
 from ..containers.auth import container as auth_container
-from ..database.database import get_db
+from ..database.database import get_db, primary_read_session
+from ..exceptions import MetricsClientNotAllowed
 from ..services.token import TokenSrvc
 from ..models.sys_users import SysUsers
+from ..utilities.timing import add_timing, get_timing
+
+metrics_networks = [
+    ipaddress.ip_network(network.strip())
+    for network in set.metrics_allowed_networks.split(",")
+    if network.strip()
+]
 
 
 async def get_validated_session(
@@ -21,7 +34,59 @@ async def get_validated_session(
     a `SysUsers` object and a string representing the session status.
 
     :return: Callable[[], Tuple[SysUsers, str]]: A function that validates the session and returns a tuple
-            consisting of a `SysUsers` object and a session status string.
+            consisting of a `SysUsers` object and a refreshed token, None while the current token is fresh.
+    """
+    return await _validate_session(db=db, jwt=jwt)
+
+
+async def get_short_validated_session(
+    jwt: str = Cookie(...),
+) -> Tuple[SysUsers, Optional[str]]:
+    """
+    Validates a session in a short read-only session of its own, closed before the path operation runs.
+
+    For path operations that run long without the request unit of work, such as imports
+    reading their upload as it arrives, so no pooled connection is held for their duration.
+
+    :return: Tuple[SysUsers, Optional[str]]: The `SysUsers` object and a refreshed token, None while
+            the current token is fresh.
     """
+    async with primary_read_session() as db:
+        return await _validate_session(db=db, jwt=jwt)
+
+
+async def _validate_session(
+    db: AsyncSession, jwt: str
+) -> Tuple[SysUsers, Optional[str]]:
     token_srvc: TokenSrvc = auth_container["token_srvc"]()
-    return await token_srvc.validate_session(db=db, jwt=jwt)
+    db_start = get_timing(phase=cnst.TIMING_DB)
+    start = time.perf_counter()
+    try:
+        return await token_srvc.validate_session(db=db, jwt=jwt)
+    finally:
+        # The session lookup is already counted under the database phase.
+        db_ms = get_timing(phase=cnst.TIMING_DB) - db_start
+        add_timing(
+            phase=cnst.TIMING_AUTH,
+            elapsed_ms=(time.perf_counter() - start) * 1000 - db_ms,
+        )
+
+
+def require_metrics_client(request: Request) -> None:
+    """
+    Lets only clients of the networks set in `METRICS_ALLOWED_NETWORKS` read the metrics.
+
+    The metrics carry no record data but expose route, cache and pool activity, they are
+    meant for the scraper on the private network rather than for users. Behind a proxy
+    the client is the proxy unless it forwards the client address to the server.
+
+    :param request: The request, with the address of its client.
+    :type request: Request
+    :raises MetricsClientNotAllowed: If the client is outside of the allowed networks.
+    """
+    try:
+        address = ipaddress.ip_address(request.client.host)
+    except (AttributeError, ValueError):
+        raise MetricsClientNotAllowed()
+    if not any(address in network for network in metrics_networks):
+        raise MetricsClientNotAllowed()
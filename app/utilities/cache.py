@@ -0,0 +1,154 @@
+"""
+Cache utilities for keeping small, short-lived results in process memory.
+
+The cache is bounded in both size (least recently used entries are evicted first)
+and age (entries expire after a time to live), and counts hits and misses so the
+effectiveness can be reported.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    A bounded least-recently-used cache whose entries expire after a time to live.
+
+    The cache is not thread safe, it is intended to be used from the event loop.
+
+    ivars:
+        ivar: maxsize: The maximum number of entries kept.
+        varType: int
+        ivar: ttl: The number of seconds an entry is valid for.
+        varType: float
+        ivar: hits: The number of lookups served from the cache.
+        varType: int
+        ivar: misses: The number of lookups that were absent or expired.
+        varType: int
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the cached value for a key, or None if it is absent or expired.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :return: The cached value.
+        :rtype: Optional[Any]
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entry when the cache is full.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param value: The value to cache.
+        :type value: Any
+        """
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Removes a single entry from the cache.
+
+        :param key: The cache key.
+        :type key: Hashable
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Builds a snapshot of the cache size and hit and miss counters.
+
+        :return: A dictionary of cache gauges and counters.
+        :rtype: Dict[str, int]
+        """
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class VersionedCache(TTLCache):
+    """
+    A TTLCache whose entries are all retired at once by bumping its version.
+
+    Entries are stored under the version current when their value was read, and only
+    entries of the current version are returned, so a value read while the version was
+    bumped is never served.
+
+    ivars:
+        ivar: version: The current version, bumped whenever the cached data changes.
+        varType: int
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.version: int = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the cached value of the current version for a key.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :return: The cached value.
+        :rtype: Optional[Any]
+        """
+        return super().get(key=(self.version, key))
+
+    def set(self, key: Hashable, value: Any, version: Optional[int] = None) -> None:
+        """
+        Stores a value under the version it was read at.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param value: The value to cache.
+        :type value: Any
+        :param version: The version current when the value was read, defaults to the current one.
+        :type version: Optional[int]
+        """
+        version = self.version if version is None else version
+        if version == self.version:
+            super().set(key=(version, key), value=value)
+
+    def bump(self) -> None:
+        """
+        Retires every entry by moving to the next version.
+        """
+        self.version += 1
+        self.clear()
@@ -0,0 +1,99 @@
+"""
+Versioned in-process cache of the catalog reads, products, product lists and their items.
+
+The catalog changes a few times a day but is read on almost every order screen. Reads
+of the catalog endpoints are cached as encoded bodies with their ETag, and every write
+of the catalog bumps the version of the cache, which retires them all at once.
+
+The cache lives in each worker, a worker that did not serve a write keeps its entries
+until they expire after `CATALOG_CACHE_TTL` seconds. Misses are read from the primary,
+a replica that did not apply the write yet would otherwise be cached under the new
+version.
+"""
+
+from typing import Any, Awaitable, Callable, Type
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings as set
+
+from ..constants import constants as cnst
+from ..database.database import primary_read_session
+from .cache import VersionedCache
+from .conditional import (
+    body_etag,
+    copy_cookies,
+    etag_matches,
+    not_modified,
+    validator_headers,
+)
+
+catalog_cache = VersionedCache(
+    maxsize=set.catalog_cache_size, ttl=set.catalog_cache_ttl
+)
+
+
+def bump_catalog_version(db: AsyncSession) -> None:
+    """
+    Retires the cached catalog reads after a write of the catalog.
+
+    The version is bumped right away, and again once the transaction of the write
+    commits, so reads that ran in between and still saw the previous catalog are
+    retired too.
+
+    :param db: The session of the write.
+    :type db: AsyncSession
+    """
+    catalog_cache.bump()
+    event.listen(
+        db.sync_session, "after_commit", lambda session: catalog_cache.bump(), once=True
+    )
+
+
+async def catalog_response(
+    request: Request,
+    response: Response,
+    schema: Type[BaseModel],
+    read: Callable[[AsyncSession], Awaitable[Any]],
+) -> Response:
+    """
+    Answers a catalog read from the cache, reading the catalog only on a miss.
+
+    A cached read answers `If-None-Match` with a `304`, or sends the cached body, without
+    touching the database. A miss runs the read in a read-only transaction of the primary,
+    encodes the result with the response schema and caches it under the version current
+    when the read started.
+
+    :param request: The request, its path and query are the cache key.
+    :type request: Request
+    :param response: The response injected in the path operation, for its cookies.
+    :type response: Response
+    :param schema: The response schema of the path operation.
+    :type schema: Type[BaseModel]
+    :param read: Reads the catalog with the session it is given, it is awaited on a miss only.
+    :type read: Callable[[AsyncSession], Awaitable[Any]]
+    :return: The answer, `200` with the body or `304` without.
+    :rtype: Response
+    """
+    key = (request.url.path, request.url.query)
+    cached = catalog_cache.get(key=key)
+    if cached is None:
+        version = catalog_cache.version
+        async with primary_read_session() as db:
+            result = await read(db)
+            body = schema.model_validate(result, from_attributes=True).model_dump_json()
+        cached = (body_etag(body=body.encode()), body)
+        catalog_cache.set(key=key, value=cached, version=version)
+    etag, body = cached
+    headers = validator_headers(etag=etag)
+    if etag_matches(
+        if_none_match=request.headers.get(cnst.IF_NONE_MATCH_HEADER), etag=etag
+    ):
+        return not_modified(response=response, headers=headers)
+    return copy_cookies(
+        source=response,
+        target=Response(content=body, media_type="application/json", headers=headers),
+    )
@@ -0,0 +1,233 @@
+"""
+Conditional GET helpers, validators of representations and `304 Not Modified` answers.
+
+A client repeating a GET sends back the validator it was given, `If-None-Match` for an
+ETag and `If-Modified-Since` for a last modification time. When the representation did
+not change, the answer is an empty `304` and the client reuses the body it has.
+"""
+
+import hashlib
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..constants import constants as cnst
+from ..database.database import transaction_manager
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def body_etag(body: bytes) -> str:
+    """
+    Builds a strong ETag from the bytes of a representation.
+
+    The tag only depends on the content, so every worker gives the same tag for the
+    same body.
+
+    :param body: The encoded representation.
+    :type body: bytes
+    :return: The quoted ETag.
+    :rtype: str
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Tells whether an `If-None-Match` header matches an ETag.
+
+    The comparison is weak, as required for `If-None-Match`, the `W/` prefix of either
+    tag is ignored and `*` matches any tag.
+
+    :param if_none_match: The value of the `If-None-Match` header.
+    :type if_none_match: Optional[str]
+    :param etag: The ETag of the current representation.
+    :type etag: str
+    :return: Whether the client has the current representation.
+    :rtype: bool
+    """
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def version_etag(version: datetime) -> str:
+    """
+    Builds a weak ETag from the version of a record, the time it was last written.
+
+    :param version: The version of the record, see `record_version`.
+    :type version: datetime
+    :return: The weak ETag.
+    :rtype: str
+    """
+    return f'W/"{(version - EPOCH) // timedelta(microseconds=1):x}"'
+
+
+def not_modified_since(if_modified_since: Optional[str], version: datetime) -> bool:
+    """
+    Tells whether a record was not written after the time of an `If-Modified-Since` header.
+
+    HTTP dates have a precision of a second, the version is truncated to compare them.
+    An invalid date is ignored.
+
+    :param if_modified_since: The value of the `If-Modified-Since` header.
+    :type if_modified_since: Optional[str]
+    :param version: The version of the record.
+    :type version: datetime
+    :return: Whether the client has the current representation.
+    :rtype: bool
+    """
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return version.replace(microsecond=0) <= since
+
+
+def copy_cookies(source: Response, target: Response) -> Response:
+    """
+    Carries the cookies set on the response of a path operation over to the returned one.
+
+    FastAPI only merges the headers of the injected response when the operation returns
+    data, a refreshed token would be lost otherwise.
+
+    :param source: The response injected in the path operation.
+    :type source: Response
+    :param target: The response returned by the path operation.
+    :type target: Response
+    :return: The returned response.
+    :rtype: Response
+    """
+    target.raw_headers.extend(
+        header for header in source.raw_headers if header[0] == b"set-cookie"
+    )
+    return target
+
+
+def not_modified(response: Response, headers: Dict[str, str]) -> Response:
+    """
+    Builds a `304 Not Modified` answer without a body.
+
+    :param response: The response injected in the path operation, for its cookies.
+    :type response: Response
+    :param headers: The validators and caching headers of the representation.
+    :type headers: Dict[str, str]
+    :return: The empty answer.
+    :rtype: Response
+    """
+    return copy_cookies(
+        source=response,
+        target=Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers),
+    )
+
+
+def validator_headers(
+    etag: str, last_modified: Optional[datetime] = None
+) -> Dict[str, str]:
+    """
+    Builds the headers sent with a representation that clients revalidate.
+
+    `Cache-Control: private, no-cache` lets the client keep the body but makes it ask
+    before every reuse, the answer being a `304` while it is current.
+
+    :param etag: The ETag of the representation.
+    :type etag: str
+    :param last_modified: The time the representation last changed, when known.
+    :type last_modified: Optional[datetime]
+    :return: The headers.
+    :rtype: Dict[str, str]
+    """
+    headers = {
+        cnst.ETAG_HEADER: etag,
+        cnst.CACHE_CONTROL_HEADER: cnst.CACHE_CONTROL_REVALIDATE,
+    }
+    if last_modified is not None:
+        headers[cnst.LAST_MODIFIED_HEADER] = format_datetime(
+            last_modified.astimezone(UTC), usegmt=True
+        )
+    return headers
+
+
+def is_fresh(request: Request, version: datetime) -> bool:
+    """
+    Tells whether the client sending a request has the current version of a record.
+
+    `If-None-Match` is evaluated when it is sent, `If-Modified-Since` otherwise.
+
+    :param request: The request, with its conditional headers.
+    :type request: Request
+    :param version: The version of the record.
+    :type version: datetime
+    :return: Whether the answer is a `304`.
+    :rtype: bool
+    """
+    if_none_match = request.headers.get(cnst.IF_NONE_MATCH_HEADER)
+    if if_none_match:
+        return etag_matches(
+            if_none_match=if_none_match, etag=version_etag(version=version)
+        )
+    return not_modified_since(
+        if_modified_since=request.headers.get(cnst.IF_MODIFIED_SINCE_HEADER),
+        version=version,
+    )
+
+
+async def record_response(
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    probe: Callable[[], Awaitable[Optional[datetime]]],
+    read: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    Answers the read of a single record, with a `304` while the client has its version.
+
+    A conditional request first runs the probe, which reads the version of the record
+    alone, and only reads the record when it changed or does not exist. The record is
+    returned with a weak ETag and `Last-Modified` derived from its version, set on the
+    response of the path operation.
+
+    :param request: The request, with its conditional headers.
+    :type request: Request
+    :param response: The response injected in the path operation.
+    :type response: Response
+    :param db: The database session of the read.
+    :type db: AsyncSession
+    :param probe: Reads the version of the record, `None` if it does not exist.
+    :type probe: Callable[[], Awaitable[Optional[datetime]]]
+    :param read: Reads the record, raising if it does not exist.
+    :type read: Callable[[], Awaitable[Any]]
+    :return: The record, or an empty `304` answer.
+    :rtype: Any
+    """
+    conditional = request.headers.get(cnst.IF_NONE_MATCH_HEADER) or request.headers.get(
+        cnst.IF_MODIFIED_SINCE_HEADER
+    )
+    async with transaction_manager(db=db):
+        if conditional:
+            version = await probe()
+            if version is not None and is_fresh(request=request, version=version):
+                return not_modified(
+                    response=response,
+                    headers=validator_headers(
+                        etag=version_etag(version=version), last_modified=version
+                    ),
+                )
+        record = await read()
+    version = record.sys_updated_at or record.sys_created_at
+    response.headers.update(
+        validator_headers(etag=version_etag(version=version), last_modified=version)
+    )
+    return record
@@ -10,6 +10,7 @@ These utilities assist with:
 from typing import Callable, List, Optional, TypeVar
 
 from pydantic import UUID4, BaseModel
+from sqlalchemy.exc import IntegrityError
 from .types import Schema
 from .logger import logger
 
@@ -65,6 +66,19 @@ def record_exists(instance: object, exception: Exception) -> bool:
     return instance
 
 
+def violates_index(error: IntegrityError, index: str) -> bool:
+    """
+    Checks if an integrity error was raised by a unique index.
+
+    The driver error carries the name of the violated constraint or index.
+
+    :param error: The integrity error raised by a statement.
+    :param index: The name of the unique index.
+    :return: bool: Returns True if the statement violated the index.
+    """
+    return getattr(error.orig.__cause__, "constraint_name", None) == index
+
+
 def record_not_exist(instance: object, exception: Exception) -> bool:
     """
     Checks if a record does not exist and raises the provided exception if it doesn't.
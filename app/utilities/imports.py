@@ -0,0 +1,235 @@
+"""
+Streaming imports of NDJSON or CSV uploads.
+
+The upload is parsed as it arrives, validated with the create schema of the records and
+written in batches of `IMPORT_BATCH_SIZE` rows, each batch in a transaction of its own.
+Memory use depends on the batch size and `IMPORT_MAX_LINE_LENGTH`, not on the size of the
+upload. Rows that cannot be parsed, validated or written are reported with their position
+instead of failing the whole import.
+"""
+
+import csv
+import json
+import zlib
+from codecs import getincrementaldecoder
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from config import settings as set
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..constants import messages as msg
+from ..constants.enums import DataFormat
+from ..database.database import batch_session
+from ..schemas.imports import ImportRes, ImportRowError
+from .logger import logger
+
+# Writes a batch of validated records and returns the positions of the skipped ones.
+BatchWriter = Callable[[List[BaseModel], AsyncSession], Awaitable[List[int]]]
+
+
+async def _lines(
+    stream: AsyncIterator[bytes], compressed: bool
+) -> AsyncIterator[Optional[str]]:
+    """
+    Splits an upload into lines as it arrives.
+
+    A line longer than `IMPORT_MAX_LINE_LENGTH` is not buffered, it is dropped up to the
+    next line ending and None is yielded in its place.
+
+    :param stream: The chunks of the upload.
+    :type stream: AsyncIterator[bytes]
+    :param compressed: Whether the upload is gzip compressed.
+    :type compressed: bool
+    :return: The lines, without line endings, None for a line over the limit.
+    :rtype: AsyncIterator[Optional[str]]
+    """
+    decompressor = zlib.decompressobj(wbits=31) if compressed else None
+    decoder = getincrementaldecoder("utf-8-sig")()
+    pending, overlong = "", False
+    async for chunk in stream:
+        if decompressor:
+            chunk = decompressor.decompress(chunk)
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            if overlong or len(line) > set.import_max_line_length:
+                # The end of a line whose start was dropped, or a line over the limit.
+                overlong = False
+                yield None
+            else:
+                yield line.rstrip("\r")
+        if len(pending) > set.import_max_line_length:
+            pending, overlong = "", True
+    if decompressor:
+        pending += decoder.decode(decompressor.flush())
+    pending += decoder.decode(b"", final=True)
+    if overlong or len(pending) > set.import_max_line_length:
+        yield None
+    elif pending:
+        yield pending.rstrip("\r")
+
+
+async def _ndjson_rows(
+    lines: AsyncIterator[Optional[str]],
+) -> AsyncIterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    row = 0
+    async for line in lines:
+        if line is None:
+            row += 1
+            yield row, None
+            continue
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            values = json.loads(line)
+        except ValueError:
+            values = None
+        yield row, values if isinstance(values, dict) else None
+
+
+async def _csv_rows(
+    lines: AsyncIterator[Optional[str]],
+) -> AsyncIterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    row, header = 0, None
+    record, length, quotes, overlong = [], 0, 0, False
+    async for line in lines:
+        if line is None:
+            # The quotes of a dropped line are unknown, its record ends with it.
+            row += 1
+            yield row, None
+            record, length, quotes, overlong = [], 0, 0, False
+            continue
+        # A quoted field may span lines, a record is complete once its quotes are balanced.
+        length += len(line)
+        overlong = overlong or length > set.import_max_line_length
+        if overlong:
+            record.clear()
+        else:
+            record.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        text = "\n".join(record)
+        record, length, quotes = [], 0, 0
+        if overlong:
+            overlong = False
+            row += 1
+            yield row, None
+            continue
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = values
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield row, None
+            continue
+        # Empty cells are missing values, so optional fields fall back to their defaults.
+        yield row, {key: value for key, value in zip(header, values) if value != ""}
+    if record or overlong:
+        yield row + 1, None
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+async def import_records(
+    stream: AsyncIterator[bytes],
+    format: DataFormat,
+    compressed: bool,
+    schema: Type[BaseModel],
+    values: Dict[str, Any],
+    write: BatchWriter,
+    exists_message: str,
+) -> ImportRes:
+    """
+    Imports the records of an upload in bounded batches.
+
+    Every row is validated with `schema`, after `values` are set on it, typically the
+    system fields and the parent of the records. A batch failing on a constraint or a
+    value is retried row by row, so only the offending rows are rejected. Other database
+    errors end the import, the batches written before are kept.
+
+    :param stream: The chunks of the upload.
+    :type stream: AsyncIterator[bytes]
+    :param format: The upload format.
+    :type format: DataFormat
+    :param compressed: Whether the upload is gzip compressed.
+    :type compressed: bool
+    :param schema: The create schema of the records.
+    :type schema: Type[BaseModel]
+    :param values: Values set on every row, they take precedence over the upload.
+    :type values: Dict[str, Any]
+    :param write: Writes a batch of records and returns the positions of skipped ones.
+    :type write: BatchWriter
+    :param exists_message: The error reported for records skipped because they exist.
+    :type exists_message: str
+    :return: The import report.
+    :rtype: ImportRes
+    """
+    report = ImportRes(
+        rows=0, imported=0, rejected=0, errors=[], errors_truncated=False
+    )
+    batch: List[Tuple[int, BaseModel]] = []
+
+    def reject(row: int, message: str) -> None:
+        report.rejected += 1
+        if len(report.errors) < set.import_max_errors:
+            report.errors.append(ImportRowError(row=row, message=message))
+        else:
+            report.errors_truncated = True
+
+    async def write_batch(records: List[Tuple[int, BaseModel]]) -> None:
+        try:
+            async with batch_session() as db:
+                skipped = await write([record for _, record in records], db)
+        except (DataError, IntegrityError) as e:
+            if len(records) == 1:
+                logger.warning("Import row %d rejected: %s", records[0][0], e.orig)
+                reject(row=records[0][0], message=msg.IMPORT_ROW_NOT_WRITTEN)
+                return
+            for record in records:
+                await write_batch(records=[record])
+            return
+        for position in skipped:
+            reject(row=records[position][0], message=exists_message)
+        report.imported += len(records) - len(skipped)
+
+    lines = _lines(stream=stream, compressed=compressed)
+    rows = _csv_rows(lines) if format == DataFormat.CSV else _ndjson_rows(lines)
+    async for row, data in rows:
+        report.rows = row
+        if data is None:
+            reject(row=row, message=msg.IMPORT_ROW_MALFORMED)
+            continue
+        try:
+            batch.append((row, schema.model_validate({**data, **values})))
+        except ValidationError as e:
+            reject(row=row, message=_validation_message(error=e))
+        if len(batch) >= set.import_batch_size:
+            await write_batch(records=batch)
+            batch = []
+    if batch:
+        await write_batch(records=batch)
+    # Rows skipped or rejected when written are reported after rows rejected when read.
+    report.errors.sort(key=lambda error: error.row)
+    return report
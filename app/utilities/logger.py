@@ -1,8 +1,31 @@
+"""
+Application logging.
+
+Records are handed to a queue on the calling thread and written by a background
+listener thread, so log I/O never blocks the event loop.
+"""
+
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt="'%Y-%m-%d %H:%M:%S",
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(
+    logging.Formatter(
+        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="'%Y-%m-%d %H:%M:%S",
+    )
 )
+
+_log_queue: SimpleQueue = SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+# The message is rendered once when queued, the listener adds the time, name and level.
+_queue_handler.setFormatter(logging.Formatter(fmt="%(message)s"))
+
+listener = QueueListener(_log_queue, _stream_handler, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
@@ -0,0 +1,51 @@
+"""
+Normalization of the values looked up by email, phone number or domain.
+
+Each function returns the value in the form of the `lookup_key` of the matching model,
+so a lookup is an equality on the expression its `lookup_index` is built on.
+"""
+
+import re
+from typing import Optional
+
+from ..constants import constants as cnst
+
+_DOMAIN = re.compile(cnst.LOOKUP_DOMAIN_PATTERN)
+_NON_DIGIT = re.compile(r"[^0-9]+")
+
+
+def email_key(value: str) -> Optional[str]:
+    """
+    Normalizes an email address like `Emails.lookup_key`.
+
+    :param value: str: the email address
+    :return: Optional[str]: the lower-cased address, None when it is empty
+    """
+    return value.strip().lower() or None
+
+
+def phone_key(value: str) -> Optional[str]:
+    """
+    Normalizes a phone number like `Numbers.lookup_key`.
+
+    Formatting characters and the leading `+` are dropped, a 10-digit number is taken as
+    North American and prefixed with its country code.
+
+    :param value: str: the phone number, e.g. `+1 (555) 010-0199`
+    :return: Optional[str]: the E.164 digits, None when there are none
+    """
+    digits = _NON_DIGIT.sub("", value)
+    if len(digits) == 10:
+        return cnst.LOOKUP_COUNTRY_CODE + digits
+    return digits or None
+
+
+def domain_key(value: str) -> Optional[str]:
+    """
+    Normalizes a domain or URL like `Websites.lookup_key`.
+
+    :param value: str: the domain or URL, e.g. `https://www.Example.com/about`
+    :return: Optional[str]: the lower-cased host without `www.`, None when there is none
+    """
+    match = _DOMAIN.match(value.strip().lower())
+    return match.group(1) if match else None
@@ -1,8 +1,28 @@
 """
 Pagination utilities for handling pagination logic, including calculating offsets 
 and determining if there are more items to display based on total count, page number, and limit.
+
+Keyset pagination is supported alongside page/limit through an opaque cursor that encodes the
+`id` of the last row on a page, so every page costs the same regardless of depth.
+
+The strategy used to compute the `total` of a page is selected by the caller, see
+`Operations.return_page`.
+
+Ranked results, such as searches, are paged by `(rank, id)` with a cursor encoding both.
 """
 
+import base64
+import binascii
+import json
+from typing import Any, List, Optional, Tuple
+
+from fastapi import Query
+from sqlalchemy import ColumnElement, Select, and_, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from ..constants.enums import CountStrategy
+from ..exceptions import InvalidCursor
+
 
 def page_offset(page: int, limit: int) -> int:
     """
@@ -25,3 +45,194 @@ def has_more_items(total_count: int, page: int, limit: int) -> bool:
     :return: bool: True if there are more items to be displayed
     """
     return total_count > (page * limit)
+
+
+def paginate(
+    statement: Select,
+    key: InstrumentedAttribute,
+    limit: int,
+    offset: int,
+    after: Optional[int] = None,
+) -> Select:
+    """
+    Utility function to apply a stable order and a page window to a statement.
+
+    When `after` is provided the window starts after that key (keyset pagination),
+    otherwise the offset is used.
+
+    :param statement: Select: the filtered statement to paginate
+    :param key: InstrumentedAttribute: unique, ordered column to page by, typically `id`
+    :param limit: int: number of items to return
+    :param offset: int: number of items to skip, ignored when `after` is provided
+    :param after: Optional[int]: key of the last item of the previous page
+    :return: Select: the paginated statement
+    """
+    statement = statement.order_by(key)
+    if after is not None:
+        return statement.where(key > after).limit(limit=limit)
+    return statement.offset(offset=offset).limit(limit=limit)
+
+
+def paginate_ranked(
+    statement: Select,
+    rank: ColumnElement,
+    key: InstrumentedAttribute,
+    limit: int,
+    after: Optional[Tuple[float, int]] = None,
+) -> Select:
+    """
+    Utility function to order a statement by descending rank and apply a keyset window.
+
+    Rows of equal rank are ordered by `key`, so the order is stable across pages.
+
+    :param statement: Select: the filtered statement to paginate
+    :param rank: ColumnElement: the rank of a row, higher first
+    :param key: InstrumentedAttribute: unique column breaking ties, typically `id`
+    :param limit: int: number of items to return
+    :param after: Optional[Tuple[float, int]]: rank and key of the last item of the previous page
+    :return: Select: the paginated statement
+    """
+    statement = statement.order_by(rank.desc(), key)
+    if after is not None:
+        after_rank, after_key = after
+        statement = statement.where(
+            or_(rank < after_rank, and_(rank == after_rank, key > after_key))
+        )
+    return statement.limit(limit=limit)
+
+
+def encode_cursor(key: int, rank: Optional[float] = None) -> str:
+    """
+    Utility function to encode a page key into an opaque cursor.
+
+    :param key: int: key of the last item on the page
+    :param rank: Optional[float]: rank of the last item on the page, for ranked results
+    :return: str: url-safe cursor
+    """
+    values = {"id": key} if rank is None else {"id": key, "rank": rank}
+    payload = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _cursor_values(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError):
+        raise InvalidCursor()
+    if not isinstance(values, dict) or not isinstance(values.get("id"), int):
+        raise InvalidCursor()
+    return values
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Utility function to decode an opaque cursor into a page key.
+
+    :param cursor: Optional[str]: cursor returned as `next_cursor` by a previous page
+    :raises InvalidCursor: If the cursor was not produced by `encode_cursor`.
+    :return: Optional[int]: key of the last item of the previous page, None without a cursor
+    """
+    if not cursor:
+        return None
+    return _cursor_values(cursor=cursor)["id"]
+
+
+def decode_ranked_cursor(cursor: Optional[str]) -> Optional[Tuple[float, int]]:
+    """
+    Utility function to decode an opaque cursor of ranked results into a rank and a page key.
+
+    :param cursor: Optional[str]: cursor returned as `next_cursor` by a previous page
+    :raises InvalidCursor: If the cursor was not produced by `encode_cursor` with a rank.
+    :return: Optional[Tuple[float, int]]: rank and key of the last item of the previous page, None without a cursor
+    """
+    if not cursor:
+        return None
+    values = _cursor_values(cursor=cursor)
+    rank = values.get("rank")
+    if isinstance(rank, bool) or not isinstance(rank, (int, float)):
+        raise InvalidCursor()
+    return float(rank), values["id"]
+
+
+def get_cursor(
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from `next_cursor`, replaces `page` when set."
+    )
+) -> Optional[int]:
+    """
+    Dependency that reads the `cursor` query parameter and returns the decoded page key.
+
+    :param cursor: Optional[str]: cursor returned as `next_cursor` by a previous page
+    :return: Optional[int]: key of the last item of the previous page
+    """
+    return decode_cursor(cursor=cursor)
+
+
+def get_ranked_cursor(
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from `next_cursor` of the previous page."
+    )
+) -> Optional[Tuple[float, int]]:
+    """
+    Dependency that reads the `cursor` query parameter of ranked results.
+
+    :param cursor: Optional[str]: cursor returned as `next_cursor` by a previous page
+    :return: Optional[Tuple[float, int]]: rank and key of the last item of the previous page
+    """
+    return decode_ranked_cursor(cursor=cursor)
+
+
+def get_count_strategy(
+    count: CountStrategy = Query(
+        CountStrategy.EXACT,
+        description=(
+            "How `total` is computed: `exact` count, `window` count fused into the page query, "
+            "`estimate` from table statistics, or `none` to skip counting."
+        ),
+    )
+) -> CountStrategy:
+    """
+    Dependency that reads the `count` query parameter.
+
+    :param count: CountStrategy: strategy used to compute the total of a page
+    :return: CountStrategy: the selected strategy
+    """
+    return count
+
+
+def split_page(items: List[Any], limit: int) -> Tuple[List[Any], bool]:
+    """
+    Utility function to trim a page fetched with `limit + 1` rows.
+
+    :param items: List[Any]: rows fetched with one extra row
+    :param limit: int: number of items per page
+    :return: Tuple[List[Any], bool]: the page and True if there are more items
+    """
+    return items[:limit], len(items) > limit
+
+
+def next_cursor(items: List[Any], has_more: bool) -> Optional[str]:
+    """
+    Utility function to build the cursor of the page following `items`.
+
+    :param items: List[Any]: rows of the current page, each having an `id`
+    :param has_more: bool: True if there are more items
+    :return: Optional[str]: cursor for the next page, None on the last page
+    """
+    if not has_more or not items:
+        return None
+    return encode_cursor(key=items[-1].id)
+
+
+def next_ranked_cursor(items: List[Any], has_more: bool) -> Optional[str]:
+    """
+    Utility function to build the cursor of the ranked page following `items`.
+
+    :param items: List[Any]: rows of the current page, each having a `rank` and an `id`
+    :param has_more: bool: True if there are more items
+    :return: Optional[str]: cursor for the next page, None on the last page
+    """
+    if not has_more or not items:
+        return None
+    return encode_cursor(key=items[-1].id, rank=items[-1].rank)
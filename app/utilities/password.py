@@ -1,24 +1,130 @@
 """
 Password utilities for handling password hashing and validation.
+
+Hashing is deliberately slow, so it never runs on the event loop. Every hash and
+verification is handed to a bounded thread pool, `pbkdf2_sha256` releases the GIL
+while it iterates so the workers hash in parallel. Callers beyond the pool size wait
+their turn on a semaphore, and the number waiting is reported as the queue depth.
 """
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from config import settings as set
 from passlib.hash import pbkdf2_sha256
-from pydantic import UUID4
 
 from ..exceptions import InvalidCredentials
 
 
-def create_hash(password: str) -> str:
+class HashPoolStats:
+    """
+    Accumulates queue and timing statistics for the password hashing pool.
+
+    ivars:
+        ivar: queued: Number of calls currently waiting for a free worker.
+        varType: int
+        ivar: running: Number of calls currently hashing on a worker.
+        varType: int
+        ivar: completed: Number of calls completed since worker start.
+        varType: int
+        ivar: queued_max: Highest number of calls waiting at once.
+        varType: int
+        ivar: wait_total: Total seconds spent waiting for a free worker.
+        varType: float
+        ivar: wait_max: Longest single wait, in seconds, for a free worker.
+        varType: float
+    """
+
+    def __init__(self) -> None:
+        self.queued: int = 0
+        self.running: int = 0
+        self.completed: int = 0
+        self.queued_max: int = 0
+        self.wait_total: float = 0.0
+        self.wait_max: float = 0.0
+
+    def record_queued(self) -> None:
+        """
+        Records a call that started waiting for a free worker.
+        """
+        self.queued += 1
+        if self.queued > self.queued_max:
+            self.queued_max = self.queued
+
+    def record_started(self, elapsed: float) -> None:
+        """
+        Records a call that acquired a worker after waiting.
+
+        :param elapsed: Seconds spent waiting for the worker.
+        :type elapsed: float
+        """
+        self.queued -= 1
+        self.running += 1
+        self.wait_total += elapsed
+        if elapsed > self.wait_max:
+            self.wait_max = elapsed
+
+    def record_abandoned(self) -> None:
+        """
+        Records a call that stopped waiting without acquiring a worker, when it was cancelled.
+        """
+        self.queued -= 1
+
+    def record_finished(self) -> None:
+        """
+        Records a call that released its worker.
+        """
+        self.running -= 1
+        self.completed += 1
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=set.password_hash_workers, thread_name_prefix="password-hash"
+)
+_slots = asyncio.Semaphore(set.password_hash_workers)
+hash_pool_stats = HashPoolStats()
+
+
+async def _run_in_pool(func: Callable[..., Any], **kwargs: Any) -> Any:
+    """
+    Runs a blocking hashing function on the hashing pool once a worker is free.
+
+    :param func: Callable[..., Any]: The blocking function to run.
+    :param kwargs: Any: Keyword arguments passed to the function.
+    :return: Any: The return value of the function.
+    """
+    hash_pool_stats.record_queued()
+    start = time.perf_counter()
+    acquired = False
+    try:
+        await _slots.acquire()
+        acquired = True
+    finally:
+        # A call cancelled while waiting, such as on a client disconnect, leaves the queue.
+        if not acquired:
+            hash_pool_stats.record_abandoned()
+    hash_pool_stats.record_started(elapsed=time.perf_counter() - start)
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, lambda: func(**kwargs))
+    finally:
+        hash_pool_stats.record_finished()
+        _slots.release()
+
+
+async def create_hash(password: str) -> str:
     """
     Generates a hashed version of the provided password using pbkdf2_sha256 algorithm.
 
     :param password: str: The password to hash.
     :return: str: The hashed password.
     """
-    return pbkdf2_sha256.hash(secret=password)
+    return await _run_in_pool(pbkdf2_sha256.hash, secret=password)
 
 
-def validate_hash(password: str, hash: str) -> bool:
+async def validate_hash(password: str, hash: str) -> bool:
     """
     Validates if the provided password matches the stored hash.
 
@@ -27,6 +133,27 @@ def validate_hash(password: str, hash: str) -> bool:
     :raises InvalidCredentials: If the password does not match the hash.
     :return: bool: True if the password matches the hash, raises InvalidCredentials otherwise.
     """
-    if pbkdf2_sha256.verify(secret=password, hash=hash):
+    if await _run_in_pool(pbkdf2_sha256.verify, secret=password, hash=hash):
         return True
     raise InvalidCredentials()
+
+
+def hash_pool_status() -> Dict[str, Any]:
+    """
+    Builds a snapshot of the password hashing pool state and accumulated statistics.
+
+    :return: Dict[str, Any]: A dictionary of pool gauges and counters.
+    """
+    stats = hash_pool_stats
+    return {
+        "workers": set.password_hash_workers,
+        "queued": stats.queued,
+        "queued_max": stats.queued_max,
+        "running": stats.running,
+        "completed": stats.completed,
+        "wait_total_seconds": stats.wait_total,
+        "wait_max_seconds": stats.wait_max,
+        "wait_avg_seconds": (
+            stats.wait_total / stats.completed if stats.completed else 0.0
+        ),
+    }
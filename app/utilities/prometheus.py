@@ -0,0 +1,71 @@
+"""
+Rendering of in-process statistics in the Prometheus text exposition format.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from ..database.query_stats import LATENCY_BUCKETS_MS, QueryStats
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Dict[str, str]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items())
+    return f"{{{pairs}}}"
+
+
+def metric_lines(
+    name: str, kind: str, help: str, samples: Iterable[Tuple[Labels, float]]
+) -> List[str]:
+    """
+    Renders a counter or gauge with one sample per label set.
+
+    :param name: The metric name.
+    :type name: str
+    :param kind: The metric type, `counter` or `gauge`.
+    :type kind: str
+    :param help: The metric description.
+    :type help: str
+    :param samples: The label sets and their values.
+    :type samples: Iterable[Tuple[Labels, float]]
+    :return: The exposition lines.
+    :rtype: List[str]
+    """
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{_labels(labels)} {value}" for labels, value in samples)
+    return lines
+
+
+def histogram_lines(
+    name: str, help: str, series: Iterable[Tuple[Labels, QueryStats]]
+) -> List[str]:
+    """
+    Renders latency statistics, recorded in milliseconds, as a histogram in seconds.
+
+    :param name: The metric name, without the `_bucket`, `_sum` and `_count` suffixes.
+    :type name: str
+    :param help: The metric description.
+    :type help: str
+    :param series: The label sets and their latency statistics.
+    :type series: Iterable[Tuple[Labels, QueryStats]]
+    :return: The exposition lines.
+    :rtype: List[str]
+    """
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} histogram"]
+    for labels, stats in series:
+        cumulative = 0
+        for bound, calls in zip(LATENCY_BUCKETS_MS, stats.buckets):
+            cumulative += calls
+            le = "+Inf" if bound == float("inf") else f"{bound / 1000:g}"
+            lines.append(f"{name}_bucket{_labels({**labels, 'le': le})} {cumulative}")
+        lines.append(f"{name}_sum{_labels(labels)} {stats.total_ms / 1000}")
+        lines.append(f"{name}_count{_labels(labels)} {stats.calls}")
+    return lines
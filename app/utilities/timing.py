@@ -0,0 +1,53 @@
+"""
+Timing utilities for breaking a request into phases for the `Server-Timing` header.
+
+The request metrics middleware opens a timing context per request. Session validation,
+database operations and path operations add their elapsed time to it, and the
+middleware reports the phases when the response starts.
+"""
+
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+_request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def start_timings() -> Dict[str, float]:
+    """
+    Opens the timing context of the current request.
+
+    :return: The phase durations of the request, in milliseconds, keyed by phase.
+    :rtype: Dict[str, float]
+    """
+    timings: Dict[str, float] = {}
+    _request_timings.set(timings)
+    return timings
+
+
+def add_timing(phase: str, elapsed_ms: float) -> None:
+    """
+    Adds elapsed time to a phase of the current request, outside of a request it is a no-op.
+
+    :param phase: The name of the phase.
+    :type phase: str
+    :param elapsed_ms: The elapsed time, in milliseconds.
+    :type elapsed_ms: float
+    """
+    timings = _request_timings.get()
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + elapsed_ms
+
+
+def get_timing(phase: str) -> float:
+    """
+    Returns the time spent so far in a phase of the current request.
+
+    :param phase: The name of the phase.
+    :type phase: str
+    :return: The elapsed time, in milliseconds, 0 outside of a request.
+    :rtype: float
+    """
+    timings = _request_timings.get()
+    return timings.get(phase, 0.0) if timings is not None else 0.0
@@ -0,0 +1,36 @@
+"""
+Shared helpers of the benchmark scripts.
+"""
+
+from typing import List, Sequence
+
+
+def percentile(values: Sequence[float], share: float) -> float:
+    """
+    Returns the value below which a share of the values fall, nearest rank.
+
+    :param values: Sequence[float]: the measured values
+    :param share: float: the share, from 0 to 1
+    :return: float: the percentile, 0 when there are no values
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(share * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def latency_row(name: str, latencies_ms: List[float]) -> str:
+    """
+    Formats the count, p50, p95 and p99 of latencies in milliseconds.
+
+    :param name: str: the name of the row
+    :param latencies_ms: List[float]: the latencies, in milliseconds
+    :return: str: the formatted row
+    """
+    return (
+        f"{name:<24} n={len(latencies_ms):<6} "
+        f"p50={percentile(latencies_ms, 0.50):8.2f}ms "
+        f"p95={percentile(latencies_ms, 0.95):8.2f}ms "
+        f"p99={percentile(latencies_ms, 0.99):8.2f}ms"
+    )
@@ -0,0 +1,75 @@
+"""
+Rows per second of the bulk insert modes, see `Operations.add_instances`.
+
+Products are inserted in the database configured for the application, read from the
+environment or `.env`, with each `BulkInsertMode` in turn. Every round runs in a
+transaction that is rolled back, so the database is left as it was:
+
+    python -m benchmarks.bulk_insert --rows 10000 --rounds 3
+
+The rows are created by the first system user, at least one must exist. `orm` is timed
+up to the flush of the instances, `returning` and `copy` up to the return of the
+inserted rows.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import UTC, datetime
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+async def run(args: argparse.Namespace) -> None:
+    from sqlalchemy import select
+
+    from app.constants.enums import BulkInsertMode
+    from app.database.database import LocalAsyncSession, async_engine
+    from app.database.operations import Operations
+    from app.models import Products
+    from app.models.sys_users import SysUsers
+    from app.schemas.products import ProductsInternalCreate
+
+    async with LocalAsyncSession() as db:
+        sys_user_uuid = await db.scalar(select(SysUsers.uuid).limit(1))
+    if sys_user_uuid is None:
+        raise SystemExit("No system user to create the products with.")
+
+    for mode in BulkInsertMode:
+        rates = []
+        for _ in range(args.rounds):
+            run_id = uuid4().hex[:8]
+            data = [
+                ProductsInternalCreate(
+                    name=f"bench-{run_id}-{index}",
+                    code=f"B{index}",
+                    sys_created_at=datetime.now(UTC),
+                    sys_created_by=sys_user_uuid,
+                )
+                for index in range(args.rows)
+            ]
+            async with LocalAsyncSession() as db:
+                start = time.perf_counter()
+                await Operations.add_instances(
+                    service="benchmark", model=Products, data=data, db=db, mode=mode
+                )
+                await db.flush()
+                elapsed = time.perf_counter() - start
+                await db.rollback()
+            rates.append(args.rows / elapsed)
+        print(f"{mode.value:<10} {max(rates):10.0f} rows/s (best of {args.rounds})")
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10000, help="rows per insert")
+    parser.add_argument("--rounds", type=int, default=3, help="inserts per mode")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Latency of unrelated requests during a login storm.
+
+Logins verify a password hash, which takes tens of milliseconds of CPU. Hashing runs
+on a bounded thread pool, see `utilities/password.py`, so the event loop keeps serving
+other requests while a storm of logins is verified.
+
+Against a running server, unrelated GETs are timed first alone, then while `--logins`
+clients log in back to back, and the p99 of both phases is compared:
+
+    python -m benchmarks.login_storm --url http://localhost:8000 \\
+        --username admin --password secret
+
+Without `--url`, the same comparison runs in process: a probe coroutine standing for
+unrelated requests measures how late the event loop wakes it, alone, during a storm of
+verifications on the pool, and during a storm of verifications run inline on the loop
+as they were before the pool. The settings are read from the environment or `.env`,
+as for the application.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Awaitable, Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks._stats import latency_row
+
+LOGIN_PATH = "/v1/system-management/login/"
+PROBE_PATH = "/v1/product-management/products/?limit=10"
+
+
+async def _time_probes(
+    probe: Callable[[], Awaitable[None]], duration: float
+) -> List[float]:
+    latencies = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await probe()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def _storm(
+    login: Callable[[], Awaitable[None]], clients: int, stop: asyncio.Event
+) -> int:
+    logins = 0
+
+    async def client() -> None:
+        nonlocal logins
+        while not stop.is_set():
+            await login()
+            logins += 1
+
+    await asyncio.gather(*(client() for _ in range(clients)))
+    return logins
+
+
+async def _compare(
+    probe: Callable[[], Awaitable[None]],
+    login: Callable[[], Awaitable[None]],
+    name: str,
+    clients: int,
+    duration: float,
+) -> List[float]:
+    stop = asyncio.Event()
+    storm = asyncio.create_task(_storm(login=login, clients=clients, stop=stop))
+    await asyncio.sleep(0.1)
+    latencies = await _time_probes(probe=probe, duration=duration)
+    stop.set()
+    logins = await storm
+    print(latency_row(name=name, latencies_ms=latencies), f"logins={logins}")
+    return latencies
+
+
+async def run_server(args: argparse.Namespace) -> None:
+    import httpx
+
+    form = {"username": args.username, "password": args.password}
+    async with httpx.AsyncClient(base_url=args.url, timeout=30) as client:
+        (await client.post(LOGIN_PATH, data=form)).raise_for_status()
+
+        async def probe() -> None:
+            (await client.get(args.path)).raise_for_status()
+
+        async with httpx.AsyncClient(base_url=args.url, timeout=30) as logins:
+
+            async def login() -> None:
+                (await logins.post(LOGIN_PATH, data=form)).raise_for_status()
+
+            print(latency_row("GET alone", await _time_probes(probe, args.duration)))
+            await _compare(probe, login, "GET during storm", args.logins, args.duration)
+
+
+async def run_in_process(args: argparse.Namespace) -> None:
+    from passlib.hash import pbkdf2_sha256
+
+    from app.utilities import password
+
+    hashed = pbkdf2_sha256.hash("secret")
+
+    async def probe() -> None:
+        # A 1ms timer, anything above 1ms is time an unrelated request waits for the loop.
+        await asyncio.sleep(0.001)
+
+    async def pooled_login() -> None:
+        await password.validate_hash(password="secret", hash=hashed)
+
+    async def inline_login() -> None:
+        pbkdf2_sha256.verify("secret", hashed)
+        await asyncio.sleep(0)
+
+    print(latency_row("probe alone", await _time_probes(probe, args.duration)))
+    await _compare(
+        probe, pooled_login, "probe, pooled storm", args.logins, args.duration
+    )
+    await _compare(
+        probe, inline_login, "probe, inline storm", args.logins, args.duration
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", help="base URL of a running server")
+    parser.add_argument("--username", help="login of a system user")
+    parser.add_argument("--password", help="password of the system user")
+    parser.add_argument("--path", default=PROBE_PATH, help="unrelated GET to time")
+    parser.add_argument("--logins", type=int, default=16, help="concurrent logins")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per phase")
+    args = parser.parse_args()
+    asyncio.run(run_server(args) if args.url else run_in_process(args))
+
+
+if __name__ == "__main__":
+    main()
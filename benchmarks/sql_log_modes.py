@@ -0,0 +1,99 @@
+"""
+Throughput across the SQL logging modes, see `database/query_log.py`.
+
+In process, the statement listeners of each mode are registered on an in-memory SQLite
+engine and short statements are run back to back, log records going through the
+application logger to a discarded stream. The statements per second of each mode show
+the cost logging adds to every query:
+
+    python -m benchmarks.sql_log_modes --statements 20000
+
+Against a running server, requests per second of a GET are measured with `--url`. The
+mode is read at startup, so start the server once per `SQL_LOG_MODE` and name the run
+with `--label`:
+
+    SQL_LOG_MODE=all uvicorn app.main:app
+    python -m benchmarks.sql_log_modes --url http://localhost:8000 --label all \\
+        --username admin --password secret
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks._stats import latency_row
+
+LOGIN_PATH = "/v1/system-management/login/"
+PROBE_PATH = "/v1/product-management/products/?limit=10"
+
+
+def run_in_process(args: argparse.Namespace) -> None:
+    from sqlalchemy import create_engine, event, text
+
+    from app.constants.enums import SqlLogMode
+    from app.database import query_log
+    from app.utilities import logger
+
+    logger._stream_handler.setStream(open(os.devnull, "w"))
+    statement = text("SELECT 1")
+    for mode in (SqlLogMode.OFF, SqlLogMode.SLOW, SqlLogMode.SAMPLED, SqlLogMode.ALL):
+        query_log.SQL_LOG_MODE = mode
+        engine = create_engine("sqlite://")
+        if mode != SqlLogMode.OFF:
+            for name in ("before_cursor_execute", "after_cursor_execute"):
+                event.listen(engine, name, getattr(query_log, f"_{name}"))
+        with engine.connect() as conn:
+            start = time.perf_counter()
+            for _ in range(args.statements):
+                conn.execute(statement)
+            elapsed = time.perf_counter() - start
+        logger.listener.stop()
+        logger.listener.start()
+        print(f"{mode.value:<8} {args.statements / elapsed:10.0f} statements/s")
+
+
+async def run_server(args: argparse.Namespace) -> None:
+    import httpx
+
+    form = {"username": args.username, "password": args.password}
+    async with httpx.AsyncClient(base_url=args.url, timeout=30) as client:
+        (await client.post(LOGIN_PATH, data=form)).raise_for_status()
+        latencies = []
+        deadline = time.perf_counter() + args.duration
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                (await client.get(args.path)).raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    print(
+        latency_row(name=args.label, latencies_ms=latencies),
+        f"{len(latencies) / args.duration:.0f} requests/s",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--statements", type=int, default=20000, help="per mode")
+    parser.add_argument("--url", help="base URL of a running server")
+    parser.add_argument("--label", default="server", help="SQL_LOG_MODE of the server")
+    parser.add_argument("--username", help="login of a system user")
+    parser.add_argument("--password", help="password of the system user")
+    parser.add_argument("--path", default=PROBE_PATH, help="GET to measure")
+    parser.add_argument("--concurrency", type=int, default=16, help="parallel clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    args = parser.parse_args()
+    if args.url:
+        asyncio.run(run_server(args))
+    else:
+        run_in_process(args)
+
+
+if __name__ == "__main__":
+    main()
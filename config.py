@@ -8,9 +8,35 @@ class Settings(BaseSettings):
     db_hst: str
     db_port: str
     db_nm: str
+    db_read_hsts: str = ""
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_pre_ping: bool = True
+    db_pool_recycle: int = 1800
+    db_pool_timeout: int = 30
+    db_statement_cache_size: int = 100
+    backfill_batch_size: int = 1000
+    bulk_insert_batch_size: int = 1000
+    catalog_cache_size: int = 256
+    catalog_cache_ttl: int = 60
+    count_cache_size: int = 1024
+    count_cache_ttl: int = 30
+    export_batch_size: int = 1000
+    import_batch_size: int = 1000
+    import_max_errors: int = 1000
+    import_max_line_length: int = 1048576
+    sql_log_mode: str = "slow"
+    sql_log_sample_rate: float = 0.01
+    sql_log_slow_ms: int = 200
+    server_timing: bool = False
+    sys_user_cache_size: int = 1024
+    sys_user_cache_ttl: int = 60
+    metrics_allowed_networks: str = "127.0.0.1/32,::1/128"
     jwt_secret_key: str
     jwt_algorithm: str
     jwt_expiration: int
+    jwt_refresh_threshold: int = 5
+    password_hash_workers: int = 2
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,29 @@
+"""
+Shared test setup.
+
+Settings are read from the environment when `config` is imported, the required ones
+get placeholder values so the application imports without a `.env` file. Tests never
+connect to a database, sessions are replaced by stubs.
+"""
+
+import os
+
+import pytest
+
+for name, value in {
+    "DB_CONNECTOR": "postgresql+asyncpg",
+    "DB_USRNM": "test",
+    "DB_PWD": "test",
+    "DB_HST": "localhost",
+    "DB_PORT": "5432",
+    "DB_NM": "test",
+    "JWT_SECRET_KEY": "test",
+    "JWT_ALGORITHM": "HS256",
+    "JWT_EXPIRATION": "15",
+}.items():
+    os.environ.setdefault(name, value)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
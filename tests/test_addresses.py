@@ -0,0 +1,85 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from app.exceptions import AddressExists
+from app.models.addresses import Addresses
+from app.schemas.addresses import AddressesInternalUpdate
+from app.services.addresses import FINGERPRINT_INDEX, UpdateSrvc
+from app.statements.addresses import AddressesStms
+
+
+def integrity_error(constraint_name):
+    cause = Exception("duplicate key value violates unique constraint")
+    cause.constraint_name = constraint_name
+    orig = Exception("IntegrityError")
+    orig.__cause__ = cause
+    return IntegrityError("UPDATE sales.em_addresses", {}, orig)
+
+
+class RacingOperations:
+    """The fingerprint is free when looked up, then taken before the update runs."""
+
+    def __init__(self, error):
+        self.error = error
+        self.reads = []
+
+    async def return_one_row(self, statement, **kwargs):
+        self.reads.append(statement)
+        if len(self.reads) == 1:
+            return SimpleNamespace(
+                address_line1="1 Main St",
+                address_line2=None,
+                city="Springfield",
+                zip="1",
+            )
+        if len(self.reads) == 2:
+            return None
+        raise self.error
+
+
+async def update(error):
+    parent_uuid = uuid.uuid4()
+    srvc = UpdateSrvc(
+        statements=AddressesStms(model=Addresses),
+        db_operations=RacingOperations(error=error),
+    )
+    return await srvc.update_address(
+        parent_uuid=parent_uuid,
+        parent_table="entities",
+        address_uuid=uuid.uuid4(),
+        address_data=AddressesInternalUpdate(
+            parent_uuid=parent_uuid, city="Shelbyville"
+        ),
+        db=None,
+    )
+
+
+def test_fingerprint_index_belongs_to_the_model():
+    assert FINGERPRINT_INDEX in {index.name for index in Addresses.__table__.indexes}
+
+
+@pytest.mark.anyio
+async def test_fingerprint_taken_by_a_concurrent_write_is_an_existing_address():
+    with pytest.raises(AddressExists):
+        await update(error=integrity_error(constraint_name=FINGERPRINT_INDEX))
+
+
+@pytest.mark.anyio
+async def test_other_integrity_errors_are_raised():
+    with pytest.raises(IntegrityError):
+        await update(error=integrity_error(constraint_name="fk_em_addresses_parent"))
+
+
+def test_fingerprint_backfill_keeps_the_update_time():
+    statement = AddressesStms(model=Addresses).update_fingerprints()
+    sql = str(
+        statement.compile(
+            dialect=postgresql.dialect(), column_keys=["id", "fingerprint"]
+        )
+    )
+    assert "sys_updated_at=sales.em_addresses.sys_updated_at" in sql
+    assert "now()" not in sql
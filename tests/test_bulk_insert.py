@@ -0,0 +1,68 @@
+import uuid
+
+import pytest
+
+from app.constants.enums import BulkInsertMode
+from app.database.operations import Operations
+from app.exceptions import ProductListItemExists
+from app.models import ProductListItems
+from app.schemas.product_list_items import ProductListItemsInternalCreate
+from app.services.product_list_items import CreateSrvc
+from app.statements.product_list_items import ProductListItemsStms
+
+
+class RecordingOperations:
+    def __init__(self):
+        self.calls = []
+
+    async def return_one_row(self, **kwargs):
+        self.calls.append("return_one_row")
+        return None
+
+    async def add_instances(self, **kwargs):
+        self.calls.append("add_instances")
+        return list(kwargs["data"])
+
+
+def items(product_list_uuid, *product_uuids):
+    return [
+        ProductListItemsInternalCreate(
+            product_list_uuid=product_list_uuid,
+            product_uuid=product_uuid,
+            sys_created_by=uuid.uuid4(),
+        )
+        for product_uuid in product_uuids
+    ]
+
+
+def test_copy_rows_repeating_a_unique_key_are_left_out():
+    first, second = uuid.uuid4(), uuid.uuid4()
+    rows = [
+        {"product_uuid": first, "price": 1},
+        {"product_uuid": second, "price": 2},
+        {"product_uuid": first, "price": 3},
+    ]
+
+    unique_rows = Operations._first_unique_rows(rows=rows, unique=("product_uuid",))
+
+    assert [row["price"] for row in unique_rows] == [1, 2]
+
+
+@pytest.mark.anyio
+async def test_copy_refuses_repeated_products_before_writing():
+    db_ops = RecordingOperations()
+    srvc = CreateSrvc(
+        statements=ProductListItemsStms(model=ProductListItems),
+        db_operations=db_ops,
+        model=ProductListItems,
+    )
+    product_list_uuid, product_uuid = uuid.uuid4(), uuid.uuid4()
+
+    with pytest.raises(ProductListItemExists):
+        await srvc.create_product_list_items(
+            product_list_uuid=product_list_uuid,
+            product_list_item_data=items(product_list_uuid, product_uuid, product_uuid),
+            db=None,
+            mode=BulkInsertMode.COPY,
+        )
+    assert db_ops.calls == []
@@ -0,0 +1,59 @@
+from contextlib import asynccontextmanager
+
+import pytest
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.utilities import catalog
+
+
+class Product(BaseModel):
+    name: str
+
+
+def get_request(path="/v1/product-management/products/"):
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": b"",
+            "headers": [],
+        }
+    )
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    opened = []
+
+    @asynccontextmanager
+    async def primary_read_session():
+        opened.append(object())
+        yield opened[-1]
+
+    monkeypatch.setattr(catalog, "primary_read_session", primary_read_session)
+    catalog.catalog_cache.clear()
+    yield opened
+    catalog.catalog_cache.clear()
+
+
+@pytest.mark.anyio
+async def test_miss_reads_from_the_primary_and_is_cached(sessions):
+    reads = []
+
+    async def read(db):
+        reads.append(db)
+        return Product(name="Widget")
+
+    first = await catalog.catalog_response(
+        request=get_request(), response=Response(), schema=Product, read=read
+    )
+    second = await catalog.catalog_response(
+        request=get_request(), response=Response(), schema=Product, read=read
+    )
+
+    assert reads == sessions
+    assert len(sessions) == 1
+    assert first.body == second.body == b'{"name":"Widget"}'
@@ -0,0 +1,50 @@
+import pytest
+
+from app.utilities import imports
+from config import settings
+
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def parsed(rows):
+    return [row async for row in rows]
+
+
+@pytest.fixture
+def max_line_length(monkeypatch):
+    monkeypatch.setattr(settings, "import_max_line_length", 10)
+
+
+@pytest.mark.anyio
+async def test_lines_over_the_limit_are_dropped_without_being_buffered(
+    max_line_length,
+):
+    stream = chunks(b"short\n", b"x" * 8, b"x" * 8, b"x" * 8, b"\nnext\n", b"y" * 20)
+    assert await parsed(imports._lines(stream=stream, compressed=False)) == [
+        "short",
+        None,
+        "next",
+        None,
+    ]
+
+
+@pytest.mark.anyio
+async def test_ndjson_rows_over_the_limit_are_rejected(max_line_length):
+    stream = chunks(b'{"a": 1}\n', b'{"a": "' + b"x" * 20 + b'"}\n', b'{"a": 2}\n')
+    rows = imports._ndjson_rows(imports._lines(stream=stream, compressed=False))
+    assert await parsed(rows) == [(1, {"a": 1}), (2, None), (3, {"a": 2})]
+
+
+@pytest.mark.anyio
+async def test_csv_records_over_the_limit_are_rejected(max_line_length):
+    # The second record spans lines that are each under the limit.
+    stream = chunks(b"a,b\n", b"1,2\n", b'3,"xxxxxx\n', b'xxxxxx"\n', b"5,6\n")
+    rows = imports._csv_rows(imports._lines(stream=stream, compressed=False))
+    assert await parsed(rows) == [
+        (1, {"a": "1", "b": "2"}),
+        (2, None),
+        (3, {"a": "5", "b": "6"}),
+    ]
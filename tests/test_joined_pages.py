@@ -0,0 +1,144 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.constants.enums import CountStrategy
+from app.containers.orchestrators import container as orchs_container
+from app.database.operations import count_cache
+from app.models import (
+    AccountLists,
+    AccountProducts,
+    Accounts,
+    EntityAccounts,
+    ProductLists,
+    Products,
+)
+from app.schemas.accounts import AccountsRes
+from app.schemas.product_lists import ProductListsRes
+from app.schemas.products import ProductsRes
+
+TOTAL = 7
+
+
+class StubRow(SimpleNamespace):
+    """A joined row, the window count is its last column."""
+
+    def __getitem__(self, index):
+        return TOTAL
+
+
+class StubResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+    def scalar(self):
+        return TOTAL
+
+
+class RecordingSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(statement)
+        return StubResult(rows=self.rows)
+
+
+def link(index):
+    return SimpleNamespace(id=index, rank=index)
+
+
+def models_of(statement):
+    return {
+        description["entity"]
+        for description in statement.column_descriptions
+        if description["entity"] is not None
+    }
+
+
+PAGES = [
+    (
+        "entity_accounts_read_orch",
+        "paginated_entity_accounts",
+        "entity_uuid",
+        {EntityAccounts, Accounts},
+        lambda index: StubRow(
+            EntityAccounts=link(index), Accounts=AccountsRes.model_construct()
+        ),
+    ),
+    (
+        "entity_accounts_read_orch",
+        "paginated_account_entities",
+        "account_uuid",
+        {EntityAccounts},
+        lambda index: StubRow(
+            EntityAccounts=link(index),
+            entity_uuid=uuid.uuid4(),
+            first_name="Ada",
+            last_name="Lovelace",
+            company_name=None,
+        ),
+    ),
+    (
+        "accounts_lists_read_orch",
+        "paginated_product_lists",
+        "account_uuid",
+        {AccountLists, ProductLists},
+        lambda index: StubRow(
+            AccountLists=link(index), ProductLists=ProductListsRes.model_construct()
+        ),
+    ),
+    (
+        "account_products_read_orch",
+        "paginated_products",
+        "account_uuid",
+        {AccountProducts, Products},
+        lambda index: StubRow(
+            AccountProducts=link(index), Products=ProductsRes.model_construct()
+        ),
+    ),
+]
+
+
+async def read_page(orch_name, method, key, build_row, count):
+    count_cache.clear()
+    db = RecordingSession(rows=[build_row(index) for index in range(1, 4)])
+    orch = orchs_container[orch_name]()
+    page = await getattr(orch, method)(
+        **{key: uuid.uuid4()}, page=1, limit=10, db=db, count=count
+    )
+    return db.statements, page
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("orch_name, method, key, models, build_row", PAGES)
+async def test_page_is_one_joined_statement_and_a_count(
+    orch_name, method, key, models, build_row
+):
+    statements, page = await read_page(
+        orch_name, method, key, build_row, CountStrategy.EXACT
+    )
+
+    page_statement, count_statement = statements
+    assert models <= models_of(page_statement)
+    assert "count" in str(count_statement).lower()
+    assert page.total == TOTAL
+    assert len(page.data) == 3
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("orch_name, method, key, models, build_row", PAGES)
+@pytest.mark.parametrize("count", [CountStrategy.WINDOW, CountStrategy.NONE])
+async def test_page_without_exact_count_is_one_statement(
+    orch_name, method, key, models, build_row, count
+):
+    statements, page = await read_page(orch_name, method, key, build_row, count)
+
+    [page_statement] = statements
+    assert models <= models_of(page_statement)
+    assert page.total == (TOTAL if count == CountStrategy.WINDOW else None)
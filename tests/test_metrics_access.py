@@ -0,0 +1,47 @@
+import pytest
+from starlette.requests import Request
+
+from app.constants import constants as cnst
+from app.exceptions import MetricsClientNotAllowed
+from app.handlers.middleware import _server_timing
+from app.utilities import auth
+
+
+def request_from(host):
+    return Request({"type": "http", "client": (host, 50000) if host else None})
+
+
+@pytest.fixture(autouse=True)
+def networks(monkeypatch):
+    monkeypatch.setattr(
+        auth,
+        "metrics_networks",
+        [
+            auth.ipaddress.ip_network("127.0.0.1/32"),
+            auth.ipaddress.ip_network("10.0.0.0/8"),
+        ],
+    )
+
+
+@pytest.mark.parametrize("host", ["127.0.0.1", "10.1.2.3"])
+def test_allowed_clients_read_metrics(host):
+    auth.require_metrics_client(request=request_from(host))
+
+
+@pytest.mark.parametrize("host", ["203.0.113.7", "::1", "testclient", None])
+def test_other_clients_are_refused(host):
+    with pytest.raises(MetricsClientNotAllowed):
+        auth.require_metrics_client(request=request_from(host))
+
+
+def test_server_timing_phases_do_not_overlap():
+    timings = {
+        cnst.TIMING_AUTH: 2.0,
+        cnst.TIMING_DB: 10.0,
+        cnst.TIMING_ORCH: 3.0,
+        cnst.TIMING_HANDLER: 9.0,
+    }
+    header = _server_timing(timings=timings, total_ms=20.0).decode()
+
+    assert "serialize;dur=5.0" in header
+    assert "total;dur=20.0" in header
@@ -0,0 +1,36 @@
+import importlib.util
+from pathlib import Path
+
+from app import models
+
+VERSIONS = Path(__file__).parent.parent / "app" / "alembic" / "versions"
+
+
+class RecordingOp:
+    """Records the tables a migration creates, every other operation is ignored."""
+
+    def __init__(self):
+        self.tables = []
+
+    def create_table(self, name, *columns, schema=None, **kwargs):
+        self.tables.append(f"{schema}.{name}" if schema else name)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def created_tables(revision):
+    [path] = VERSIONS.glob(f"{revision}_*.py")
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    migration.op = RecordingOp()
+    migration.upgrade()
+    return migration.op.tables
+
+
+def test_autogenerate_metadata_holds_every_table_of_the_initial_schema():
+    tables = created_tables("0f3b2a1c9d10")
+
+    assert tables
+    assert set(tables) - set(models.Base.metadata.tables) == set()
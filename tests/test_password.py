@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from app.utilities import password
+
+
+@pytest.mark.anyio
+async def test_cancelled_wait_leaves_the_queue(monkeypatch):
+    monkeypatch.setattr(password, "_slots", asyncio.Semaphore(1))
+    monkeypatch.setattr(password, "hash_pool_stats", password.HashPoolStats())
+    release = asyncio.Event()
+
+    async def hold():
+        await password._slots.acquire()
+        await release.wait()
+        password._slots.release()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(password._run_in_pool(lambda: True))
+    await asyncio.sleep(0)
+    assert password.hash_pool_stats.queued == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    release.set()
+    await holder
+
+    assert password.hash_pool_stats.queued == 0
+    assert password.hash_pool_stats.running == 0
+
+
+@pytest.mark.anyio
+async def test_hash_round_trip_releases_the_worker():
+    hashed = await password.create_hash(password="secret")
+
+    assert await password.validate_hash(password="secret", hash=hashed)
+    assert password.hash_pool_stats.queued == 0
+    assert password.hash_pool_stats.running == 0
@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy import create_engine, event, exc, text
+
+from app.constants.enums import SqlLogMode
+from app.database import query_log
+
+
+@pytest.fixture
+def logged(monkeypatch):
+    monkeypatch.setattr(query_log, "SQL_LOG_MODE", SqlLogMode.ALL)
+    records = []
+    monkeypatch.setattr(
+        query_log.logger, "log", lambda level, msg, *args: records.append(args)
+    )
+    engine = create_engine("sqlite://")
+    event.listen(engine, "before_cursor_execute", query_log._before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", query_log._after_cursor_execute)
+    return engine, records
+
+
+def test_statements_are_logged_with_their_duration(logged):
+    engine, records = logged
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    [(elapsed_ms, service, statement)] = records
+    assert statement == "SELECT 1"
+    assert 0 <= elapsed_ms < 1000
+
+
+def test_failed_statement_leaves_no_start_time_behind(logged):
+    engine, records = logged
+    with engine.connect() as conn:
+        with pytest.raises(exc.OperationalError):
+            conn.execute(text("SELECT * FROM missing"))
+        assert not any("start" in str(key) for key in conn.info)
+        conn.execute(text("SELECT 2"))
+
+    assert [statement for _, _, statement in records] == ["SELECT 2"]
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from app.constants import constants as cnst
+from app.database import query_stats
+from app.database.operations import Operations
+from app.utilities.timing import get_timing, start_timings
+
+
+@pytest.fixture(autouse=True)
+def stats(monkeypatch):
+    monkeypatch.setattr(query_stats, "query_stats", {})
+    return query_stats
+
+
+@query_stats.timed_operation
+async def failing(service):
+    await asyncio.sleep(0.01)
+    raise TimeoutError
+
+
+@pytest.mark.anyio
+async def test_failed_operation_is_recorded_without_rows(stats):
+    start_timings()
+    with pytest.raises(TimeoutError):
+        await failing(service="orders")
+
+    recorded = stats.query_stats[("orders", "failing")]
+    assert recorded.calls == 1
+    assert recorded.rows == 0
+    assert recorded.total_ms >= 10
+    assert get_timing(phase=cnst.TIMING_DB) >= 10
+
+
+class Partitions:
+    def __init__(self, batches):
+        self.batches = batches
+
+    def scalars(self):
+        return self
+
+    async def partitions(self):
+        for batch in self.batches:
+            await asyncio.sleep(0.01)
+            yield batch
+
+
+class StreamingSession:
+    async def stream(self, statement, execution_options):
+        return Partitions(batches=[[1, 2], [3]])
+
+
+@pytest.mark.anyio
+async def test_streamed_rows_are_recorded_without_the_time_batches_are_held(stats):
+    async for _ in Operations.stream_rows(
+        service="exports", statement=None, db=StreamingSession()
+    ):
+        await asyncio.sleep(0.05)
+
+    recorded = stats.query_stats[("exports", "stream_rows")]
+    assert recorded.calls == 1
+    assert recorded.rows == 3
+    assert 20 <= recorded.total_ms < 50
@@ -0,0 +1,25 @@
+import uuid
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.services.sys_users import invalidate_sys_user, sys_user_cache
+
+
+def test_user_recached_before_commit_is_invalidated_on_commit():
+    sys_user_uuid = uuid.uuid4()
+    key = str(sys_user_uuid)
+    session = Session(create_engine("sqlite://"))
+    session.execute(text("SELECT 1"))
+    sys_user_cache.set(key=key, value="enabled user")
+
+    invalidate_sys_user(
+        sys_user_uuid=sys_user_uuid, db=SimpleNamespace(sync_session=session)
+    )
+    assert sys_user_cache.get(key=key) is None
+    # A request validated before the commit still reads the enabled user.
+    sys_user_cache.set(key=key, value="enabled user")
+    session.commit()
+
+    assert sys_user_cache.get(key=key) is None
@@ -0,0 +1,37 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+
+from app.models import Products
+from app.schemas.addresses import AddressesInternalUpdate
+from app.schemas.products import ProductsDel, ProductsInternalUpdate
+
+
+@pytest.mark.parametrize(
+    "build, field",
+    [
+        (
+            lambda: AddressesInternalUpdate(parent_uuid=uuid.uuid4()),
+            "sys_updated_at",
+        ),
+        (lambda: ProductsInternalUpdate(name="Widget"), "sys_updated_at"),
+        (lambda: ProductsDel(), "sys_deleted_at"),
+    ],
+)
+def test_system_timestamps_are_taken_when_the_schema_is_validated(build, field):
+    before = datetime.now(tz=UTC)
+    value = getattr(build(), field)
+    after = datetime.now(tz=UTC)
+
+    assert before <= value <= after
+
+
+def test_update_without_timestamp_sets_it_in_the_database():
+    statement = update(Products).values(name="Widget")
+
+    compiled = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "sys_updated_at=now()" in compiled